@@ -62,6 +62,15 @@ setup(
         've-utils>=2.5.3'
     ],
     extras_require={
+        "NUMPY": [
+            "numpy>=1.24.0"
+        ],
+        "MQTT": [
+            "paho-mqtt>=2.1.0"
+        ],
+        "PARQUET": [
+            "pyarrow>=14.0.0"
+        ],
         "TEST": [
             "pytest>=8.3.2",
             "pytest-cov>=5.0.0",
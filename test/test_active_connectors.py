@@ -2,6 +2,7 @@
 import pytest
 from ve_utils.utype import UType as Ut
 from vemonitor_m8.workers.active_connectors import ActiveConnectors
+from vemonitor_m8.workers.active_connectors import SharedConnectors
 
 
 @pytest.fixture(name="helper_manager", scope="class")
@@ -136,3 +137,35 @@ class TestActiveConnectors:
         assert helper_manager.obj.is_valid_item_value(
             value=None
         ) is False
+
+
+class TestSharedConnectors:
+    """Test SharedConnectors model class."""
+
+    def test_add_item(self):
+        """Test add_item method """
+        obj = SharedConnectors()
+        connector = object()
+        assert obj.add_item(
+            key=("serial", "bmv700"),
+            value=connector
+        ) is True
+        # first connector registered is kept
+        assert obj.add_item(
+            key=("serial", "bmv700"),
+            value=object()
+        ) is False
+        assert obj.get_item(("serial", "bmv700")) is connector
+        # connector conf dict is not a live connector
+        assert obj.add_item(
+            key=("redis", "local"),
+            value={"host": "127.0.0.1"}
+        ) is False
+
+    def test_get_connector_lock(self):
+        """Test get_connector_lock method """
+        obj = SharedConnectors()
+        connector = object()
+        lock = obj.get_connector_lock(connector)
+        assert obj.get_connector_lock(connector) is lock
+        assert obj.get_connector_lock(object()) is not lock
@@ -0,0 +1,144 @@
+"""Test AppBlockRun module."""
+import inspect
+from os import path as Opath
+import pytest
+from vemonitor_m8.conf_manager.config_loader import ConfigLoader
+from vemonitor_m8.conf_manager.data_structure_loader import DataStructureLoader
+from vemonitor_m8.core.app_run_main import AppBlockRun
+from vemonitor_m8.core.data_checker import DataChecker
+from vemonitor_m8.core.exceptions import DeviceInputValueError
+from vemonitor_m8.core.exceptions import DeviceDataConfError
+from vemonitor_m8.models.workers import InputTimeSeriesWorker
+
+
+class TimeSeriesInputTest(InputTimeSeriesWorker):
+    """Time series input worker, reading rows set on init."""
+
+    def __init__(self, rows: dict):
+        InputTimeSeriesWorker.__init__(self)
+        self.rows = rows
+        self.set_name("chained")
+        self.set_columns({'bmv700': ['V', 'I'], 'bmv712': ['SOC']})
+
+    def is_ready(self) -> bool:
+        """Test if worker is ready."""
+        return True
+
+    def set_worker_status(self) -> bool:
+        """Test if Worker status is ready."""
+        self._status = True
+        return self._status
+
+    def set_worker(self, worker: dict) -> bool:
+        """Set Worker class instance."""
+        return True
+
+    def read_data(self, timeout: int = 2) -> dict:
+        """Get rows set on init."""
+        return self.rows
+
+
+@pytest.fixture(name="helper_manager", scope="class")
+def helper_manager_fixture():
+    """AppBlockRun test manager fixture"""
+    class HelperManager:
+        """AppBlockRun test manager fixture Class"""
+
+        def __init__(self):
+            current_script_path = Opath.dirname(
+                Opath.abspath(
+                    inspect.getfile(inspect.currentframe())
+                )
+            )
+            loader = DataStructureLoader(
+                file_names="dummy_g_conf.yaml",
+                file_path=Opath.join(current_script_path, "conf")
+            )
+            self.checkers = loader.get_yaml_data_structure().get('points')
+            self.conf_path = Opath.join(current_script_path, "conf")
+
+        def get_app_block_run(self) -> AppBlockRun:
+            """Get AppBlockRun of batSerialMonitor test block."""
+            conf = ConfigLoader(self.conf_path).get_settings_from_schema(
+                block_name=None,
+                app_name="batSerialMonitor",
+            )
+            return AppBlockRun(conf=conf)
+
+    return HelperManager()
+
+
+class TestAppBlockRun:
+    """Test AppBlockRun class."""
+
+    def test_compile_ingest(self, helper_manager):
+        """Test compile_ingest method."""
+        plan = DataChecker.compile_plan(['H10', 'H6'], helper_manager.checkers)
+        ingest = AppBlockRun.compile_ingest(plan)
+        frame = {'H10': '26', 'H6': '-5526739', 'PID': "0x203"}
+        # same result than projection, check and time keys steps
+        expected = DataChecker.check_input_columns(
+            {'H10': '26', 'H6': '-5526739'},
+            helper_manager.checkers
+        )
+        expected['time'] = 1667000123.25
+        expected['time_ref'] = AppBlockRun.get_time_ref(1667000123.25)
+        assert ingest(frame, 1667000123.25) == expected
+        assert expected['time_ref'] == 123.25
+        assert ingest(frame) == {'H10': 26, 'H6': -5526.739}
+        assert ingest({'PID': "0x203"}, 1667000123.25) is None
+        with pytest.raises(DeviceInputValueError):
+            ingest({'H6': 25.2})
+
+    def test_add_time_series_data(self, helper_manager):
+        """Test time series input rows are cached on their time keys."""
+        obj = helper_manager.get_app_block_run()
+        worker = TimeSeriesInputTest({
+            1700000000: {
+                'bmv700': {'V': '12500', 'I': '1000', 'P': '12'},
+                'bmv712': {'SOC': '950'}
+            },
+            1700000001: {'bmv700': {'V': '12600'}}
+        })
+        assert obj.register_input_nodes(worker) is True
+        assert obj.add_time_series_data(worker, worker.read_data()) is True
+        data = obj.inputs_data.data
+        assert sorted(data) == [1700000000, 1700000001]
+        assert data[1700000000]['bmv700']['V'] == 12.5
+        assert 'P' not in data[1700000000]['bmv700']
+        assert data[1700000000]['bmv712']['time'] == 1700000000
+        assert data[1700000001]['bmv700']['V'] == 12.6
+        assert obj.add_time_series_data(worker, {}) is False
+
+    def test_format_input_rows(self, helper_manager):
+        """Test batch rows format, same results than row by row."""
+        obj = helper_manager.get_app_block_run()
+        columns = ['V', 'I']
+        rows = [{'V': '12500', 'I': '-1234'}, {'P': '12'}, {'V': 12600}]
+        time_keys = [1700000000, 1700000001, 1700000002]
+        assert obj.format_input_rows(rows, columns, time_keys) == [
+            obj.format_input_data(row, columns, time_key)
+            for row, time_key in zip(rows, time_keys)
+        ]
+        assert obj.format_input_rows(rows, None, time_keys)\
+            == [None, None, None]
+        with pytest.raises(DeviceDataConfError):
+            obj.format_input_rows([{'V': 12.5}], columns, time_keys)
+
+    def test_late_time_series_data(self, helper_manager, monkeypatch):
+        """Test oldest cached time series row is notified."""
+        obj = helper_manager.get_app_block_run()
+        late_times = []
+        monkeypatch.setattr(
+            obj, "on_time_series_cached", late_times.append
+        )
+        worker = TimeSeriesInputTest({
+            1700000010: {'bmv700': {'V': '12500'}},
+            1700000002: {'bmv712': {'SOC': '950'}},
+            1700000005: {'bmv700': {'V': '12600'}}
+        })
+        assert obj.register_input_nodes(worker) is True
+        assert obj.add_time_series_data(worker, worker.read_data()) is True
+        assert late_times == [1700000002]
+        assert obj.add_time_series_data(worker, {}) is False
+        assert late_times == [1700000002]
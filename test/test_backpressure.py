@@ -0,0 +1,120 @@
+"""Test Backpressure module."""
+import pytest
+from vemonitor_m8.core.backpressure import Backpressure
+from vemonitor_m8.core.data_cache import DataCache
+from vemonitor_m8.core.threads_controller import ThreadsController
+from test.test_outputs_pool import DummyOutputWorker
+
+
+@pytest.fixture(name="helper_manager")
+def helper_manager_fixture():
+    """Backpressure test manager fixture"""
+    class HelperManager:
+        """Backpressure test manager fixture Class"""
+
+        def __init__(self):
+            self.cache = DataCache(max_rows=100)
+            self.cache.register_node('node')
+            self.worker = DummyOutputWorker('out')
+
+        def add_rows(self, obj: Backpressure, nb_rows: int, start: int = 10):
+            """Add rows to cache and register them."""
+            for i in range(nb_rows):
+                assert self.cache.add_data_cache(
+                    time_key=start + i,
+                    node='node',
+                    data={'V': 12 + i}
+                ) is True
+                obj.register_row(start + i)
+
+        def get_outputs(self) -> dict:
+            """Get outputs to check."""
+            return {
+                'out': (self.worker, self.worker.get_last_saved_time())
+            }
+
+    return HelperManager()
+
+
+class TestBackpressure:
+    """Test Backpressure class."""
+
+    def test_from_conf(self):
+        """Test from_conf method."""
+        assert Backpressure.from_conf(None) is None
+        obj = Backpressure.from_conf({
+            'max_pending_rows': 5,
+            'policy': "throttle",
+            'low_priority_inputs': ["bmv"],
+            'throttle_factor': 3
+        })
+        assert obj.max_pending_rows == 5
+        assert obj.policy == "throttle"
+        assert obj.low_priority_inputs == ["bmv"]
+        assert obj.throttle_factor == 3
+        assert Backpressure(policy="bad").policy == "drop_oldest"
+
+    def test_drop_oldest(self, helper_manager):
+        """Test drop_oldest policy."""
+        obj = Backpressure(max_pending_rows=5)
+        helper_manager.add_rows(obj, 8)
+        assert obj.check(
+            helper_manager.get_outputs(), helper_manager.cache
+        ) == 3
+        assert helper_manager.worker.get_last_saved_time() == 13
+        stats = obj.get_stats()
+        assert stats['shed_events'] == 1
+        assert stats['dropped_rows'] == {'out': 3}
+        assert stats['max_pending'] == {'out': 8}
+        # sent rows are forgotten
+        assert obj.get_pending_rows(0) == [13, 14, 15, 16, 17]
+        assert obj.check(
+            helper_manager.get_outputs(), helper_manager.cache
+        ) == 0
+
+    def test_rollup(self, helper_manager):
+        """Test rollup policy."""
+        obj = Backpressure(max_pending_rows=5, policy="rollup")
+        helper_manager.add_rows(obj, 8)
+        assert obj.check(
+            helper_manager.get_outputs(), helper_manager.cache
+        ) == 4
+        assert helper_manager.worker.get_last_saved_time() == 0
+        assert obj.get_pending_rows(0) == [13, 14, 15, 16, 17]
+        assert helper_manager.cache.data[13] == {'node': {'V': 14}}
+        assert 10 not in helper_manager.cache.data
+        assert obj.get_stats()['rollup_rows'] == 4
+
+    def test_throttle(self, helper_manager):
+        """Test throttle policy."""
+        threads = ThreadsController()
+        assert threads.add_timer_key("0_serial_bmv_0", 1, print) is True
+        input_timers = {'bmv': ("0_serial_bmv_0", 1)}
+        obj = Backpressure(
+            max_pending_rows=4,
+            policy="throttle",
+            low_priority_inputs=["bmv"],
+            throttle_factor=3
+        )
+        helper_manager.add_rows(obj, 6)
+        assert obj.check(
+            helper_manager.get_outputs(), helper_manager.cache,
+            threads, input_timers
+        ) == 0
+        assert obj.throttled is True
+        assert threads._timers["0_serial_bmv_0"].interval == 3
+        assert obj.get_stats()['throttle_events'] == 1
+        # over twice max_pending_rows oldest rows are dropped
+        helper_manager.add_rows(obj, 4, start=16)
+        assert obj.check(
+            helper_manager.get_outputs(), helper_manager.cache,
+            threads, input_timers
+        ) == 6
+        # restore interval when outputs are back
+        helper_manager.worker.set_last_saved_time(19)
+        obj.check(
+            helper_manager.get_outputs(), helper_manager.cache,
+            threads, input_timers
+        )
+        assert obj.throttled is False
+        assert threads._timers["0_serial_bmv_0"].interval == 1
@@ -0,0 +1,141 @@
+"""Test BatchChecker module."""
+import inspect
+from os import path as Opath
+import pytest
+from vemonitor_m8.conf_manager.data_structure_loader import DataStructureLoader
+from vemonitor_m8.core.batch_checker import BatchChecker
+from vemonitor_m8.core.data_checker import DataChecker
+from vemonitor_m8.core.exceptions import DeviceDataConfError
+
+
+@pytest.fixture(name="helper_manager", scope="class")
+def helper_manager_fixture():
+    """BatchChecker test manager fixture"""
+    class HelperManager:
+        """BatchChecker test manager fixture Class"""
+
+        def __init__(self):
+            current_script_path = Opath.dirname(
+                Opath.abspath(
+                    inspect.getfile(inspect.currentframe())
+                )
+            )
+            loader = DataStructureLoader(
+                file_names="dummy_g_conf.yaml",
+                file_path=Opath.join(current_script_path, "conf")
+            )
+            self.checkers = loader.get_yaml_data_structure().get('points')
+            self.columns = ['H10', 'H6', 'H7', 'H9']
+            self.rows = [
+                {'H10': '26', 'H6': '-5526739', 'H7': '11733', 'H9': '3683'},
+                {'H10': '27', 'H6': '-5526000', 'H7': '11740', 'H9': '3690'},
+                {'H10': 28, 'H6': -5525000, 'H7': 11750, 'V': '12800'}
+            ]
+
+    return HelperManager()
+
+
+class TestBatchChecker:
+    """Test BatchChecker class."""
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_check_rows(self, helper_manager, use_numpy):
+        """Test check_rows method."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        obj = BatchChecker(
+            helper_manager.columns,
+            helper_manager.checkers,
+            use_numpy=use_numpy
+        )
+        rows, errors = obj.check_rows(helper_manager.rows)
+        assert errors == []
+        # same results than row by row checks, out of columns are ignored
+        assert rows == [
+            DataChecker.check_input_plan(row, obj.plan)
+            for row in helper_manager.rows
+        ]
+        assert rows[0] == {
+            'H10': 26, 'H6': -5526.739, 'H7': 11.733, 'H9': 3683
+        }
+        assert 'V' not in rows[2]
+        assert obj.check_rows([]) == ([], [])
+
+    def test_check_rows_errors(self, helper_manager):
+        """Test check_rows method with invalid values."""
+        obj = BatchChecker(helper_manager.columns, helper_manager.checkers)
+        rows, errors = obj.check_rows([
+            {'H10': '26', 'H6': '-5526739'},
+            {'H10': 26.5, 'H6': '-5526739'},
+            {'H10': '27', 'H6': 25.2}
+        ])
+        assert [(row, col) for row, col, _ in errors] == [(1, 0), (2, 1)]
+        assert rows == [
+            {'H10': 26, 'H6': -5526.739},
+            {'H6': -5526.739},
+            {'H10': 27}
+        ]
+
+    def test_check_columns(self, helper_manager):
+        """Test check_columns method."""
+        obj = BatchChecker(
+            helper_manager.columns,
+            helper_manager.checkers,
+            local_checkers={
+                'H10': {
+                    'name': 'Number of automatic synchronizations',
+                    'input_type': 'int',
+                    'output_type': 'float',
+                    'floatpoint': 0.1
+                }
+            }
+        )
+        data, errors = obj.check_columns({
+            'H10': ['26', '27', 'bad'],
+            'H7': ['11733', 11740],
+            'V': ['12800']
+        })
+        assert errors == []
+        assert data == {'H10': [2.6, 2.7, 0.0], 'H7': [11.733, 11.74]}
+
+    def test_check_float_columns(self):
+        """Test non integer floats are rounded like row by row checks."""
+        pytest.importorskip("numpy")
+        checkers = {
+            'V': {'input_type': 'float', 'output_type': 'float'},
+            'I': {
+                'input_type': 'numeric',
+                'output_type': 'float',
+                'floatpoint': 0.01
+            }
+        }
+        values = [886.9165, -395.15, 0.0005, 12.3456, -1.2345, 2.675]
+        values.extend(i / 10000 - 1000 for i in range(0, 20000000, 997))
+        obj = BatchChecker(['V', 'I'], checkers)
+        assert obj.is_numpy_column('V', values) is True
+        data, errors = obj.check_columns({
+            'V': values,
+            'I': [str(value) for value in values]
+        })
+        assert errors == []
+        assert data['V'] == [obj.plan['V'](value) for value in values]
+        assert data['I'] == [obj.plan['I'](str(value)) for value in values]
+        assert data['V'][0] == 886.917
+        assert data['I'][1] == -3.951
+
+    def test_bad_checker(self, helper_manager):
+        """Test checkers configuration errors are raised on init."""
+        with pytest.raises(DeviceDataConfError):
+            BatchChecker(['H10', 'bad_column'], helper_manager.checkers)
+        with pytest.raises(DeviceDataConfError):
+            BatchChecker(
+                ['H10'],
+                helper_manager.checkers,
+                local_checkers={
+                    'H10': {
+                        'input_type': 'int',
+                        'output_type': 'float',
+                        'floatpoint': '0.1'
+                    }
+                }
+            )
@@ -0,0 +1,87 @@
+"""Test BlockSupervisor module."""
+import multiprocessing
+import os
+import time
+import pytest
+from vemonitor_m8.core import block_supervisor
+from vemonitor_m8.core.block_supervisor import BlockSupervisor
+
+
+def run_shard_test(pids, block_indexes: list):
+    """Shard process test entry point, waiting to be terminated."""
+    pids.put(os.getpid())
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def run_supervisor_test(pids):
+    """Supervisor process test entry point, with one test shard."""
+    block_supervisor.run_shard = run_shard_test
+    obj = BlockSupervisor.__new__(BlockSupervisor)
+    obj.conf = pids
+    obj.processes = []
+    obj.shards = [[0]]
+    obj.run()
+
+
+def get_block(name: str, serial: list, redis: list) -> dict:
+    """Get app block with serial inputs and redis outputs sources."""
+    return {
+        'name': name,
+        'app': 'test',
+        'inputs': {
+            'serial': [{'source': source} for source in serial]
+        },
+        'outputs': {
+            'redis': [{'source': source} for source in redis]
+        }
+    }
+
+
+class TestBlockSupervisor:
+    """Test BlockSupervisor class."""
+
+    def test_get_block_exclusive_keys(self):
+        """Test get_block_exclusive_keys method."""
+        block = get_block("a", ["bmv700", "mppt"], ["local"])
+        assert BlockSupervisor.get_block_exclusive_keys(block) == {
+            ("serial", "bmv700"), ("serial", "mppt")
+        }
+
+    def test_get_blocks_groups(self):
+        """Test blocks sharing a serial port are grouped."""
+        app_blocks = [
+            get_block("a", ["bmv700"], ["local"]),
+            get_block("b", ["mppt1"], ["local"]),
+            get_block("c", ["mppt2"], ["local"]),
+            get_block("d", ["mppt1", "mppt2"], ["local"]),
+            get_block("e", ["bmv702"], ["local"]),
+        ]
+        groups = BlockSupervisor.get_blocks_groups(app_blocks)
+        assert sorted(groups) == [[0], [1, 2, 3], [4]]
+
+    def test_get_shards(self):
+        """Test get_shards method."""
+        groups = [[0], [1, 2, 3], [4], [5]]
+        assert BlockSupervisor.get_shards(groups, nb_processes=2) == [
+            [1, 2, 3], [0, 4, 5]
+        ]
+        assert BlockSupervisor.get_shards(groups, nb_processes=8) == [
+            [1, 2, 3], [0], [4], [5]
+        ]
+
+    def test_terminate(self):
+        """Test shard processes are stopped if supervisor is terminated."""
+        pids = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=run_supervisor_test,
+            args=(pids,)
+        )
+        process.start()
+        shard_pid = pids.get(timeout=5)
+        process.terminate()
+        process.join(timeout=10)
+        assert process.exitcode is not None
+        with pytest.raises(ProcessLookupError):
+            os.kill(shard_pid, 0)
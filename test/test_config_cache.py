@@ -0,0 +1,127 @@
+"""Test ConfigCache module."""
+import inspect
+import os
+import shutil
+from os import path as Opath
+import pytest
+from vemonitor_m8.conf_manager.config_cache import ConfigCache
+from vemonitor_m8.conf_manager.config_loader import ConfigLoader
+from vemonitor_m8.models.config import Config
+
+
+@pytest.fixture(name="helper_manager", scope="class")
+def helper_manager_fixture():
+    """Config cache test manager fixture"""
+    class HelperManager:
+        """Config cache test manager fixture Class"""
+        def __init__(self):
+            current_script_path = Opath.dirname(
+                Opath.abspath(
+                    inspect.getfile(inspect.currentframe())
+                )
+            )
+            self.test_path = Opath.join(
+                current_script_path,
+                "conf"
+            )
+
+        def copy_conf(self, path) -> str:
+            """Copy test configuration files to path."""
+            conf_path = Opath.join(str(path), "conf")
+            shutil.copytree(self.test_path, conf_path)
+            return conf_path
+
+    return HelperManager()
+
+
+class TestConfigCache:
+    """Test ConfigCache class."""
+
+    def test_fingerprint(self, tmp_path):
+        """Test get_fingerprint and is_unchanged methods."""
+        file_path = tmp_path / "conf.yaml"
+        file_path.write_text("a: 1\n", encoding="utf-8")
+        fingerprint = ConfigCache.get_fingerprint(str(file_path))
+        assert fingerprint.get("size") == 5
+        assert ConfigCache.is_unchanged(fingerprint) is True
+        # same content with new mtime is unchanged
+        os.utime(file_path, ns=(0, fingerprint.get("mtime") + 10 ** 9))
+        assert ConfigCache.is_unchanged(fingerprint) is True
+        file_path.write_text("a: 2\n", encoding="utf-8")
+        os.utime(file_path, ns=(0, fingerprint.get("mtime") + 10 ** 9))
+        assert ConfigCache.is_unchanged(fingerprint) is False
+        file_path.unlink()
+        assert ConfigCache.is_unchanged(fingerprint) is False
+        assert ConfigCache.get_fingerprint(str(file_path)) is None
+
+    def test_load_and_save(self, tmp_path):
+        """Test load and save methods."""
+        file_path = tmp_path / "conf.yaml"
+        file_path.write_text("a: 1\n", encoding="utf-8")
+        obj = ConfigCache(str(tmp_path / "cache"))
+        params = {"app_name": "test"}
+        conf = Config()
+        assert obj.load(params) is None
+        assert obj.save(params, [str(file_path)], conf) is True
+        assert isinstance(obj.load(params), Config)
+        assert obj.load({"app_name": "other"}) is None
+        assert obj.save(params, [str(tmp_path / "bad.yaml")], conf) is False
+
+        file_path.write_text("a: 22\n", encoding="utf-8")
+        assert obj.load(params) is None
+
+        # a missing searched file is created
+        missing_path = tmp_path / "first.yaml"
+        assert obj.save(
+            params, [str(file_path)], conf, [str(missing_path)]
+        ) is True
+        assert isinstance(obj.load(params), Config)
+        assert obj.sources == [str(file_path)]
+        missing_path.write_text("a: 1\n", encoding="utf-8")
+        assert obj.load(params) is None
+
+        # corrupted cache file
+        with open(obj.get_file_path(params), "wb") as file:
+            file.write(b"bad pickle")
+        assert obj.load(params) is None
+
+    def test_config_loader(self, helper_manager, tmp_path):
+        """Test ConfigLoader with cache_dir."""
+        conf_path = helper_manager.copy_conf(tmp_path)
+        cache_dir = str(tmp_path / "cache")
+        settings = ConfigLoader(conf_path, cache_dir=cache_dir)\
+            .get_settings_from_schema(app_name="batSerialMonitor")
+        assert settings.is_valid()
+        assert len(os.listdir(cache_dir)) == 1
+
+        loader = ConfigLoader(conf_path, cache_dir=cache_dir)
+        cached = loader.get_settings_from_schema(app_name="batSerialMonitor")
+        assert Opath.join(conf_path, "dummy_g_conf.yaml")\
+            in loader.loaded_files
+        assert cached.serialize() == settings.serialize()
+        assert loader.missing_files\
+            == [Opath.join(conf_path, "vm_conf.yaml")]
+
+        # an included file is changed
+        with open(Opath.join(conf_path, "dummy_g_appConnectors.yaml"),
+                  "a", encoding="utf-8") as file:
+            file.write("\n# changed\n")
+        cached = loader.get_settings_from_schema(app_name="batSerialMonitor")
+        assert Opath.join(conf_path, "dummy_g_appConnectors.yaml")\
+            in loader.loaded_files
+        assert cached.serialize() == settings.serialize()
+
+        # a configuration file is created on a higher priority path
+        params = {
+            "file_path": loader.file_path,
+            "child_list": None,
+            "keys_list": None,
+            "app_name": "batSerialMonitor",
+            "block_name": None
+        }
+        assert isinstance(loader.cache.load(params), Config)
+        shutil.copy(
+            Opath.join(conf_path, "dummy_g_conf.yaml"),
+            Opath.join(conf_path, "vm_conf.yaml")
+        )
+        assert loader.cache.load(params) is None
@@ -0,0 +1,145 @@
+"""Test config_reload module."""
+import copy
+import inspect
+import shutil
+import time
+from os import path as Opath
+import pytest
+from vemonitor_m8.conf_manager.config_loader import ConfigLoader
+from vemonitor_m8.core.config_reload import ConfigDiff, ConfigReloader
+from vemonitor_m8.models.config import Config
+
+
+@pytest.fixture(name="helper_manager", scope="class")
+def helper_manager_fixture():
+    """Config reload test manager fixture"""
+    class HelperManager:
+        """Config reload test manager fixture Class"""
+        def __init__(self):
+            current_script_path = Opath.dirname(
+                Opath.abspath(
+                    inspect.getfile(inspect.currentframe())
+                )
+            )
+            self.test_path = Opath.join(
+                current_script_path,
+                "conf"
+            )
+            self.conf = ConfigLoader(self.test_path)\
+                .get_settings_from_schema(app_name="batSerialMonitor")
+
+        def copy_conf(self, path) -> str:
+            """Copy test configuration files to path."""
+            conf_path = Opath.join(str(path), "conf")
+            shutil.copytree(self.test_path, conf_path)
+            return conf_path
+
+        def get_conf(self) -> Config:
+            """Get a copy of test configuration."""
+            return copy.deepcopy(self.conf)
+
+    return HelperManager()
+
+
+class TestConfigDiff:
+    """Test ConfigDiff class."""
+
+    def test_diff_items(self, helper_manager):
+        """Test diff_items and get_item_changes methods."""
+        old_conf = helper_manager.get_conf()
+        conf = helper_manager.get_conf()
+        old_block, block = old_conf.app_blocks[0], conf.app_blocks[0]
+        name = "serial_bmv700_bmv700"
+        diff = ConfigDiff.diff_items(
+            old_conf, conf, old_block, block, 'inputs'
+        )
+        assert diff.get('unchanged') == [name]
+
+        # columns order is not a change
+        block['inputs']['serial'][0]['columns'].reverse()
+        block['inputs']['serial'][0]['time_interval'] = 2
+        diff = ConfigDiff.diff_items(
+            old_conf, conf, old_block, block, 'inputs'
+        )
+        assert diff.get('changed') == [name]
+        assert diff.get('reconnect') == []
+        assert ConfigDiff.get_item_changes(
+            old_block['inputs']['serial'][0],
+            block['inputs']['serial'][0]
+        ) == ['time_interval']
+
+        # connector changed
+        conf.app_connectors['serial']['bmv700']['serialPort'] = "/dev/tty1"
+        diff = ConfigDiff.diff_items(
+            old_conf, conf, old_block, block, 'inputs'
+        )
+        assert diff.get('changed') == [name]
+        assert diff.get('reconnect') == [name]
+
+        # item renamed
+        block['inputs']['serial'][0]['name'] = "bmv"
+        diff = ConfigDiff.diff_items(
+            old_conf, conf, old_block, block, 'inputs'
+        )
+        assert diff.get('added') == ["serial_bmv700_bmv"]
+        assert diff.get('removed') == [name]
+
+    def test_diff_blocks(self, helper_manager):
+        """Test diff_blocks and get_block_changes methods."""
+        old_conf = helper_manager.get_conf()
+        conf = helper_manager.get_conf()
+        assert ConfigDiff.diff_blocks(old_conf, conf).get('unchanged')\
+            == ["bmvFakeSerial"]
+        assert ConfigDiff.get_block_by_name(conf, "bmvFakeSerial")[0] == 0
+        assert ConfigDiff.get_block_by_name(conf, "bad") == (None, None)
+
+        conf.app_blocks[0]['redis_cache']['max_data_points'] = 60
+        assert ConfigDiff.get_block_changes(
+            old_conf.app_blocks[0], conf.app_blocks[0]
+        ) == ['redis_cache']
+        assert ConfigDiff.diff_blocks(old_conf, conf).get('changed')\
+            == ["bmvFakeSerial"]
+
+        conf.app_blocks[0]['name'] = "renamed"
+        diff = ConfigDiff.diff_blocks(old_conf, conf)
+        assert diff.get('added') == ["renamed"]
+        assert diff.get('removed') == ["bmvFakeSerial"]
+
+
+class TestConfigReloader:
+    """Test ConfigReloader class."""
+
+    def test_reload(self, helper_manager, tmp_path):
+        """Test is_due and load methods."""
+        conf_path = helper_manager.copy_conf(tmp_path)
+        loader = ConfigLoader(conf_path)
+        conf = loader.get_settings_from_schema(app_name="batSerialMonitor")
+        assert conf.is_valid()
+        obj = ConfigReloader(
+            loader,
+            params={"app_name": "batSerialMonitor"},
+            watch_interval=0.01
+        )
+        time.sleep(0.02)
+        assert obj.is_due() is False
+        obj.request()
+        assert obj.is_due() is True
+        assert isinstance(obj.load(), Config)
+        assert obj.is_due() is False
+
+        # an included file is changed
+        connectors_path = Opath.join(conf_path, "dummy_g_appConnectors.yaml")
+        with open(connectors_path, "a", encoding="utf-8") as file:
+            file.write("\n# changed\n")
+        time.sleep(0.02)
+        assert obj.is_due() is True
+        assert isinstance(obj.load(), Config)
+
+        # invalid configuration is ignored until changed again
+        with open(connectors_path, "a", encoding="utf-8") as file:
+            file.write("\nbad: [\n")
+        time.sleep(0.02)
+        assert obj.is_due() is True
+        assert obj.load() is None
+        time.sleep(0.02)
+        assert obj.is_due() is False
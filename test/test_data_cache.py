@@ -220,3 +220,23 @@ class TestDataChecker:
         }
         assert max_time == 1722013487
         assert last_time == 1722013488
+
+    def test_rollup_rows(self, helper_manager):
+        """Test rollup_rows method."""
+        helper_manager.obj.reset_data_cache()
+        helper_manager.obj.register_node('pytest_1')
+        for i, value in enumerate([12, 13, 14]):
+            assert helper_manager.obj.add_data_cache(
+                time_key=1722013441 + i,
+                node="pytest_1",
+                data={'V': value, 'I': 1.5 + i, 'PID': "0xA053"}
+            ) is True
+        assert helper_manager.obj.rollup_rows(
+            [1722013441, 1722013442, 1722013443]
+        ) is True
+        assert helper_manager.obj.data == {
+            1722013443: {'pytest_1': {'V': 13, 'I': 2.5, 'PID': "0xA053"}}
+        }
+        # nothing to aggregate
+        assert helper_manager.obj.rollup_rows([1722013443]) is False
+        assert helper_manager.obj.rollup_rows([]) is False
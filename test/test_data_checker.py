@@ -232,3 +232,58 @@ class TestDataChecker:
         assert Ut.is_dict(result, not_null=True) and len(data) == len(result)
         item = result.get('H10')
         assert Ut.is_float(item) and item == 2.6
+
+    def test_compile_plan(self, helper_manager):
+        """Test compile_plan and check_input_plan methods """
+        data = {'H10': '26', 'H6': '-5526739',
+                'H7': '11733', 'H8': '16161', 'H9': '368301'}
+        checkers = helper_manager.checkers.get('points')
+        plan = DataChecker.compile_plan(list(data), checkers)
+        assert sorted(plan) == sorted(data)
+        result = DataChecker.check_input_plan(data, plan)
+        assert result == DataChecker.check_input_columns(
+            columns=data,
+            checkers=checkers
+        )
+        assert Ut.is_int(result.get('H10')) and result.get('H10') == 26
+        assert Ut.is_float(result.get('H6'))\
+            and result.get('H6') == -5526.739
+
+        local_checkers = {
+            'H10': {
+                'name': 'Number of automatic synchronizations',
+                'input_type': 'int',
+                'output_type': 'float',
+                'floatpoint': 0.1
+            }
+        }
+        plan = DataChecker.compile_plan(list(data), checkers, local_checkers)
+        result = DataChecker.check_input_plan(data, plan)
+        assert Ut.is_float(result.get('H10')) and result.get('H10') == 2.6
+        # columns out of plan are ignored
+        assert DataChecker.check_input_plan({'V': '12800'}, plan) == {}
+        assert DataChecker.check_input_plan({}, plan) is None
+
+    def test_compile_plan_errors(self, helper_manager):
+        """Test compiled plan errors are raised on check """
+        checkers = helper_manager.checkers.get('points')
+        local_checkers = {
+            'H10': {
+                'name': 'Number of automatic synchronizations',
+                'input_type': 'int',
+                'output_type': 'float',
+                'floatpoint': '0.1'
+            },
+            'H7': {'name': 'Bad checker'}
+        }
+        plan = DataChecker.compile_plan(
+            ['H10', 'H6', 'H7'], checkers, local_checkers
+        )
+        assert DataChecker.check_input_plan({'H6': '-5526739'}, plan)\
+            == {'H6': -5526.739}
+        with pytest.raises(DeviceDataConfError):
+            DataChecker.check_input_plan({'H10': '26'}, plan)
+        with pytest.raises(DeviceDataConfError):
+            DataChecker.check_input_plan({'H7': '11733'}, plan)
+        with pytest.raises(DeviceInputValueError):
+            DataChecker.check_input_plan({'H6': 25.2}, plan)
@@ -0,0 +1,81 @@
+"""Test DeadbandFilter module."""
+from vemonitor_m8.core.deadband_filter import DeadbandFilter, LastValueCarry
+
+
+class TestDeadbandFilter:
+    """Test DeadbandFilter class."""
+
+    def test_from_points(self):
+        """Test from_points method."""
+        obj = DeadbandFilter.from_points({
+            'V': {'name': 'Voltage', 'deadband': {'abs': 0.05}},
+            'Relay': {'name': 'Relay', 'deadband': {'heartbeat': 300}},
+            'I': {'name': 'Current'}
+        })
+        assert obj.rules == {
+            'V': {'abs': 0.05, 'rel': 0, 'heartbeat': 60},
+            'Relay': {'abs': 0, 'rel': 0, 'heartbeat': 300}
+        }
+        assert DeadbandFilter.from_points({'I': {'name': 'Current'}}) is None
+        assert DeadbandFilter.from_points(None) is None
+
+    def test_is_changed(self):
+        """Test is_changed method."""
+        rule = DeadbandFilter.get_rule({'abs': 0.05, 'rel': 0.01})
+        assert DeadbandFilter.is_changed(rule, 12.8, 12.8) is False
+        assert DeadbandFilter.is_changed(rule, 12.86, 12.8) is False
+        assert DeadbandFilter.is_changed(rule, 13, 12.8) is True
+        rule = DeadbandFilter.get_rule({})
+        assert DeadbandFilter.is_changed(rule, "ON", "OFF") is True
+        assert DeadbandFilter.is_changed(rule, 1, 1) is False
+
+    def test_filter_data(self):
+        """Test filter_data method."""
+        obj = DeadbandFilter({
+            'V': DeadbandFilter.get_rule({'abs': 0.05, 'heartbeat': 10}),
+            'Relay': DeadbandFilter.get_rule({})
+        })
+        row = {'V': 12.8, 'Relay': "OFF", 'I': 1.5, 'time': 100}
+        assert obj.filter_data(100, "bmv", row) == row
+        # unchanged values are suppressed, time keys are kept
+        result = obj.filter_data(
+            101, "bmv", {'V': 12.82, 'Relay': "OFF", 'I': 1.5, 'time': 101}
+        )
+        assert result == {'I': 1.5, 'time': 101}
+        assert obj.filter_data(102, "bmv", {'V': 12.9})\
+            == {'V': 12.9}
+        # other node has his own last values
+        assert obj.filter_data(102, "mppt", {'V': 12.9}) == {'V': 12.9}
+        # heartbeat
+        assert obj.filter_data(160, "bmv", {'Relay': "OFF"})\
+            == {'Relay': "OFF"}
+        assert DeadbandFilter.has_values({'time': 101}) is False
+        assert obj.get_stats() == {'kept': 5, 'suppressed': 2}
+
+
+class TestLastValueCarry:
+    """Test LastValueCarry class."""
+
+    def test_fill(self):
+        """Test fill method."""
+        obj = LastValueCarry()
+        structure = {'bmv': ['V', 'Relay']}
+        data = {
+            101: {'bmv': {'V': 12.9}},
+            100: {'bmv': {'V': 12.8, 'Relay': "OFF"}}
+        }
+        result = obj.fill(data, structure)
+        assert result == {
+            100: {'bmv': {'V': 12.8, 'Relay': "OFF"}},
+            101: {'bmv': {'V': 12.9, 'Relay': "OFF"}}
+        }
+        # cache data is not modified
+        assert data[101] == {'bmv': {'V': 12.9}}
+        # last values are kept from previous calls
+        assert obj.fill({102: {}}, structure) == {
+            102: {'bmv': {'V': 12.9, 'Relay': "OFF"}}
+        }
+        # older rows are not filled with more recent values
+        assert obj.fill({99: {'bmv': {'V': 12.7}}}, structure) == {
+            99: {'bmv': {'V': 12.7}}
+        }
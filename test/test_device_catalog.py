@@ -0,0 +1,72 @@
+"""Test DeviceCatalog module."""
+import pytest
+from vemonitor_m8.conf_manager.config_cache import ConfigCache
+from vemonitor_m8.conf_manager.config_loader_helper\
+    import ConfigLoaderHelper as cHelp
+from vemonitor_m8.conf_manager.device_catalog import DeviceCatalog
+from vemonitor_m8.conf_manager.yaml_loader import YmlConfLoader
+
+
+@pytest.fixture(name="helper_manager", scope="class")
+def helper_manager_fixture():
+    """DeviceCatalog test manager fixture"""
+    class HelperManager:
+        """DeviceCatalog test manager fixture Class"""
+        def __init__(self):
+            self.source_path = DeviceCatalog.get_source_path()
+            self.obj = DeviceCatalog.from_yaml(self.source_path)
+
+    return HelperManager()
+
+
+class TestDeviceCatalog:
+    """Test DeviceCatalog class."""
+
+    def test_index_is_up_to_date(self, helper_manager):
+        """Test shipped index matches yaml source."""
+        index = DeviceCatalog.from_index(
+            ConfigCache.get_file_hash(helper_manager.source_path)
+        )
+        assert index is not None
+        assert index.devices == helper_manager.obj.devices
+        assert index.points == helper_manager.obj.points
+        assert DeviceCatalog.from_index("outdated") is None
+
+    def test_load(self, helper_manager):
+        """Test load method."""
+        loaded_files = []
+        obj = DeviceCatalog.load(loaded_files=loaded_files)
+        assert loaded_files == [helper_manager.source_path]
+        assert obj.points == helper_manager.obj.points
+
+    def test_get_data_structure(self, helper_manager):
+        """Test get_data_structure and points views methods."""
+        obj = helper_manager.obj
+        columns = ['V', 'I', 'SOC', 'H17']
+        data = obj.get_data_structure(points=columns)
+        assert data == cHelp.get_data_structure(
+            data_structure=YmlConfLoader.get_config(
+                helper_manager.source_path
+            ),
+            points=columns
+        )
+        data['points']['V']['unit'] = "mV"
+        assert obj.get_point('V').get('unit') == "V"
+        assert obj.get_point('bad') is None
+        assert list(obj.get_data_structure(
+            devices=['MPPT']
+        ).get('devices')) == ['MPPT']
+        assert obj.get_device_columns('bad') == []
+        assert set(obj.get_device_points('ARDMONITOR'))\
+            == {'t_bat', 't_int', 't_ext'}
+
+    def test_write_index(self, helper_manager, tmp_path):
+        """Test write_index method."""
+        path = tmp_path / "index.py"
+        assert DeviceCatalog.write_index(str(path)) is True
+        index = {}
+        exec(path.read_text(encoding="utf-8"), index)  # pylint: disable=W0122
+        assert index.get('SOURCE_HASH') == ConfigCache.get_file_hash(
+            helper_manager.source_path
+        )
+        assert index.get('POINTS') == helper_manager.obj.points
@@ -0,0 +1,79 @@
+"""Test FifoLock module."""
+import threading
+import time
+from vemonitor_m8.core.fifo_lock import FifoLock
+
+
+class TestFifoLock:
+    """Test FifoLock class."""
+
+    def test_acquire(self):
+        """Test acquire and release methods."""
+        obj = FifoLock()
+        assert obj.is_locked() is False
+        assert obj.acquire("bmv", timeout=1) is True
+        assert obj.is_locked() is True
+        assert obj.is_owner("bmv") is True
+        assert obj.is_owner("mppt") is False
+        # same caller on same thread don't wait
+        assert obj.acquire("bmv", timeout=0) is True
+        # other caller waits until timeout
+        assert obj.acquire("mppt", timeout=0.05) is False
+        obj.release()
+        assert obj.is_locked() is False
+        assert obj.acquire("mppt", timeout=0) is True
+        obj.release()
+        stats = obj.get_stats()
+        assert stats['acquired'] == 2
+        assert stats['timeouts'] == 1
+        assert stats['waiting'] == 0
+
+    def test_fifo_order(self):
+        """Test lock is granted in arrival order."""
+        obj = FifoLock()
+        order = []
+
+        def worker(name: str):
+            assert obj.acquire(name, timeout=5) is True
+            order.append(name)
+            obj.release()
+
+        assert obj.acquire("main") is True
+        threads = []
+        for i in range(5):
+            thread = threading.Thread(target=worker, args=(f"caller_{i}",))
+            thread.start()
+            threads.append(thread)
+            # let thread queue before starting next one
+            while obj.get_stats()['waiting'] < i + 1:
+                time.sleep(0.001)
+        obj.release()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert order == [f"caller_{i}" for i in range(5)]
+        stats = obj.get_stats()
+        assert stats['acquired'] == 6
+        assert stats['max_wait'] > 0
+        assert stats['mean_wait'] > 0
+
+    def test_timeout_skip(self):
+        """Test timed out caller don't block next callers."""
+        obj = FifoLock()
+        results = {}
+
+        def worker(name: str, timeout: float):
+            results[name] = obj.acquire(name, timeout=timeout)
+            if results[name]:
+                obj.release()
+
+        assert obj.acquire("main") is True
+        first = threading.Thread(target=worker, args=("first", 0.05))
+        first.start()
+        while obj.get_stats()['waiting'] < 1:
+            time.sleep(0.001)
+        second = threading.Thread(target=worker, args=("second", 5))
+        second.start()
+        first.join(timeout=5)
+        obj.release()
+        second.join(timeout=5)
+        assert results == {'first': False, 'second': True}
@@ -0,0 +1,277 @@
+"""Test FileSinkOutputWorker module."""
+import csv
+import json
+import os
+import pytest
+from vemonitor_m8.core.exceptions import SettingInvalidException
+from vemonitor_m8.workers.file_sink.file_sink import FileSink, FileSinkApp
+from vemonitor_m8.workers.file_sink.file_sink_worker import (
+    FileSinkOutputWorker, FileSinkWorkerHelper
+)
+from vemonitor_m8.workers.file_sink.file_writers import (
+    FileWriter, FileWriterHelper, NdjsonWriter
+)
+from vemonitor_m8.workers.workers_manager import WorkersManager
+
+
+@pytest.fixture(name="helper_manager", scope="function")
+def helper_manager_fixture(tmp_path):
+    """FileSinkOutputWorker test manager fixture"""
+    class HelperManager:
+        """FileSinkOutputWorker test manager fixture Class"""
+        def __init__(self):
+            self.path = str(tmp_path)
+            self.data = {
+                1700000001: {'bmv700': {'V': 12.6, 'I': None}},
+                1700000000: {'bmv700': {'V': 12.5, 'I': 1, 'Relay': "ON"}}
+            }
+            self.workers = []
+
+        def get_worker(self, **kwargs) -> FileSinkOutputWorker:
+            """Get FileSinkOutputWorker instance, in tmp directory."""
+            item = {
+                'name': "history",
+                'source': "local",
+                'time_interval': 1,
+                'columns': {'bmv700': ['V', 'I', 'Relay']}
+            }
+            item.update(kwargs)
+            worker = FileSinkOutputWorker({
+                'connector': {
+                    'path': self.path,
+                    'fsync_interval': 0,
+                    'retention_days': 1
+                },
+                'worker_key': "file",
+                'enum_key': 0,
+                'item': item
+            })
+            self.workers.append(worker)
+            return worker
+
+        def get_sink_dir(self) -> str:
+            """Get history sink directory."""
+            return os.path.join(self.path, "history")
+
+        def get_index(self) -> dict:
+            """Get history sink index files."""
+            path = os.path.join(self.get_sink_dir(), FileSink.INDEX_FILE)
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file).get('files')
+
+        def close(self):
+            """Close workers."""
+            for worker in self.workers:
+                worker.close()
+
+    helper = HelperManager()
+    yield helper
+    helper.close()
+
+
+class TestFileSinkWorkerHelper:
+    """Test FileSinkWorkerHelper class."""
+
+    def test_get_rows(self, helper_manager):
+        """Test get_rows and get_flat_columns methods."""
+        columns = {'bmv700': ['V', 'Relay']}
+        assert FileSinkWorkerHelper.get_flat_columns(columns)\
+            == ["bmv700.V", "bmv700.Relay"]
+        assert FileSinkWorkerHelper.get_rows(
+            helper_manager.data, columns
+        ) == [
+            (1700000000, {'bmv700.V': 12.5, 'bmv700.Relay': "ON"}),
+            (1700000001, {'bmv700.V': 12.6})
+        ]
+        assert FileSinkWorkerHelper.get_rows({}, columns) == []
+
+    def test_get_flat_types(self):
+        """Test get_flat_types method."""
+        columns = {'bmv700': ['V', 'Relay', 'H1']}
+        assert FileSinkWorkerHelper.get_flat_types(
+            columns, {'V': "float", 'Relay': "str"}
+        ) == {'bmv700.V': "float", 'bmv700.Relay': "str"}
+        assert FileSinkWorkerHelper.get_flat_types(columns, None) == {}
+
+    def test_get_writer_class(self):
+        """Test writers formats, and pyarrow fall back."""
+        assert FileWriterHelper.get_formats()\
+            == ["ndjson", "csv", "arrow", "parquet"]
+        assert FileWriterHelper.get_writer_class("bad") is None
+        if not FileWriter.has_pyarrow():
+            assert FileWriterHelper.get_writer_class("parquet")\
+                is NdjsonWriter
+
+
+class TestFileSinkOutputWorker:
+    """Test FileSinkOutputWorker class."""
+
+    def test_send_data_ndjson(self, helper_manager):
+        """Test send_data method, with ndjson format."""
+        worker = helper_manager.get_worker()
+        assert worker.get_worker_status() is True
+        assert isinstance(worker.worker, FileSinkApp)
+        assert worker.send_data(helper_manager.data, worker.columns) is True
+        assert worker.send_data({}, worker.columns) is False
+
+        index = helper_manager.get_index()
+        file_name = "history_20231114T221320Z.ndjson"
+        assert index[file_name]['start'] == 1700000000
+        assert index[file_name]['end'] == 1700000001
+        assert index[file_name]['rows'] == 2
+        worker.close()
+        path = os.path.join(helper_manager.get_sink_dir(), file_name)
+        with open(path, "r", encoding="utf-8") as file:
+            assert [json.loads(line) for line in file] == [
+                {'time': 1700000000, 'bmv700.V': 12.5,
+                 'bmv700.I': 1, 'bmv700.Relay': "ON"},
+                {'time': 1700000001, 'bmv700.V': 12.6, 'bmv700.I': None}
+            ]
+        assert helper_manager.get_index()[file_name]['size']\
+            == os.path.getsize(path)
+
+    def test_send_data_csv(self, helper_manager):
+        """Test send_data method, with csv format."""
+        worker = helper_manager.get_worker(format="csv")
+        assert worker.send_data(helper_manager.data, worker.columns) is True
+        worker.close()
+        path = os.path.join(
+            helper_manager.get_sink_dir(), "history_20231114T221320Z.csv"
+        )
+        with open(path, "r", encoding="utf-8") as file:
+            assert list(csv.reader(file)) == [
+                ["time", "bmv700.V", "bmv700.I", "bmv700.Relay"],
+                ["1700000000", "12.5", "1", "ON"],
+                ["1700000001", "12.6", "", ""]
+            ]
+
+    def test_rotation(self, helper_manager):
+        """Test files rotation by interval and by size, and retention."""
+        worker = helper_manager.get_worker(rotate_interval=3600)
+        for time_key in (1700000000, 1700001000, 1700003600):
+            assert worker.send_data(
+                {time_key: {'bmv700': {'V': 12.5}}}, worker.columns
+            ) is True
+        assert len(helper_manager.get_index()) == 2
+
+        # files ended before retention are removed on rotation
+        assert worker.send_data(
+            {1700200000: {'bmv700': {'V': 12.5}}}, worker.columns
+        ) is True
+        index = helper_manager.get_index()
+        assert list(index) == ["history_20231117T054640Z.ndjson"]
+        assert sorted(os.listdir(helper_manager.get_sink_dir())) == [
+            "history_20231117T054640Z.ndjson", FileSink.INDEX_FILE
+        ]
+
+        # files without end time (not synced before a crash) are removed
+        sink = worker.sink
+        sink.index["history_crash.ndjson"] = {'start': 1700100000}
+        sink.index["history_old.ndjson"] = {}
+        path = os.path.join(
+            helper_manager.get_sink_dir(), "history_old.ndjson"
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("{}\n")
+        os.utime(path, (1700100000, 1700100000))
+        assert sink.get_file_end("history_old.ndjson", {}) == 1700100000
+        assert sink.get_file_end("history_none.ndjson", {}) is None
+        assert sink.apply_retention(1700200000) == 2
+        assert "history_crash.ndjson" not in sink.index
+        assert os.path.exists(path) is False
+
+        worker = helper_manager.get_worker(
+            name="small", rotate_size=1024, rotate_interval=0
+        )
+        for time_key in range(1700000000, 1700000100, 10):
+            worker.send_data(
+                {
+                    time_key + i: {'bmv700': {'V': 12.5, 'Relay': "ON"}}
+                    for i in range(10)
+                },
+                worker.columns
+            )
+        assert len(os.listdir(os.path.join(helper_manager.path, "small")))\
+            > 2
+
+    def test_parquet(self, helper_manager):
+        """Test send_data method, with parquet format."""
+        worker = helper_manager.get_worker(format="parquet")
+        assert worker.send_data(helper_manager.data, worker.columns) is True
+        worker.close()
+        if not FileWriter.has_pyarrow():
+            assert list(helper_manager.get_index())\
+                == ["history_20231114T221320Z.ndjson"]
+        else:
+            pq = pytest.importorskip("pyarrow.parquet")
+            table = pq.read_table(os.path.join(
+                helper_manager.get_sink_dir(),
+                "history_20231114T221320Z.parquet"
+            ))
+            assert table.column_names\
+                == ["time", "bmv700.V", "bmv700.I", "bmv700.Relay"]
+            assert table.column("bmv700.I").to_pylist() == [1.0, None]
+
+    def test_points_types(self, helper_manager):
+        """Test columns types are set from points output types."""
+        worker = helper_manager.get_worker(format="arrow")
+        assert worker.set_points_types({}) is False
+        assert worker.set_points_types({
+            'V': {'output_type': "float"},
+            'I': {'output_type': "int"},
+            'Relay': {'output_type': "str"}
+        }) is True
+        assert worker.get_point_type('I') == "int"
+        assert worker.sink.types == {
+            'bmv700.V': "float", 'bmv700.I': "int", 'bmv700.Relay': "str"
+        }
+        # numeric column empty on first batch is typed from points
+        assert worker.send_data(
+            {1700000000: {'bmv700': {'V': 12.5, 'Relay': "ON"}}},
+            worker.columns
+        ) is True
+        assert worker.sink.writer.types == worker.sink.types
+        if FileWriter.has_pyarrow():
+            assert str(worker.sink.writer.schema.field("bmv700.I").type)\
+                == "double"
+
+    def test_remove_shared_connector(self, helper_manager):
+        """Test removed worker sink is closed, if connector is shared."""
+        manager = WorkersManager()
+        workers = [
+            manager.init_output_worker(
+                connector={
+                    'path': helper_manager.path,
+                    'fsync_interval': 0
+                },
+                worker_key="file",
+                enum_key=i,
+                item={
+                    'name': name,
+                    'source': "local",
+                    'time_interval': 1,
+                    'columns': {'bmv700': ['V']}
+                }
+            )
+            for i, name in enumerate(["history", "small"])
+        ]
+        helper_manager.workers.extend(workers)
+        assert workers[1].worker is workers[0].worker
+        assert workers[0].send_data(
+            helper_manager.data, workers[0].columns
+        ) is True
+        assert workers[0].sink.writer is not None
+        assert manager.remove_output_worker(
+            "file_local_history", ("file", "local")
+        ) is workers[0]
+        assert workers[0].sink.writer is None
+        assert helper_manager.get_index()[
+            "history_20231114T221320Z.ndjson"
+        ]['size'] > 0
+
+    def test_bad_conf(self, helper_manager):
+        """Test invalid configuration."""
+        with pytest.raises(SettingInvalidException):
+            helper_manager.get_worker(format="xls")
+        with pytest.raises(SettingInvalidException):
+            helper_manager.get_worker(name=None)
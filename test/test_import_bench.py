@@ -0,0 +1,37 @@
+"""Test ImportBench module."""
+from vemonitor_m8.core.import_bench import ImportBench
+from vemonitor_m8.workers.workers_loader import WorkersLoader
+
+
+class TestImportBench:
+    """Test ImportBench class."""
+
+    def test_parse_line(self):
+        """Test parse_line method."""
+        assert ImportBench.parse_line(
+            "import time:       338 |     312170 | vemonitor_m8"
+        ) == ("vemonitor_m8", 338, 312170)
+        assert ImportBench.parse_line(
+            "import time: self [us] | cumulative | imported package"
+        ) is None
+        assert ImportBench.parse_line("bad line") is None
+        assert ImportBench.parse_line(None) is None
+
+    def test_run(self):
+        """Test run and get_report methods."""
+        times = ImportBench.run(("vemonitor_m8.core.async_app_run",))
+        names = [item[0] for item in times]
+        assert "vemonitor_m8.core.async_app_run" in names
+        assert times[0][2] >= times[-1][2]
+        # backends not used by app block are not imported
+        assert "redis" not in names
+        assert "jsonschema" not in names
+        assert "vemonitor_m8.app_run" not in names
+
+        report = ImportBench.get_report(times, top=3)
+        assert len(report.splitlines()) == 4
+
+    def test_get_worker_class(self):
+        """Test WorkersLoader get_worker_class method."""
+        worker = WorkersLoader.get_worker_class("RedisOutputWorker")
+        assert worker.__name__ == "RedisOutputWorker"
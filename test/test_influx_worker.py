@@ -0,0 +1,195 @@
+"""Test InfluxDbOutputWorker module."""
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from vemonitor_m8.core.exceptions import SettingInvalidException
+from vemonitor_m8.workers.influxdb.influx_app import InfluxApp
+from vemonitor_m8.workers.influxdb.influx_worker import (
+    InfluxDbOutputWorker, InfluxWorkerHelper
+)
+
+
+class InfluxStubHandler(BaseHTTPRequestHandler):
+    """InfluxDb 2 write api stub, responding server statuses in order."""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Record write request, and respond next status."""
+        body = self.rfile.read(int(self.headers.get('Content-Length')))
+        if self.headers.get('Content-Encoding') == "gzip":
+            body = gzip.decompress(body)
+        self.server.requests.append({
+            'path': self.path,
+            'headers': dict(self.headers),
+            'lines': body.decode("utf-8").split("\n"),
+            'client': self.client_address
+        })
+        status = self.server.statuses.pop(0)\
+            if self.server.statuses else 204
+        self.send_response(status)
+        if status == 503:
+            self.send_header('Retry-After', "0.01")
+        self.send_header('Content-Length', "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=W0622
+        """Disable stub requests logs."""
+
+
+@pytest.fixture(name="helper_manager", scope="function")
+def helper_manager_fixture():
+    """InfluxDbOutputWorker test manager fixture"""
+    class HelperManager:
+        """InfluxDbOutputWorker test manager fixture Class"""
+        def __init__(self):
+            self.server = ThreadingHTTPServer(
+                ("127.0.0.1", 0), InfluxStubHandler
+            )
+            self.server.requests = []
+            self.server.statuses = []
+            self.thread = threading.Thread(
+                target=self.server.serve_forever, daemon=True
+            )
+            self.thread.start()
+            self.data = {
+                1700000000: {'bmv700': {'V': 12.5, 'I': 1, 'Relay': "ON"}},
+                1700000001: {'bmv700': {'V': 12.6, 'I': None}}
+            }
+            self.workers = []
+
+        def get_worker(self, **kwargs) -> InfluxDbOutputWorker:
+            """Get InfluxDbOutputWorker instance, on stub server."""
+            item = {
+                'source': "local",
+                'time_interval': 1,
+                'db': "vemonitor",
+                'measurement': "battery",
+                'tags': ["site=home", "BMV700"],
+                'columns': {'bmv700': ['V', 'I', 'Relay']}
+            }
+            item.update(kwargs)
+            worker = InfluxDbOutputWorker({
+                'connector': {
+                    'host': "http://127.0.0.1:"
+                            f"{self.server.server_address[1]}",
+                    'org': "vemonitor",
+                    'auth': "my_token",
+                    'timeout': 2000
+                },
+                'worker_key': "influxDb2",
+                'enum_key': 0,
+                'item': item
+            })
+            self.workers.append(worker)
+            return worker
+
+        def close(self):
+            """Close workers and stop stub server."""
+            for worker in self.workers:
+                worker.close()
+            self.server.shutdown()
+            self.server.server_close()
+
+    helper = HelperManager()
+    yield helper
+    helper.close()
+
+
+class TestInfluxWorkerHelper:
+    """Test InfluxWorkerHelper class."""
+
+    def test_line_protocol(self):
+        """Test line protocol helpers methods."""
+        assert InfluxWorkerHelper.get_tags(["site=home", "BMV700"])\
+            == {'site': "home", 'BMV700': "true"}
+        assert InfluxWorkerHelper.get_line_prefix(
+            "bat tery", "bmv,700", {'site': "my home"}
+        ) == r"bat\ tery,node=bmv\,700,site=my\ home"
+        assert InfluxWorkerHelper.format_value(1) == "1.0"
+        assert InfluxWorkerHelper.format_value(True) == "true"
+        assert InfluxWorkerHelper.format_value('a"b') == r'"a\"b"'
+        assert InfluxWorkerHelper.format_value(float('nan')) is None
+        assert InfluxWorkerHelper.format_value(None) is None
+
+    def test_split_lines(self):
+        """Test split_lines method."""
+        lines = ["a" * 9] * 5
+        assert [len(batch) for batch in InfluxWorkerHelper.split_lines(
+            lines, batch_size=2, max_batch_bytes=1000
+        )] == [2, 2, 1]
+        assert [len(batch) for batch in InfluxWorkerHelper.split_lines(
+            lines, batch_size=10, max_batch_bytes=30
+        )] == [3, 2]
+        # non ascii lines are split by encoded size
+        assert [len(batch) for batch in InfluxWorkerHelper.split_lines(
+            ["é" * 9] * 5, batch_size=10, max_batch_bytes=40
+        )] == [2, 2, 1]
+        assert InfluxWorkerHelper.split_lines([], 10, 10) == []
+
+
+class TestInfluxDbOutputWorker:
+    """Test InfluxDbOutputWorker class."""
+
+    def test_get_lines(self, helper_manager):
+        """Test get_lines method."""
+        worker = helper_manager.get_worker()
+        assert worker.get_worker_status() is True
+        assert worker.get_lines(helper_manager.data) == [
+            'battery,BMV700=true,node=bmv700,site=home '
+            'V=12.5,I=1.0,Relay="ON" 1700000000',
+            'battery,BMV700=true,node=bmv700,site=home V=12.6 1700000001'
+        ]
+        assert worker.get_lines({}) == []
+        with pytest.raises(SettingInvalidException):
+            helper_manager.get_worker(measurement=None)
+
+    def test_send_data(self, helper_manager):
+        """Test send_data method, on stub server."""
+        worker = helper_manager.get_worker(batch_size=1)
+        assert worker.send_data(helper_manager.data, worker.columns) is True
+        requests = helper_manager.server.requests
+        assert len(requests) == 2
+        assert requests[0]['path'] == "/api/v2/write?"\
+            "org=vemonitor&bucket=vemonitor&precision=s"
+        assert requests[0]['headers'].get('Authorization')\
+            == "Token my_token"
+        assert requests[0]['headers'].get('Content-Encoding') == "gzip"
+        assert requests[1]['lines'] == [
+            'battery,BMV700=true,node=bmv700,site=home V=12.6 1700000001'
+        ]
+        # keep-alive connection is reused
+        assert requests[0]['client'] == requests[1]['client']
+
+        # batch without writable values is sent, without request
+        assert worker.send_data(
+            {1700000002: {'bmv700': {'V': None, 'I': float("nan")}}},
+            worker.columns
+        ) is True
+        assert len(requests) == 2
+
+    def test_retries(self, helper_manager):
+        """Test send_data retries and errors."""
+        worker = helper_manager.get_worker()
+        server = helper_manager.server
+        server.statuses = [503, 500]
+        assert worker.send_data(helper_manager.data, worker.columns) is True
+        assert len(server.requests) == 3
+
+        # bad lines are dropped
+        server.statuses = [400]
+        assert worker.send_data(helper_manager.data, worker.columns) is True
+
+        # auth errors are not retried
+        server.requests.clear()
+        server.statuses = [401]
+        assert worker.send_data(helper_manager.data, worker.columns) is False
+        assert len(server.requests) == 1
+
+        worker.worker.max_retries = 1
+        server.statuses = [503, 503]
+        assert worker.send_data(helper_manager.data, worker.columns) is False
+
+        assert InfluxApp.get_backoff(2) == 2
+        assert InfluxApp.get_backoff(0, "3") == 3
+        assert InfluxApp.get_backoff(10) == InfluxApp.BACKOFF_MAX
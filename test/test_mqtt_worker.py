@@ -0,0 +1,176 @@
+"""Test MqttOutputWorker module."""
+import json
+import socket
+import threading
+import pytest
+import paho.mqtt.client as mqtt
+from vemonitor_m8.core.exceptions import SettingInvalidException
+from vemonitor_m8.workers.mqtt.mqtt_app import MqttApp
+from vemonitor_m8.workers.mqtt.mqtt_worker import (
+    MqttOutputWorker, MqttWorkerHelper
+)
+
+
+def is_broker_reachable(host: str = "localhost", port: int = 1883) -> bool:
+    """Test if a local mqtt broker is reachable."""
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.fixture(name="helper_manager", scope="function")
+def helper_manager_fixture():
+    """MqttOutputWorker test manager fixture"""
+    class HelperManager:
+        """MqttOutputWorker test manager fixture Class"""
+        def __init__(self):
+            self.data = {
+                1700000000: {'bmv700': {'V': 12.5, 'I': 1.2}},
+                1700000001: {'bmv700': {'V': 12.6, 'I': 1.1}}
+            }
+            self.structure = {'bmv700': ['V', 'I']}
+            self.workers = []
+
+        def get_worker(self, topic: str, **kwargs) -> MqttOutputWorker:
+            """Get MqttOutputWorker instance."""
+            item = {
+                'name': "dash",
+                'source': "local",
+                'time_interval': 1,
+                'cache_interval': 2,
+                'topic': topic,
+                'columns': self.structure
+            }
+            item.update(kwargs)
+            worker = MqttOutputWorker({
+                'connector': {
+                    'host': "localhost",
+                    'port': 1883,
+                    'waitTimeout': 0.2
+                },
+                'worker_key': "mqtt",
+                'enum_key': 0,
+                'item': item
+            })
+            self.workers.append(worker)
+            return worker
+
+    helper = HelperManager()
+    yield helper
+    for worker in helper.workers:
+        worker.close()
+
+
+class TestMqttWorkerHelper:
+    """Test MqttWorkerHelper class."""
+
+    def test_get_topic_fields(self):
+        """Test get_topic_fields method."""
+        assert MqttWorkerHelper.get_topic_fields("ve/{node}/{point}")\
+            == {'node', 'point'}
+        assert MqttWorkerHelper.get_topic_fields("ve/batch") == set()
+        assert MqttWorkerHelper.get_topic_fields("ve/{bad}") is None
+        assert MqttWorkerHelper.get_topic_fields("ve/{point}") is None
+        assert MqttWorkerHelper.get_topic_fields("ve/{node") is None
+
+    def test_payloads(self, helper_manager):
+        """Test payloads methods."""
+        data = helper_manager.data
+        assert MqttWorkerHelper.get_point_payload(data, 'bmv700', 'V')\
+            == [{'time': 1700000000, 'value': 12.5},
+                {'time': 1700000001, 'value': 12.6}]
+        assert MqttWorkerHelper.get_point_payload(
+            data, 'bmv700', 'V', compact=True
+        ) == [[1700000000, 12.5], [1700000001, 12.6]]
+        assert MqttWorkerHelper.get_node_payload(
+            data, 'bmv700', ['V', 'I'], compact=True
+        ) == {
+            'time': [1700000000, 1700000001],
+            'V': [12.5, 12.6],
+            'I': [1.2, 1.1]
+        }
+        assert MqttWorkerHelper.get_batch_payload(
+            data, helper_manager.structure
+        )[1] == {'time': 1700000001, 'bmv700': {'V': 12.6, 'I': 1.1}}
+        assert MqttWorkerHelper.dumps({'a': [1, 2]}, compact=True)\
+            == '{"a":[1,2]}'
+
+
+class TestMqttOutputWorker:
+    """Test MqttOutputWorker class."""
+
+    def test_get_messages(self, helper_manager):
+        """Test get_messages method, without broker."""
+        worker = helper_manager.get_worker(
+            "ve/{name}/{node}/{point}", qos=1, compact=True
+        )
+        assert worker.qos == 1 and worker.compact is True
+        assert isinstance(worker.worker, MqttApp)
+        messages = worker.get_messages(
+            helper_manager.data, helper_manager.structure
+        )
+        assert [topic for topic, _ in messages]\
+            == ["ve/dash/bmv700/V", "ve/dash/bmv700/I"]
+        assert json.loads(messages[1][1])\
+            == [[1700000000, 1.2], [1700000001, 1.1]]
+
+        # nodes without rows in batch are not published
+        worker = helper_manager.get_worker("ve/{node}", compact=True)
+        messages = worker.get_messages(
+            helper_manager.data, dict(helper_manager.structure, mppt=['V'])
+        )
+        assert [topic for topic, _ in messages] == ["ve/bmv700"]
+
+        worker = helper_manager.get_worker("ve/batch")
+        messages = worker.get_messages(
+            helper_manager.data, helper_manager.structure
+        )
+        assert len(messages) == 1 and messages[0][0] == "ve/batch"
+        assert worker.get_messages({}, helper_manager.structure) == []
+
+        if not is_broker_reachable():
+            assert worker.get_worker_status() is False
+            assert worker.send_data(
+                helper_manager.data, helper_manager.structure
+            ) is False
+
+        with pytest.raises(SettingInvalidException):
+            helper_manager.get_worker("ve/{bad}")
+
+    @pytest.mark.skipif(
+        not is_broker_reachable(),
+        reason="No local mqtt broker (mosquitto) on localhost:1883"
+    )
+    def test_send_data(self, helper_manager):
+        """Test send_data method, on local broker."""
+        received, done = [], threading.Event()
+
+        def on_message(client, userdata, message):
+            received.append((message.topic, json.loads(message.payload)))
+            if len(received) == 2:
+                done.set()
+
+        def on_connect(client, userdata, flags, reason_code, properties):
+            client.subscribe("vemonitor_test/#", qos=1)
+
+        subscriber = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        subscriber.on_connect = on_connect
+        subscriber.on_message = on_message
+        subscriber.connect("localhost", 1883)
+        subscriber.loop_start()
+        try:
+            worker = helper_manager.get_worker(
+                "vemonitor_test/{node}/{point}", qos=1
+            )
+            assert worker.get_worker_status() is True
+            assert worker.send_data(
+                helper_manager.data, helper_manager.structure
+            ) is True
+            assert done.wait(2) is True
+            assert dict(received).get("vemonitor_test/bmv700/V")[0]\
+                == {'time': 1700000000, 'value': 12.5}
+        finally:
+            subscriber.loop_stop()
+            subscriber.disconnect()
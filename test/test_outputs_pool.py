@@ -0,0 +1,235 @@
+"""Test OutputsPool module."""
+import time
+import pytest
+from vemonitor_m8.core.outputs_pool import OutputsPool
+from vemonitor_m8.models.workers import OutputWorker, Workers
+
+
+class DummyOutputWorker(OutputWorker):
+    """Dummy output worker used to test OutputsPool."""
+
+    def __init__(self, name: str, delay: float = 0, is_send: bool = True):
+        OutputWorker.__init__(self)
+        self.worker = object()
+        self.delay = delay
+        self.is_send = is_send
+        self.sent = []
+        self.set_worker_conf({
+            'name': name,
+            'worker_key': 'dummy',
+            'enum_key': 0,
+            'time_interval': 1,
+            'cache_interval': 2,
+            'send_timeout': 0.5,
+            'columns': {'node': ['V']}
+        })
+
+    def is_ready(self) -> bool:
+        return True
+
+    def set_worker_status(self) -> bool:
+        return True
+
+    def set_worker(self, worker: dict) -> bool:
+        return True
+
+    def send_data(self, data: dict, input_structure: dict) -> bool:
+        time.sleep(self.delay)
+        self.sent.append(data)
+        return self.is_send
+
+
+class OutOfOrderOutputWorker(DummyOutputWorker):
+    """Dummy output worker, failing slowly on time key 10 batches."""
+
+    def send_data(self, data: dict, input_structure: dict) -> bool:
+        if 10 in data:
+            time.sleep(0.3)
+            return False
+        self.sent.append(data)
+        return True
+
+
+@pytest.fixture(name="helper_manager")
+def helper_manager_fixture():
+    """OutputsPool test manager fixture"""
+    class HelperManager:
+        """OutputsPool test manager fixture Class"""
+
+        def __init__(self):
+            self.workers = Workers()
+            self.pool = OutputsPool()
+            self.data = {
+                10: {'node': {'V': 12.5}},
+                11: {'node': {'V': 12.6}}
+            }
+
+        def add_worker(self,
+                       name: str,
+                       worker_class: type = DummyOutputWorker,
+                       max_in_flight: int = 1,
+                       **kwargs
+                       ) -> DummyOutputWorker:
+            """Add dummy output worker."""
+            worker = worker_class(name, **kwargs)
+            worker.set_max_in_flight(max_in_flight)
+            self.workers.add_output_worker(name, worker)
+            assert self.pool.init_worker(name, worker) is True
+            return worker
+
+    return HelperManager()
+
+
+class TestOutputsPool:
+    """Test OutputsPool class."""
+
+    def test_submit_and_complete(self, helper_manager):
+        """Test submit and process_completed methods."""
+        worker = helper_manager.add_worker("fast")
+        assert helper_manager.pool.submit(
+            name="fast",
+            worker=worker,
+            data=helper_manager.data,
+            from_time=0,
+            last_time=12
+        ) is True
+        # max_in_flight is 1 by default
+        assert helper_manager.pool.can_submit("fast", worker) is False
+        assert helper_manager.pool.get_from_time("fast", worker) == 12
+        assert helper_manager.pool.wait_completed(
+            helper_manager.workers, timeout=2
+        ) is True
+        assert worker.get_last_saved_time() == 12
+        assert helper_manager.pool.get_stats("fast").get('sent') == 2
+        assert helper_manager.pool.can_submit("fast", worker) is True
+
+    def test_slow_output_not_blocking(self, helper_manager):
+        """Test slow output don't delay other outputs."""
+        slow = helper_manager.add_worker("slow", delay=0.4)
+        fast = helper_manager.add_worker("fast")
+        now = time.monotonic()
+        for name, worker in [("slow", slow), ("fast", fast)]:
+            helper_manager.pool.submit(
+                name=name,
+                worker=worker,
+                data=helper_manager.data,
+                from_time=0,
+                last_time=12
+            )
+        while fast.get_last_saved_time() == 0:
+            helper_manager.pool.process_completed(helper_manager.workers)
+            time.sleep(0.01)
+        assert time.monotonic() - now < 0.3
+        assert slow.get_last_saved_time() == 0
+        helper_manager.pool.wait_completed(helper_manager.workers, timeout=2)
+        assert slow.get_last_saved_time() == 12
+
+    def test_send_error_rewind(self, helper_manager):
+        """Test failed send rewind dispatched time."""
+        worker = helper_manager.add_worker("error", is_send=False)
+        helper_manager.pool.submit(
+            name="error",
+            worker=worker,
+            data=helper_manager.data,
+            from_time=5,
+            last_time=12
+        )
+        helper_manager.pool.wait_completed(helper_manager.workers, timeout=2)
+        assert worker.get_last_saved_time() == 0
+        assert helper_manager.pool.get_from_time("error", worker) == 5
+        assert helper_manager.pool.get_stats("error").get('errors') == 1
+
+    def test_out_of_order_error(self, helper_manager):
+        """Test newer job success don't acknowledge older failed job."""
+        worker = helper_manager.add_worker(
+            "ordered", worker_class=OutOfOrderOutputWorker, max_in_flight=2
+        )
+        assert helper_manager.pool.submit(
+            name="ordered",
+            worker=worker,
+            data={10: {'node': {'V': 12.5}}},
+            from_time=5,
+            last_time=10
+        ) is True
+        assert helper_manager.pool.submit(
+            name="ordered",
+            worker=worker,
+            data={11: {'node': {'V': 12.6}}},
+            from_time=10,
+            last_time=11
+        ) is True
+        while not worker.sent:
+            time.sleep(0.01)
+        # newer job is done, but older job is still running
+        helper_manager.pool.process_completed(helper_manager.workers)
+        assert worker.get_last_saved_time() == 0
+        helper_manager.pool.wait_completed(helper_manager.workers, timeout=2)
+        assert worker.get_last_saved_time() == 0
+        assert helper_manager.pool.get_from_time("ordered", worker) == 5
+        assert helper_manager.pool.get_stats("ordered").get('errors') == 1
+        assert helper_manager.pool.get_stats("ordered").get('sent') == 1
+
+    def test_rewind_saved(self, helper_manager):
+        """Test late rows rewind worker last_saved_time."""
+        worker = helper_manager.add_worker("late", delay=0.3)
+        worker.set_last_saved_time(8)
+        assert helper_manager.pool.rewind_saved("late", worker, 9) is False
+        helper_manager.pool.submit(
+            name="late",
+            worker=worker,
+            data=helper_manager.data,
+            from_time=8,
+            last_time=12
+        )
+        assert helper_manager.pool.rewind_saved("late", worker, 5) is True
+        assert worker.get_last_saved_time() == 5
+        assert helper_manager.pool.get_from_time("late", worker) == 5
+        # running job result don't skip late rows anymore
+        helper_manager.pool.wait_completed(helper_manager.workers, timeout=2)
+        assert worker.get_last_saved_time() == 5
+        assert helper_manager.pool.get_stats("late").get('sent') == 2
+        assert helper_manager.pool.rewind_saved("bad", worker, 1) is False
+
+    def test_check_deadlines(self, helper_manager):
+        """Test expired jobs results are ignored."""
+        worker = helper_manager.add_worker("hung", delay=0.8)
+        helper_manager.pool.submit(
+            name="hung",
+            worker=worker,
+            data=helper_manager.data,
+            from_time=0,
+            last_time=12
+        )
+        time.sleep(0.6)
+        helper_manager.pool.check_deadlines()
+        assert helper_manager.pool.get_stats("hung").get('timeouts') == 1
+        assert helper_manager.pool.get_from_time("hung", worker) == 0
+        # running job still use the in flight slot
+        assert helper_manager.pool.can_submit("hung", worker) is False
+        helper_manager.pool.wait_completed(helper_manager.workers, timeout=2)
+        assert worker.get_last_saved_time() == 0
+        helper_manager.pool.shutdown()
+
+    def test_remove_worker(self, helper_manager):
+        """Test removed worker jobs results are ignored."""
+        worker = helper_manager.add_worker("slow", delay=0.3)
+        helper_manager.pool.submit(
+            name="slow",
+            worker=worker,
+            data=helper_manager.data,
+            from_time=0,
+            last_time=12
+        )
+        assert helper_manager.pool.remove_worker(
+            "slow", helper_manager.workers, timeout=0
+        ) is False
+        assert helper_manager.pool.get_stats("slow") is None
+        time.sleep(0.4)
+        assert helper_manager.pool.process_completed(
+            helper_manager.workers
+        ) == 1
+        assert worker.get_last_saved_time() == 0
+        assert helper_manager.pool.has_in_flight() is False
+        assert helper_manager.pool.remove_worker(
+            "slow", helper_manager.workers
+        ) is True
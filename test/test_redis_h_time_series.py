@@ -552,3 +552,70 @@ class TestHmapTimeSeriesApp:
         }
         assert max_time == 1722013487
         assert last_time == 1722013488
+
+    def test_read_time_series(self, helper_manager):
+        """Test read_time_series method, from consumer watermarks."""
+        helper_manager.init_redis_h_time_series()
+        helper_manager.init_nodes_test()
+        helper_manager.obj.set_max_rows(10)
+        helper_manager.add_more_data_test()
+        helper_manager.obj.api.cli.delete(
+            HmapTimeSeriesApp.get_watermarks_key(helper_manager.node_name)
+        )
+        structure = {'pytest_1': ['V'], 'pytest_3': ['V', 'I']}
+
+        # read two oldest rows of each node
+        result, watermarks = helper_manager.obj.read_time_series(
+            node_name=helper_manager.node_name,
+            consumer="pytest",
+            watermarks={},
+            nb_items=2,
+            structure=structure
+        )
+        assert result == {
+            1722013445: {'pytest_3': {'V': 31.8, 'I': 6.52}},
+            1722013450: {'pytest_3': {'V': 36.8, 'I': 11.52}},
+            1722013481: {'pytest_1': {'V': 67.8}},
+            1722013482: {'pytest_1': {'V': 68.8}}
+        }
+        assert watermarks == {
+            'pytest_pytest_1': 1722013482,
+            'pytest_pytest_3': 1722013450
+        }
+        assert helper_manager.obj.set_watermarks(
+            node_name=helper_manager.node_name,
+            consumer="pytest",
+            watermarks=watermarks
+        ) == 2
+
+        # watermarks are loaded from server, and next rows are read
+        result, watermarks = helper_manager.obj.read_time_series(
+            node_name=helper_manager.node_name,
+            consumer="pytest",
+            watermarks={},
+            nb_items=2,
+            structure=structure
+        )
+        assert list(result) == [
+            1722013455, 1722013460, 1722013483, 1722013484
+        ]
+
+        # read all remaining rows
+        result, watermarks = helper_manager.obj.read_time_series(
+            node_name=helper_manager.node_name,
+            consumer="pytest",
+            watermarks=watermarks,
+            structure=structure
+        )
+        assert list(result)[0] == 1722013465
+        assert watermarks == {
+            'pytest_pytest_1': 1722013490,
+            'pytest_pytest_3': 1722013490
+        }
+        result, watermarks = helper_manager.obj.read_time_series(
+            node_name=helper_manager.node_name,
+            consumer="pytest",
+            watermarks=watermarks,
+            structure=structure
+        )
+        assert result == {}
@@ -2,6 +2,7 @@
 import pytest
 from vemonitor_m8.core.exceptions import SettingInvalidException
 from vemonitor_m8.workers.redis.redis_app import RedisApp
+from vemonitor_m8.workers.redis.redis_h_time_series import HmapTimeSeriesApp
 from vemonitor_m8.workers.redis.redis_worker import RedisInputWorker
 from vemonitor_m8.workers.redis.redis_worker import RedisOutputWorker
 
@@ -169,7 +170,7 @@ class TestRedisInputWorker:
         )
         assert result is True
 
-        redis_app = RedisApp(
+        redis_app = HmapTimeSeriesApp(
             credentials=helper_manager.credentials
         )
         result = helper_manager.obj.set_worker(
@@ -177,6 +178,12 @@ class TestRedisInputWorker:
         )
         assert result is True
 
+        # plain redis app can't read time series rows
+        with pytest.raises(SettingInvalidException):
+            helper_manager.obj.set_worker(
+                worker=RedisApp(credentials=helper_manager.credentials)
+            )
+
         with pytest.raises(SettingInvalidException):
             helper_manager.obj.set_worker(
                 worker=None
@@ -200,6 +207,53 @@ class TestRedisInputWorker:
                 conf={'a': 1}
             )
 
+    def test_read_data(self, helper_manager):
+        """Test read_data method, reading another instance output."""
+        helper_manager.init_input_worker()
+        reader = helper_manager.obj
+        reader.worker.reset_node_data(reader.redis_node)
+        reader.worker.api.cli.delete(
+            HmapTimeSeriesApp.get_watermarks_key(reader.redis_node)
+        )
+        helper_manager.init_output_worker()
+        writer = helper_manager.obj
+        writer.set_redis_node(reader.redis_node)
+        assert writer.send_data(
+            data={
+                1725018314: {'bmv700': {'V': 12.064, 'I': -7.546, 'P': -91}},
+                1725018315: {'bmv700': {'V': 12.065, 'I': -7.557, 'P': -91}}
+            },
+            input_structure={"bmv700": ["V", "I", "P"]}
+        ) is True
+
+        reader.set_max_items(1)
+        assert reader.read_data() == {
+            1725018314: {'bmv700': {'V': 12.064, 'I': -7.546, 'P': -91}}
+        }
+        reader.set_rows_cached()
+        # rows are not committed before being sent by outputs
+        assert reader.commit(reader.get_cached_position(), 0) is False
+        assert reader.read_data() == {
+            1725018315: {'bmv700': {'V': 12.065, 'I': -7.557, 'P': -91}}
+        }
+        reader.set_rows_cached()
+        assert reader.read_data() == {}
+
+        # a restarted reader resumes from committed watermarks
+        helper_manager.init_input_worker()
+        assert len(helper_manager.obj.read_data()) == 2
+        assert reader.commit(
+            reader.get_cached_position(), 1725018314
+        ) is True
+        helper_manager.init_input_worker()
+        assert helper_manager.obj.read_data() == {
+            1725018315: {'bmv700': {'V': 12.065, 'I': -7.557, 'P': -91}}
+        }
+        assert reader.commit(reader.get_cached_position(), None) is True
+        assert reader.commit(reader.get_cached_position(), None) is False
+        helper_manager.init_input_worker()
+        assert helper_manager.obj.read_data() == {}
+
 
 class TestRedisOutputWorker:
     """Test RedisOutputWorker model class."""
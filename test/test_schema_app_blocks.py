@@ -255,6 +255,102 @@ class TestAppBlocksSchema:
         self.helper_test_ref_cols(data, schema_manager)
         self.helper_test_time_interval(data, schema_manager)
 
+    def test_block_serial_readers(self, schema_manager):
+        """Test block serial_readers data"""
+        schema_manager.init_data()
+        schema_manager.obj[0]['serial_readers'] = {
+            'mode': "process",
+            'ring_slots': 256,
+            'slot_size': 4096
+        }
+        assert Ut.is_list(
+            SchemaValidate.validate_data_from_schema(
+                schema_manager.obj, schema_manager.schema),
+            not_null=True
+        )
+        bad_values = [
+            ('mode', "thread_pool"),
+            ('ring_slots', 2),
+            ('slot_size', 100),
+            ('bad_key', 1)
+        ]
+        for key, value in bad_values:
+            conf = dict(schema_manager.obj[0]['serial_readers'])
+            schema_manager.obj[0]['serial_readers'][key] = value
+            with pytest.raises(ValidationError):
+                SchemaValidate.validate_data_from_schema(
+                    schema_manager.obj, schema_manager.schema)
+            schema_manager.obj[0]['serial_readers'] = conf
+
+    def test_block_backpressure(self, schema_manager):
+        """Test block backpressure data"""
+        schema_manager.init_data()
+        schema_manager.obj[0]['backpressure'] = {
+            'max_pending_rows': 30,
+            'policy': "throttle",
+            'low_priority_inputs': ["bmv700", "mppt"],
+            'throttle_factor': 4
+        }
+        assert Ut.is_list(
+            SchemaValidate.validate_data_from_schema(
+                schema_manager.obj, schema_manager.schema),
+            not_null=True
+        )
+        bad_values = [
+            ('max_pending_rows', 1),
+            ('policy', "drop_newest"),
+            ('low_priority_inputs', []),
+            ('throttle_factor', 1),
+            ('bad_key', 1)
+        ]
+        for key, value in bad_values:
+            conf = dict(schema_manager.obj[0]['backpressure'])
+            schema_manager.obj[0]['backpressure'][key] = value
+            with pytest.raises(ValidationError):
+                SchemaValidate.validate_data_from_schema(
+                    schema_manager.obj, schema_manager.schema)
+            schema_manager.obj[0]['backpressure'] = conf
+
+    def test_block_fast_start(self, schema_manager):
+        """Test block fast_start data"""
+        schema_manager.init_data()
+        schema_manager.obj[0]['fast_start'] = True
+        assert Ut.is_list(
+            SchemaValidate.validate_data_from_schema(
+                schema_manager.obj, schema_manager.schema),
+            not_null=True
+        )
+        schema_manager.obj[0]['fast_start'] = "yes"
+        with pytest.raises(ValidationError):
+            SchemaValidate.validate_data_from_schema(
+                schema_manager.obj, schema_manager.schema)
+        del schema_manager.obj[0]['fast_start']
+
+    def test_block_shutdown(self, schema_manager):
+        """Test block shutdown data"""
+        schema_manager.init_data()
+        schema_manager.obj[0]['shutdown'] = {
+            'drain_timeout': 5,
+            'watermarks_file': "/var/lib/vemonitor/watermarks.json"
+        }
+        assert Ut.is_list(
+            SchemaValidate.validate_data_from_schema(
+                schema_manager.obj, schema_manager.schema),
+            not_null=True
+        )
+        bad_values = [
+            ('drain_timeout', 0),
+            ('watermarks_file', "bad path"),
+            ('bad_key', 1)
+        ]
+        for key, value in bad_values:
+            conf = dict(schema_manager.obj[0]['shutdown'])
+            schema_manager.obj[0]['shutdown'][key] = value
+            with pytest.raises(ValidationError):
+                SchemaValidate.validate_data_from_schema(
+                    schema_manager.obj, schema_manager.schema)
+            schema_manager.obj[0]['shutdown'] = conf
+
     def test_block_redis(self, schema_manager):
         """Test block data"""
         schema_manager.init_data()
@@ -5,7 +5,7 @@ Test data_structure json schema validation.
 """
 import pytest
 from ve_utils.utype import UType as Ut
-from jsonschema.exceptions import SchemaError
+from jsonschema.exceptions import SchemaError, ValidationError
 from vemonitor_m8.conf_manager.schema_validate import SchemaValidate
 from vemonitor_m8.conf_manager.data_structure_loader import DataStructureLoader
 from .schema_test_helper import SchemaTestHelper
@@ -69,3 +69,26 @@ class TestSchemaDataStructure:
             ('floatpoint', schema_manager.obj['points']['V'])
         ]
         schema_manager.run_test_values(datas=datas, key="positive_number")
+
+    def test_points_deadband(self, schema_manager):
+        """Test points deadband data"""
+        point = schema_manager.obj['points']['V']
+        point['deadband'] = {'abs': 50, 'rel': 0.01, 'heartbeat': 60}
+        assert Ut.is_dict(
+            SchemaValidate.validate_data(schema_manager.obj, "data_structure"),
+            not_null=True
+        )
+        bad_values = [
+            ('abs', -1),
+            ('rel', 2),
+            ('heartbeat', 0),
+            ('bad_key', 1)
+        ]
+        for key, value in bad_values:
+            conf = dict(point['deadband'])
+            point['deadband'][key] = value
+            with pytest.raises(ValidationError):
+                SchemaValidate.validate_data_from_schema(
+                    schema_manager.obj, schema_manager.schema)
+            point['deadband'] = conf
+        del point['deadband']
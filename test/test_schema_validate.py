@@ -3,7 +3,7 @@ import inspect
 from os import path as Opath
 import pytest
 from ve_utils.utype import UType as Ut
-from jsonschema.exceptions import SchemaError
+from jsonschema.exceptions import SchemaError, ValidationError
 from vemonitor_m8.conf_manager.shema_validate_selector import SchemaValidate as jValid
 from vemonitor_m8.conf_manager.config_loader import ConfigLoader
 
@@ -65,3 +65,34 @@ class TestSchemaValidate:
 
         with pytest.raises(SchemaError):
             jValid.load_schema('')
+
+    def test_validators_registry(self, helper_manager):
+        """Test schemas and compiled validators registry"""
+        jValid.clear_cache()
+        schema = jValid.load_schema('appBlocks')
+        assert jValid.load_schema('appBlocks') is schema
+
+        validator = jValid.get_validator(schema)
+        assert jValid.get_validator(schema) is validator
+        assert validator.format_checker is not None
+
+        c_loader = ConfigLoader(helper_manager.test_path)
+        settings = c_loader.get_settings_from_schema(
+            app_name="batSerialMonitor")
+        res = jValid.validate_data(
+            data=settings.app_blocks, shem_key_path='appBlocks')
+        assert Ut.is_list(res, not_null=True)
+        assert jValid.get_validator(schema) is validator
+
+        # validators of not loaded schemas are not kept
+        other = {"type": "object"}
+        assert jValid.get_validator(other) is not jValid.get_validator(other)
+
+        with pytest.raises(ValidationError):
+            jValid.validate_data(data=[{}], shem_key_path='appBlocks')
+
+        with pytest.raises(SchemaError):
+            jValid.get_validator({"type": "bad_type"})
+
+        jValid.clear_cache()
+        assert jValid.load_schema('appBlocks') is not schema
@@ -0,0 +1,103 @@
+"""Test ShmRingBuffer module."""
+import multiprocessing
+import pytest
+from vemonitor_m8.core.shm_ring import ShmRingBuffer
+
+
+def produce_rows(ring_conf: tuple, nb_rows: int):
+    """Push rows from producer process."""
+    ring = ShmRingBuffer.attach(*ring_conf)
+    i = 0
+    while i < nb_rows:
+        if ring.push({'node': "serial_1", 'time': i, 'data': {'V': i}}):
+            i += 1
+    ring.close()
+
+
+@pytest.fixture(name="helper_manager")
+def helper_manager_fixture():
+    """ShmRingBuffer test manager fixture"""
+    class HelperManager:
+        """ShmRingBuffer test manager fixture Class"""
+
+        def __init__(self):
+            self.obj = ShmRingBuffer.create(nb_slots=4, slot_size=96)
+
+    helper = HelperManager()
+    yield helper
+    helper.obj.close()
+
+
+class TestShmRingBuffer:
+    """Test ShmRingBuffer class."""
+
+    def test_create(self):
+        """Test create method."""
+        with pytest.raises(ValueError):
+            ShmRingBuffer.create(nb_slots=0)
+        with pytest.raises(ValueError):
+            ShmRingBuffer.create(slot_size=2)
+
+    def test_push_pop(self, helper_manager):
+        """Test push and pop methods."""
+        ring = helper_manager.obj
+        assert ring.pop() is None
+        assert ring.push({'a': 1}) is True
+        assert ring.push({'b': 2.5}) is True
+        assert ring.get_nb_items() == 2
+        assert ring.pop() == {'a': 1}
+        assert ring.pop() == {'b': 2.5}
+        assert ring.pop() is None
+
+    def test_full_and_oversize(self, helper_manager):
+        """Test rows are dropped if ring is full or row too large."""
+        ring = helper_manager.obj
+        for i in range(4):
+            assert ring.push({'i': i}) is True
+        assert ring.is_full() is True
+        assert ring.push({'i': 4}) is False
+        assert ring.push({'big': "x" * 100}) is False
+        assert ring.get_nb_dropped() == 2
+        # slots are reused after pop
+        assert ring.pop_batch(max_items=3) == [{'i': 0}, {'i': 1}, {'i': 2}]
+        assert ring.push({'i': 5}) is True
+        assert ring.pop_batch() == [{'i': 3}, {'i': 5}]
+
+    def test_slot_commit(self, helper_manager):
+        """Test slots are popped only once committed and valid."""
+        ring = helper_manager.obj
+        assert ring.push({'a': 1}) is True
+        offset = ring._get_slot_offset(0)
+        # slot published before his commit word is visible
+        ring._set_commit(offset, 0)
+        assert ring.pop() is None
+        ring._set_commit(offset, 1)
+        # slot data not yet visible
+        start = offset + ShmRingBuffer.SLOT_HEADER_SIZE
+        ring.buf[start] = ord("[")
+        assert ring.pop() is None
+        ring.buf[start] = ord("{")
+        assert ring.pop() == {'a': 1}
+        assert ring._get_commit(offset) == 0
+        # slot not released by consumer (torn read index) is not overwritten
+        for i in range(4):
+            assert ring.push({'i': i}) is True
+        assert ring.pop() == {'i': 0}
+        ring._set_commit(ring._get_slot_offset(1), 2)
+        assert ring.push({'i': 4}) is False
+        assert ring.pop_batch() == [{'i': 1}, {'i': 2}, {'i': 3}]
+
+    def test_producer_process(self, helper_manager):
+        """Test rows pushed from another process."""
+        ring = helper_manager.obj
+        process = multiprocessing.Process(
+            target=produce_rows,
+            args=((ring.name, ring.nb_slots, ring.slot_size), 50)
+        )
+        process.start()
+        rows = []
+        while len(rows) < 50:
+            rows.extend(ring.pop_batch())
+        process.join(timeout=5)
+        assert process.exitcode == 0
+        assert [row.get('time') for row in rows] == list(range(50))
@@ -47,3 +47,24 @@ class TestThreadsController:
         assert round(timer_list[3] - timer_list[1], 0) == 1.0
         assert round(timer_list[4] - timer_list[3], 0) == 1.0
         assert round(timer_list[5] - timer_list[4], 0) == 0.0
+
+    def test_remove_timer_key(self):
+        """Test remove_timer_key method."""
+        obj = ThreadsController()
+        timer_list = []
+        obj.add_timer_key(
+            key="Timer1",
+            interval=1,
+            callback=timers_callback,
+            kwargs={'timer_list': timer_list}
+        )
+        obj.start_timers()
+        time.sleep(1.5)
+        assert obj.remove_timer_key("Timer1", timeout=1) is True
+        assert obj.has_timer_key("Timer1") is False
+        assert obj.remove_timer_key("Timer1") is False
+        nb_runs = len(timer_list)
+        time.sleep(1.5)
+        obj.cancel_all_timers()
+        assert nb_runs > 0
+        assert len(timer_list) == nb_runs
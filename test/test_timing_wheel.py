@@ -0,0 +1,144 @@
+"""Test TimingWheel module."""
+import time
+from vemonitor_m8.core.timing_wheel import ScheduledJob, TimingWheel
+
+
+def job_callback(**kwargs):
+    """Job callback function"""
+    kwargs.get('calls').append(time.monotonic())
+    time.sleep(kwargs.get('delay', 0))
+
+
+class TestScheduledJob:
+    """Test ScheduledJob class."""
+
+    def test_set_next_deadline(self):
+        """Test set_next_deadline method."""
+        job = ScheduledJob(key="job", interval=2, callback=job_callback)
+        job.set_next_deadline(epoch=100, now=100.5)
+        assert job.index == 1
+        assert job.deadline == 102
+        job.set_next_deadline(epoch=100, now=102.01)
+        assert job.deadline == 104
+        assert job.get_stats().get('missed') == 0
+        # driver was late, two grid points are lost
+        job.set_next_deadline(epoch=100, now=108.5)
+        assert job.deadline == 110
+        assert job.get_stats().get('missed') == 2
+
+    def test_set_offset(self):
+        """Test set_offset method."""
+        job = ScheduledJob(
+            key="job", interval=2, callback=job_callback, offset=0.4
+        )
+        job.set_next_deadline(epoch=100, now=100.5)
+        assert job.deadline == 102.4
+        assert job.set_offset(3.25) is True
+        assert job.offset == 1.25
+        job.set_next_deadline(epoch=100, now=102.5)
+        assert job.deadline == 103.25
+        assert job.get_stats().get('missed') == 0
+        assert job.set_offset(-1) is False
+
+    def test_bad_overrun_policy(self):
+        """Test bad overrun policy is replaced by skip."""
+        job = ScheduledJob(
+            key="job", interval=1, callback=job_callback, overrun="bad"
+        )
+        assert job.overrun == "skip"
+
+
+class TestTimingWheel:
+    """Test TimingWheel class."""
+
+    def test_run_on_grid(self):
+        """Test jobs run on epoch grid without drift."""
+        wheel = TimingWheel(resolution=0.005, wheel_size=8, nb_levels=3)
+        calls = []
+        assert wheel.add_job(ScheduledJob(
+            key="job", interval=0.1, callback=job_callback,
+            kwargs={'calls': calls, 'delay': 0.03}
+        )) is True
+        assert wheel.add_job(ScheduledJob(
+            key="job", interval=0.1, callback=job_callback
+        )) is False
+        epoch = time.monotonic()
+        wheel.start(epoch=epoch)
+        time.sleep(1.05)
+        wheel.stop()
+        assert len(calls) == 10
+        for i, call in enumerate(calls):
+            assert abs(call - (epoch + (i + 1) * 0.1)) < 0.02
+        stats = wheel.get_stats().get('job')
+        assert stats.get('runs') == 10
+        assert stats.get('max_jitter') < 0.02
+
+    def test_long_interval_cascade(self):
+        """Test jobs stored on upper wheel levels run on time."""
+        wheel = TimingWheel(resolution=0.001, wheel_size=4, nb_levels=3)
+        calls = []
+        wheel.add_job(ScheduledJob(
+            key="job", interval=0.15, callback=job_callback,
+            kwargs={'calls': calls}
+        ))
+        epoch = time.monotonic()
+        wheel.start(epoch=epoch)
+        time.sleep(0.5)
+        wheel.stop()
+        assert len(calls) == 3
+        for i, call in enumerate(calls):
+            assert abs(call - (epoch + (i + 1) * 0.15)) < 0.02
+
+    def test_overrun_skip(self):
+        """Test overrun runs are skipped."""
+        wheel = TimingWheel(resolution=0.005)
+        calls = []
+        wheel.add_job(ScheduledJob(
+            key="job", interval=0.1, callback=job_callback,
+            kwargs={'calls': calls, 'delay': 0.25}, overrun="skip"
+        ))
+        wheel.start(epoch=time.monotonic())
+        time.sleep(0.65)
+        wheel.stop()
+        stats = wheel.get_stats().get('job')
+        # runs at 0.1 and 0.4, skipped at 0.2, 0.3, 0.5 and 0.6
+        assert len(calls) == 2
+        assert stats.get('skipped') == 4
+        assert stats.get('coalesced') == 0
+
+    def test_overrun_coalesce(self):
+        """Test overrun runs are coalesced in one run."""
+        wheel = TimingWheel(resolution=0.005)
+        calls = []
+        wheel.add_job(ScheduledJob(
+            key="job", interval=0.1, callback=job_callback,
+            kwargs={'calls': calls, 'delay': 0.25}, overrun="coalesce"
+        ))
+        epoch = time.monotonic()
+        wheel.start(epoch=epoch)
+        time.sleep(0.45)
+        wheel.stop(wait=True)
+        stats = wheel.get_stats().get('job')
+        # runs at 0.1, then 0.2 and 0.3 coalesced in one run at 0.35
+        assert len(calls) == 2
+        assert abs(calls[1] - (epoch + 0.35)) < 0.02
+        assert stats.get('coalesced') == 1
+        assert stats.get('last_jitter') > 0.04
+
+    def test_remove_job(self):
+        """Test remove_job method."""
+        wheel = TimingWheel(resolution=0.005)
+        calls = []
+        wheel.add_job(ScheduledJob(
+            key="job", interval=0.1, callback=job_callback,
+            kwargs={'calls': calls}
+        ))
+        assert wheel.has_job("job") is True
+        wheel.start()
+        assert wheel.is_running() is True
+        assert wheel.remove_job("job") is True
+        assert wheel.remove_job("job") is False
+        time.sleep(0.3)
+        wheel.stop()
+        assert not calls
+        assert wheel.is_running() is False
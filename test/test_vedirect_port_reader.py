@@ -0,0 +1,112 @@
+"""Test VedirectPortReader module."""
+import pytest
+from vemonitor_m8.workers.vedirect.vedirect_port_reader\
+    import VedirectPortReader
+
+
+class DummyVedirectApp:
+    """Dummy vedirect app, counting serial reads."""
+
+    def __init__(self):
+        self.nb_reads = 0
+
+    def read_data(self, caller_name: str, timeout: int = 2) -> dict:
+        """Return one decoded VE.Direct block."""
+        self.nb_reads += 1
+        return {'V': 12800, 'I': 1500, 'P': 19, 'SOC': 876, 'PID': "0x203"}
+
+
+@pytest.fixture(name="helper_manager")
+def helper_manager_fixture():
+    """VedirectPortReader test manager fixture"""
+    class HelperManager:
+        """VedirectPortReader test manager fixture Class"""
+
+        def __init__(self):
+            self.app = DummyVedirectApp()
+            self.obj = VedirectPortReader(source="bmv700", app=self.app)
+            assert self.obj.add_item("bmv", "serial_bmv700_bmv", 1, ['V', 'I'])
+            assert self.obj.add_item("extra", "serial_bmv700_extra", 2, ['P'])
+            assert self.obj.add_item("soc", "serial_bmv700_soc", 10, ['SOC'])
+
+    return HelperManager()
+
+
+class TestVedirectPortReader:
+    """Test VedirectPortReader class."""
+
+    def test_add_item(self, helper_manager):
+        """Test add_item method."""
+        obj = helper_manager.obj
+        assert obj.get_columns() == ['I', 'P', 'SOC', 'V']
+        assert obj.get_tick_interval() == 1
+        assert obj.add_item("bad", "serial_bad", 0, ['V']) is False
+        assert obj.add_item("bad", "serial_bad", 1, []) is False
+        assert obj.get_items_names() == ["bmv", "extra", "soc"]
+        assert obj.get_item_node("soc") == "serial_bmv700_soc"
+        reader = VedirectPortReader(source="bmv700", app=None)
+        reader.add_item("a", "node_a", 1.5, ['V'])
+        reader.add_item("b", "node_b", 2.5, ['I'])
+        assert reader.get_tick_interval() == 0.5
+
+    def test_get_due_items(self, helper_manager):
+        """Test get_due_items method."""
+        obj = helper_manager.obj
+        assert obj.get_due_items(10) == ["bmv", "extra", "soc"]
+        assert obj.get_due_items(11) == ["bmv"]
+        assert obj.get_due_items(12) == ["bmv", "extra"]
+        assert obj.set_item_interval("extra", 4) is True
+        assert obj.get_due_items(14) == ["bmv"]
+        assert obj.get_due_items(16) == ["bmv", "extra"]
+        assert obj.set_item_interval("bad", 4) is False
+
+    def test_read_tick(self, helper_manager):
+        """Test read_tick method."""
+        obj = helper_manager.obj
+        time_key, data, due_items = obj.read_tick()
+        # port is read once for all due items
+        assert helper_manager.app.nb_reads == 1
+        assert time_key > 0
+        assert "bmv" in due_items
+        assert data == {'V': 12800, 'I': 1500, 'P': 19, 'SOC': 876}
+        assert obj.get_item_data("bmv", data) == {'V': 12800, 'I': 1500}
+        assert obj.get_item_data("bad", data) is None
+        assert obj.get_stats()['reads'] == 1
+
+    def test_read_tick_all_items(self, helper_manager):
+        """Test read_tick method reading all items."""
+        obj = helper_manager.obj
+        time_key, data, due_items = obj.read_tick(all_items=True)
+        assert helper_manager.app.nb_reads == 1
+        assert due_items == ["bmv", "extra", "soc"]
+        assert data == {'V': 12800, 'I': 1500, 'P': 19, 'SOC': 876}
+
+    def test_get_item_row(self, helper_manager):
+        """Test read_tick without projection and get_item_row method."""
+        obj = helper_manager.obj
+        _, data, _ = obj.read_tick(project=False)
+        assert data['PID'] == "0x203"
+        row = {'V': 12.8, 'I': 1.5, 'P': 19, 'SOC': 87.6,
+               'time': 1667000000.5, 'time_ref': 0.5}
+        assert obj.get_item_row("bmv", row) == {
+            'V': 12.8, 'I': 1.5, 'time': 1667000000.5, 'time_ref': 0.5
+        }
+        assert obj.get_item_row("bmv", row, reuse=True) is not row
+        assert obj.get_item_row("bad", row) is None
+        reader = VedirectPortReader(source="bmv700", app=None)
+        reader.add_item("all", "node_all", 1, ['V', 'I', 'P', 'SOC'])
+        assert reader.get_item_row("all", row, reuse=True) is row
+        assert reader.get_item_row("all", row) == row
+
+    def test_remove_item(self, helper_manager):
+        """Test remove_item method."""
+        obj = helper_manager.obj
+        assert obj.remove_item("bmv") is True
+        assert obj.get_columns() == ['P', 'SOC']
+        assert obj.get_tick_interval() == 2
+        assert obj.get_due_items(5) == ["extra", "soc"]
+        assert obj.remove_item("bmv") is False
+        assert obj.remove_item("extra") is True
+        assert obj.remove_item("soc") is True
+        assert obj.has_items() is False
+        assert obj.get_columns() == []
@@ -0,0 +1,61 @@
+"""Test vedirect reader processes module."""
+import multiprocessing
+import signal
+import time
+import pytest
+from vemonitor_m8.workers.vedirect.vedirect_reader_process import (
+    init_reader_signals
+)
+
+
+def run_reader_test(started):
+    """Reader process test entry point, waiting to be terminated."""
+    init_reader_signals()
+    started.set()
+    while True:
+        time.sleep(0.05)
+
+
+@pytest.fixture(name="helper_manager")
+def helper_manager_fixture():
+    """Reader processes test manager fixture"""
+    class HelperManager:
+        """Reader processes test manager fixture Class"""
+
+        def __init__(self):
+            self.sigterm = signal.getsignal(signal.SIGTERM)
+            self.sighup = signal.getsignal(signal.SIGHUP)
+            self.process = None
+
+        def restore(self):
+            """Restore main process signal handlers."""
+            signal.signal(signal.SIGTERM, self.sigterm)
+            signal.signal(signal.SIGHUP, self.sighup)
+            if self.process is not None and self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout=2)
+
+    helper = HelperManager()
+    yield helper
+    helper.restore()
+
+
+class TestReaderProcess:
+    """Test reader process signal handlers."""
+
+    def test_terminate_reader(self, helper_manager):
+        """Test reader don't run main process signal handlers."""
+        # main process graceful stop, must not run on reader process
+        signal.signal(signal.SIGTERM, lambda signum, frame: None)
+        signal.signal(signal.SIGHUP, lambda signum, frame: None)
+        started = multiprocessing.Event()
+        helper_manager.process = multiprocessing.Process(
+            target=run_reader_test,
+            args=(started,),
+            daemon=True
+        )
+        helper_manager.process.start()
+        assert started.wait(timeout=5) is True
+        helper_manager.process.terminate()
+        helper_manager.process.join(timeout=5)
+        assert helper_manager.process.exitcode == -signal.SIGTERM
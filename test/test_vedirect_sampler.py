@@ -0,0 +1,55 @@
+"""Test PacketRateSampler module."""
+from vemonitor_m8.workers.vedirect.vedirect_sampler import PacketRateSampler
+
+
+class TestPacketRateSampler:
+    """Test PacketRateSampler class."""
+
+    def test_add_block_time(self):
+        """Test device cadence and phase learning."""
+        obj = PacketRateSampler(min_samples=5)
+        assert obj.add_block_time(None) is False
+        assert obj.is_ready() is False
+        assert obj.get_read_offset() is None
+        assert obj.get_next_block_time(1722013441) is None
+        # device sends blocks every 1.1s, read every 2 blocks
+        start = 1722013440.3
+        for i in range(0, 60, 2):
+            assert obj.add_block_time(start + i * 1.1) is True
+        assert obj.is_ready() is True
+        assert abs(obj.period - 1.1) < 0.01
+        assert abs(obj.anchor - (start + 58 * 1.1)) < 0.05
+        next_block = obj.get_next_block_time(start + 58 * 1.1 + 0.5)
+        assert abs(next_block - (start + 59 * 1.1)) < 0.05
+        # outliers are rejected
+        period = obj.period
+        obj.add_block_time(start + 58 * 1.1 + 0.5)
+        assert obj.period == period
+        assert obj.get_stats()['rejected'] == 1
+
+    def test_read_offset(self):
+        """Test read offset, just after expected blocks."""
+        obj = PacketRateSampler(min_samples=3, read_margin=0.05)
+        for i in range(5):
+            obj.add_block_time(1722013440.4 + i)
+        assert abs(obj.get_read_offset() - 0.45) < 0.01
+        assert obj.is_offset_changed(0) is True
+        assert obj.is_offset_changed(0.45) is False
+        assert abs(obj.get_read_offset(2) - 0.45) < 0.01
+        assert obj.is_offset_changed(1.45, 2) is True
+        # offset is compared modulo interval
+        obj.anchor = 1722013444.92
+        assert obj.is_offset_changed(0.98) is False
+
+    def test_check_interval(self):
+        """Test input intervals clamp and warnings."""
+        obj = PacketRateSampler()
+        assert obj.check_interval(0.5, "bmv") == 1
+        assert obj.check_interval(2, "bmv") == 2
+        for i in range(5):
+            obj.add_block_time(1722013440.4 + i * 2)
+        assert obj.warn_fast_interval(5, "bmv") is False
+        obj.period = 2
+        assert obj.warn_fast_interval(1, "bmv") is True
+        # warn only once
+        assert obj.warn_fast_interval(1, "bmv") is False
@@ -0,0 +1,42 @@
+"""Test WatermarkStore module."""
+import json
+import os
+from vemonitor_m8.core.watermarks import WatermarkStore
+
+
+class TestWatermarkStore:
+    """Test WatermarkStore class."""
+
+    def test_set(self, tmp_path):
+        """Test get and set methods."""
+        obj = WatermarkStore(str(tmp_path / "watermarks.json"))
+        key = WatermarkStore.get_key("BmvToRedis", "redis_1")
+        assert key == "BmvToRedis.redis_1"
+        assert obj.get(key) is None
+        assert obj.set(key, 1667000010) is True
+        assert obj.get(key) == 1667000010
+        # watermarks never move backward
+        assert obj.set(key, 1667000000) is True
+        assert obj.get(key) == 1667000010
+        assert obj.set(key, -1) is False
+        assert obj.set("", 10) is False
+
+    def test_save(self, tmp_path):
+        """Test save and load methods."""
+        file_path = tmp_path / "data" / "watermarks.json"
+        obj = WatermarkStore(str(file_path))
+        obj.set("BmvToRedis.redis_1", 1667000010)
+        assert obj.save() is True
+        assert not os.path.isfile(f"{file_path}.tmp")
+        with open(file_path, encoding="utf-8") as file:
+            assert json.load(file) == {"BmvToRedis.redis_1": 1667000010}
+        obj = WatermarkStore(str(file_path))
+        assert obj.get("BmvToRedis.redis_1") == 1667000010
+
+    def test_load_bad_file(self, tmp_path):
+        """Test load method with a corrupted file."""
+        file_path = tmp_path / "watermarks.json"
+        file_path.write_text("{bad json", encoding="utf-8")
+        obj = WatermarkStore(str(file_path))
+        assert obj.data == {}
+        assert obj.load() is False
@@ -0,0 +1,163 @@
+"""Test WorkersRegistry module."""
+from importlib.metadata import EntryPoint
+import pytest
+from jsonschema.exceptions import ValidationError
+from vemonitor_m8.conf_manager.shema_validate_selector\
+    import SchemaValidateSelector as jValid
+from vemonitor_m8.core.exceptions import VeMonitorError
+from vemonitor_m8.workers.workers_loader import WorkersLoader
+from vemonitor_m8.workers.workers_registry import (
+    WorkerPlugin, WorkersRegistry
+)
+
+
+def get_fake_plugin() -> WorkerPlugin:
+    """Get fakeDb worker plugin."""
+    return WorkerPlugin(
+        key="fakeDb",
+        output_class="not_installed_package.fake_worker:FakeWorker",
+        connector_schema={
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {"host": {"type": "string"}}
+        },
+        output_schema={
+            "type": "object",
+            "required": ["source"],
+            "properties": {"source": {"$ref": "/schemas/source"}}
+        },
+        capabilities={'batch_size': 500, 'columnar': True}
+    )
+
+
+@pytest.fixture(name="helper_manager", scope="function")
+def helper_manager_fixture():
+    """WorkersRegistry test manager fixture"""
+    class HelperManager:
+        """WorkersRegistry test manager fixture Class"""
+        def __init__(self):
+            self.connectors = {"fakeDb": {"local": {"host": "localhost"}}}
+            self.entry_point = EntryPoint(
+                name="fakeDb",
+                value=f"{__name__}:get_fake_plugin",
+                group=WorkersRegistry.ENTRY_POINTS_GROUP
+            )
+
+        @staticmethod
+        def get_app_block(outputs: dict) -> list:
+            """Get app blocks conf with outputs."""
+            return [{
+                "name": "fakeBlock",
+                "app": "batSerialMonitor",
+                "inputs": {
+                    "serial": [{
+                        "source": "bmv700",
+                        "name": "bmv700",
+                        "device": "BMV700",
+                        "columns": ["V"],
+                        "time_interval": 1
+                    }]
+                },
+                "outputs": outputs
+            }]
+
+    yield HelperManager()
+    WorkersRegistry.unregister("fakeDb")
+
+
+class TestWorkerPlugin:
+    """Test WorkerPlugin class."""
+
+    def test_worker_class(self):
+        """Test get_worker_class and plugin declaration methods."""
+        plugin = WorkersRegistry.get_plugin("redis")
+        assert plugin.is_valid()
+        assert plugin.has_worker('input') and plugin.has_worker('output')
+        assert plugin.get_class_name('output') == "RedisOutputWorker"
+        assert plugin.get_worker_class('output').__name__\
+            == "RedisOutputWorker"
+        assert plugin.get_capabilities().get('async') is False
+
+        plugin = get_fake_plugin()
+        assert plugin.has_worker('input') is False
+        assert plugin.get_worker_class('input') is None
+        assert plugin.get_worker_class('output') is None
+        assert plugin.get_capabilities() == {
+            'batch_size': 500, 'async': False, 'columnar': True,
+            'columnar_output': False
+        }
+        assert WorkerPlugin.is_class_path("module") is False
+        assert WorkerPlugin(key="bad", input_class="bad").is_valid() is False
+
+
+class TestWorkersRegistry:
+    """Test WorkersRegistry class."""
+
+    def test_register(self, helper_manager):
+        """Test register, unregister and schemas extensions methods."""
+        with pytest.raises(ValidationError):
+            jValid.is_valid_app_connectors_conf(helper_manager.connectors)
+        assert WorkersRegistry.register(get_fake_plugin()) is True
+        assert WorkersRegistry.get_capabilities("fakeDb")\
+            .get('batch_size') == 500
+        assert WorkersRegistry.get_capabilities("file")\
+            .get('columnar_output') is True
+        assert WorkersRegistry.get_capabilities("influxDb2")\
+            .get('batch_size') is None
+        assert jValid.is_valid_app_connectors_conf(helper_manager.connectors)
+        assert jValid.is_valid_app_blocks_conf(
+            helper_manager.get_app_block({"fakeDb": [{"source": "local"}]})
+        )
+        with pytest.raises(ValidationError):
+            jValid.is_valid_app_blocks_conf(
+                helper_manager.get_app_block({"fakeDb": [{"bad": 1}]})
+            )
+
+        # built-in plugins are not replaced
+        assert WorkersRegistry.register(
+            WorkerPlugin(key="redis", input_class="module:Worker")
+        ) is False
+        assert WorkersRegistry.unregister("fakeDb") is True
+        with pytest.raises(ValidationError):
+            jValid.is_valid_app_connectors_conf(helper_manager.connectors)
+
+    def test_discover(self, helper_manager, monkeypatch):
+        """Test discover and get_plugin methods."""
+        monkeypatch.setattr(
+            WorkersRegistry,
+            "get_entry_points",
+            lambda: [
+                helper_manager.entry_point,
+                EntryPoint(
+                    name="badDb",
+                    value="vemonitor_m8.workers.workers_registry:Ut",
+                    group=WorkersRegistry.ENTRY_POINTS_GROUP
+                )
+            ]
+        )
+        plugins = WorkersRegistry.discover(force=True)
+        assert "fakeDb" in plugins
+        assert "badDb" not in plugins
+        assert "serial" in plugins
+        assert WorkersRegistry.get_plugin("fakeDb").get_class_name('output')\
+            == "FakeWorker"
+        assert WorkersRegistry.get_plugin("unknown") is None
+
+    def test_workers_loader(self, helper_manager):
+        """Test WorkersLoader init_worker method."""
+        assert WorkersLoader.get_output_worker_by_key(
+            worker_key="unknown", connector={}, enum_key=0, item={}
+        ) is None
+        # serial plugin has no output worker
+        assert WorkersLoader.get_output_worker_by_key(
+            worker_key="serial", connector={}, enum_key=0, item={}
+        ) is None
+        assert WorkersRegistry.register(get_fake_plugin())
+        assert helper_manager.entry_point.name in WorkersRegistry.get_plugins()
+        with pytest.raises(VeMonitorError):
+            WorkersLoader.get_output_worker_by_key(
+                worker_key="fakeDb", connector={}, enum_key=0, item={}
+            )
+        assert WorkersLoader.get_worker_class("VedirectWorker").__name__\
+            == "VedirectWorker"
+        assert WorkersLoader.get_worker_class("bad") is None
@@ -4,8 +4,9 @@ YmlConfLoader Unit Tests class
 import os
 import inspect
 import pytest
+import yaml
 from ve_utils.utype import UType as Ut
-from vemonitor_m8.conf_manager.yaml_loader import YmlConfLoader
+from vemonitor_m8.conf_manager.yaml_loader import IncludeImport, YmlConfLoader
 from vemonitor_m8.core.exceptions import YAMLFileEmpty
 from vemonitor_m8.core.exceptions import YAMLFileNotFound
 from vemonitor_m8.core.exceptions import YAMLFileError
@@ -184,3 +185,32 @@ class TestYmlConfLoader():
                     "dummy_conf_list_bad_imports.yaml"
                 )
             )
+
+    def test_parse_once(self, tmp_path):
+        """Test included files are parsed once per load, with timings."""
+        main_path = tmp_path / "main.yaml"
+        main_path.write_text(
+            "Imports: ['child.yaml', 'child.yaml']\nMain: 1\n",
+            encoding="utf-8"
+        )
+        (tmp_path / "child.yaml").write_text("Child: 2\n", encoding="utf-8")
+        loaded_files = []
+        conf = YmlConfLoader.get_config(
+            str(main_path), loaded_files=loaded_files
+        )
+        assert conf.get('Main') == 1 and conf.get('Child') == 2
+        assert loaded_files == [
+            str(main_path), str(tmp_path / "child.yaml")
+        ]
+        obj = IncludeImport(str(main_path))
+        obj.import_from_included_files(str(main_path))
+        assert list(obj.timings) == loaded_files
+        # file included twice is a copy
+        child = obj.load_file(str(tmp_path / "child.yaml"))
+        child['Child'] = 3
+        assert obj.load_file(str(tmp_path / "child.yaml")) == {'Child': 2}
+        assert list(obj.timings) == loaded_files
+        if yaml.__with_libyaml__:
+            assert IncludeImport.get_loader() is yaml.CSafeLoader
+        else:
+            assert IncludeImport.get_loader() is yaml.SafeLoader
@@ -1,10 +1,14 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
-"""Init vemonitor_m8 App"""
+"""
+Init vemonitor_m8 App
+
+AppRun is imported by main, so importing any vemonitor_m8 module,
+or running with --version, don't import workers and their dependencies.
+"""
 import logging
 import sys
 import argparse
-from vemonitor_m8.app_run import AppRun
 from vemonitor_m8.version import VERSION
 
 __author__ = "Eli Serra"
@@ -36,16 +40,36 @@ def parse_args(args):
         '--app',
         help='Main app to run'
     )
+    parser.add_argument(
+        '--processes', type=int, default=1,
+        help='Number of processes used to run app blocks. '
+             'Blocks using the same serial port run on the same process.'
+    )
     parser.add_argument(
         '--conf_path', help='Main Configuration file path'
     )
     parser.add_argument(
         '--log_path', help='Console log file path'
     )
+    parser.add_argument(
+        '--conf_cache',
+        help='Compiled configuration cache directory path. '
+             'Unchanged configuration is loaded from cache.'
+    )
+    parser.add_argument(
+        '--watch_conf', type=float,
+        help='Configuration files watch interval in seconds. '
+             'Changed configuration is reloaded without restart, '
+             'as on SIGHUP signal.'
+    )
     parser.add_argument(
         "--debug", action='store_true',
         help="Show debug output"
     )
+    parser.add_argument(
+        "--import_times", action='store_true',
+        help="Show import time breakdown of app modules and exit"
+    )
     parser.add_argument(
         '-v', '--version',
         action='version',
@@ -66,12 +90,21 @@ def main():
 
     # check if we want debug
     configure_logging(debug=parser.debug)
+    if parser.import_times:
+        from vemonitor_m8.core.import_bench import ImportBench
+        print(ImportBench.get_report(ImportBench.run()))
+        return
+
     logger.warning("---------- VeMonitor_m8 ----------")
     logger.debug("Args: %s", parser)
 
+    from vemonitor_m8.app_run import AppRun
     AppRun(
         block=parser.block,
-        app=parser.app
+        app=parser.app,
+        processes=parser.processes,
+        conf_cache=parser.conf_cache,
+        watch_conf=parser.watch_conf
     )
 
 
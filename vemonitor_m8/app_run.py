@@ -1,22 +1,34 @@
-"""Vemonitor main runner."""
+"""
+Vemonitor main runner.
+
+Configuration loader and block runners are imported on first use.
+"""
 import logging
+from typing import Optional
 from ve_utils.utype import UType as Ut
 
-from vemonitor_m8.core.async_app_run import AsyncAppBlockRun
-from vemonitor_m8.conf_manager.config_loader import ConfigLoader
-
 logging.basicConfig()
 logger = logging.getLogger("vemonitor")
 
 
 class AppRun:
     """Run App Helper"""
-    def __init__(self, block: str, app: str):
+    def __init__(self,
+                 block: str,
+                 app: str,
+                 processes: int = 1,
+                 conf_cache: Optional[str] = None,
+                 watch_conf: Optional[float] = None
+                 ):
         self.conf = None
         self.app = None
+        self.loader = None
         self.params = {
             "block": block,
             "app": app,
+            "processes": processes,
+            "conf_cache": conf_cache,
+            "watch_conf": watch_conf,
         }
         if self.load_conf():
             self.run()
@@ -29,19 +41,60 @@ class AppRun:
         """Load configuration."""
         result = False
         if self.has_params():
-            loader = ConfigLoader()
-            self.conf = loader.get_settings_from_schema(
-                block_name=self.params.get("block"),
-                app_name=self.params.get("app"),
+            from vemonitor_m8.conf_manager.config_loader import ConfigLoader
+            self.loader = ConfigLoader(
+                cache_dir=self.params.get("conf_cache")
+            )
+            self.conf = self.loader.get_settings_from_schema(
+                **self.get_loader_params()
             )
             result = True
         return result
 
+    def get_loader_params(self) -> dict:
+        """Get configuration loader params."""
+        return {
+            "block_name": self.params.get("block"),
+            "app_name": self.params.get("app"),
+        }
+
+    def get_reloader(self):
+        """Get configuration reloader, on SIGHUP or files changes."""
+        from vemonitor_m8.core.config_reload import ConfigReloader
+        return ConfigReloader(
+            loader=self.loader,
+            params=self.get_loader_params(),
+            watch_interval=self.params.get("watch_conf")
+        )
+
     def run(self) -> bool:
-        """Test if instance has params"""
+        """
+        Run app blocks.
+
+        One block is run by AsyncAppBlockRun,
+        several blocks by MultiBlockRun in one process,
+        or by BlockSupervisor if more than one process is requested.
+        Configuration hot reload is not available with BlockSupervisor.
+        """
         if self.conf.is_valid():
             logger.info(
                 "Starting app blocks workers"
             )
-            self.app = AsyncAppBlockRun(self.conf)
-            self.app.run_block()
+            processes = Ut.get_int(self.params.get("processes"), 1)
+            if len(self.conf.app_blocks) == 1:
+                from vemonitor_m8.core.async_app_run import AsyncAppBlockRun
+                self.app = AsyncAppBlockRun(self.conf)
+                self.app.set_reloader(self.get_reloader())
+                self.app.run_block()
+            elif processes > 1:
+                from vemonitor_m8.core.block_supervisor import BlockSupervisor
+                self.app = BlockSupervisor(
+                    self.conf,
+                    nb_processes=processes
+                )
+                self.app.run()
+            else:
+                from vemonitor_m8.core.multi_block_run import MultiBlockRun
+                self.app = MultiBlockRun(self.conf)
+                self.app.set_reloader(self.get_reloader())
+                self.app.run_blocks()
@@ -0,0 +1,212 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Compiled configuration cache Helper.
+
+Store the compiled Config object in a pickle file,
+so an unchanged configuration is loaded without parsing yaml files
+and without jsonschema validations.
+Cache file name is a hash of loader params and package version,
+and the cache entry keeps source files fingerprints
+(path, mtime, size and sha256 hash).
+Searched configuration paths who don't exist are fingerprinted
+as missing files, so a file created later on a higher priority path
+invalidates the entry.
+An entry is used only if all source files are unchanged:
+same mtime and size, or same content hash, and missing files still missing.
+
+Cache files are trusted pickle files,
+cache directory must only be writable by vemonitor user.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import Optional
+from ve_utils.utype import UType as Ut
+from vemonitor_m8.models.config import Config
+from vemonitor_m8.version import VERSION
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class ConfigCache:
+    """Compiled configuration cache Helper"""
+
+    DEFAULT_DIR = os.path.join("~", ".cache", "vemonitor")
+    FILE_PREFIX = "conf_"
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        if not Ut.is_str(cache_dir, not_null=True):
+            cache_dir = self.DEFAULT_DIR
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        # source files paths of last loaded entry
+        self.sources = []
+
+    @staticmethod
+    def get_file_hash(path: str) -> str:
+        """Get sha256 hash of file content."""
+        sha = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(65536), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    @staticmethod
+    def get_fingerprint(path: str) -> Optional[dict]:
+        """Get source file fingerprint, or None if file is not readable."""
+        result = None
+        try:
+            stat = os.stat(path)
+            result = {
+                "path": os.path.abspath(path),
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": ConfigCache.get_file_hash(path)
+            }
+        except OSError:
+            result = None
+        return result
+
+    @staticmethod
+    def get_missing_fingerprint(path: str) -> dict:
+        """Get fingerprint of searched source file, who doesn't exist."""
+        return {
+            "path": os.path.abspath(path),
+            "mtime": None,
+            "size": None,
+            "hash": None
+        }
+
+    @staticmethod
+    def is_missing(fingerprint: dict) -> bool:
+        """Test if fingerprint is a missing source file fingerprint."""
+        return fingerprint.get("hash") is None
+
+    @staticmethod
+    def is_unchanged(fingerprint: dict) -> bool:
+        """
+        Test if source file is unchanged since fingerprint.
+
+        File hash is computed only if mtime or size changed.
+        A missing file is unchanged while it doesn't exist.
+        """
+        result = False
+        try:
+            stat = os.stat(fingerprint.get("path"))
+            if stat.st_mtime_ns == fingerprint.get("mtime")\
+                    and stat.st_size == fingerprint.get("size"):
+                result = True
+            elif stat.st_size == fingerprint.get("size"):
+                result = ConfigCache.get_file_hash(
+                    fingerprint.get("path")
+                ) == fingerprint.get("hash")
+        except OSError:
+            result = ConfigCache.is_missing(fingerprint)
+        return result
+
+    @staticmethod
+    def get_key(params: dict) -> str:
+        """Get cache key from loader params and package version."""
+        data = json.dumps(
+            {"version": VERSION, "params": params},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get_file_path(self, params: dict) -> str:
+        """Get cache file path of loader params."""
+        return os.path.join(
+            self.cache_dir,
+            f"{self.FILE_PREFIX}{ConfigCache.get_key(params)[:32]}.pickle"
+        )
+
+    def load(self, params: dict) -> Optional[Config]:
+        """Load cached Config of params, if source files are unchanged."""
+        result = None
+        path = self.get_file_path(params)
+        if os.path.isfile(path):
+            try:
+                with open(path, "rb") as file:
+                    entry = pickle.load(file)
+                if Ut.is_dict(entry)\
+                        and entry.get("version") == VERSION\
+                        and Ut.is_list(entry.get("sources"), not_null=True)\
+                        and isinstance(entry.get("config"), Config)\
+                        and all(
+                            ConfigCache.is_unchanged(fingerprint)
+                            for fingerprint in entry.get("sources")
+                        ):
+                    result = entry.get("config")
+                    self.sources = [
+                        fingerprint.get("path")
+                        for fingerprint in entry.get("sources")
+                        if not ConfigCache.is_missing(fingerprint)
+                    ]
+            except (OSError, pickle.UnpicklingError,
+                    AttributeError, EOFError, ImportError) as ex:
+                logger.warning(
+                    "[ConfigCache::load] "
+                    "Unable to load configuration cache %s, ex: %s",
+                    path, ex
+                )
+        return result
+
+    def save(self,
+             params: dict,
+             sources: list,
+             config: Config,
+             missing_files: Optional[list] = None
+             ) -> bool:
+        """
+        Write Config and source files fingerprints to cache file.
+
+        missing_files are searched source paths who don't exist.
+        """
+        result = False
+        fingerprints = [
+            ConfigCache.get_fingerprint(source)
+            for source in dict.fromkeys(sources)
+        ]
+        if isinstance(config, Config)\
+                and Ut.is_list(fingerprints, not_null=True)\
+                and all(fingerprints):
+            if Ut.is_list(missing_files):
+                fingerprints.extend([
+                    ConfigCache.get_missing_fingerprint(path)
+                    for path in dict.fromkeys(missing_files)
+                    if not os.path.exists(path)
+                ])
+            path = self.get_file_path(params)
+            tmp_path = f"{path}.tmp"
+            try:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+                with open(tmp_path, "wb") as file:
+                    pickle.dump(
+                        {
+                            "version": VERSION,
+                            "sources": fingerprints,
+                            "config": config
+                        },
+                        file,
+                        protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(tmp_path, path)
+                result = True
+            except (OSError, pickle.PicklingError) as ex:
+                logger.warning(
+                    "[ConfigCache::save] "
+                    "Unable to save configuration cache %s, ex: %s",
+                    path, ex
+                )
+        return result
@@ -26,6 +26,9 @@ from vemonitor_m8.models.config import Config
 from vemonitor_m8.conf_manager.schema_validate import SchemaValidate as sValid
 from vemonitor_m8.conf_manager.config_loader_helper import ConfigLoaderHelper as cHelp
 from vemonitor_m8.conf_manager.data_structure_loader import DataStructureLoader
+from vemonitor_m8.conf_manager.config_cache import ConfigCache
+from vemonitor_m8.conf_manager.device_catalog import DeviceCatalog
+from vemonitor_m8.workers.workers_registry import WorkersRegistry
 from vemonitor_m8.core.exceptions import NullSettingException, YAMLFileNotFound
 
 logging.basicConfig()
@@ -37,8 +40,13 @@ class ConfigLoader(DataStructureLoader):
 
     FILE_NAMES = ("vm_conf.yaml", "dummy_g_conf.yaml", "vemonitor.yaml")
 
-    def __init__(self, file_path=None):
+    def __init__(self, file_path=None, cache_dir: Optional[str] = None):
         DataStructureLoader.__init__(self, self.FILE_NAMES, file_path)
+        self.cache = None
+        # paths of yaml files loaded by last settings load
+        self.loaded_files = []
+        if Ut.is_str(cache_dir, not_null=True):
+            self.cache = ConfigCache(cache_dir)
 
     def _get_settings_from_file(self,
                                 child_list: Optional[list] = None,
@@ -46,7 +54,7 @@ class ConfigLoader(DataStructureLoader):
                                 ) -> dict:
         """Load config from file"""
         # Import the configuration from yaml files
-        imp_conf = self.get_yaml_config(child_list)
+        imp_conf = self.get_yaml_config(child_list, self.loaded_files)
         # Remove unused configuration keys
         if Ut.is_list(keys_list, not_null=True):
             imp_conf = Ut.get_items_from_dict(imp_conf, keys_list)
@@ -120,6 +128,9 @@ class ConfigLoader(DataStructureLoader):
         Use child_list to filter which secondary files to import, and
         keys_list to filter root keys in the imported dictionary.
 
+        If loader has a cache_dir, compiled Config is loaded from cache
+        while source yaml files are unchanged.
+
         Data from yaml files is validated using jsonschema.
         Then the filtered and compiled data is validated a second time,
         with the jsonschema.
@@ -142,8 +153,50 @@ class ConfigLoader(DataStructureLoader):
                     YAMLFileNotFound
         """
         now = time.time()
-        logger.debug("Start loading configuration from yaml.")
+        params = {
+            "file_path": self.file_path,
+            "child_list": child_list,
+            "keys_list": keys_list,
+            "app_name": app_name,
+            "block_name": block_name
+        }
+        output = None
+        if self.cache is not None:
+            output = self.cache.load(params)
+        if output is not None:
+            self.loaded_files = list(self.cache.sources)
+            logger.info(
+                "Load configuration data from cache, completed in %ss.",
+                round(time.time()-now, 6)
+            )
+        else:
+            output = self.compile_settings(
+                child_list=child_list,
+                keys_list=keys_list,
+                app_name=app_name,
+                block_name=block_name
+            )
+            if self.cache is not None:
+                self.cache.save(
+                    params, self.loaded_files, output, self.missing_files
+                )
+            logger.info(
+                "Load and validate, configuration data, completed in %ss.",
+                round(time.time()-now, 6)
+            )
+        return output
 
+    def compile_settings(self,
+                         child_list: Optional[list] = None,
+                         keys_list: Optional[list] = None,
+                         app_name: Optional[str] = None,
+                         block_name: Optional[str] = None
+                         ) -> Config:
+        """Get, validate and compile configuration settings from files."""
+        logger.debug("Start loading configuration from yaml.")
+        self.loaded_files = []
+        # workers plugins extend appConnectors and appBlocks schemas
+        WorkersRegistry.discover()
         output = self.set_settings_from_files(
             child_list=child_list,
             keys_list=keys_list,
@@ -151,20 +204,19 @@ class ConfigLoader(DataStructureLoader):
             block_name=block_name
         )
 
-        data_structure = self.get_yaml_data_structure(
-            file_path="victronDeviceData.yaml"
-        )
+        # device catalog is loaded from his prebuilt index
+        catalog = DeviceCatalog.load(loaded_files=self.loaded_files)
         app_blocks_columns = output.get_app_blocks_columns()
-        filtered_checks = cHelp.get_data_structure(
-            data_structure=data_structure,
+        filtered_checks = catalog.get_data_structure(
             points=app_blocks_columns
-            )
+        )
         # ToDo: userColumnsChecks.yaml must be appended to victronDeviceData
         # ToDo: userColumnsChecks.yaml must be loaded from defined conf path
         try:
             # get columns checks from user file
             data_structure = self.get_yaml_data_structure(
-                file_path="userColumnsChecks.yaml"
+                file_path="userColumnsChecks.yaml",
+                loaded_files=self.loaded_files
             )
             filtered_checks.update(cHelp.get_data_structure(
                 data_structure=data_structure,
@@ -176,8 +228,4 @@ class ConfigLoader(DataStructureLoader):
             pass
 
         output.set_data_structures(filtered_checks)
-        logger.info(
-            "Load and validate, configuration data, completed in %ss.",
-            round(time.time()-now, 6)
-        )
         return output
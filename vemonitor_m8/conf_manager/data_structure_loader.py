@@ -52,7 +52,8 @@ class DataStructureLoader(Loader):
         Loader.__init__(self, file_names, file_path)
 
     def get_yaml_data_structure(self,
-                                file_path: Optional[str] = None
+                                file_path: Optional[str] = None,
+                                loaded_files: Optional[list] = None
                                 ) -> Optional[Union[dict, list]]:
         """
             Class Methods which loads the provided YAML
@@ -81,7 +82,9 @@ class DataStructureLoader(Loader):
             path = Opath.join(user_path, file_path)
 
         if Ut.is_str(path) and Opath.isfile(path):
-            return YmlConfLoader.get_config(path)
+            return YmlConfLoader.get_config(
+                path, loaded_files=loaded_files
+            )
         else:
             raise YAMLFileNotFound(
                 "[Loader::get_yaml_data_structure] Fatal Error: "
@@ -0,0 +1,203 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Victron device catalog Helper.
+
+The device catalog (confFiles/victronDeviceData.yaml) is compiled
+into a generated python module (victron_device_index),
+shipped with the package, and imported at start without yaml parsing.
+The index keeps the sha256 hash of his yaml source,
+if the yaml source changed the catalog is loaded and validated from yaml.
+
+Regenerate the index after editing the yaml source:
+    python -m vemonitor_m8.conf_manager.device_catalog
+"""
+import copy
+import importlib
+import logging
+import os
+import pprint
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.conf_manager.config_cache import ConfigCache
+from vemonitor_m8.conf_manager.yaml_loader import YmlConfLoader
+from vemonitor_m8.conf_manager.shema_validate_selector\
+    import SchemaValidateSelector as jValid
+from vemonitor_m8.core.exceptions import SettingInvalidException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class DeviceCatalog:
+    """Victron device catalog Helper"""
+
+    SOURCE_FILE = "victronDeviceData.yaml"
+    INDEX_MODULE = "vemonitor_m8.conf_manager.victron_device_index"
+
+    def __init__(self, devices: dict, points: dict):
+        self.devices = devices
+        self.points = points
+
+    @staticmethod
+    def get_source_path() -> str:
+        """Get yaml source file path of device catalog."""
+        return os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "confFiles",
+            DeviceCatalog.SOURCE_FILE
+        )
+
+    @staticmethod
+    def get_index_path() -> str:
+        """Get generated index module file path."""
+        return os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            f"{DeviceCatalog.INDEX_MODULE.rsplit('.', 1)[-1]}.py"
+        )
+
+    @classmethod
+    def from_yaml(cls,
+                  path: Optional[str] = None,
+                  loaded_files: Optional[list] = None
+                  ) -> 'DeviceCatalog':
+        """Load and validate device catalog from yaml source."""
+        if not Ut.is_str(path, not_null=True):
+            path = DeviceCatalog.get_source_path()
+        data = YmlConfLoader.get_config(path, loaded_files=loaded_files)
+        if not jValid.is_valid_data_structure_conf(data):
+            raise SettingInvalidException(
+                "Error on Device Data Structure configuration, "
+                f"file {path} is not valid."
+            )
+        return cls(
+            devices=data.get('devices'),
+            points=data.get('points')
+        )
+
+    @classmethod
+    def from_index(cls, source_hash: str) -> Optional['DeviceCatalog']:
+        """Get device catalog from generated index, if up to date."""
+        result = None
+        try:
+            index = importlib.import_module(DeviceCatalog.INDEX_MODULE)
+            if index.SOURCE_HASH == source_hash:
+                result = cls(devices=index.DEVICES, points=index.POINTS)
+        except (ImportError, AttributeError):
+            result = None
+        return result
+
+    @classmethod
+    def load(cls, loaded_files: Optional[list] = None) -> 'DeviceCatalog':
+        """
+        Load device catalog from index, or from yaml if index is outdated.
+
+        Yaml source path is appended to loaded_files in both cases.
+        """
+        path = DeviceCatalog.get_source_path()
+        result = cls.from_index(ConfigCache.get_file_hash(path))
+        if result is None:
+            logger.info(
+                "[DeviceCatalog::load] "
+                "Device catalog index is outdated, loading %s. "
+                "Regenerate it with: "
+                "python -m vemonitor_m8.conf_manager.device_catalog",
+                path
+            )
+            result = cls.from_yaml(path)
+        if isinstance(loaded_files, list):
+            loaded_files.append(path)
+        return result
+
+    def get_point(self, key: str) -> Optional[dict]:
+        """Get data structure point."""
+        return self.points.get(key)
+
+    def get_device_columns(self, device: str) -> list:
+        """Get device columns."""
+        return self.devices.get(device) or []
+
+    def get_device_points(self, device: str) -> dict:
+        """Get device data structure points, by column."""
+        return {
+            key: self.points[key]
+            for key in self.get_device_columns(device)
+            if key in self.points
+        }
+
+    def get_data_structure(self,
+                           points: Optional[list] = None,
+                           devices: Optional[list] = None
+                           ) -> dict:
+        """
+        Get data structure conf of points and devices.
+
+        All points or devices are returned if not filtered.
+        Returned data is a copy of catalog data.
+        """
+        if not Ut.is_list(devices, not_null=True):
+            devices = self.devices
+        if not Ut.is_list(points, not_null=True):
+            points = self.points
+        return copy.deepcopy({
+            'devices': {
+                key: self.devices[key]
+                for key in devices
+                if key in self.devices
+            },
+            'points': {
+                key: self.points[key]
+                for key in points
+                if key in self.points
+            }
+        })
+
+    def get_index_source(self, source_hash: str) -> str:
+        """Get generated index module source code."""
+        return "\n".join([
+            '"""',
+            f"Victron device catalog index, generated from "
+            f"confFiles/{DeviceCatalog.SOURCE_FILE}.",
+            "",
+            "Do not edit, regenerate it with:",
+            "    python -m vemonitor_m8.conf_manager.device_catalog",
+            '"""',
+            "",
+            "SOURCE_HASH = (",
+            f'    "{source_hash}"',
+            ")",
+            "",
+            f"DEVICES = {DeviceCatalog.format_data(self.devices)}",
+            "",
+            f"POINTS = {DeviceCatalog.format_data(self.points)}",
+            ""
+        ])
+
+    @staticmethod
+    def format_data(data: dict) -> str:
+        """Format index data as python literal, in yaml source order."""
+        return pprint.pformat(data, width=68, compact=True, sort_dicts=False)
+
+    @staticmethod
+    def write_index(path: Optional[str] = None) -> bool:
+        """Compile yaml source to generated index module."""
+        if not Ut.is_str(path, not_null=True):
+            path = DeviceCatalog.get_index_path()
+        source_path = DeviceCatalog.get_source_path()
+        catalog = DeviceCatalog.from_yaml(source_path)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(catalog.get_index_source(
+                ConfigCache.get_file_hash(source_path)
+            ))
+        return True
+
+
+if __name__ == "__main__":
+    DeviceCatalog.write_index()
@@ -42,6 +42,8 @@ class Loader():
                  ):
         self.settings = None
         self.file_path = None
+        # searched paths of configuration file, who don't exist
+        self.missing_files = []
         self.set_file_path(
             file_name=file_names,
             base_path=file_path
@@ -78,6 +80,7 @@ class Loader():
             :doc-author: Trelent
         """
         self.file_path = None
+        self.missing_files = []
         if not Ut.is_str(base_path, not_null=True)\
                 or not os.path.isdir(base_path):
             base_path = None
@@ -87,9 +90,13 @@ class Loader():
                 gpath = os.path.join(base_path, file_name)
                 if os.path.isfile(gpath):
                     self.file_path = gpath
+                else:
+                    self.missing_files.append(gpath)
 
             if self.file_path is None:
-                self.file_path = Loader.get_real_file_path(file_name)
+                self.file_path = Loader.get_real_file_path(
+                    file_name, self.missing_files
+                )
 
         elif Ut.is_tuple(file_name) or Ut.is_list(file_name):
             tmp = None
@@ -99,9 +106,10 @@ class Loader():
                     if os.path.isfile(tmp):
                         self.file_path = tmp
                         break
+                    self.missing_files.append(tmp)
 
                 if tmp is None:
-                    tmp = Loader.get_real_file_path(name)
+                    tmp = Loader.get_real_file_path(name, self.missing_files)
 
                     if Ut.is_str(tmp) and os.path.isfile(tmp):
                         self.file_path = tmp
@@ -116,7 +124,8 @@ class Loader():
                 )
 
     def get_yaml_config(self,
-                        child_list: Optional[list] = None
+                        child_list: Optional[list] = None,
+                        loaded_files: Optional[list] = None
                         ) -> Optional[Union[dict, list]]:
         """
         Loads the provided YAML file from self.file_path
@@ -133,12 +142,18 @@ class Loader():
             >>> {...} # Content of yaml files (result can be a list)
         :param child_list: list or None: List of yaml file names to import,
             others are not.
+        :param loaded_files: list or None: If set,
+            paths of loaded files are appended to it.
         :return: list dict or None: The loaded YAML data
         """
-        return YmlConfLoader.get_config(self.file_path, child_list)
+        return YmlConfLoader.get_config(
+            self.file_path, child_list, loaded_files
+        )
 
     @staticmethod
-    def get_real_file_path(file_path: Optional[str]) -> Optional[str]:
+    def get_real_file_path(file_path: Optional[str],
+                           missing_files: Optional[list] = None
+                           ) -> Optional[str]:
         """
             Try to return a full path from a given <file_path>
             If the path is an absolute on, we return it directly.
@@ -153,6 +168,8 @@ class Loader():
 
             :param file_path file path to test
             :type file_path: str
+            :param missing_files: If set,
+                searched paths who don't exist are appended to it.
             :return: absolute path to the file file_path
                 or None if is doen't exist
         """
@@ -168,10 +185,14 @@ class Loader():
                     logger.debug("File found in %s", current_path)
                     result = sel_path
                     break
+                if Ut.is_list(missing_files):
+                    missing_files.append(sel_path)
 
         else:
             if os.path.isfile(file_path):
                 result = file_path
+            elif Ut.is_list(missing_files):
+                missing_files.append(file_path)
         return result
 
     @staticmethod
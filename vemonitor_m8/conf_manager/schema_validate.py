@@ -9,6 +9,13 @@ and validate the instance data.
 If any validation error occurs, raise exception.
 Or if no error occurs, return data tested object
 
+Schemas are loaded and checked once, and their compiled validators
+(with format checking) are kept in a registry, shared by all calls.
+jsonschema is imported on first use, so a configuration loaded from cache
+don't import it.
+Schema extensions callbacks can extend loaded schemas,
+used by workers plugins to declare their configuration schemas.
+
 :Example:
     > SchemaValidate.validate_data(
         data=appBlocks_data,
@@ -21,9 +28,8 @@ Or if no error occurs, return data tested object
 """
 import inspect
 import logging
+import threading
 from os import path as Opath
-from jsonschema import validate
-from jsonschema.exceptions import SchemaError
 
 from ve_utils.ujson import UJson
 from ve_utils.utype import UType as Ut
@@ -43,6 +49,63 @@ class SchemaValidate():
     """Simple Class to load jsonschema file and validate data."""
 
     MAX_FILE_SIZE = 80000
+    # registries of loaded schemas and compiled validators
+    _schemas = {}
+    _validators = {}
+    # schema extensions callbacks, by schema key
+    _extensions = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def add_schema_extension(cls, file_key: str, callback) -> bool:
+        """
+        Add schema extension callback, if not already added.
+
+        Callback gets loaded schema and returns extended schema,
+        schema must be copied before being extended.
+        Loaded schemas and validators registries are cleared.
+        """
+        result = False
+        if Ut.is_str(file_key, not_null=True) and callable(callback):
+            with cls._lock:
+                callbacks = cls._extensions.setdefault(file_key, [])
+                if callback not in callbacks:
+                    callbacks.append(callback)
+                    result = True
+            cls.clear_cache()
+        return result
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear loaded schemas and compiled validators registries."""
+        with cls._lock:
+            cls._schemas = {}
+            cls._validators = {}
+
+    @classmethod
+    def get_validator(cls, schema: dict):
+        """
+        Get compiled validator of schema.
+
+        Schema is checked once, validators are kept for loaded schemas.
+        """
+        # jsonschema is imported on first validation
+        from jsonschema import validators
+        entry = cls._validators.get(id(schema))
+        if entry is None or entry[0] is not schema:
+            validator_class = validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            entry = (
+                schema,
+                validator_class(
+                    schema,
+                    format_checker=validator_class.FORMAT_CHECKER
+                )
+            )
+            if any(item is schema for item in cls._schemas.values()):
+                with cls._lock:
+                    cls._validators[id(schema)] = entry
+        return entry[1]
 
     @classmethod
     def validate_data(cls, data: any, shem_key_path: str) -> None:
@@ -74,6 +137,7 @@ class SchemaValidate():
         .. raises:: ValidationError, SchemaError, ErrorTree
         .. warnings:: Class Method and Public
         """
+        from jsonschema.exceptions import SchemaError
         schema = SchemaValidate.load_schema(shem_key_path)
         if Ut.is_dict(schema, not_null=True):
             return SchemaValidate.validate_data_from_schema(data, schema)
@@ -111,8 +175,13 @@ class SchemaValidate():
         .. raises:: ValidationError, SchemaError, ErrorTree
         .. warnings:: Class Method and Public
         """
+        from jsonschema.exceptions import SchemaError, best_match
         if Ut.is_dict(schema, not_null=True):
-            validate(instance=data, schema=schema)
+            error = best_match(
+                cls.get_validator(schema).iter_errors(data)
+            )
+            if error is not None:
+                raise error
             return data
         raise SchemaError(
             f"Fatal error: invalid jsonschema : {schema}"
@@ -125,6 +194,9 @@ class SchemaValidate():
         """
         Load json schema from file_key, and return parsed content.
 
+        Schema files are loaded once, and parsed content is shared
+        by all calls, it must not be modified.
+
         First get the file name, adding "_schema.json"
         at the end of file_key value.
         Then use the current script path to locate the schema directory path.
@@ -151,12 +223,26 @@ class SchemaValidate():
         .. raises:: ValidationError, SchemaError, ErrorTree
         .. warnings:: Class Method and Private
         """
+        from jsonschema.exceptions import SchemaError
         if not Ut.is_str(file_key, not_null=True) or Opath.isabs(file_key):
             raise SchemaError(
                 f"Fatal error, jsonschema for key {file_key}."
                 "is not valid"
             )
+        data = cls._schemas.get(file_key)
+        if data is None:
+            data = cls._load_schema_file(file_key)
+            for callback in cls._extensions.get(file_key, []):
+                data = callback(data)
+            if Ut.is_dict(data, not_null=True):
+                with cls._lock:
+                    data = cls._schemas.setdefault(file_key, data)
+        return data
 
+    @classmethod
+    def _load_schema_file(cls, file_key: str):
+        """Read and parse json schema file of file_key."""
+        from jsonschema.exceptions import SchemaError
         current_script_path = Opath.dirname(
             Opath.abspath(inspect.getfile(inspect.currentframe()))
         )
@@ -11,13 +11,17 @@ Used to load yaml configuration file.
      - Licence:
          https://github.com/kalliope-project/kalliope/blob/master/LICENSE.md
 
+ Yaml files are parsed with libyaml CSafeLoader if available,
+ each file is parsed once per load, and his parse time is logged on debug.
+
  .. seealso:: Loader
  .. raises:: YAMLFileNotFound, YAMLFileEmpty, YAMLFileError
 """
+import copy
 import logging
 import os
+import time
 from typing import Optional, Union
-import yaml
 from ve_utils.utype import UType as Ut
 from vemonitor_m8.core.exceptions import \
     YAMLFileNotFound, YAMLFileEmpty, YAMLFileError
@@ -38,7 +42,8 @@ class YmlConfLoader:
 
     @staticmethod
     def get_config(yaml_file: Optional[str],
-                   child_list: Optional[list] = None
+                   child_list: Optional[list] = None,
+                   loaded_files: Optional[list] = None
                    ) -> Optional[Union[dict, list]]:
         """
         Load the configuration file.
@@ -55,6 +60,8 @@ class YmlConfLoader:
         :param child_list:list or None=None:
             Used to Import only the list of childs
             from a parent configuration file.
+        :param loaded_files:list or None=None:
+            If set, paths of loaded files are appended to it.
         :return: The content of the configuration file.
 
         :Example:
@@ -86,6 +93,13 @@ class YmlConfLoader:
                 child_list)
 
             result = inc_import.get_data()
+            if Ut.is_list(loaded_files):
+                loaded_files.extend(inc_import.files)
+            logger.debug(
+                "Files loaded in %ss: %s",
+                round(sum(inc_import.timings.values()), 6),
+                inc_import.timings
+            )
         else:
             raise YAMLFileNotFound(f"File {file_path_to_load} not found")
         return result
@@ -135,6 +149,9 @@ class IncludeImport:
         """
         self.cumuled_size = 0
         self.data = None
+        self.files = []
+        self.timings = {}
+        self._parsed = {}
         self.get_master_conf(file_path)
 
     MAX_FILE_SIZE, MAX_TOTAL_SIZE = 500000, 500000
@@ -177,8 +194,7 @@ class IncludeImport:
                     and IncludeImport.is_yaml_ext(file_path):
                 self.cumuled_size = file_size
                 # load the yaml file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    self.data = yaml.safe_load(f)
+                self.data = self.load_file(file_path)
             else:
                 raise YAMLFileError(
                     f"[YAMLLoader] File {file_path} is too big ( > 500Mb ) "
@@ -254,9 +270,7 @@ class IncludeImport:
                         IncludeImport.is_yaml_ext(file_path):
 
                     self.cumuled_size = self.cumuled_size + file_size
-
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        conf = yaml.safe_load(f)
+                    conf = self.load_file(file_path)
                 else:
                     raise YAMLFileError(
                         f"[YAMLLoader] File {file_path} is too big, "
@@ -420,6 +434,40 @@ class IncludeImport:
                 res = True
         return res
 
+    def load_file(self, file_path: str) -> Optional[Union[dict, list]]:
+        """
+        Parse yaml file once per load, and register his parse time.
+
+        A copy of parsed data is returned, so a file included twice
+        is not changed by updates of his other include.
+        """
+        path = os.path.abspath(file_path)
+        if path not in self._parsed:
+            start = time.perf_counter()
+            with open(file_path, "r", encoding="utf-8") as f:
+                self._parsed[path] = IncludeImport.safe_load(f)
+            self.timings[file_path] = round(time.perf_counter() - start, 6)
+            self.files.append(file_path)
+            logger.debug(
+                "File %s parsed in %ss with %s.",
+                file_path,
+                self.timings[file_path],
+                IncludeImport.get_loader().__name__
+            )
+        return copy.deepcopy(self._parsed[path])
+
+    @staticmethod
+    def get_loader():
+        """Get yaml safe loader, libyaml CSafeLoader if available."""
+        import yaml
+        return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    @staticmethod
+    def safe_load(stream) -> Optional[Union[dict, list]]:
+        """Parse yaml stream, yaml is imported on first use."""
+        import yaml
+        return yaml.load(stream, Loader=IncludeImport.get_loader())
+
     @staticmethod
     def is_yaml_ext(file_name: str) -> bool:
         """Test if file has yaml extension."""
@@ -7,12 +7,15 @@ from typing import Optional
 from vemonitor_m8.core.utils import Utils as Ut
 from vemonitor_m8.events.app_block_events import AppBlockEvents
 from vemonitor_m8.core.data_cache import DataCache
+from vemonitor_m8.models.workers import InputTimeSeriesWorker
 from vemonitor_m8.models.workers import WorkersHelper
-from vemonitor_m8.workers.redis.redis_cache import RedisCache
 from vemonitor_m8.models.inputs_cache import InputsCache
 from vemonitor_m8.core.data_checker import DataChecker
+from vemonitor_m8.core.batch_checker import BatchChecker
+from vemonitor_m8.core.deadband_filter import DeadbandFilter
 from vemonitor_m8.models.config import Config
 from vemonitor_m8.workers.workers_manager import WorkersManager
+from vemonitor_m8.workers.active_connectors import SharedConnectors
 from vemonitor_m8.core.exceptions import DeviceInputValueError, VeMonitorError
 from vemonitor_m8.core.exceptions import RedisConnectionException
 from vemonitor_m8.core.exceptions import SettingInvalidException
@@ -28,14 +31,26 @@ logger = logging.getLogger("vemonitor")
 class AppBlockRun:
     """Async App block run Helper"""
 
-    def __init__(self, conf: Config):
+    def __init__(self,
+                 conf: Config,
+                 block_index: int = 0,
+                 shared_connectors: Optional[SharedConnectors] = None
+                 ):
         self._run = False
         self.conf: Optional[Config] = None
+        self.block_index = block_index
         self.events = AppBlockEvents()
         self.inputs_data: Optional[InputsCache] = None
-        self.workers = WorkersManager()
+        self.workers = WorkersManager(shared_connectors=shared_connectors)
+        self._check_plans = {}
+        self._ingests = {}
+        self._batch_checkers = {}
+        self.deadband: Optional[DeadbandFilter] = None
         if self.set_conf(conf)\
                 and self.init_data_cache():
+            self.deadband = DeadbandFilter.from_points(
+                self.conf.data_structures.get('points')
+            )
             self._run = True
 
     def is_ready(self) -> bool:
@@ -46,7 +61,35 @@ class AppBlockRun:
 
     def is_conf_ready(self) -> bool:
         """Test if class instance have valid battery_bank property."""
-        return AppBlockRun.is_conf(self.conf)
+        return AppBlockRun.is_conf(self.conf)\
+            and self.conf.has_app_block_key(self.block_index)
+
+    def get_block(self) -> Optional[dict]:
+        """Get app block run by instance."""
+        result = None
+        if self.is_conf_ready():
+            result = self.conf.app_blocks[self.block_index]
+        return result
+
+    def get_block_name(self) -> Optional[str]:
+        """Get app block name."""
+        result = None
+        block = self.get_block()
+        if Ut.is_dict(block, not_null=True):
+            result = block.get('name')
+        return result
+
+    def get_cache_name(self) -> str:
+        """
+        Get redis inputs cache name.
+
+        Each block has his own cache name
+        if configuration contains more than one block.
+        """
+        result = "inputs_cache"
+        if len(self.conf.app_blocks) > 1:
+            result = f"inputs_cache_{self.get_block_name()}"
+        return result
 
     def is_cache_ready(self) -> bool:
         """Test if class instance have valid battery_bank property."""
@@ -57,12 +100,15 @@ class AppBlockRun:
         result = False
         if self.is_conf_ready():
             redis_cache = self.conf.get_redis_cache_by_key(  # type: ignore
-                index=0
+                index=self.block_index
             )
             if Ut.is_dict(redis_cache, not_null=True):
+                # redis is imported only by blocks using Redis cache
+                from vemonitor_m8.workers.redis.redis_cache import RedisCache
                 try:
                     self.inputs_data = RedisCache(
                         max_rows=redis_cache.get("max_data_points"),
+                        cache_name=self.get_cache_name(),
                         connector=self.get_app_connector_by_key_item(
                             item_key="redis",
                             source=redis_cache.get("source")
@@ -113,19 +159,84 @@ class AppBlockRun:
             )
         return result
 
+    def get_check_plan(self, columns: list) -> dict:
+        """
+        Get input data check plan of columns.
+
+        Plans are compiled once per columns list, from data structures points.
+        """
+        key = tuple(columns)
+        result = self._check_plans.get(key)
+        if result is None:
+            result = DataChecker.compile_plan(
+                columns,
+                self.conf.data_structures.get('points')
+            )
+            self._check_plans[key] = result
+        return result
+
+    def get_ingest(self, columns: list):
+        """Get single pass ingest function of columns, compiled once."""
+        key = tuple(columns)
+        result = self._ingests.get(key)
+        if result is None:
+            result = AppBlockRun.compile_ingest(self.get_check_plan(columns))
+            self._ingests[key] = result
+        return result
+
+    def get_batch_checker(self, columns: list) -> BatchChecker:
+        """Get multi rows input data checker of columns, compiled once."""
+        key = tuple(columns)
+        result = self._batch_checkers.get(key)
+        if result is None:
+            result = BatchChecker(
+                columns,
+                self.conf.data_structures.get('points')
+            )
+            self._batch_checkers[key] = result
+        return result
+
+    @staticmethod
+    def compile_ingest(plan: dict):
+        """
+        Compile single pass ingest function from check plan.
+
+        Ingest function projects raw data on plan columns,
+        checks and formats values, and adds time keys if time_key is set,
+        building the cache row in one pass.
+        """
+        items = tuple(plan.items())
+
+        def ingest(data: dict, time_key: Optional[float] = None):
+            row = {
+                key: converter(data[key])
+                for key, converter in items
+                if key in data
+            }
+            if not row:
+                row = None
+            elif time_key is not None:
+                row['time'] = time_key
+                row['time_ref'] = AppBlockRun.get_time_ref(time_key)
+            return row
+        return ingest
+
     def format_input_data(self,
                           data: dict,
-                          columns: Optional[list] = None
+                          columns: Optional[list] = None,
+                          time_key: Optional[float] = None
                           ) -> dict:
-        """Format input data."""
+        """
+        Format input data.
+
+        Raw data is projected on columns, checked, formatted
+        and time keys are added if time_key is set, in one pass.
+        """
         result = None
-        data = Ut.get_items_from_dict(data, columns)
-        if Ut.is_dict(data, not_null=True):
+        if Ut.is_dict(data, not_null=True)\
+                and Ut.is_list(columns, not_null=True):
             try:
-                result = DataChecker.check_input_columns(
-                    data,
-                    self.conf.data_structures.get('points')
-                )
+                result = self.get_ingest(columns)(data, time_key)
             except (
                 DeviceDataConfError,
                 DeviceInputValueError
@@ -134,11 +245,44 @@ class AppBlockRun:
                     "Fatal Error: Device Data Error. "
                     "See Your device data configuration. "
                     "Or some ipnut value is bad type"
-                    f"data checked: {data}"
+                    f"data checked: {Ut.get_items_from_dict(data, columns)}"
                 ) from ex
 
         return result
 
+    def format_input_rows(self,
+                          rows: list,
+                          columns: Optional[list],
+                          time_keys: list
+                          ) -> list:
+        """
+        Format input rows of one node, column by column.
+
+        Same results than format_input_data on each row,
+        rows without any value are None.
+        """
+        result = [None] * len(rows)
+        if Ut.is_list(rows, not_null=True)\
+                and Ut.is_list(columns, not_null=True):
+            checked, errors = self.get_batch_checker(columns)\
+                .check_rows(rows)
+            if errors:
+                index, _, message = errors[0]
+                raise DeviceDataConfError(
+                    "Fatal Error: Device Data Error. "
+                    "See Your device data configuration. "
+                    "Or some ipnut value is bad type"
+                    f"data checked: {rows[index]}, error: {message}"
+                )
+            for index, row in enumerate(checked):
+                if row:
+                    row['time'] = time_keys[index]
+                    row['time_ref'] = AppBlockRun.get_time_ref(
+                        time_keys[index]
+                    )
+                    result[index] = row
+        return result
+
     def get_app_connector_by_key_item(self, item_key: str, source: str):
         """Get connector by key item and source."""
         return self.conf.get_app_connector_by_key_item(
@@ -152,6 +296,94 @@ class AppBlockRun:
                 and len(self.inputs_data.data) >= 5:
             self.events.on_worker_data_ready()
 
+    def on_data_cached(self, time_key: float):
+        """On input data added to cache event."""
+
+    def on_time_series_cached(self, time_key: int):
+        """On time series rows added to cache event, with oldest time key."""
+
+    def filter_input_data(self,
+                          time_key: float,
+                          node: str,
+                          data: dict
+                          ) -> Optional[dict]:
+        """
+        Remove values suppressed by points deadband rules.
+
+        Return None if no value is kept.
+        """
+        result = data
+        if self.deadband is not None:
+            result = self.deadband.filter_data(time_key, node, data)
+            if not DeadbandFilter.has_values(result):
+                result = None
+        return result
+
+    def add_input_data(self, time_key: float, node: str, data: dict) -> bool:
+        """Add input node data to cache, after deadband filter."""
+        result = False
+        data = self.filter_input_data(time_key, node, data)
+        if data is not None:
+            result = self.inputs_data.add_data_cache(
+                time_key=time_key,
+                node=node,
+                data=data
+            )
+            self.on_data_cached(time_key)
+        return result
+
+    def register_input_nodes(self, worker) -> bool:
+        """Compile input worker check plans, and init his nodes in cache."""
+        if isinstance(worker, InputTimeSeriesWorker):
+            nodes = worker.columns
+        else:
+            nodes = {worker.get_name(): worker.columns}
+        for node, columns in nodes.items():
+            self.get_check_plan(columns)
+            self.inputs_data.register_node(node=node)
+        return True
+
+    def add_time_series_data(self,
+                             worker: InputTimeSeriesWorker,
+                             data: dict
+                             ) -> bool:
+        """
+        Add time series input rows to cache, with their own time keys.
+
+        Rows of each node are formatted in one batch, column by column.
+        Rows can be older than rows already sent to outputs,
+        so oldest cached time key is notified to rewind outputs.
+        """
+        result = False
+        if Ut.is_dict(data, not_null=True):
+            min_time = None
+            nodes_rows = {}
+            for time_key, nodes in data.items():
+                for node, values in nodes.items():
+                    time_keys, rows = nodes_rows.setdefault(node, ([], []))
+                    time_keys.append(time_key)
+                    rows.append(values)
+            nodes_rows = {
+                node: iter(self.format_input_rows(
+                    rows, worker.columns.get(node), time_keys
+                ))
+                for node, (time_keys, rows) in nodes_rows.items()
+            }
+            for time_key, nodes in data.items():
+                for node in nodes:
+                    row = next(nodes_rows[node])
+                    if Ut.is_dict(row, not_null=True)\
+                            and self.add_input_data(
+                                time_key=time_key,
+                                node=node,
+                                data=row):
+                        result = True
+                        if min_time is None or time_key < min_time:
+                            min_time = time_key
+            if min_time is not None:
+                self.on_time_series_cached(min_time)
+        return result
+
     def read_worker_data(self,
                          worker_key: str
                          ):
@@ -162,17 +394,15 @@ class AppBlockRun:
             try:
                 time_key = time.time()
                 data = worker.read_data()
-                if Ut.is_dict(data, not_null=True):
-                    data = self.format_input_data(data, worker.columns)
+                if isinstance(worker, InputTimeSeriesWorker):
+                    test = self.add_time_series_data(worker, data)
+                    worker.set_rows_cached()
+                elif Ut.is_dict(data, not_null=True):
+                    data = self.format_input_data(
+                        data, worker.columns, time_key
+                    )
                     if Ut.is_dict(data, not_null=True):
-                        data.update({'time': time_key})
-                        data.update({
-                            'time_ref': Ut.get_rounded_float(
-                                    time_key - int(time_key/1000) * 1000, 3
-                                    )
-                        })
-
-                        self.inputs_data.add_data_cache(
+                        self.add_input_data(
                             time_key=time_key,
                             node=worker.get_name(),
                             data=data
@@ -210,9 +440,16 @@ class AppBlockRun:
             )
         return test
 
+    @staticmethod
+    def get_time_ref(time_key: float) -> float:
+        """Get time_ref key value, seconds in current 1000 seconds."""
+        return Ut.get_rounded_float(
+            time_key - int(time_key/1000) * 1000, 3
+        )
+
     @staticmethod
     def is_conf(conf: Optional[Config]) -> bool:
         """Test if valid conf"""
         return isinstance(conf, Config)\
             and conf.is_valid()\
-            and len(conf.app_blocks) == 1  # type: ignore
+            and len(conf.app_blocks) >= 1  # type: ignore
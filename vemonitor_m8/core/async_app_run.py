@@ -2,16 +2,30 @@
 # -*- coding: utf-8 -*-
 """Async App block run Helper"""
 import logging
+import threading
 import time
 import sys
 import signal
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from vemonitor_m8.core.app_run_main import AppBlockRun
 from vemonitor_m8.core.utils import Utils as Ut
-from vemonitor_m8.core.threads_controller import RepeatTimer, ThreadsController
+from vemonitor_m8.core.threads_controller import ThreadsController
+from vemonitor_m8.core.outputs_pool import OutputsPool
+from vemonitor_m8.core.backpressure import Backpressure
+from vemonitor_m8.core.watermarks import WatermarkStore
+from vemonitor_m8.core.deadband_filter import DeadbandFilter
+from vemonitor_m8.core.deadband_filter import LastValueCarry
+from vemonitor_m8.core.config_reload import ConfigDiff, ConfigReloader
 from vemonitor_m8.models.config import Config
-from vemonitor_m8.models.workers import WorkersHelper
+from vemonitor_m8.models.workers import OutputWorker, WorkersHelper
+from vemonitor_m8.models.workers import InputTimeSeriesWorker
+from vemonitor_m8.workers.active_connectors import SharedConnectors
+from vemonitor_m8.workers.vedirect.vedirect_worker import VedirectWorker
+from vemonitor_m8.workers.vedirect.vedirect_reader_process\
+    import SerialReadersPool
+from vemonitor_m8.workers.vedirect.vedirect_port_reader\
+    import VedirectPortReader
 from vemonitor_m8.core.exceptions import VeMonitorError, WorkerException
 from vemonitor_m8.core.exceptions import DeviceDataConfError
 
@@ -26,19 +40,71 @@ logger = logging.getLogger("vemonitor")
 class AsyncAppBlockRun(AppBlockRun):
     """Async App block run Helper"""
 
-    def __init__(self, conf: Config):
-        AppBlockRun.__init__(self, conf=conf)
-        self._threads = ThreadsController()
-        signal.signal(signal.SIGINT, self.signal_handler)
+    # serial connection wait timeout on fast start mode
+    FAST_WAIT_TIMEOUT = 2
+    # max time to flush cached data to outputs on shutdown
+    DRAIN_TIMEOUT = 10
+    # max time to wait running jobs of workers removed on reload
+    RELOAD_TIMEOUT = 5
+
+    def __init__(self,
+                 conf: Config,
+                 block_index: int = 0,
+                 shared_connectors: Optional[SharedConnectors] = None,
+                 threads: Optional[ThreadsController] = None
+                 ):
+        AppBlockRun.__init__(
+            self,
+            conf=conf,
+            block_index=block_index,
+            shared_connectors=shared_connectors
+        )
+        self.outputs_pool = OutputsPool(shared_connectors=shared_connectors)
+        self.serial_readers = self.init_serial_readers()
+        self.backpressure = self.init_backpressure()
+        self.port_readers = {}
+        self._input_timers = {}
+        self._carry = {}
+        self._first_read = threading.Event()
+        self._late_time: Optional[int] = None
+        self.watermarks = self.init_watermarks()
+        self._is_stopped = False
+        self._inputs_stopped = False
+        self._stop_requested = False
+        self.reloader: Optional[ConfigReloader] = None
+        if isinstance(threads, ThreadsController):
+            # Scheduler and signals are handled by MultiBlockRun
+            self._threads = threads
+        else:
+            self._threads = ThreadsController()
+            signal.signal(signal.SIGINT, self.signal_handler)
+            signal.signal(signal.SIGTERM, self.signal_handler)
+            if hasattr(signal, "SIGHUP"):
+                signal.signal(signal.SIGHUP, self.reload_signal_handler)
 
     def exit_handler(self):
-        """Exit handler"""
-        self.cancel_all_timers()
+        """Exit handler, flush cached data to outputs before exit."""
+        self.graceful_stop()
         sys.exit(1)
 
+    def request_stop(self):
+        """
+        Request block stop, main loop exits and flushes outputs.
+
+        Only flags are set, so it's safe to call from signal handlers,
+        interrupted main loop may hold block locks.
+        """
+        self._stop_requested = True
+        self._run = False
+
     def signal_handler(self, sig, frame):
-        """Sig handler"""
-        self.exit_handler()
+        """Sig handler, graceful stop is run by main loop."""
+        self.request_stop()
+
+    def reload_signal_handler(self, sig, frame):
+        """SIGHUP handler, request configuration reload."""
+        if self.reloader is not None:
+            self.reloader.request()
 
     def close_input_workers(self) -> bool:
         """Read and get data from inputs workers."""
@@ -67,13 +133,175 @@ class AsyncAppBlockRun(AppBlockRun):
         """Cancell all Thread timers."""
         self._run = False
         self._threads.cancel_all_timers()
+        if self.serial_readers is not None:
+            self.serial_readers.stop()
+        self.outputs_pool.shutdown(wait=False)
         time.sleep(0.2)
         self.close_input_workers()
         self.close_output_workers()
 
+    def get_shutdown_conf(self) -> dict:
+        """Get block shutdown configuration."""
+        result = {}
+        block = self.get_block()
+        if Ut.is_dict(block, not_null=True)\
+                and Ut.is_dict(block.get('shutdown'), not_null=True):
+            result = block.get('shutdown')
+        return result
+
+    def get_drain_timeout(self) -> float:
+        """Get max time to flush cached data to outputs on shutdown."""
+        result = self.get_shutdown_conf().get('drain_timeout')
+        if not Ut.is_numeric(result, positive=True):
+            result = self.DRAIN_TIMEOUT
+        return result
+
+    def init_watermarks(self) -> Optional[WatermarkStore]:
+        """Init outputs watermarks store from block shutdown conf."""
+        result = None
+        file_path = self.get_shutdown_conf().get('watermarks_file')
+        if Ut.is_str(file_path, not_null=True):
+            result = WatermarkStore(file_path)
+        return result
+
+    def restore_watermarks(self) -> int:
+        """Restore outputs last_saved_time from watermarks store."""
+        result = 0
+        if self.watermarks is not None:
+            for key, worker in self.workers.loop_on_output_workers():
+                value = self.watermarks.get(WatermarkStore.get_key(
+                    self.get_block_name(), key
+                ))
+                if value is not None\
+                        and value > worker.get_last_saved_time()\
+                        and worker.set_last_saved_time(value):
+                    result += 1
+        return result
+
+    def save_watermarks(self) -> bool:
+        """Save outputs last_saved_time on watermarks store."""
+        result = False
+        if self.watermarks is not None:
+            for key, worker in self.workers.loop_on_output_workers():
+                self.watermarks.set(
+                    WatermarkStore.get_key(self.get_block_name(), key),
+                    worker.get_last_saved_time()
+                )
+            result = self.watermarks.save()
+        return result
+
+    def stop_inputs(self):
+        """
+        Stop inputs timers and serial readers, outputs keep running.
+
+        Rows left on serial readers ring buffers are added to cache.
+        Inputs are stopped only once.
+        """
+        self._run = False
+        if not self._inputs_stopped:
+            self._inputs_stopped = True
+            self._threads.cancel_all_timers()
+            if self.serial_readers is not None:
+                self.serial_readers.stop_processes()
+                with self._threads.lock:
+                    while self.serial_readers.drain(
+                            inputs_data=self.inputs_data,
+                            on_cached=self.on_data_cached,
+                            row_filter=self.filter_input_data) > 0:
+                        pass
+                self.serial_readers.stop()
+
+    def flush_outputs(self, deadline: float) -> bool:
+        """
+        Send all cached rows to every output, partial batches included.
+
+        Outputs are flushed in parallel, on their own thread pools,
+        until they have sent all cached rows or deadline is reached.
+        An output failing to send is not flushed anymore.
+        :return: True if all outputs sent all cached rows.
+        """
+        result = False
+        errors = {
+            key: self.outputs_pool.get_stats(key).get('errors', 0)
+            for key, worker in self.workers.loop_on_output_workers()
+            if self.outputs_pool.get_stats(key) is not None
+        }
+        failed = set()
+        while not result and time.monotonic() < deadline:
+            self.outputs_pool.process_completed(self.workers)
+            self.outputs_pool.check_deadlines()
+            self.rewind_late_outputs()
+            is_pending = False
+            for key, worker in self.workers.loop_on_output_workers():
+                stats = self.outputs_pool.get_stats(key)
+                if key in failed or stats is None:
+                    continue
+                if stats.get('errors') > errors.get(key):
+                    failed.add(key)
+                elif not self.outputs_pool.can_submit(key, worker):
+                    is_pending = True
+                else:
+                    from_time = self.outputs_pool.get_from_time(key, worker)
+                    data, last_time, _ = self.get_output_data(
+                        key, worker, from_time
+                    )
+                    if Ut.is_dict(data, not_null=True)\
+                            and self.outputs_pool.submit(
+                                name=key,
+                                worker=worker,
+                                data=data,
+                                from_time=from_time,
+                                last_time=last_time):
+                        is_pending = True
+            if not is_pending\
+                    and not self.outputs_pool.has_in_flight():
+                result = True
+            else:
+                time.sleep(0.01)
+        self.outputs_pool.process_completed(self.workers)
+        if failed or not result:
+            logger.error(
+                "[AsyncAppBlockRun::flush_outputs] "
+                "Unable to flush all cached data of block %s. "
+                "Failed outputs: %s",
+                self.get_block_name(),
+                sorted(failed)
+            )
+        return result and not failed
+
+    def graceful_stop(self, deadline: Optional[float] = None) -> bool:
+        """
+        Stop block, flushing cached data to outputs before closing.
+
+        Inputs are stopped, cached rows are sent to all outputs,
+        outputs watermarks are saved, and then connectors are closed.
+        :param deadline: time.monotonic() time limit to flush outputs.
+        """
+        result = False
+        if not self._is_stopped:
+            self._is_stopped = True
+            if deadline is None:
+                deadline = time.monotonic() + self.get_drain_timeout()
+            self.stop_inputs()
+            result = self.flush_outputs(deadline)
+            positions = self.get_time_series_positions()
+            self.rewind_late_outputs()
+            self.commit_time_series_inputs(positions)
+            self.save_watermarks()
+            self.outputs_pool.shutdown(wait=False)
+            self.close_input_workers()
+            self.close_output_workers()
+            logger.info(
+                "[AsyncAppBlockRun] Block %s stopped, outputs flushed: %s",
+                self.get_block_name(),
+                result
+            )
+        return result
+
     def format_input_data(self,
                           data: dict,
-                          columns: Optional[list] = None
+                          columns: Optional[list] = None,
+                          time_key: Optional[float] = None
                           ) -> dict:
         """Format input data."""
         result = None
@@ -81,7 +309,8 @@ class AsyncAppBlockRun(AppBlockRun):
             result = AppBlockRun.format_input_data(
                 self,
                 data=data,
-                columns=columns
+                columns=columns,
+                time_key=time_key
             )
         except DeviceDataConfError as ex:
             self.cancel_all_timers()
@@ -93,26 +322,37 @@ class AsyncAppBlockRun(AppBlockRun):
             ) from ex
         return result
 
+    def format_input_rows(self,
+                          rows: list,
+                          columns: Optional[list],
+                          time_keys: list
+                          ) -> list:
+        """Format input rows of one node, column by column."""
+        try:
+            result = AppBlockRun.format_input_rows(
+                self,
+                rows=rows,
+                columns=columns,
+                time_keys=time_keys
+            )
+        except DeviceDataConfError:
+            self.cancel_all_timers()
+            raise
+        return result
+
     def read_worker_data(self,
                          worker_key: str
                          ):
         """Read input data from worker"""
         test = False
         try:
-            start = time.perf_counter()
-            current_thread = threading.current_thread()
             worker = self.workers.get_input_worker(worker_key)
             if WorkersHelper.is_worker(worker):
-                interval = worker.time_interval
-                with self._threads.lock:
-                    test = AppBlockRun.read_worker_data(
-                        self,
-                        worker_key=worker_key
-                    )
-                AsyncAppBlockRun.set_thread_interval(
-                    current_thread=current_thread,
-                    interval=interval,
-                    start=start
+                # serial ports are arbitrated by their own lock,
+                # so inputs on different connectors are read in parallel
+                test = AppBlockRun.read_worker_data(
+                    self,
+                    worker_key=worker_key
                 )
         except VeMonitorError as ex:
             logger.error(
@@ -128,59 +368,118 @@ class AsyncAppBlockRun(AppBlockRun):
 
         return test
 
+    def add_input_data(self, time_key: float, node: str, data: dict) -> bool:
+        """Add input node data to cache, shared with main thread."""
+        with self._threads.lock:
+            return AppBlockRun.add_input_data(
+                self,
+                time_key=time_key,
+                node=node,
+                data=data
+            )
+
     def loop_inputs(self):
         """Run block inputs."""
-        if Ut.is_dict(self.conf.app_blocks[0].get('inputs'), not_null=True):
-            for key, items in self.conf.app_blocks[0].get('inputs').items():
+        block = self.get_block()
+        if Ut.is_dict(block, not_null=True)\
+                and Ut.is_dict(block.get('inputs'), not_null=True):
+            for key, items in block.get('inputs').items():
                 if Ut.is_str(key, not_null=True)\
                         and Ut.is_list(items, not_null=True):
                     for i, item in enumerate(items):
                         yield key, i, item
 
+    def is_fast_start(self) -> bool:
+        """Test if block fast_start mode is enabled."""
+        block = self.get_block()
+        return Ut.is_dict(block, not_null=True)\
+            and block.get('fast_start') is True
+
+    def init_input_item_worker(self,
+                               key: str,
+                               enum_key: int,
+                               item: dict
+                               ):
+        """Init input item worker."""
+        connector = self.get_app_connector_by_key_item(
+            key,
+            item.get('source')
+        )
+        if self.is_fast_start()\
+                and key == "serial"\
+                and Ut.is_dict(connector)\
+                and 'waitTimeout' not in connector:
+            connector = dict(connector, waitTimeout=self.FAST_WAIT_TIMEOUT)
+        return self.workers.init_input_worker(
+            connector=connector,
+            worker_key=key,
+            enum_key=enum_key,
+            item=item
+        )
+
+    def init_input_workers(self, items: list) -> list:
+        """
+        Init input items workers.
+
+        On fast start, first worker of each connector is initialised
+        concurrently, other workers reuse the connector opened.
+        """
+        result = []
+        if self.is_fast_start() and len(items) > 1:
+            firsts = {}
+            for key, i, item in items:
+                firsts.setdefault((key, item.get('source')), (key, i, item))
+            with ThreadPoolExecutor(
+                    max_workers=len(firsts),
+                    thread_name_prefix="input_init") as executor:
+                futures = [
+                    executor.submit(self.init_input_item_worker, *args)
+                    for args in firsts.values()
+                ]
+                for future in futures:
+                    future.result()
+            result = [
+                self.init_input_item_worker(key, i, item)
+                for key, i, item in items
+            ]
+        else:
+            for key, i, item in items:
+                result.append(self.init_input_item_worker(key, i, item))
+                if not self.is_fast_start():
+                    time.sleep(0.5)
+        return result
+
     def add_input_items_timer(self) -> bool:
         """Read and get data from inputs workers."""
         result = True
         min_interval = 0
+        items = []
         for key, i, item in self.loop_inputs():
-            if Ut.is_dict(item, not_null=True):
-                # if valid item
-                worker = self.workers.init_input_worker(
-                    connector=self.get_app_connector_by_key_item(
-                        key,
-                        item.get('source')
-                    ),
-                    worker_key=key,
-                    enum_key=i,
-                    item=item
-                )
-                if WorkersHelper.is_worker(worker):
+            if Ut.is_dict(item, not_null=True)\
+                    and key == "serial"\
+                    and self.serial_readers is not None:
+                # serial item read on reader process
+                if self.add_serial_reader_item(i, item):
                     min_interval = Ut.get_min_in_loop(
                         value=min_interval,
-                        min_val=worker.time_interval
+                        min_val=item.get('time_interval')
                     )
-                    timer_key = f"{key}_{item.get('name')}_{i}"
-                    worker_key = WorkersHelper.get_worker_name(key, item)
-                    item.get('columns').sort()
-                    if self._threads.add_timer_key(
-                        key=timer_key,
-                        interval=worker.time_interval,
-                        callback=self.read_worker_data,
-                        kwargs={
-                            'worker_key': worker_key
-                        }
-                    ):
-                        # init nodes in cache data
-                        self.inputs_data.register_node(
-                            node=worker.get_name()
-                        )
-                    else:
-                        result = False
                 else:
                     result = False
-
-                time.sleep(0.5)
+            elif Ut.is_dict(item, not_null=True):
+                items.append((key, i, item))
             else:
                 result = False
+
+        workers = self.init_input_workers(items)
+        for (key, i, item), worker in zip(items, workers):
+            if WorkersHelper.is_worker(worker):
+                min_interval = Ut.get_min_in_loop(
+                    value=min_interval,
+                    min_val=worker.time_interval
+                )
+            if not self.add_input_worker_timer(key, i, item, worker):
+                result = False
         if not self.workers.get_workers_status():
             raise WorkerException(
                 "Fatal Error: Some Input workers fails. "
@@ -188,99 +487,941 @@ class AsyncAppBlockRun(AppBlockRun):
                 f"Workers Status : {self.workers.get_input_workers_status()}"
             )
 
+        if not self.add_port_readers_timers():
+            result = False
+        if self.is_fast_start():
+            self.stagger_timers()
         self.inputs_data.set_interval_min(min_interval)
         self._threads.start_timers()
+        if self.serial_readers is not None:
+            self.serial_readers.start(
+                points=self.conf.data_structures.get('points')
+            )
+        if self.is_fast_start():
+            self.warm_up_inputs()
+        return result
+
+    def add_input_worker_timer(self,
+                               key: str,
+                               enum_key: int,
+                               item: dict,
+                               worker
+                               ) -> bool:
+        """Add input worker timer, or register it on his port reader."""
+        result = False
+        if WorkersHelper.is_worker(worker):
+            timer_key = f"{self.block_index}_{key}_"\
+                f"{item.get('name')}_{enum_key}"
+            worker_key = WorkersHelper.get_worker_name(key, item)
+            if Ut.is_list(item.get('columns')):
+                item.get('columns').sort()
+            if key == "serial":
+                # serial items are read by their port reader
+                result = self.add_port_reader_item(worker, item)
+            elif self._threads.add_timer_key(
+                key=timer_key,
+                interval=worker.time_interval,
+                callback=self.read_worker_data,
+                kwargs={
+                    'worker_key': worker_key
+                }
+            ):
+                self._input_timers[item.get('name')] = (
+                    timer_key, worker.time_interval
+                )
+                # init nodes in cache data
+                self.register_input_nodes(worker)
+                result = True
+        return result
+
+    def get_inputs_timers(self) -> list:
+        """Get block inputs timers keys and intervals, sorted by key."""
+        result = [
+            (self.get_port_timer_key(source), port_reader.get_tick_interval())
+            for source, port_reader in self.port_readers.items()
+        ]
+        result.extend([
+            timer
+            for timer in self._input_timers.values()
+            if Ut.is_str(timer[0])
+        ])
+        return sorted(result)
+
+    def stagger_timers(self) -> bool:
+        """
+        Spread inputs timers runs across their interval.
+
+        Offsets are deterministic, from timers order,
+        so inputs don't all run on the same second.
+        """
+        result = True
+        timers = self.get_inputs_timers()
+        nb_timers = len(timers)
+        for index, (timer_key, interval) in enumerate(timers):
+            if not self._threads.set_timer_offset(
+                    timer_key,
+                    round(interval * index / nb_timers, 3)):
+                result = False
+        return result
+
+    def warm_up_inputs(self):
+        """
+        Read all inputs once, concurrently, without waiting timers.
+
+        Port readers read all their items, to get first data quickly.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.port_readers) + len(self._input_timers) + 1,
+            thread_name_prefix="input_warm_up"
+        )
+        for source in self.port_readers:
+            executor.submit(self.read_port_data, source, True)
+        for key, worker in self.workers.loop_on_input_workers():
+            if not isinstance(worker, VedirectWorker):
+                executor.submit(self.read_worker_data, key)
+        executor.shutdown(wait=False)
+
+    def wait_first_read(self, timeout: float = 1) -> bool:
+        """Wait until first input data is cached, at most timeout seconds."""
+        start = time.monotonic()
+        result = self._first_read.wait(timeout)
+        if result:
+            logger.info(
+                "[AsyncAppBlockRun] Block %s ready, first data in %ss.",
+                self.get_block_name(),
+                round(time.monotonic() - start, 3)
+            )
+        return result
+
+    def add_port_reader_item(self,
+                             worker: VedirectWorker,
+                             item: dict
+                             ) -> bool:
+        """Register serial input item on his source port reader."""
+        result = False
+        source = item.get('source')
+        if source not in self.port_readers:
+            self.port_readers[source] = VedirectPortReader(
+                source=source,
+                app=worker.worker
+            )
+        port_reader = self.port_readers[source]
+        # device can't send blocks faster than his period
+        worker.set_time_interval(
+            worker.worker.sampler.check_interval(
+                worker.time_interval,
+                worker.get_name()
+            )
+        )
+        if port_reader.add_item(
+                name=item.get('name'),
+                node=worker.get_name(),
+                interval=worker.time_interval,
+                columns=worker.columns):
+            self._input_timers[item.get('name')] = (
+                port_reader, worker.time_interval
+            )
+            self.inputs_data.register_node(node=worker.get_name())
+            result = True
+        return result
+
+    def get_port_timer_key(self, source: str) -> str:
+        """Get serial port reader timer key."""
+        return f"{self.block_index}_serial_port_{source}"
+
+    def add_port_readers_timers(self) -> bool:
+        """Add one timer per serial port, on port tick interval."""
+        result = True
+        for source in self.port_readers:
+            if not self.set_port_reader_timer(source):
+                result = False
+        return result
+
+    def set_port_reader_timer(self, source: str) -> bool:
+        """Add serial port timer, or set it on port tick interval."""
+        result = False
+        port_reader = self.port_readers.get(source)
+        timer_key = self.get_port_timer_key(source)
+        if port_reader is not None and port_reader.has_items():
+            # compile port columns check plan before first read
+            self.get_check_plan(port_reader.get_columns())
+            if self._threads.has_timer_key(timer_key):
+                result = self._threads.set_timer_interval(
+                    timer_key,
+                    port_reader.get_tick_interval()
+                )
+            else:
+                result = self._threads.add_timer_key(
+                    key=timer_key,
+                    interval=port_reader.get_tick_interval(),
+                    callback=self.read_port_data,
+                    kwargs={
+                        'source': source
+                    })
+        return result
+
+    def adapt_port_timer(self, source: str) -> bool:
+        """
+        Re-phase port timer just after expected device blocks.
+
+        Block cadence and phase are learned by port vedirect app sampler.
+        """
+        result = False
+        port_reader = self.port_readers.get(source)
+        sampler = port_reader.app.sampler
+        interval = port_reader.get_tick_interval()
+        sampler.warn_fast_interval(interval, source)
+        if sampler.is_offset_changed(port_reader.read_offset, interval):
+            offset = sampler.get_read_offset(interval)
+            if self._threads.set_timer_offset(
+                    self.get_port_timer_key(source),
+                    offset):
+                port_reader.read_offset = offset
+                result = True
+                logger.debug(
+                    "[AsyncAppBlockRun::adapt_port_timer] "
+                    "Port %s reads shifted to %ss after each second. "
+                    "Sampler: %s",
+                    source, round(offset, 3), sampler.get_stats()
+                )
         return result
 
+    def read_port_data(self, source: str, all_items: bool = False) -> bool:
+        """
+        Read serial port once, and add data of every due item to cache.
+
+        Raw frame is projected, checked and formatted in one pass,
+        for the union of items columns.
+        """
+        result = False
+        port_reader = self.port_readers.get(source)
+        try:
+            time_key, data, due_items = port_reader.read_tick(
+                all_items=all_items,
+                project=False
+            )
+            self.adapt_port_timer(source)
+            if Ut.is_dict(data, not_null=True):
+                data = self.format_input_data(
+                    data,
+                    port_reader.get_columns(),
+                    time_key
+                )
+            if Ut.is_dict(data, not_null=True):
+                for name in due_items:
+                    item_data = port_reader.get_item_row(
+                        name, data, reuse=len(due_items) == 1
+                    )
+                    if Ut.is_dict(item_data, not_null=True):
+                        self.add_input_data(
+                            time_key=time_key,
+                            node=port_reader.get_item_node(name),
+                            data=item_data
+                        )
+                        result = True
+        except VeMonitorError as ex:
+            logger.error(
+                "[AsyncAppBlockRun::read_port_data] "
+                "Port %s exception, ex : %s .",
+                source,
+                str(ex)
+            )
+            self.cancel_all_timers()
+            raise VeMonitorError(
+                "Fatal Error: "
+                "Ann error occured while running VeMonitor"
+            ) from ex
+        return result
+
+    def init_serial_readers(self) -> Optional[SerialReadersPool]:
+        """
+        Init serial readers pool if block serial_readers mode is process.
+
+        Each serial connector is then read by his own process.
+        """
+        result = None
+        block = self.get_block()
+        if Ut.is_dict(block, not_null=True):
+            conf = block.get('serial_readers')
+            if Ut.is_dict(conf, not_null=True)\
+                    and conf.get('mode') == "process":
+                result = SerialReadersPool(
+                    nb_slots=Ut.get_int(conf.get('ring_slots'), 256),
+                    slot_size=Ut.get_int(conf.get('slot_size'), 4096)
+                )
+        return result
+
+    def add_serial_reader_item(self, enum_key: int, item: dict) -> bool:
+        """Register serial input item on serial readers pool."""
+        result = False
+        source = item.get('source')
+        connector = VedirectWorker.get_connector_conf(
+            conf=WorkersHelper.format_worker_conf(
+                connector=self.get_app_connector_by_key_item(
+                    "serial",
+                    source
+                ),
+                worker_key="serial",
+                enum_key=enum_key,
+                item=item
+            )
+        )
+        if VedirectWorker.is_connector(connector)\
+                and Ut.is_dict(connector):
+            # serial port can't be opened by another block
+            if isinstance(self.workers.shared_connectors, SharedConnectors):
+                self.workers.shared_connectors.add_item(
+                    key=("serial", source),
+                    value=self.serial_readers
+                )
+            name = WorkersHelper.get_worker_name("serial", item)
+            item.get('columns').sort()
+            result = self.serial_readers.add_item(
+                source=source,
+                connector=connector,
+                name=name,
+                columns=item.get('columns'),
+                interval=item.get('time_interval')
+            )
+            if result:
+                self.inputs_data.register_node(node=name)
+        return result
+
+    def drain_serial_readers(self) -> int:
+        """Add rows read by serial reader processes to inputs cache."""
+        result = 0
+        if self.serial_readers is not None:
+            if not self.serial_readers.is_alive():
+                self.cancel_all_timers()
+                raise WorkerException(
+                    "Fatal Error: Some serial reader process is down. "
+                    f"Readers stats: {self.serial_readers.get_stats()}"
+                )
+            with self._threads.lock:
+                result = self.serial_readers.drain(
+                    inputs_data=self.inputs_data,
+                    on_cached=self.on_data_cached,
+                    row_filter=self.filter_input_data
+                )
+        return result
+
+    def init_backpressure(self) -> Optional[Backpressure]:
+        """Init backpressure helper from block backpressure conf."""
+        block = self.get_block()
+        result = None
+        if Ut.is_dict(block, not_null=True):
+            result = Backpressure.from_conf(block.get('backpressure'))
+            max_rows = self.inputs_data.get_max_rows()\
+                if self.is_cache_ready() else 0
+            if result is not None\
+                    and 0 < max_rows <= result.max_pending_rows:
+                logger.warning(
+                    "[AsyncAppBlockRun::init_backpressure] "
+                    "Backpressure max_pending_rows (%s) "
+                    "should be lower than cache max rows (%s), "
+                    "or rows will be removed from cache before shedding.",
+                    result.max_pending_rows,
+                    max_rows
+                )
+        return result
+
+    def on_data_cached(self, time_key: float):
+        """Register cached row on backpressure helper."""
+        self._first_read.set()
+        if self.backpressure is not None:
+            self.backpressure.register_row(time_key)
+
+    def on_time_series_cached(self, time_key: int):
+        """Register oldest time series row, to rewind outputs."""
+        with self._threads.lock:
+            if self._late_time is None or time_key < self._late_time:
+                self._late_time = time_key
+
+    def rewind_late_outputs(self) -> int:
+        """
+        Rewind outputs already past late time series rows.
+
+        Late rows are cached on their own time keys,
+        so outputs must send data again from the oldest late row.
+        """
+        result = 0
+        with self._threads.lock:
+            time_key, self._late_time = self._late_time, None
+        if time_key is not None:
+            for key, worker in self.workers.loop_on_output_workers():
+                if self.outputs_pool.rewind_saved(key, worker, time_key):
+                    result += 1
+                    logger.warning(
+                        "[AsyncAppBlockRun::rewind_late_outputs] "
+                        "Late time series rows, output worker %s "
+                        "send data again from time %s.",
+                        key,
+                        time_key
+                    )
+        return result
+
+    def check_backpressure(self) -> int:
+        """Apply backpressure shed policy on overloaded outputs."""
+        result = 0
+        if self.backpressure is not None\
+                and self.backpressure.is_check_time():
+            outputs = {
+                key: (worker, self.outputs_pool.get_from_time(key, worker))
+                for key, worker in self.workers.loop_on_output_workers()
+            }
+            with self._threads.lock:
+                result = self.backpressure.check(
+                    outputs=outputs,
+                    inputs_data=self.inputs_data,
+                    threads=self._threads,
+                    input_timers=self._input_timers
+                )
+        return result
+
+    def get_time_series_positions(self) -> dict:
+        """Get read positions of time series inputs cached rows."""
+        return {
+            key: worker.get_cached_position()
+            for key, worker in self.workers.loop_on_input_workers()
+            if isinstance(worker, InputTimeSeriesWorker)
+        }
+
+    def commit_time_series_inputs(self, positions: dict) -> int:
+        """
+        Commit time series inputs read positions, of rows sent by outputs.
+
+        Positions must be got before rewinding outputs on late rows,
+        so rows cached meanwhile are not committed before being sent.
+        """
+        result = 0
+        saved_time = min(
+            (
+                worker.get_last_saved_time()
+                for _, worker in self.workers.loop_on_output_workers()
+            ),
+            default=None
+        )
+        for key, position in positions.items():
+            worker = self.workers.get_input_worker(key)
+            if isinstance(worker, InputTimeSeriesWorker)\
+                    and position is not None\
+                    and worker.commit(position, saved_time):
+                result += 1
+        return result
+
+    def run_block_loop(self) -> bool:
+        """Run one main loop iteration of block."""
+        self.check_reload()
+        self.drain_serial_readers()
+        self.check_backpressure()
+        return self.run_output_workers()
+
     def loop_outputs_items(self):
         """Run block inputs."""
-        if Ut.is_dict(self.conf.app_blocks[0].get('outputs'), not_null=True):
-            for key, items in self.conf.app_blocks[0].get('outputs').items():
+        block = self.get_block()
+        if Ut.is_dict(block, not_null=True)\
+                and Ut.is_dict(block.get('outputs'), not_null=True):
+            for key, items in block.get('outputs').items():
                 if Ut.is_str(key, not_null=True)\
                         and Ut.is_list(items, not_null=True):
                     for i, item in enumerate(items):
                         if Ut.is_dict(item, not_null=True):
                             yield key, i, item
 
+    def init_output_item_worker(self,
+                                key: str,
+                                enum_key: int,
+                                item: dict
+                                ) -> Optional[OutputWorker]:
+        """Init output item worker, his points types and last value carry."""
+        result = self.workers.init_output_worker(
+            connector=self.get_app_connector_by_key_item(
+                key,
+                item.get('source')
+            ),
+            worker_key=key,
+            enum_key=enum_key,
+            item=item
+        )
+        if WorkersHelper.is_output_worker(result):
+            result.set_points_types(self.conf.data_structures.get('points'))
+        if item.get('carry_values') is True:
+            self._carry[WorkersHelper.get_worker_name(key, item)] =\
+                LastValueCarry()
+        return result
+
     def setup_outputs_workers(self) -> bool:
         """Setup block outputs."""
         result = False
         if self.is_ready():
             result = True
             for key, i, item in self.loop_outputs_items():
-                self.workers.init_output_worker(
-                    connector=self.get_app_connector_by_key_item(
-                        key,
-                        item.get('source')
-                    ),
-                    worker_key=key,
-                    enum_key=i,
-                    item=item
-                )
+                self.init_output_item_worker(key, i, item)
                 result = True
         return result
 
+    def get_output_data(self,
+                        name: str,
+                        worker: OutputWorker,
+                        from_time: int
+                        ) -> tuple:
+        """
+        Get output worker data from cache.
+
+        Values suppressed by deadband filter are carried
+        from last known values, if output carry_values is set.
+        """
+        with self._threads.lock:
+            data, last_time, max_time = self.inputs_data.get_data_from_cache(
+                from_time=from_time,
+                nb_items=worker.get_cache_interval(),
+                structure=worker.columns
+            )
+        if name in self._carry:
+            data = self._carry[name].fill(data, worker.columns)
+        return data, last_time, max_time
+
+    def setup_outputs_pool(self) -> bool:
+        """Setup outputs workers pool."""
+        result = True
+        for key, worker in self.workers.loop_on_output_workers():
+            if not self.outputs_pool.init_worker(key, worker):
+                result = False
+        self.restore_watermarks()
+        return result
+
+    def is_output_data_ready(self,
+                             worker: OutputWorker,
+                             data: Optional[dict],
+                             from_time: int,
+                             last_time: int
+                             ) -> bool:
+        """Test if output worker has enough data to send."""
+        interval = abs(last_time - from_time)
+        is_time_interval = (
+            from_time == 0
+            or interval >= (
+                worker.time_interval * worker.cache_interval
+            )
+        )
+        return Ut.is_dict(data, not_null=True)\
+            and len(data) == worker.cache_interval\
+            and is_time_interval
+
     def run_output_workers(self) -> bool:
-        """Run block outputs."""
+        """
+        Run block outputs.
+
+        Data is extracted from cache on main thread,
+        and sent concurrently by every output worker thread pool.
+        Completed jobs advance output workers last_saved_time.
+        """
         result = False
+        self.outputs_pool.process_completed(self.workers)
+        self.outputs_pool.check_deadlines()
+        positions = self.get_time_series_positions()
+        self.rewind_late_outputs()
+        self.commit_time_series_inputs(positions)
         if self.inputs_data.has_data()\
                 and self.workers.has_output_workers():
             result = True
             for key, worker in self.workers.loop_on_output_workers():
-                data_cache = self.inputs_data.get_data_from_cache(
-                    from_time=worker.get_last_saved_time(),
-                    nb_items=worker.get_cache_interval(),
-                    structure=worker.columns
-                )
-                data, last_time, max_time = data_cache
-                interval = abs(last_time - worker.last_saved_time)
-                is_time_interval = (
-                    worker.last_saved_time == 0
-                    or interval >= (
-                        worker.time_interval * worker.cache_interval
-                    )
+                if not self.outputs_pool.can_submit(key, worker):
+                    continue
+                from_time = self.outputs_pool.get_from_time(key, worker)
+                data, last_time, _ = self.get_output_data(
+                    key, worker, from_time
                 )
-                is_interval = Ut.is_dict(data, not_null=True)\
-                    and len(data) == worker.cache_interval\
-                    and is_time_interval
-                if is_interval:
-                    is_data_send = worker.send_data(
+                if self.is_output_data_ready(
+                        worker=worker,
                         data=data,
-                        input_structure=worker.columns
-                    )
-                    if not is_data_send:
+                        from_time=from_time,
+                        last_time=last_time):
+                    if not self.outputs_pool.submit(
+                            name=key,
+                            worker=worker,
+                            data=data,
+                            from_time=from_time,
+                            last_time=last_time):
                         result = False
-                    else:
-                        worker.set_last_saved_time(last_time)
+        return result
+
+    def set_reloader(self, reloader: Optional[ConfigReloader]) -> bool:
+        """Set configuration reloader, checked on block main loop."""
+        result = False
+        if reloader is None or isinstance(reloader, ConfigReloader):
+            self.reloader = reloader
+            result = True
+        return result
+
+    def check_reload(self) -> bool:
+        """Reload configuration if requested or if source files changed."""
+        result = False
+        if self.reloader is not None and self.reloader.is_due():
+            conf = self.reloader.load()
+            if conf is not None:
+                result = self.reload_conf(conf)
+        return result
+
+    def is_input_reloadable(self, key: str) -> bool:
+        """Test if input items of key can be reloaded without restart."""
+        return not (key == "serial" and self.serial_readers is not None)
+
+    def remove_input_item(self,
+                          key: str,
+                          item: dict,
+                          drop_shared: bool = False
+                          ) -> bool:
+        """
+        Stop input item timer and remove his worker.
+
+        Serial port reader and his timer are removed with last port item.
+        """
+        source = item.get('source')
+        timer = self._input_timers.pop(item.get('name'), None)
+        port_reader = self.port_readers.get(source)
+        if key == "serial" and port_reader is not None:
+            port_reader.remove_item(item.get('name'))
+            if port_reader.has_items():
+                self.set_port_reader_timer(source)
+            else:
+                self._threads.remove_timer_key(
+                    self.get_port_timer_key(source),
+                    timeout=self.RELOAD_TIMEOUT
+                )
+                self.port_readers.pop(source)
+        elif timer is not None:
+            self._threads.remove_timer_key(
+                timer[0],
+                timeout=self.RELOAD_TIMEOUT
+            )
+        return self.workers.remove_input_worker(
+            worker_name=WorkersHelper.get_worker_name(key, item),
+            connector_key=(key, source),
+            drop_shared=drop_shared
+        ) is not None
+
+    def set_input_item_interval(self, key: str, item: dict) -> bool:
+        """Set running input item time interval, worker is kept."""
+        result = False
+        worker = self.workers.get_input_worker(
+            WorkersHelper.get_worker_name(key, item)
+        )
+        timer = self._input_timers.get(item.get('name'))
+        if WorkersHelper.is_worker(worker)\
+                and timer is not None\
+                and worker.set_time_interval(item.get('time_interval')):
+            if key == "serial":
+                result = self.add_port_reader_item(worker, item)\
+                    and self.set_port_reader_timer(item.get('source'))
+            elif self._threads.set_timer_interval(
+                    timer[0],
+                    worker.time_interval):
+                self._input_timers[item.get('name')] = (
+                    timer[0], worker.time_interval
+                )
+                result = True
+        return result
+
+    def add_input_item(self, key: str, enum_key: int, item: dict) -> bool:
+        """Init input item worker and start his timer."""
+        result = self.add_input_worker_timer(
+            key,
+            enum_key,
+            item,
+            self.init_input_item_worker(key, enum_key, item)
+        )
+        if result and key == "serial":
+            result = self.set_port_reader_timer(item.get('source'))
+        return result
+
+    def remove_output_item(self,
+                           key: str,
+                           item: dict,
+                           drop_shared: bool = False
+                           ) -> Optional[int]:
+        """
+        Remove output item worker, waiting his running jobs.
+
+        :return: worker last_saved_time, also saved on watermarks store.
+        """
+        result = None
+        name = WorkersHelper.get_worker_name(key, item)
+        worker = self.workers.get_output_worker(name)
+        if WorkersHelper.is_output_worker(worker):
+            self.outputs_pool.remove_worker(
+                name,
+                self.workers,
+                timeout=self.RELOAD_TIMEOUT
+            )
+            result = worker.get_last_saved_time()
+            if self.watermarks is not None:
+                self.watermarks.set(
+                    WatermarkStore.get_key(self.get_block_name(), name),
+                    result
+                )
+            self._carry.pop(name, None)
+            self.workers.remove_output_worker(
+                worker_name=name,
+                connector_key=(key, item.get('source')),
+                drop_shared=drop_shared
+            )
+        return result
+
+    def update_output_item(self, key: str, enum_key: int, item: dict) -> bool:
+        """Set running output item worker conf, connector is kept."""
+        result = False
+        name = WorkersHelper.get_worker_name(key, item)
+        worker = self.workers.get_output_worker(name)
+        if WorkersHelper.is_output_worker(worker):
+            result = worker.set_worker_conf(
+                WorkersHelper.get_worker_conf_from_dict(
+                    WorkersHelper.format_worker_conf(
+                        connector=worker.worker,
+                        worker_key=key,
+                        enum_key=enum_key,
+                        item=item
+                    )
+                )
+            )
+            if item.get('carry_values') is not True:
+                self._carry.pop(name, None)
+            elif name not in self._carry:
+                self._carry[name] = LastValueCarry()
+        return result
+
+    def add_output_item(self,
+                        key: str,
+                        enum_key: int,
+                        item: dict,
+                        last_saved_time: Optional[int] = None
+                        ) -> bool:
+        """
+        Init output item worker on outputs pool.
+
+        Worker resumes from last_saved_time, or from his watermark.
+        """
+        result = False
+        name = WorkersHelper.get_worker_name(key, item)
+        worker = self.init_output_item_worker(key, enum_key, item)
+        if WorkersHelper.is_output_worker(worker)\
+                and self.outputs_pool.init_worker(name, worker):
+            if last_saved_time is None and self.watermarks is not None:
+                last_saved_time = self.watermarks.get(
+                    WatermarkStore.get_key(self.get_block_name(), name)
+                )
+            if last_saved_time is not None\
+                    and last_saved_time > worker.get_last_saved_time():
+                worker.set_last_saved_time(last_saved_time)
+            result = True
+        return result
+
+    def reload_data_structures(self):
+        """Recompile check plans, deadband rules and outputs points types."""
+        self._check_plans = {}
+        self._ingests = {}
+        for _, worker in self.workers.loop_on_output_workers():
+            worker.set_points_types(self.conf.data_structures.get('points'))
+        deadband = DeadbandFilter.from_points(
+            self.conf.data_structures.get('points')
+        )
+        if deadband is not None and self.deadband is not None:
+            # keep last kept values of deadband filter
+            self.deadband.rules = deadband.rules
+        else:
+            self.deadband = deadband
+
+    def reload_conf(self, conf: Config) -> bool:
+        """
+        Apply new configuration on running block.
+
+        Only workers whose item or connector changed are restarted,
+        unchanged workers, port readers, inputs cache
+        and outputs watermarks are kept.
+        Other block keys, and serial reader processes items,
+        are applied on next restart.
+        """
+        result = False
+        index, block = ConfigDiff.get_block_by_name(
+            conf,
+            self.get_block_name()
+        )
+        if block is not None:
+            changes = ConfigDiff.get_block_changes(self.get_block(), block)
+            if Ut.is_list(changes, not_null=True):
+                logger.warning(
+                    "[AsyncAppBlockRun::reload_conf] "
+                    "Block %s keys %s changed, "
+                    "restart is needed to apply them.",
+                    self.get_block_name(), changes
+                )
+            result = self.apply_conf_diff(conf, index, block)
+        else:
+            logger.error(
+                "[AsyncAppBlockRun::reload_conf] "
+                "Block %s not found on new configuration, "
+                "restart is needed to apply it.",
+                self.get_block_name()
+            )
+        return result
+
+    def apply_conf_diff(self, conf: Config, index: int, block: dict) -> bool:
+        """
+        Restart block workers changed on new configuration.
+
+        Removed and restarted workers are stopped with running conf,
+        then new and restarted workers are started with new conf.
+        """
+        old_conf, old_block = self.conf, self.get_block()
+        inputs = ConfigDiff.diff_items(
+            old_conf, conf, old_block, block, 'inputs'
+        )
+        outputs = ConfigDiff.diff_items(
+            old_conf, conf, old_block, block, 'outputs'
+        )
+        old_inputs = ConfigDiff.get_items(old_block, 'inputs')
+        new_inputs = ConfigDiff.get_items(block, 'inputs')
+        old_outputs = ConfigDiff.get_items(old_block, 'outputs')
+        new_outputs = ConfigDiff.get_items(block, 'outputs')
+        skipped = [
+            name
+            for state in ('added', 'removed', 'changed')
+            for name in inputs.get(state)
+            if not self.is_input_reloadable(
+                (new_inputs.get(name) or old_inputs.get(name))[0]
+            )
+        ]
+        if Ut.is_list(skipped, not_null=True):
+            logger.warning(
+                "[AsyncAppBlockRun::apply_conf_diff] "
+                "Serial reader processes items %s changed, "
+                "restart is needed to apply them.",
+                skipped
+            )
+        intervals = [
+            name
+            for name in inputs.get('changed')
+            if name not in skipped
+            and name not in inputs.get('reconnect')
+            and ConfigDiff.get_item_changes(
+                old_inputs[name][2], new_inputs[name][2]
+            ) == ['time_interval']
+        ]
+        restarted = [
+            name
+            for name in inputs.get('changed')
+            if name not in skipped and name not in intervals
+        ]
+
+        # stop removed and restarted workers, with running configuration
+        saved_times = {}
+        for name in outputs.get('removed') + outputs.get('reconnect'):
+            key, _, item = old_outputs[name]
+            saved_times[name] = self.remove_output_item(
+                key,
+                item,
+                drop_shared=name in outputs.get('reconnect')
+            )
+        for name in inputs.get('removed') + restarted:
+            key, _, item = old_inputs[name]
+            if name not in skipped:
+                self.remove_input_item(
+                    key,
+                    item,
+                    drop_shared=name in inputs.get('reconnect')
+                )
+
+        self.conf = conf
+        self.block_index = index
+        if conf.data_structures != old_conf.data_structures:
+            self.reload_data_structures()
+
+        result = True
+        try:
+            for name in intervals:
+                key, _, item = new_inputs[name]
+                if not self.set_input_item_interval(key, item):
+                    result = False
+            for name in inputs.get('added') + restarted:
+                key, i, item = new_inputs[name]
+                if name not in skipped\
+                        and not self.add_input_item(key, i, item):
+                    result = False
+            for name in outputs.get('changed'):
+                key, i, item = new_outputs[name]
+                if name not in outputs.get('reconnect')\
+                        and not self.update_output_item(key, i, item):
+                    result = False
+            for name in outputs.get('added') + outputs.get('reconnect'):
+                key, i, item = new_outputs[name]
+                if not self.add_output_item(
+                        key, i, item,
+                        last_saved_time=saved_times.get(name)):
+                    result = False
+        except WorkerException as ex:
+            result = False
+            logger.error(
+                "[AsyncAppBlockRun::apply_conf_diff] "
+                "Unable to start some reloaded workers, ex: %s",
+                ex
+            )
+        min_interval = 0
+        for _, worker in self.workers.loop_on_input_workers():
+            min_interval = Ut.get_min_in_loop(
+                value=min_interval,
+                min_val=worker.time_interval
+            )
+        self.inputs_data.set_interval_min(min_interval)
+        logger.info(
+            "[AsyncAppBlockRun::apply_conf_diff] "
+            "Block %s configuration reloaded, "
+            "inputs: %s, outputs: %s",
+            self.get_block_name(),
+            {state: len(names) for state, names in inputs.items()},
+            {state: len(names) for state, names in outputs.items()}
+        )
+        return result
+
+    def setup_block(self) -> bool:
+        """
+        Setup block inputs timers, outputs workers and outputs pool.
+
+        Inputs workers run on background (Threads), executed by a timer.
+        """
+        result = False
+        if self.is_conf_ready():
+            self.add_input_items_timer()
+            self.setup_outputs_workers()
+            self.setup_outputs_pool()
+            if not self.workers.get_workers_status():
+                self.cancel_all_timers()
+                logger.error(
+                    "Fatal Error: Some output workers fails. "
+                    "Please control all outputs conectors, "
+                    "are up and ready."
+                )
+                raise WorkerException(
+                    "Fatal Error: Some output workers fails. "
+                    "Unable to open a connexion "
+                    "with some output connectors. "
+                    "Workers Status : "
+                    f"{self.workers.get_output_workers_status()}"
+                )
+            result = True
         return result
 
     def run_block(self):
-        """Run Block inputs and outputs."""
+        """
+        Run Block inputs and outputs.
+
+        On stop request, block is stopped gracefully after main loop exit,
+        outside of any block lock.
+        """
         try:
-            if AppBlockRun.is_conf(self.conf):
-                # self.events.subscribe_worker_data_ready(self.run_output_item)
-                # inputs workers blocks run on background (Threads),
-                # executed by a timer
-                self.add_input_items_timer()
-                # inputs workers blocks run
-                self.setup_outputs_workers()
-                if not self.workers.get_workers_status():
-                    self.cancel_all_timers()
-                    logger.error(
-                        "Fatal Error: Some output workers fails. "
-                        "Please control all outputs conectors, "
-                        "are up and ready."
-                    )
-                    raise WorkerException(
-                        "Fatal Error: Some output workers fails. "
-                        "Unable to open a connexion "
-                        "with some output connectors. "
-                        "Workers Status : "
-                        f"{self.workers.get_output_workers_status()}"
-                    )
-                time.sleep(1)
+            if self.setup_block():
+                self.wait_first_read(timeout=1)
                 while self._run:
-                    self.run_output_workers()
+                    self.run_block_loop()
 
                     time.sleep(0.1)
         except (
@@ -292,31 +1433,6 @@ class AsyncAppBlockRun(AppBlockRun):
                 "ex: %s",
                 ex
             )
+            self.request_stop()
+        if self._stop_requested:
             self.exit_handler()
-
-    @staticmethod
-    def set_thread_interval(current_thread: RepeatTimer,
-                            interval: int,
-                            start: int) -> bool:
-        """Test if valid conf"""
-        result = -1
-        now = time.perf_counter()
-        if isinstance(current_thread, RepeatTimer)\
-                and Ut.is_int(interval, positive=True)\
-                and Ut.is_float(start, positive=True):
-            result = current_thread.interval
-            diff = abs(now - start)
-            new_interval = round(abs(interval - diff), 6)
-            if new_interval > 0:
-                current_thread.interval = new_interval
-                result = new_interval
-                logger.debug(
-                    "[AsyncAppBlockRun::set_thread_interval] "
-                    "New thread interval : %s - "
-                    "Worker Interval : %s - "
-                    "Read time: %s",
-                    new_interval,
-                    interval,
-                    diff
-                )
-        return result
@@ -0,0 +1,230 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Backpressure Helper.
+
+Bound the number of cached rows waiting to be sent by each output worker.
+When an output has more pending rows than max_pending_rows,
+a shed policy is applied:
+    - drop_oldest: oldest pending rows are skipped by the output
+    - rollup: oldest pending rows are aggregated in one row
+    - throttle: low priority inputs are read less often,
+      until pending rows fall under half of max_pending_rows.
+      Over twice max_pending_rows, oldest rows are dropped.
+Every shed event is counted on stats.
+"""
+import bisect
+import logging
+import threading
+import time
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.core.threads_controller import ThreadsController
+from vemonitor_m8.models.inputs_cache import InputsCache
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class Backpressure:
+    """Backpressure Helper"""
+
+    POLICIES = ("drop_oldest", "rollup", "throttle")
+
+    def __init__(self,
+                 max_pending_rows: int = 60,
+                 policy: str = "drop_oldest",
+                 low_priority_inputs: Optional[list] = None,
+                 throttle_factor: int = 2,
+                 check_interval: float = 1
+                 ):
+        self.max_pending_rows = max_pending_rows
+        self.policy = policy if policy in self.POLICIES else "drop_oldest"
+        self.low_priority_inputs = low_priority_inputs or []
+        self.throttle_factor = throttle_factor
+        self.check_interval = check_interval
+        self.throttled = False
+        self._rows = []
+        self._lock = threading.Lock()
+        self._last_check = 0
+        self.stats = {
+            "shed_events": 0,
+            "dropped_rows": {},
+            "rollup_rows": 0,
+            "throttle_events": 0,
+            "max_pending": {}
+        }
+
+    @classmethod
+    def from_conf(cls, conf: Optional[dict]) -> Optional['Backpressure']:
+        """Get instance from block backpressure configuration."""
+        result = None
+        if Ut.is_dict(conf, not_null=True):
+            result = cls(
+                max_pending_rows=Ut.get_int(conf.get('max_pending_rows'), 60),
+                policy=conf.get('policy', "drop_oldest"),
+                low_priority_inputs=conf.get('low_priority_inputs'),
+                throttle_factor=Ut.get_int(conf.get('throttle_factor'), 2)
+            )
+        return result
+
+    def get_stats(self) -> dict:
+        """Get shed events stats."""
+        return self.stats
+
+    def register_row(self, time_key: float):
+        """Register cached row time key."""
+        time_key = Ut.get_int(time_key, 0)
+        with self._lock:
+            index = bisect.bisect_left(self._rows, time_key)
+            if index == len(self._rows) or self._rows[index] != time_key:
+                self._rows.insert(index, time_key)
+
+    def get_pending_rows(self, from_time: int) -> list:
+        """Get rows time keys not sent yet, from output from_time."""
+        with self._lock:
+            return self._rows[bisect.bisect_left(self._rows, from_time):]
+
+    def forget_rows(self, from_time: int):
+        """Forget rows sent by all outputs."""
+        with self._lock:
+            index = bisect.bisect_left(self._rows, from_time)
+            del self._rows[:index]
+
+    def is_check_time(self) -> bool:
+        """Test if outputs pending rows must be checked."""
+        now = time.monotonic()
+        result = now - self._last_check >= self.check_interval
+        if result:
+            self._last_check = now
+        return result
+
+    def add_shed_event(self, message: str, *args):
+        """Count and log shed event."""
+        self.stats["shed_events"] += 1
+        logger.warning("[Backpressure] " + message, *args)
+
+    def drop_oldest(self, name: str, worker, rows: list) -> int:
+        """Skip oldest pending rows of output worker."""
+        keep = rows[-self.max_pending_rows:]
+        nb_dropped = len(rows) - len(keep)
+        if nb_dropped > 0:
+            worker.set_last_saved_time(keep[0])
+            dropped = self.stats["dropped_rows"]
+            dropped[name] = dropped.get(name, 0) + nb_dropped
+            self.add_shed_event(
+                "Output %s is overloaded, %s oldest rows dropped.",
+                name, nb_dropped
+            )
+        return nb_dropped
+
+    def rollup(self, inputs_data: InputsCache, rows: list) -> int:
+        """Aggregate oldest pending rows in one row."""
+        nb_rows = len(rows) - self.max_pending_rows + 1
+        result = 0
+        if nb_rows > 1 and inputs_data.rollup_rows(rows[:nb_rows]):
+            with self._lock:
+                for time_key in rows[:nb_rows - 1]:
+                    index = bisect.bisect_left(self._rows, time_key)
+                    if index < len(self._rows)\
+                            and self._rows[index] == time_key:
+                        del self._rows[index]
+            self.stats["rollup_rows"] += nb_rows
+            self.add_shed_event(
+                "%s oldest rows aggregated in one row.",
+                nb_rows
+            )
+            result = nb_rows
+        return result
+
+    def set_throttle(self,
+                     threads: ThreadsController,
+                     input_timers: dict,
+                     throttled: bool
+                     ) -> bool:
+        """
+        Throttle or restore low priority inputs timers interval.
+
+        input_timers values are tuples of (timer key, interval),
+        or (port reader, interval) for serial items.
+        """
+        result = False
+        if throttled != self.throttled:
+            factor = self.throttle_factor if throttled else 1
+            for name in self.low_priority_inputs:
+                timer = input_timers.get(name)
+                if Ut.is_tuple(timer, eq=2):
+                    timer_key, interval = timer
+                    if Ut.is_str(timer_key):
+                        threads.set_timer_interval(
+                            timer_key, interval * factor
+                        )
+                    else:
+                        # item read by a serial port reader
+                        timer_key.set_item_interval(name, interval * factor)
+            self.throttled = throttled
+            if throttled:
+                self.stats["throttle_events"] += 1
+                self.add_shed_event(
+                    "Outputs are overloaded, "
+                    "low priority inputs %s are throttled.",
+                    self.low_priority_inputs
+                )
+            else:
+                logger.info(
+                    "[Backpressure] Low priority inputs are restored."
+                )
+            result = True
+        return result
+
+    def check(self,
+              outputs: dict,
+              inputs_data: InputsCache,
+              threads: Optional[ThreadsController] = None,
+              input_timers: Optional[dict] = None
+              ) -> int:
+        """
+        Check outputs pending rows and apply shed policy.
+
+        :param outputs: dict of output name: (worker, from_time)
+        :return: Number of shed rows.
+        """
+        result = 0
+        max_pending, min_time = 0, None
+        for name, (worker, from_time) in outputs.items():
+            rows = self.get_pending_rows(from_time)
+            nb_pending = len(rows)
+            max_pending = max(max_pending, nb_pending)
+            self.stats["max_pending"][name] = max(
+                self.stats["max_pending"].get(name, 0), nb_pending
+            )
+            if nb_pending > self.max_pending_rows:
+                if self.policy == "rollup":
+                    nb_shed = self.rollup(inputs_data, rows)
+                    if nb_shed == 0:
+                        nb_shed = self.drop_oldest(name, worker, rows)
+                    result += nb_shed
+                elif self.policy == "drop_oldest"\
+                        or nb_pending > 2 * self.max_pending_rows:
+                    result += self.drop_oldest(name, worker, rows)
+            # rows dispatched to running jobs may be sent again
+            saved_time = worker.get_last_saved_time()
+            min_time = saved_time if min_time is None\
+                else min(min_time, saved_time)
+
+        if self.policy == "throttle"\
+                and isinstance(threads, ThreadsController):
+            if max_pending > self.max_pending_rows:
+                self.set_throttle(threads, input_timers or {}, True)
+            elif max_pending <= self.max_pending_rows // 2:
+                self.set_throttle(threads, input_timers or {}, False)
+        if min_time is not None:
+            self.forget_rows(min_time)
+        return result
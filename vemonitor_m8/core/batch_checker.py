@@ -0,0 +1,213 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Batch Checker Module.
+
+Check and format a block of input rows column by column,
+with the same results than DataChecker.check_input_columns row by row.
+Numeric columns are parsed with NumPy where it is installed,
+then scaled by floatpoint and rounded with Python round,
+as NumPy round results differ on some half values.
+Other columns, and numeric columns NumPy can't parse as a whole,
+are checked value by value with DataChecker compiled converters.
+Invalid cells are reported by row and column index, and left out of rows.
+"""
+import logging
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.core.data_checker import DataChecker
+from vemonitor_m8.core.exceptions import DeviceDataConfError
+from vemonitor_m8.core.exceptions import DeviceInputValueError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class BatchChecker:
+    """Batch Checker Module"""
+
+    # output types formatted with NumPy, and their NumPy dtypes
+    NUMPY_TYPES = {
+        "int": "int64",
+        "float": "float64",
+        "numeric": "float64",
+        "time": "float64"
+    }
+
+    def __init__(self,
+                 columns: list,
+                 checkers: dict,
+                 local_checkers: Optional[dict] = None,
+                 use_numpy: bool = True
+                 ):
+        self.columns = list(columns)
+        self.use_numpy = use_numpy and BatchChecker.has_numpy()
+        self.checkers = self.get_columns_checkers(
+            checkers, local_checkers
+        )
+        self.plan = DataChecker.compile_plan(
+            self.columns, checkers, local_checkers
+        )
+        self._col_indexes = {
+            key: index for index, key in enumerate(self.columns)
+        }
+
+    @staticmethod
+    def has_numpy() -> bool:
+        """Test if NumPy is installed."""
+        return np is not None
+
+    def get_columns_checkers(self,
+                             checkers: dict,
+                             local_checkers: Optional[dict] = None
+                             ) -> dict:
+        """
+        Get and validate checker of every column.
+
+        Configuration errors are raised here, before any row is checked.
+        """
+        result = {}
+        if not Ut.is_dict(checkers, not_null=True):
+            checkers = {}
+        for key in self.columns:
+            if Ut.is_dict(local_checkers) and key in local_checkers:
+                checker = local_checkers.get(key)
+            else:
+                checker = checkers.get(key)
+            DataChecker.validate_checker(key, checker)
+            float_point = checker.get('floatpoint')
+            if float_point is not None\
+                    and not Ut.is_float(float_point, positive=True):
+                raise DeviceDataConfError(
+                    "Error: Unable to check/format data value. "
+                    "Float point value or device data is not valid. "
+                    f"Please Check Device data point: {key}"
+                )
+            result[key] = checker
+        return result
+
+    def is_numpy_column(self, key: str, values: list) -> bool:
+        """Test if column values can be formatted with NumPy."""
+        result = False
+        checker = self.checkers.get(key)
+        input_type = DataChecker.INPUT_TYPES.get(checker.get('input_type'))
+        if self.use_numpy\
+                and input_type is not None\
+                and checker.get('output_type') in self.NUMPY_TYPES:
+            # values must pass input type test, None values are excluded
+            result = all(
+                value_type is str or issubclass(value_type, input_type)
+                for value_type in set(map(type, values))
+            )
+        return result
+
+    def format_numpy_column(self, key: str, values: list) -> Optional[list]:
+        """
+        Parse column values with NumPy, then scale and round them.
+
+        Values are rounded with Python round, like DataChecker converters.
+        :return: None if some value can't be parsed.
+        """
+        result = None
+        checker = self.checkers.get(key)
+        output_type = checker.get('output_type')
+        try:
+            data = np.array(values, dtype=self.NUMPY_TYPES.get(output_type))
+        except (ValueError, TypeError, OverflowError):
+            data = None
+        if data is not None:
+            result = data.tolist()
+            if output_type != "int":
+                result = [round(value, 3) for value in result]
+            float_point = checker.get('floatpoint')
+            if Ut.is_float(float_point) and float_point != 0:
+                result = [round(value * float_point, 3) for value in result]
+        return result
+
+    def check_column(self, key: str, values: list) -> tuple:
+        """
+        Check and format column values.
+
+        :return: tuple of (formatted values, invalid values errors),
+            errors are tuples of (value index, error message),
+            formatted values of invalid values are None.
+        """
+        result, errors = None, []
+        if self.is_numpy_column(key, values):
+            result = self.format_numpy_column(key, values)
+        if result is None:
+            result = []
+            converter = self.plan.get(key)
+            for index, value in enumerate(values):
+                try:
+                    result.append(converter(value))
+                except DeviceInputValueError as ex:
+                    result.append(None)
+                    errors.append((index, str(ex)))
+        return result, errors
+
+    def check_columns(self, data: dict) -> tuple:
+        """
+        Check and format columns of values.
+
+        :param data: dict of column name: list of values.
+        :return: tuple of (dict of column name: formatted values, errors),
+            errors are tuples of (row index, column index, error message).
+        """
+        result, errors = {}, []
+        if Ut.is_dict(data, not_null=True):
+            for key, values in data.items():
+                if key in self.plan and Ut.is_list(values):
+                    result[key], col_errors = self.check_column(key, values)
+                    errors.extend([
+                        (row, self._col_indexes.get(key), message)
+                        for row, message in col_errors
+                    ])
+        return result, errors
+
+    def check_rows(self, rows: list) -> tuple:
+        """
+        Check and format rows, column by column.
+
+        Columns out of checker columns are ignored,
+        invalid cells are left out of rows.
+        :return: tuple of (formatted rows, errors),
+            errors are tuples of (row index, column index, error message).
+        """
+        result, errors = [], []
+        if Ut.is_list(rows, not_null=True):
+            indexes, data = {}, {}
+            for row_index, row in enumerate(rows):
+                if Ut.is_dict(row):
+                    for key, value in row.items():
+                        if key in self.plan:
+                            indexes.setdefault(key, []).append(row_index)
+                            data.setdefault(key, []).append(value)
+            result = [{} for _ in rows]
+            for key, values in data.items():
+                formatted, col_errors = self.check_column(key, values)
+                bad_indexes = set()
+                for index, message in col_errors:
+                    bad_indexes.add(index)
+                    errors.append((
+                        indexes[key][index],
+                        self._col_indexes.get(key),
+                        message
+                    ))
+                for index, row_index in enumerate(indexes[key]):
+                    if index not in bad_indexes:
+                        result[row_index][key] = formatted[index]
+            errors.sort()
+        return result, errors
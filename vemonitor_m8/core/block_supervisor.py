@@ -0,0 +1,165 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+App blocks supervisor Helper.
+
+Shard app blocks across worker processes, each process
+runs his blocks with a MultiBlockRun instance.
+Blocks using the same exclusive connector (eg: a serial port)
+are always run in the same process.
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from typing import Optional
+from vemonitor_m8.core.app_run_main import AppBlockRun
+from vemonitor_m8.core.multi_block_run import MultiBlockRun
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.models.app_block_helper import AppBlockHelper
+from vemonitor_m8.models.config import Config
+from vemonitor_m8.core.exceptions import SettingInvalidException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__license__ = "Apache"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+def run_shard(conf: Config, block_indexes: list):
+    """Run app blocks shard on worker process."""
+    # supervisor handler is inherited, blocks install their own handlers
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    app = MultiBlockRun(conf=conf, block_indexes=block_indexes)
+    app.run_blocks()
+
+
+class BlockSupervisor:
+    """App blocks supervisor Helper"""
+
+    EXCLUSIVE_CONNECTORS = ("serial",)
+
+    def __init__(self,
+                 conf: Config,
+                 nb_processes: Optional[int] = None
+                 ):
+        self.conf: Optional[Config] = None
+        self.processes = []
+        self.shards = []
+        if not AppBlockRun.is_conf(conf):
+            raise SettingInvalidException(
+                "[veMonitor] Fatal error: "
+                "Config is not valid."
+            )
+        self.conf = conf
+        if not Ut.is_int(nb_processes, positive=True):
+            nb_processes = os.cpu_count() or 1
+        self.shards = BlockSupervisor.get_shards(
+            groups=BlockSupervisor.get_blocks_groups(conf.app_blocks),
+            nb_processes=nb_processes
+        )
+
+    @staticmethod
+    def get_block_exclusive_keys(block: dict) -> set:
+        """Get block exclusive connectors keys (worker_key, source)."""
+        result = set()
+        sources = AppBlockHelper.get_app_block_sources(block)
+        if Ut.is_dict(sources, not_null=True):
+            for key, values in sources.items():
+                if key in BlockSupervisor.EXCLUSIVE_CONNECTORS:
+                    result.update((key, value) for value in values)
+        return result
+
+    @staticmethod
+    def get_blocks_groups(app_blocks: list) -> list:
+        """
+        Group blocks indexes using same exclusive connectors.
+
+        Groups sharing any exclusive connector are merged.
+        """
+        groups = []
+        for index, block in enumerate(app_blocks):
+            keys = BlockSupervisor.get_block_exclusive_keys(block)
+            indexes = [index]
+            for group in [g for g in groups if g[1] & keys]:
+                groups.remove(group)
+                indexes.extend(group[0])
+                keys |= group[1]
+            groups.append((sorted(indexes), keys))
+        return [indexes for indexes, _ in groups]
+
+    @staticmethod
+    def get_shards(groups: list, nb_processes: int) -> list:
+        """Dispatch blocks groups on less loaded shards."""
+        shards = [[] for _ in range(min(nb_processes, len(groups)))]
+        for group in sorted(groups, key=len, reverse=True):
+            shard = min(shards, key=len)
+            shard.extend(group)
+        return [sorted(shard) for shard in shards if shard]
+
+    def is_alive(self) -> bool:
+        """Test if any worker process is alive."""
+        return any(process.is_alive() for process in self.processes)
+
+    def start(self) -> bool:
+        """Start one worker process per shard."""
+        for i, shard in enumerate(self.shards):
+            process = multiprocessing.Process(
+                target=run_shard,
+                args=(self.conf, shard),
+                name=f"vemonitor_shard_{i}"
+            )
+            process.start()
+            self.processes.append(process)
+            logger.info(
+                "[BlockSupervisor] Start process %s (pid %s) "
+                "with blocks %s",
+                process.name, process.pid, shard
+            )
+        return Ut.is_list(self.processes, not_null=True)
+
+    def stop(self, timeout: float = 5):
+        """Terminate and join all worker processes."""
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            process.join(timeout=timeout)
+
+    def signal_handler(self, sig, frame):
+        """SIGTERM handler, worker processes are stopped on exit."""
+        raise SystemExit(f"Signal {sig} received.")
+
+    def run(self):
+        """
+        Start worker processes, and stop all if one of them fails.
+
+        Worker processes are also stopped if supervisor is terminated.
+        """
+        signal.signal(signal.SIGTERM, self.signal_handler)
+        try:
+            self.start()
+            while self.is_alive():
+                for process in self.processes:
+                    if not process.is_alive() and process.exitcode != 0:
+                        logger.error(
+                            "[BlockSupervisor] Process %s exited "
+                            "with code %s, stopping all processes.",
+                            process.name, process.exitcode
+                        )
+                        self.stop()
+                        return
+                time.sleep(1)
+        except (
+                    SystemExit,
+                    KeyboardInterrupt
+                ) as ex:
+            logger.warning(
+                "Exit vemonitor... "
+                "ex: %s",
+                ex
+            )
+            self.stop()
@@ -0,0 +1,266 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Configuration hot reload Helpers.
+
+    - ConfigDiff: diff app blocks, inputs, outputs and connectors
+      of two compiled configurations.
+    - ConfigReloader: reload configuration on request (SIGHUP),
+      or when configuration source files changed (file watch).
+
+Block runners apply the diff incrementally,
+only workers whose item or connector changed are restarted.
+"""
+import logging
+import threading
+import time
+from typing import Optional, Union
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.conf_manager.config_cache import ConfigCache
+from vemonitor_m8.models.config import Config
+from vemonitor_m8.models.workers import WorkersHelper
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class ConfigDiff:
+    """Configuration diff Helper"""
+
+    # block keys applied by workers diff
+    ITEMS_KEYS = ('name', 'inputs', 'outputs')
+
+    @staticmethod
+    def get_block_by_name(conf: Config, name: str) -> tuple:
+        """
+        Get app block and his index by name.
+
+        :return: tuple of (block index, block), or (None, None)
+        """
+        result = (None, None)
+        if isinstance(conf, Config) and conf.has_app_blocks():
+            for index, block in enumerate(conf.app_blocks):
+                if Ut.is_dict(block) and block.get('name') == name:
+                    result = (index, block)
+                    break
+        return result
+
+    @staticmethod
+    def get_item_conf(item: dict) -> dict:
+        """Get item conf, with sorted columns list."""
+        result = dict(item)
+        if Ut.is_list(result.get('columns')):
+            result['columns'] = sorted(result.get('columns'))
+        return result
+
+    @staticmethod
+    def get_item_changes(old_item: dict, new_item: dict) -> list:
+        """Get changed item keys."""
+        old_conf = ConfigDiff.get_item_conf(old_item)
+        new_conf = ConfigDiff.get_item_conf(new_item)
+        return sorted(
+            key
+            for key in set(old_conf).union(new_conf)
+            if old_conf.get(key) != new_conf.get(key)
+        )
+
+    @staticmethod
+    def get_items(block: Optional[dict], section: str) -> dict:
+        """Get block section items by worker name."""
+        result = {}
+        if Ut.is_dict(block) and Ut.is_dict(block.get(section)):
+            for key, items in block.get(section).items():
+                if Ut.is_list(items):
+                    for index, item in enumerate(items):
+                        if Ut.is_dict(item, not_null=True):
+                            name = WorkersHelper.get_worker_name(key, item)
+                            result[name] = (key, index, item)
+        return result
+
+    @staticmethod
+    def get_connector(conf: Config, key: str, source: str) -> Optional[dict]:
+        """Get item connector conf."""
+        result = None
+        if isinstance(conf, Config):
+            result = conf.get_app_connector_by_key_item(key, source)
+        return result
+
+    @staticmethod
+    def diff_items(old_conf: Config,
+                   new_conf: Config,
+                   old_block: Optional[dict],
+                   new_block: Optional[dict],
+                   section: str
+                   ) -> dict:
+        """
+        Diff block section items.
+
+        An item is changed if his conf or his connector conf changed,
+        changed items with changed connector are also in reconnect list.
+        :return: dict of added, removed, changed, reconnect
+            and unchanged lists of worker names.
+        """
+        result = {
+            'added': [],
+            'removed': [],
+            'changed': [],
+            'reconnect': [],
+            'unchanged': []
+        }
+        old_items = ConfigDiff.get_items(old_block, section)
+        new_items = ConfigDiff.get_items(new_block, section)
+        for name, (key, _, item) in new_items.items():
+            if name not in old_items:
+                result['added'].append(name)
+                continue
+            is_reconnect = ConfigDiff.get_connector(
+                new_conf, key, item.get('source')
+            ) != ConfigDiff.get_connector(
+                old_conf, key, item.get('source')
+            )
+            if is_reconnect:
+                result['reconnect'].append(name)
+            if is_reconnect\
+                    or ConfigDiff.get_item_conf(item)\
+                    != ConfigDiff.get_item_conf(old_items[name][2]):
+                result['changed'].append(name)
+            else:
+                result['unchanged'].append(name)
+        result['removed'] = [
+            name for name in old_items if name not in new_items
+        ]
+        return result
+
+    @staticmethod
+    def get_block_changes(old_block: dict, new_block: dict) -> list:
+        """Get changed block keys, other than workers items keys."""
+        return sorted(
+            key
+            for key in set(old_block).union(new_block)
+            if key not in ConfigDiff.ITEMS_KEYS
+            and old_block.get(key) != new_block.get(key)
+        )
+
+    @staticmethod
+    def diff_blocks(old_conf: Config, new_conf: Config) -> dict:
+        """
+        Diff configurations app blocks by name.
+
+        :return: dict of added, removed, changed and unchanged
+            lists of block names.
+        """
+        result = {'added': [], 'removed': [], 'changed': [], 'unchanged': []}
+        old_names = [block.get('name') for block in old_conf.app_blocks]
+        for block in new_conf.app_blocks:
+            name = block.get('name')
+            _, old_block = ConfigDiff.get_block_by_name(old_conf, name)
+            if old_block is None:
+                result['added'].append(name)
+            elif ConfigDiff.get_block_changes(old_block, block)\
+                    or any(
+                        ConfigDiff.diff_items(
+                            old_conf, new_conf, old_block, block, section
+                        ).get(state)
+                        for section in ('inputs', 'outputs')
+                        for state in ('added', 'removed', 'changed')
+                    ):
+                result['changed'].append(name)
+            else:
+                result['unchanged'].append(name)
+        result['removed'] = [
+            name for name in old_names
+            if ConfigDiff.get_block_by_name(new_conf, name)[1] is None
+        ]
+        return result
+
+
+class ConfigReloader:
+    """
+    Configuration reload Helper.
+
+    Reload is requested by SIGHUP (see request),
+    or by configuration source files changes,
+    checked every watch_interval seconds if set.
+    """
+
+    def __init__(self,
+                 loader,
+                 params: Optional[dict] = None,
+                 watch_interval: Optional[Union[int, float]] = None
+                 ):
+        self.loader = loader
+        self.params = params if Ut.is_dict(params) else {}
+        self.watch_interval = watch_interval\
+            if Ut.is_numeric(watch_interval, positive=True) else None
+        self._requested = threading.Event()
+        self._sources = []
+        self._last_check = time.monotonic()
+        self.set_sources(loader.loaded_files)
+
+    def set_sources(self, files: list):
+        """Set fingerprints of configuration source files."""
+        self._sources = [
+            fingerprint
+            for fingerprint in (
+                ConfigCache.get_fingerprint(path)
+                for path in dict.fromkeys(files or [])
+            )
+            if fingerprint is not None
+        ]
+
+    def request(self):
+        """Request configuration reload, from signal handler."""
+        self._requested.set()
+
+    def is_sources_changed(self) -> bool:
+        """Test if any configuration source file changed."""
+        return any(
+            not ConfigCache.is_unchanged(fingerprint)
+            for fingerprint in self._sources
+        )
+
+    def is_due(self) -> bool:
+        """Test if reload is requested, or source files changed."""
+        result = self._requested.is_set()
+        now = time.monotonic()
+        if not result\
+                and self.watch_interval is not None\
+                and now - self._last_check >= self.watch_interval:
+            self._last_check = now
+            result = self.is_sources_changed()
+        return result
+
+    def load(self) -> Optional[Config]:
+        """
+        Load and compile configuration.
+
+        Invalid configuration is logged and ignored,
+        running configuration is kept.
+        """
+        result = None
+        files = [fingerprint.get('path') for fingerprint in self._sources]
+        self._requested.clear()
+        try:
+            result = self.loader.get_settings_from_schema(**self.params)
+            if not isinstance(result, Config) or not result.is_valid():
+                raise ValueError("Configuration is not valid.")
+        except Exception as ex:
+            result = None
+            logger.error(
+                "[ConfigReloader::load] "
+                "Unable to reload configuration, "
+                "running configuration is kept. ex: %s",
+                ex
+            )
+        if result is not None:
+            files = []
+        # a bad file is not reloaded until changed again
+        self.set_sources(files + self.loader.loaded_files)
+        return result
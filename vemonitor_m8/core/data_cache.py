@@ -155,6 +155,54 @@ class DataCache(InputsCache):
             self.control_node_data_len(node=node)
         return result
 
+    def rollup_rows(self, time_keys: list) -> bool:
+        """
+        Aggregate rows in one row, stored on last time key.
+
+        Numeric values are averaged, other values
+        and time keys keep the last row value.
+        """
+        result = False
+        if Ut.is_list(time_keys, not_null=True):
+            keys = [
+                key
+                for key in sorted(time_keys)
+                if self.has_key_data(key)
+            ]
+            if len(keys) > 1:
+                values = {}
+                for key in keys:
+                    for node, data in self.data.pop(key).items():
+                        node_values = values.setdefault(node, {})
+                        for column, value in data.items():
+                            node_values.setdefault(column, []).append(value)
+                self.data[keys[-1]] = {
+                    node: {
+                        column: DataCache.get_rollup_value(column, items)
+                        for column, items in node_values.items()
+                    }
+                    for node, node_values in values.items()
+                }
+                result = True
+        return result
+
+    @staticmethod
+    def get_rollup_value(column: str, values: list):
+        """Get mean of numeric values, or last value."""
+        result = values[-1]
+        is_numeric = all(
+            isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            for value in values
+        )
+        if is_numeric and column not in ('time', 'time_ref'):
+            mean = sum(values) / len(values)
+            if all(isinstance(value, int) for value in values):
+                result = int(round(mean))
+            else:
+                result = round(mean, 6)
+        return result
+
     def get_cache_data_by_structure(self,
                                     time_key: int,
                                     structure: Optional[dict] = None
@@ -2,7 +2,14 @@
 # -*- coding: utf-8 -*-
 """
 Data Checker Module
+
+Input columns can be checked from checkers configuration on every read
+(check_input_columns), or from a plan compiled once per columns list
+(compile_plan and check_input_plan).
+A plan maps each column to a converter closure,
+with checker configuration validated and types resolved at compile time.
 """
+from functools import partial
 from typing import Optional
 from ve_utils.utype import UType as Ut
 from vemonitor_m8.core.exceptions import DeviceDataConfError
@@ -14,6 +21,18 @@ class DataChecker:
     """
         Data Checker Module
     """
+    # instance types tested by Ut.is_valid_format, from input types names
+    INPUT_TYPES = {
+        "str": str,
+        "bool": bool,
+        "int": int,
+        "float": float,
+        "numeric": (int, float),
+        "dict": dict,
+        "tuple": tuple,
+        "list": list
+    }
+
     @staticmethod
     def is_valid_checker(checker):
         """Test if is valid checker data"""
@@ -152,3 +171,127 @@ class DataChecker:
             callback=DataChecker.check_output_item,
             local_checkers=local_checkers
         )
+
+    @staticmethod
+    def get_conf_error_converter(error: DeviceDataConfError):
+        """Get converter raising checker configuration error."""
+        def converter(value):
+            raise error
+        return converter
+
+    @staticmethod
+    def get_input_test(key: str, input_type: str):
+        """Get input value test function, from input type name."""
+        instance_type = DataChecker.INPUT_TYPES.get(input_type)
+        if instance_type is None:
+            # unknown types are tested (and rejected) by Ut.is_valid_format
+            def input_test(value):
+                return DataChecker.validate_input_value(
+                    key, value, {'input_type': input_type}
+                )
+        else:
+            def input_test(value):
+                if value is not None\
+                        and not isinstance(value, (str, instance_type)):
+                    raise DeviceInputValueError(
+                        "Error: Device Input Value Error. "
+                        "Float point value or device data is not valid. "
+                        f"Please Check Device data point: {key}"
+                    )
+        return input_test
+
+    @staticmethod
+    def get_formatter(output_type: str):
+        """Get value formatter function, from output type name."""
+        if output_type == "int":
+            result = Ut.get_int
+        elif output_type in ["float", "numeric", "time"]:
+            result = partial(Ut.get_rounded_float, rnd=3)
+        else:
+            result = partial(
+                Ut.format_by_type, data_type=output_type, float_round=3
+            )
+        return result
+
+    @staticmethod
+    def compile_item(key: str, checker: Optional[dict]):
+        """
+        Compile item checker to a converter closure.
+
+        Converter has the same results than check_input_item.
+        Configuration errors are raised when converter is called.
+        """
+        result = None
+        float_point = checker.get('floatpoint')\
+            if Ut.is_dict(checker) else None
+        if not DataChecker.is_valid_checker(checker):
+            result = DataChecker.get_conf_error_converter(
+                DeviceDataConfError(
+                    "Error: Unable to check/format data value. "
+                    "Checker configuration is bad or null. "
+                    f"Please Check Device data point: {key}"
+                )
+            )
+        elif float_point is not None\
+                and not Ut.is_float(float_point, positive=True):
+            result = DataChecker.get_conf_error_converter(
+                DeviceDataConfError(
+                    "Error: Unable to check/format data value. "
+                    "Float point value or device data is not valid. "
+                    f"Please Check Device data point: {key}"
+                )
+            )
+        else:
+            input_test = DataChecker.get_input_test(
+                key, checker.get('input_type')
+            )
+            formatter = DataChecker.get_formatter(checker.get('output_type'))
+            if Ut.is_float(float_point) and float_point != 0:
+                def converter(value):
+                    input_test(value)
+                    return round(formatter(value) * float_point, 3)
+            else:
+                def converter(value):
+                    input_test(value)
+                    return formatter(value)
+            result = converter
+        return result
+
+    @staticmethod
+    def compile_plan(columns: list,
+                     checkers: dict,
+                     local_checkers: Optional[dict] = None
+                     ) -> dict:
+        """
+        Compile columns checkers to a plan of converters closures.
+
+        :return: dict of column name: converter
+        """
+        result = {}
+        if Ut.is_list(columns, not_null=True)\
+                and Ut.is_dict(checkers, not_null=True):
+            for key in columns:
+                if Ut.is_str(key):
+                    if Ut.is_dict(local_checkers) and key in local_checkers:
+                        checker = local_checkers.get(key)
+                    else:
+                        checker = checkers.get(key)
+                    result[key] = DataChecker.compile_item(key, checker)
+        return result
+
+    @staticmethod
+    def check_input_plan(columns: dict, plan: dict) -> Optional[dict]:
+        """
+        Check columns with a compiled plan.
+
+        Columns out of plan are ignored.
+        """
+        res = None
+        if Ut.is_dict(columns, not_null=True)\
+                and Ut.is_dict(plan, not_null=True):
+            res = {
+                key: plan[key](value)
+                for key, value in columns.items()
+                if key in plan
+            }
+        return res
@@ -0,0 +1,167 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Deadband filter Helper.
+
+Suppress input values who didn't change enough since last kept value,
+before they are added to inputs cache.
+Rules are set per data structure point, with `deadband` key:
+    - abs: absolute deadband, values are kept if they move more than abs
+    - rel: relative deadband, ratio of last kept value
+    - heartbeat: max time in seconds between two kept values
+Without abs and rel, only changed values are kept (change only).
+Suppressed values can be reconstructed for outputs by last value carry
+(see LastValueCarry).
+"""
+import logging
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class DeadbandFilter:
+    """Deadband filter Helper"""
+
+    # columns never filtered
+    TIME_KEYS = ('time', 'time_ref')
+    DEFAULT_HEARTBEAT = 60
+
+    def __init__(self, rules: dict):
+        self.rules = rules
+        self._last = {}
+        self.stats = {
+            "kept": 0,
+            "suppressed": 0
+        }
+
+    @classmethod
+    def from_points(cls,
+                    points: Optional[dict]
+                    ) -> Optional['DeadbandFilter']:
+        """Get instance from data structure points deadband rules."""
+        result = None
+        if Ut.is_dict(points, not_null=True):
+            rules = {
+                key: DeadbandFilter.get_rule(point.get('deadband'))
+                for key, point in points.items()
+                if Ut.is_dict(point)
+                and Ut.is_dict(point.get('deadband'))
+            }
+            if Ut.is_dict(rules, not_null=True):
+                result = cls(rules)
+        return result
+
+    @staticmethod
+    def get_rule(conf: dict) -> dict:
+        """Get point rule from deadband configuration."""
+        heartbeat = conf.get('heartbeat')
+        return {
+            'abs': Ut.get_float(conf.get('abs'), 0),
+            'rel': Ut.get_float(conf.get('rel'), 0),
+            'heartbeat': heartbeat if Ut.is_numeric(heartbeat, positive=True)
+            else DeadbandFilter.DEFAULT_HEARTBEAT
+        }
+
+    def get_stats(self) -> dict:
+        """Get kept and suppressed values stats."""
+        return self.stats
+
+    @staticmethod
+    def is_changed(rule: dict, value, last) -> bool:
+        """Test if value moved out of rule deadband from last value."""
+        result = value != last
+        if result\
+                and (rule.get('abs') > 0 or rule.get('rel') > 0)\
+                and Ut.is_numeric(value) and Ut.is_numeric(last)\
+                and not Ut.is_bool(value) and not Ut.is_bool(last):
+            diff = abs(value - last)
+            result = diff > rule.get('abs')\
+                and diff > rule.get('rel') * abs(last)
+        return result
+
+    def filter_data(self, time_key: float, node: str, data: dict) -> dict:
+        """
+        Remove suppressed values from node data.
+
+        Values are kept if changed out of deadband,
+        or if heartbeat time elapsed since last kept value.
+        """
+        result = {}
+        if Ut.is_dict(data, not_null=True):
+            last_values = self._last.setdefault(node, {})
+            for key, value in data.items():
+                rule = self.rules.get(key)
+                last = last_values.get(key)
+                if rule is None or key in self.TIME_KEYS:
+                    result[key] = value
+                elif last is None\
+                        or time_key - last[0] >= rule.get('heartbeat')\
+                        or time_key < last[0]\
+                        or DeadbandFilter.is_changed(rule, value, last[1]):
+                    last_values[key] = (time_key, value)
+                    result[key] = value
+                    self.stats["kept"] += 1
+                else:
+                    self.stats["suppressed"] += 1
+        return result
+
+    @staticmethod
+    def has_values(data: Optional[dict]) -> bool:
+        """Test if data has other values than time keys."""
+        return Ut.is_dict(data, not_null=True)\
+            and any(
+                key not in DeadbandFilter.TIME_KEYS
+                for key in data
+            )
+
+
+class LastValueCarry:
+    """
+    Last value carry Helper.
+
+    Fill columns missing in output rows with last known value,
+    to reconstruct values suppressed by deadband filter.
+    """
+
+    def __init__(self):
+        self._last = {}
+
+    def fill(self, data: dict, structure: dict) -> dict:
+        """
+        Fill missing structure columns of rows, in time order.
+
+        Rows are copied, cache data is not modified.
+        A value is carried only to rows more recent than it.
+        """
+        result = {}
+        if Ut.is_dict(data, not_null=True)\
+                and Ut.is_dict(structure, not_null=True):
+            for time_key in sorted(data):
+                row = {
+                    node: dict(values)
+                    for node, values in data[time_key].items()
+                }
+                for node, columns in structure.items():
+                    last_values = self._last.setdefault(node, {})
+                    values = row.get(node)
+                    if values is None:
+                        values = {}
+                    for column in columns:
+                        if column in values:
+                            last_values[column] = (time_key, values[column])
+                        elif column in last_values\
+                                and last_values[column][0] < time_key:
+                            values[column] = last_values[column][1]
+                    if Ut.is_dict(values, not_null=True):
+                        row[node] = values
+                result[time_key] = row
+        return result
@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Fifo lock Helper.
+
+Lock granted to callers in arrival order, with timeout aware acquisition
+and wait time statistics.
+A caller already holding the lock, from the same thread,
+acquires it again without waiting.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional, Union
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class FifoLock:
+    """Fifo lock Helper"""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._waiters = deque()
+        self._owner = None
+        self._owner_thread = None
+        self.stats = {
+            "acquired": 0,
+            "timeouts": 0,
+            "waiting": 0,
+            "max_wait": 0,
+            "total_wait": 0
+        }
+
+    def get_owner(self) -> Optional[str]:
+        """Get name of caller holding the lock."""
+        return self._owner
+
+    def is_locked(self) -> bool:
+        """Test if lock is held."""
+        return self._owner is not None
+
+    def is_owner(self, caller_name: str) -> bool:
+        """Test if lock is held by caller_name."""
+        return self.is_locked() and self._owner == caller_name
+
+    def get_stats(self) -> dict:
+        """Get lock acquisitions and wait time stats."""
+        result = dict(self.stats)
+        result["mean_wait"] = 0
+        if result["acquired"] > 0:
+            result["mean_wait"] = round(
+                result["total_wait"] / result["acquired"], 6
+            )
+        return result
+
+    def _is_turn(self, waiter: object) -> bool:
+        """Test if waiter is first in line and lock is free."""
+        return self._owner is None and self._waiters[0] is waiter
+
+    def _update_stats(self, wait: float):
+        """Update acquisitions stats."""
+        self.stats["acquired"] += 1
+        self.stats["total_wait"] = round(self.stats["total_wait"] + wait, 6)
+        self.stats["max_wait"] = max(self.stats["max_wait"], round(wait, 6))
+
+    def acquire(self,
+                caller_name: str,
+                timeout: Optional[Union[int, float]] = None
+                ) -> bool:
+        """
+        Acquire lock for caller_name, in arrival order.
+
+        :param timeout: Max time to wait in seconds, None to wait forever.
+        :return: False if timeout is reached.
+        """
+        result = False
+        start = time.monotonic()
+        with self._cond:
+            if self._owner == caller_name\
+                    and self._owner_thread == threading.get_ident():
+                result = True
+            else:
+                waiter = object()
+                self._waiters.append(waiter)
+                self.stats["waiting"] = len(self._waiters)
+                end = None if timeout is None else start + timeout
+                while not self._is_turn(waiter):
+                    remaining = None if end is None\
+                        else end - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._is_turn(waiter):
+                    self._owner = caller_name
+                    self._owner_thread = threading.get_ident()
+                    self._update_stats(time.monotonic() - start)
+                    result = True
+                else:
+                    self.stats["timeouts"] += 1
+                    # next waiter may be first in line now
+                    self._cond.notify_all()
+                self._waiters.remove(waiter)
+                self.stats["waiting"] = len(self._waiters)
+        return result
+
+    def release(self):
+        """Release lock, and wake up next caller in line."""
+        with self._cond:
+            self._owner = None
+            self._owner_thread = None
+            self._cond.notify_all()
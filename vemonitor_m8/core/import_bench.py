@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Import time benchmark Helper.
+
+Import a module in a new python interpreter with `-X importtime`,
+and report the import time breakdown, slowest modules first.
+Times are in microseconds:
+    - self: module own import time
+    - cumulative: module import time, with its imports
+"""
+import logging
+import subprocess
+import sys
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class ImportBench:
+    """Import time benchmark Helper"""
+
+    # modules imported to run one app block
+    DEFAULT_MODULES = (
+        "vemonitor_m8.app_run",
+        "vemonitor_m8.conf_manager.config_loader",
+        "vemonitor_m8.core.async_app_run"
+    )
+    LINE_PREFIX = "import time:"
+
+    @staticmethod
+    def parse_line(line: str) -> Optional[tuple]:
+        """
+        Parse `-X importtime` output line.
+
+        :return: tuple of (module name, self time, cumulative time)
+        """
+        result = None
+        if Ut.is_str(line) and line.startswith(ImportBench.LINE_PREFIX):
+            values = line[len(ImportBench.LINE_PREFIX):].split("|")
+            if len(values) == 3\
+                    and values[0].strip().isdigit()\
+                    and values[1].strip().isdigit():
+                result = (
+                    values[2].strip(),
+                    int(values[0]),
+                    int(values[1])
+                )
+        return result
+
+    @staticmethod
+    def run(modules: Optional[tuple] = None, timeout: int = 60) -> list:
+        """
+        Import modules in a new interpreter and get imports times.
+
+        :return: list of (module name, self time, cumulative time),
+            slowest cumulative time first.
+        """
+        result = []
+        if not Ut.is_tuple(modules, not_null=True)\
+                and not Ut.is_list(modules, not_null=True):
+            modules = ImportBench.DEFAULT_MODULES
+        code = "\n".join([f"import {module}" for module in modules])
+        try:
+            process = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", code],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False
+            )
+            for line in process.stderr.splitlines():
+                item = ImportBench.parse_line(line)
+                if item is not None:
+                    result.append(item)
+            result.sort(key=lambda item: item[2], reverse=True)
+        except (OSError, subprocess.SubprocessError) as ex:
+            logger.error(
+                "[ImportBench::run] "
+                "Unable to run import time benchmark, ex: %s",
+                ex
+            )
+        return result
+
+    @staticmethod
+    def get_report(times: list, top: int = 25) -> str:
+        """Get import time breakdown report of top slowest modules."""
+        lines = [f"{'cumulative (ms)':>16} {'self (ms)':>10}  module"]
+        for name, self_time, cumulative in times[:top]:
+            lines.append(
+                f"{cumulative / 1000:>16.1f} {self_time / 1000:>10.1f}  {name}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,249 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Multi App blocks run Helper.
+
+Run several app blocks in one process.
+Blocks share the same scheduler (ThreadsController)
+and the same live connectors (SharedConnectors),
+so a serial port or a redis connection is opened only once.
+Each block keeps his own workers and inputs cache.
+"""
+import logging
+import time
+import sys
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from vemonitor_m8.core.app_run_main import AppBlockRun
+from vemonitor_m8.core.async_app_run import AsyncAppBlockRun
+from vemonitor_m8.core.config_reload import ConfigDiff, ConfigReloader
+from vemonitor_m8.core.threads_controller import ThreadsController
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.models.config import Config
+from vemonitor_m8.workers.active_connectors import SharedConnectors
+from vemonitor_m8.core.exceptions import SettingInvalidException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__license__ = "Apache"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class MultiBlockRun:
+    """Multi App blocks run Helper"""
+
+    def __init__(self,
+                 conf: Config,
+                 block_indexes: Optional[list] = None
+                 ):
+        self._run = False
+        self.conf: Optional[Config] = None
+        self.blocks = []
+        self.shared_connectors = SharedConnectors()
+        self._threads = ThreadsController()
+        self.reloader: Optional[ConfigReloader] = None
+        self._is_stopped = False
+        self._stop_requested = False
+        if self.set_conf(conf)\
+                and self.init_blocks(block_indexes):
+            self._run = True
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.reload_signal_handler)
+
+    def set_conf(self, conf: Config) -> bool:
+        """Set Configuration data."""
+        result = False
+        if AppBlockRun.is_conf(conf):
+            self.conf = conf
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[veMonitor] Fatal error: "
+                "Config is not valid."
+            )
+        return result
+
+    def init_blocks(self, block_indexes: Optional[list] = None) -> bool:
+        """Init one AsyncAppBlockRun per block index."""
+        if not Ut.is_list(block_indexes, not_null=True):
+            block_indexes = list(range(len(self.conf.app_blocks)))
+        for index in block_indexes:
+            if not self.conf.has_app_block_key(index):
+                raise SettingInvalidException(
+                    "[veMonitor] Fatal error: "
+                    f"App block index {index} is not defined."
+                )
+            self.blocks.append(
+                AsyncAppBlockRun(
+                    conf=self.conf,
+                    block_index=index,
+                    shared_connectors=self.shared_connectors,
+                    threads=self._threads
+                )
+            )
+        return Ut.is_list(self.blocks, not_null=True)
+
+    def is_ready(self) -> bool:
+        """Test if all blocks are ready."""
+        return self._run is True\
+            and Ut.is_list(self.blocks, not_null=True)\
+            and all(block.is_ready() for block in self.blocks)
+
+    def exit_handler(self):
+        """Exit handler, flush cached data to outputs before exit."""
+        self.graceful_stop()
+        sys.exit(1)
+
+    def request_stop(self):
+        """
+        Request blocks stop, main loop exits and flushes outputs.
+
+        Only flags are set, so it's safe to call from signal handlers.
+        """
+        self._stop_requested = True
+        self._run = False
+
+    def signal_handler(self, sig, frame):
+        """Sig handler, graceful stop is run by main loop."""
+        self.request_stop()
+
+    def reload_signal_handler(self, sig, frame):
+        """SIGHUP handler, request configuration reload."""
+        if self.reloader is not None:
+            self.reloader.request()
+
+    def set_reloader(self, reloader: Optional[ConfigReloader]) -> bool:
+        """Set configuration reloader, checked on main loop."""
+        result = False
+        if reloader is None or isinstance(reloader, ConfigReloader):
+            self.reloader = reloader
+            result = True
+        return result
+
+    def check_reload(self) -> bool:
+        """Reload configuration if requested or if source files changed."""
+        result = False
+        if self.reloader is not None and self.reloader.is_due():
+            conf = self.reloader.load()
+            if conf is not None:
+                result = self.reload_conf(conf)
+        return result
+
+    def reload_conf(self, conf: Config) -> bool:
+        """
+        Apply new configuration on running blocks.
+
+        Blocks restart only their changed workers.
+        Added or removed blocks are applied on next restart.
+        """
+        result = True
+        diff = ConfigDiff.diff_blocks(self.conf, conf)
+        if Ut.is_list(diff.get('added'), not_null=True)\
+                or Ut.is_list(diff.get('removed'), not_null=True):
+            logger.warning(
+                "[MultiBlockRun::reload_conf] "
+                "App blocks added %s or removed %s, "
+                "restart is needed to apply them.",
+                diff.get('added'), diff.get('removed')
+            )
+        for block in self.blocks:
+            if not block.reload_conf(conf):
+                result = False
+        self.conf = conf
+        return result
+
+    def cancel_all_timers(self):
+        """Cancel timers and close workers of all blocks."""
+        self._run = False
+        for block in self.blocks:
+            block.cancel_all_timers()
+
+    def graceful_stop(self) -> bool:
+        """
+        Stop all blocks, flushing cached data to outputs before closing.
+
+        Inputs of all blocks are stopped first,
+        then blocks are flushed in parallel,
+        with the longest block drain timeout.
+        Blocks are stopped only once.
+        """
+        result = False
+        self._run = False
+        if not self._is_stopped\
+                and Ut.is_list(self.blocks, not_null=True):
+            self._is_stopped = True
+            deadline = time.monotonic() + max(
+                block.get_drain_timeout() for block in self.blocks
+            )
+            for block in self.blocks:
+                block.stop_inputs()
+            with ThreadPoolExecutor(
+                    max_workers=len(self.blocks),
+                    thread_name_prefix="block_stop") as executor:
+                result = all(executor.map(
+                    lambda block: block.graceful_stop(deadline),
+                    self.blocks
+                ))
+        return result
+
+    def setup_blocks(self) -> bool:
+        """Setup inputs timers and outputs workers of all blocks."""
+        result = True
+        for block in self.blocks:
+            logger.info(
+                "[MultiBlockRun] Setup app block %s",
+                block.get_block_name()
+            )
+            if not block.setup_block():
+                result = False
+        return result
+
+    def wait_blocks_first_read(self, timeout: float = 1) -> bool:
+        """Wait until every block cached his first data, at most timeout."""
+        result = True
+        end = time.monotonic() + timeout
+        for block in self.blocks:
+            if not block.wait_first_read(max(0, end - time.monotonic())):
+                result = False
+        return result
+
+    def run_blocks_loop(self) -> bool:
+        """Run one main loop iteration of all blocks."""
+        result = True
+        self.check_reload()
+        for block in self.blocks:
+            if not block.run_block_loop():
+                result = False
+        return result
+
+    def run_blocks(self):
+        """
+        Run all blocks inputs and outputs.
+
+        On stop request, blocks are stopped gracefully after main loop exit,
+        outside of any block lock.
+        """
+        try:
+            if self.setup_blocks():
+                self.wait_blocks_first_read(timeout=1)
+                while self.is_ready():
+                    self.run_blocks_loop()
+
+                    time.sleep(0.1)
+        except (
+                    SystemExit,
+                    KeyboardInterrupt
+                ) as ex:
+            logger.warning(
+                "Exit vemonitor... "
+                "ex: %s",
+                ex
+            )
+            self.request_stop()
+        if self._stop_requested:
+            self.exit_handler()
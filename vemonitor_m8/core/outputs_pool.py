@@ -0,0 +1,350 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Outputs workers pool Helper.
+
+Send data to every output worker concurrently.
+Each output worker has his own thread pool, send timeout
+and in flight limit, so a slow output can't delay the others.
+Send results are returned on a completion queue,
+who is used to advance output workers last_saved_time.
+As jobs can complete out of order, last_saved_time is only advanced
+to the last contiguous acknowledged job, and data is sent again
+from the oldest failed or expired job.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.models.workers import OutputWorker, WorkersHelper
+from vemonitor_m8.workers.active_connectors import SharedConnectors
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class OutputJob:
+    """Output send job Helper"""
+    def __init__(self,
+                 worker_name: str,
+                 from_time: int,
+                 last_time: int,
+                 nb_items: int,
+                 timeout: float
+                 ):
+        self.worker_name = worker_name
+        self.from_time = from_time
+        self.last_time = last_time
+        self.nb_items = nb_items
+        self.start = time.monotonic()
+        self.deadline = self.start + timeout
+        self.expired = False
+        self.is_send = False
+        self.future = None
+
+    def is_deadline_reached(self, now: float) -> bool:
+        """Test if job deadline is reached."""
+        return not self.expired and now >= self.deadline
+
+
+class OutputsPool:
+    """Outputs workers pool Helper"""
+    def __init__(self, shared_connectors: Optional[SharedConnectors] = None):
+        self.completed = queue.Queue()
+        self.shared_connectors = shared_connectors
+        self._executors = {}
+        self._in_flight = {}
+        self._pending = {}
+        self._dispatched = {}
+        self._connector_locks = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def init_worker(self, name: str, worker: OutputWorker) -> bool:
+        """Init worker executor, in flight jobs and stats."""
+        result = False
+        if Ut.is_str(name, not_null=True)\
+                and WorkersHelper.is_output_worker(worker):
+            if name not in self._executors:
+                self._executors[name] = ThreadPoolExecutor(
+                    max_workers=worker.get_max_in_flight(),
+                    thread_name_prefix=f"output_{name}"
+                )
+                self._in_flight[name] = []
+                self._pending[name] = []
+                self._dispatched[name] = 0
+                self._stats[name] = {
+                    "sent": 0,
+                    "errors": 0,
+                    "timeouts": 0,
+                    "last_latency": 0,
+                    "max_latency": 0
+                }
+            result = True
+        return result
+
+    def get_connector_lock(self, worker: OutputWorker) -> threading.Lock:
+        """
+        Get lock shared by output workers using the same connector.
+
+        Workers can share the same connector instance
+        (see ActiveConnectors), who is not thread safe.
+        Locks are shared with other app blocks if shared_connectors is set.
+        """
+        if isinstance(self.shared_connectors, SharedConnectors):
+            return self.shared_connectors.get_connector_lock(worker.worker)
+        key = id(worker.worker)
+        with self._lock:
+            if key not in self._connector_locks:
+                self._connector_locks[key] = threading.Lock()
+            return self._connector_locks[key]
+
+    def get_stats(self, name: Optional[str] = None) -> Optional[dict]:
+        """Get output workers send stats."""
+        if Ut.is_str(name, not_null=True):
+            return self._stats.get(name)
+        return self._stats
+
+    def get_nb_in_flight(self, name: str) -> int:
+        """Get number of running jobs for worker name."""
+        return len(self._in_flight.get(name, []))
+
+    def can_submit(self, name: str, worker: OutputWorker) -> bool:
+        """Test if a new job can be submitted to worker name."""
+        return name in self._executors\
+            and self.get_nb_in_flight(name) < worker.get_max_in_flight()
+
+    def get_from_time(self, name: str, worker: OutputWorker) -> int:
+        """
+        Get time from which data must be sent to worker.
+
+        Data already dispatched to running jobs is ignored.
+        """
+        return max(
+            worker.get_last_saved_time(),
+            Ut.get_int(self._dispatched.get(name), 0)
+        )
+
+    def submit(self,
+               name: str,
+               worker: OutputWorker,
+               data: dict,
+               from_time: int,
+               last_time: int
+               ) -> bool:
+        """Submit data to send on worker thread pool."""
+        result = False
+        if self.can_submit(name, worker)\
+                and Ut.is_dict(data, not_null=True):
+            job = OutputJob(
+                worker_name=name,
+                from_time=from_time,
+                last_time=last_time,
+                nb_items=len(data),
+                timeout=worker.get_send_timeout()
+            )
+            self._in_flight[name].append(job)
+            self._pending[name].append(job)
+            self._dispatched[name] = last_time
+            job.future = self._executors[name].submit(
+                self._send_data, worker, data, job
+            )
+            result = True
+        return result
+
+    def _send_data(self, worker: OutputWorker, data: dict, job: OutputJob):
+        """Send data to worker and push result on completion queue."""
+        is_send, error = False, None
+        try:
+            with self.get_connector_lock(worker):
+                is_send = worker.send_data(
+                    data=data,
+                    input_structure=worker.columns
+                )
+        except Exception as ex:
+            error = ex
+        self.completed.put((job, is_send is True, error))
+
+    def check_deadlines(self):
+        """Expire running jobs whose deadline is reached."""
+        now = time.monotonic()
+        for name, jobs in self._in_flight.items():
+            for job in jobs:
+                if job.is_deadline_reached(now):
+                    job.expired = True
+                    self._stats[name]["timeouts"] += 1
+                    self.drop_pending(name, job)
+                    self.rewind(name, job.from_time)
+                    logger.error(
+                        "[OutputsPool::check_deadlines] "
+                        "Output worker %s send timeout, "
+                        "data will be sent again. "
+                        "Running since: %ss",
+                        name,
+                        round(now - job.start, 3)
+                    )
+
+    def rewind(self, name: str, from_time: int):
+        """Rewind dispatched time to resend data from from_time."""
+        dispatched = Ut.get_int(self._dispatched.get(name), 0)
+        if dispatched > from_time:
+            self._dispatched[name] = from_time
+
+    def rewind_saved(self,
+                     name: str,
+                     worker: OutputWorker,
+                     from_time: int
+                     ) -> bool:
+        """
+        Rewind worker last_saved_time, to send late rows again.
+
+        Running jobs with rows newer than from_time
+        must not advance last_saved_time anymore.
+        :return: True if worker was rewound.
+        """
+        result = False
+        if name in self._executors\
+                and Ut.is_int(from_time, mini=0)\
+                and from_time < self.get_from_time(name, worker):
+            for job in self._pending.get(name, []):
+                if job.last_time >= from_time:
+                    self.drop_pending(name, job)
+                    break
+            self.rewind(name, from_time)
+            if worker.get_last_saved_time() > from_time:
+                worker.set_last_saved_time(from_time)
+            result = True
+        return result
+
+    def drop_pending(self, name: str, job: OutputJob):
+        """
+        Drop job and newer jobs from pending acknowledgements.
+
+        Newer jobs data is sent again from the dropped job from_time,
+        so they must not advance last_saved_time anymore.
+        """
+        jobs = self._pending.get(name, [])
+        if job in jobs:
+            del jobs[jobs.index(job):]
+
+    def acknowledge(self, name: str, job: OutputJob, worker: OutputWorker):
+        """
+        Acknowledge successful job.
+
+        last_saved_time is advanced through the contiguous
+        successful jobs, up to the oldest job still running.
+        """
+        jobs = self._pending.get(name, [])
+        if job in jobs:
+            job.is_send = True
+            while jobs and jobs[0].is_send:
+                done = jobs.pop(0)
+                if done.last_time > worker.get_last_saved_time():
+                    worker.set_last_saved_time(done.last_time)
+
+    def process_completed(self, workers) -> int:
+        """
+        Process completion queue.
+
+        Successful jobs advance output worker last_saved_time,
+        once all older jobs are acknowledged.
+        Failed jobs rewind dispatched time so data is sent again.
+        Expired jobs results are ignored.
+        """
+        nb_done = 0
+        while True:
+            try:
+                job, is_send, error = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            nb_done += 1
+            name = job.worker_name
+            if job not in self._in_flight.get(name, []):
+                # job of a removed worker
+                continue
+            self._in_flight[name].remove(job)
+            worker = workers.get_output_worker(name)
+            latency = round(time.monotonic() - job.start, 6)
+            stats = self._stats[name]
+            stats["last_latency"] = latency
+            stats["max_latency"] = max(stats["max_latency"], latency)
+            if job.expired:
+                logger.warning(
+                    "[OutputsPool::process_completed] "
+                    "Ignore expired job result from output worker %s. "
+                    "Latency: %ss",
+                    name,
+                    latency
+                )
+            elif is_send and WorkersHelper.is_output_worker(worker):
+                stats["sent"] += job.nb_items
+                self.acknowledge(name, job, worker)
+            else:
+                stats["errors"] += 1
+                self.drop_pending(name, job)
+                self.rewind(name, job.from_time)
+                logger.error(
+                    "[OutputsPool::process_completed] "
+                    "Unable to send data to output worker %s. "
+                    "ex: %s",
+                    name,
+                    error
+                )
+        return nb_done
+
+    def wait_completed(self, workers, timeout: float) -> bool:
+        """Wait running jobs until timeout, and process results."""
+        deadline = time.monotonic() + timeout
+        while self.has_in_flight() and time.monotonic() < deadline:
+            self.process_completed(workers)
+            time.sleep(0.01)
+        self.process_completed(workers)
+        return not self.has_in_flight()
+
+    def remove_worker(self, name: str, workers, timeout: float = 0) -> bool:
+        """
+        Remove worker executor, waiting his running jobs until timeout.
+
+        Results of jobs still running after timeout are ignored.
+        :return: True if worker has no running job left.
+        """
+        result = True
+        if name in self._executors:
+            deadline = time.monotonic() + timeout
+            while self.get_nb_in_flight(name) > 0\
+                    and time.monotonic() < deadline:
+                self.process_completed(workers)
+                time.sleep(0.01)
+            self.process_completed(workers)
+            result = self.get_nb_in_flight(name) == 0
+            self._executors.pop(name).shutdown(
+                wait=False, cancel_futures=True
+            )
+            self._in_flight.pop(name, None)
+            self._pending.pop(name, None)
+            self._dispatched.pop(name, None)
+            self._stats.pop(name, None)
+        return result
+
+    def has_in_flight(self) -> bool:
+        """Test if any job is running."""
+        return any(
+            Ut.is_list(jobs, not_null=True)
+            for jobs in self._in_flight.values()
+        )
+
+    def shutdown(self, wait: bool = False):
+        """Shutdown all workers executors."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+        self._executors = {}
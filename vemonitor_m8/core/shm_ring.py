@@ -0,0 +1,214 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Shared memory ring buffer Helper.
+
+Single producer / single consumer ring buffer,
+stored on a multiprocessing SharedMemory block.
+Each slot contains a length prefixed json item.
+The write index is only updated by the producer
+and the read index only by the consumer, so no lock is needed.
+
+Indexes are written without memory barrier and may be read torn,
+and payload is not guaranteed to be visible before indexes
+on weakly ordered CPUs (ARM). So each slot has a commit word,
+set by the producer to slot index + 1 once data is written,
+and cleared by the consumer once data is copied, and a crc32 of his data:
+    - consumer reads a slot only if his commit word and crc32 are valid,
+      else the slot is read again on next pop
+    - producer writes a slot only if his commit word is cleared,
+      else the item is dropped as if ring was full
+
+Memory layout:
+    - header (64 bytes): write index, read index, dropped items count
+    - nb_slots slots of slot_size bytes:
+      commit word (8 bytes) + crc32 (4 bytes) + item length (4 bytes)
+      + json data
+"""
+import logging
+import struct
+import zlib
+from multiprocessing import shared_memory
+from typing import Optional
+from ve_utils.ujson import UJson
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class ShmRingBuffer:
+    """Shared memory ring buffer Helper"""
+
+    HEADER_SIZE = 64
+    WRITE_OFFSET = 0
+    READ_OFFSET = 8
+    DROPPED_OFFSET = 16
+    SLOT_HEADER_SIZE = 16
+
+    def __init__(self,
+                 shm: shared_memory.SharedMemory,
+                 nb_slots: int,
+                 slot_size: int,
+                 owner: bool = False
+                 ):
+        self.shm = shm
+        self.nb_slots = nb_slots
+        self.slot_size = slot_size
+        self.owner = owner
+        self.buf = shm.buf
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name."""
+        return self.shm.name
+
+    @classmethod
+    def create(cls,
+               nb_slots: int = 256,
+               slot_size: int = 4096,
+               name: Optional[str] = None
+               ) -> 'ShmRingBuffer':
+        """Create new ring buffer, owned by current process."""
+        if not Ut.is_int(nb_slots, positive=True)\
+                or not Ut.is_int(slot_size, mini=cls.SLOT_HEADER_SIZE + 2):
+            raise ValueError(
+                "[ShmRingBuffer::create] "
+                "Bad nb_slots or slot_size values."
+            )
+        shm = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            size=cls.HEADER_SIZE + nb_slots * slot_size
+        )
+        shm.buf[:shm.size] = bytes(shm.size)
+        return cls(shm, nb_slots, slot_size, owner=True)
+
+    @classmethod
+    def attach(cls,
+               name: str,
+               nb_slots: int,
+               slot_size: int
+               ) -> 'ShmRingBuffer':
+        """
+        Attach existing ring buffer, from producer process.
+
+        Producer processes are children of the owner process,
+        so they share his resource tracker and never unlink the block.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, nb_slots, slot_size, owner=False)
+
+    def _get_index(self, offset: int) -> int:
+        """Get index value from header."""
+        return struct.unpack_from("<Q", self.buf, offset)[0]
+
+    def _set_index(self, offset: int, value: int):
+        """Set index value on header."""
+        struct.pack_into("<Q", self.buf, offset, value)
+
+    def _get_commit(self, offset: int) -> int:
+        """Get slot commit word."""
+        return struct.unpack_from("<Q", self.buf, offset)[0]
+
+    def _set_commit(self, offset: int, value: int):
+        """Set slot commit word."""
+        struct.pack_into("<Q", self.buf, offset, value)
+
+    def _get_slot_offset(self, index: int) -> int:
+        """Get slot offset from index."""
+        return self.HEADER_SIZE + (index % self.nb_slots) * self.slot_size
+
+    def get_nb_items(self) -> int:
+        """Get number of items waiting to be read."""
+        return self._get_index(self.WRITE_OFFSET)\
+            - self._get_index(self.READ_OFFSET)
+
+    def get_nb_dropped(self) -> int:
+        """Get number of items dropped by producer."""
+        return self._get_index(self.DROPPED_OFFSET)
+
+    def is_full(self) -> bool:
+        """Test if ring buffer is full."""
+        return self.get_nb_items() >= self.nb_slots
+
+    def push(self, item: dict) -> bool:
+        """
+        Push item on ring buffer (producer side).
+
+        Return False and count item as dropped
+        if ring is full or item is too large for a slot.
+        """
+        result = False
+        data = UJson.dumps_json(item).encode('utf-8')
+        size = len(data)
+        index = self._get_index(self.WRITE_OFFSET)
+        offset = self._get_slot_offset(index)
+        if size <= self.slot_size - self.SLOT_HEADER_SIZE\
+                and not self.is_full()\
+                and self._get_commit(offset) == 0:
+            struct.pack_into(
+                "<II", self.buf, offset + 8, zlib.crc32(data), size
+            )
+            start = offset + self.SLOT_HEADER_SIZE
+            self.buf[start:start + size] = data
+            # commit and publish slot only once data is written
+            self._set_commit(offset, index + 1)
+            self._set_index(self.WRITE_OFFSET, index + 1)
+            result = True
+        else:
+            self._set_index(
+                self.DROPPED_OFFSET,
+                self.get_nb_dropped() + 1
+            )
+        return result
+
+    def pop(self) -> Optional[dict]:
+        """
+        Pop item from ring buffer (consumer side).
+
+        Slots not yet committed, or whose data is not yet visible,
+        are not popped and read again on next pop.
+        """
+        result = None
+        index = self._get_index(self.READ_OFFSET)
+        if index < self._get_index(self.WRITE_OFFSET):
+            offset = self._get_slot_offset(index)
+            if self._get_commit(offset) == index + 1:
+                crc, size = struct.unpack_from("<II", self.buf, offset + 8)
+                start = offset + self.SLOT_HEADER_SIZE
+                size = min(size, self.slot_size - self.SLOT_HEADER_SIZE)
+                data = bytes(self.buf[start:start + size])
+                if zlib.crc32(data) == crc:
+                    # release slot only once data is copied
+                    self._set_commit(offset, 0)
+                    self._set_index(self.READ_OFFSET, index + 1)
+                    result = UJson.loads_json(data.decode('utf-8'))
+        return result
+
+    def pop_batch(self, max_items: int = 100) -> list:
+        """Pop up to max_items from ring buffer."""
+        result = []
+        while len(result) < max_items:
+            item = self.pop()
+            if item is None:
+                break
+            result.append(item)
+        return result
+
+    def close(self):
+        """Close ring buffer, and unlink it if owner."""
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
@@ -5,35 +5,30 @@ import logging
 import threading
 from typing import Union
 from ve_utils.utype import UType as Ut
+from vemonitor_m8.core.timing_wheel import ScheduledJob, TimingWheel
 
 logging.basicConfig()
 logger = logging.getLogger("vemonitor")
 
 
-class RepeatTimer(threading.Timer):
-    """Threading Timer Helper"""
-
-    def __init__(self, interval, function, args=None, kwargs=None):
-        threading.Timer.__init__(self, interval, function, args, kwargs)
-
-    def run(self):
-        """Run Timer."""
-        while not self.finished.wait(self.interval):
-            self.function(*self.args, **self.kwargs)
-
-
 class ThreadsController:
-    """Threads controller Helper"""
+    """
+    Threads controller Helper
+
+    Timers are periodic jobs run by a timing wheel scheduler,
+    on a common epoch grid and a small pool of threads.
+    """
 
-    def __init__(self):
-        self._max_threads = 10
+    def __init__(self, max_workers: int = 4):
+        self._max_timers = 512
         self._timers = None
-        self._threads = None
+        self._wheel = TimingWheel(max_workers=max_workers)
         self.lock = threading.Lock()
 
     def can_add_threads(self):
-        """Test if instance has any timer registered."""
-        return threading.active_count() <= self._max_threads
+        """Test if a new timer can be registered."""
+        return not self.has_timers()\
+            or len(self._timers) < self._max_timers
 
     def has_timers(self):
         """Test if instance has any timer registered."""
@@ -47,30 +42,64 @@ class ThreadsController:
     def has_timer_key(self, key: str):
         """Test if instance has timer key registered."""
         return self.has_timers()\
-            and isinstance(self._timers.get(key), RepeatTimer)
+            and isinstance(self._timers.get(key), ScheduledJob)
+
+    def remove_timer_key(self, key: str, timeout: float = 0) -> bool:
+        """
+        Remove timer, it is not run anymore.
+
+        Wait until timeout for timer callback running.
+        :return: True if timer is removed and his callback not running.
+        """
+        result = False
+        if self.has_timer_key(key):
+            job = self._timers.pop(key)
+            result = self._wheel.remove_job(key)
+            deadline = time.monotonic() + timeout
+            while job.running and time.monotonic() < deadline:
+                time.sleep(0.01)
+            result = result and not job.running
+        return result
+
+    def set_timer_interval(self,
+                           key: str,
+                           interval: Union[int, float]
+                           ) -> bool:
+        """Set timer interval, used from next timer run."""
+        result = False
+        if self.has_timer_key(key):
+            result = self._wheel.set_job_interval(key, interval)
+        return result
+
+    def set_timer_offset(self,
+                         key: str,
+                         offset: Union[int, float]
+                         ) -> bool:
+        """Set timer phase offset from epoch grid, used from next run."""
+        result = False
+        if self.has_timer_key(key):
+            result = self._wheel.set_job_offset(key, offset)
+        return result
+
+    def get_timers_stats(self) -> dict:
+        """Get jitter and duration stats of every timer."""
+        return self._wheel.get_stats()
 
     def cancel_all_timers(self):
         """Cancel all timers running"""
         if self.has_timers():
-            for timer in self._timers.values():
-                timer.cancel()
+            self._wheel.stop()
 
     def start_timers(self):
-        """Test if instance has timer key registered."""
+        """Start all registered timers on a common epoch grid."""
         result = False
         if self.has_timers():
-            result = True
-            ready = False
-            for key, timer in self._timers.items():
-                if isinstance(timer, RepeatTimer):
-                    if not ready:
-                        ready = ThreadsController.sleep_time_to_start()
-                    timer.start()
-                    logger.debug(
-                        "[ThreadsController:start_timer_keys] "
-                        "Starting timer %s at %s.",
-                        key, time.time()
-                    )
+            result = self._wheel.start()
+            logger.debug(
+                "[ThreadsController:start_timers] "
+                "Starting %s timers at %s.",
+                len(self._timers), time.time()
+            )
         return result
 
     def add_timer_key(self,
@@ -78,8 +107,10 @@ class ThreadsController:
                       interval: Union[int, float],
                       callback,
                       args=None,
-                      kwargs=None) -> bool:
-        """Add RepeatTimer to _timers property."""
+                      kwargs=None,
+                      overrun: str = "skip",
+                      offset: Union[int, float] = 0) -> bool:
+        """Add periodic job to _timers property."""
         result = False
         if Ut.is_str(key, not_null=True)\
                 and Ut.is_numeric(interval, positive=True)\
@@ -87,19 +118,24 @@ class ThreadsController:
 
             if not self.has_timer_key(key):
                 self.init_timers()
-                self._timers[key] = RepeatTimer(
-                    interval,
-                    callback,
-                    args,
-                    kwargs
+                job = ScheduledJob(
+                    key=key,
+                    interval=interval,
+                    callback=callback,
+                    args=args,
+                    kwargs=kwargs,
+                    overrun=overrun,
+                    offset=offset
                 )
-                result = True
-        elif not (Ut.is_str(key, not_null=True)
-                  and Ut.is_numeric(interval, positive=True)):
+                if self._wheel.add_job(job):
+                    self._timers[key] = job
+                    result = True
+        elif Ut.is_str(key, not_null=True)\
+                and Ut.is_numeric(interval, positive=True):
             logger.error(
                 "[ThreadsController:add_timer_key] "
                 "Unable to add timer with key %s. "
-                "No more threads can be added ",
+                "No more timers can be added ",
                 key
             )
         else:
@@ -111,18 +147,3 @@ class ThreadsController:
                 interval
             )
         return result
-
-    @staticmethod
-    def sleep_time_to_start():
-        """Sleep time before run thread."""
-        now = time.time()
-        time_sleep = 10 - (now % 10)
-        logger.info(
-            "[ThreadsController:sleep_time_to_start] "
-            "sleeping %s before start timers. "
-            "start time defined at : %s",
-            time_sleep,
-            now + time_sleep
-        )
-        time.sleep(time_sleep)
-        return True
@@ -0,0 +1,377 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Hierarchical timing wheel scheduler Helper.
+
+Run many periodic jobs on a single driver thread and a small worker pool.
+Every job deadline is computed from a common epoch
+(epoch + offset + index * interval), so run time never accumulates drift.
+Overruns are skipped or coalesced by job policy,
+and each job keeps his own jitter and duration stats.
+"""
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class ScheduledJob:
+    """Periodic scheduled job Helper"""
+
+    OVERRUN_POLICIES = ("skip", "coalesce")
+
+    def __init__(self,
+                 key: str,
+                 interval: Union[int, float],
+                 callback,
+                 args=None,
+                 kwargs=None,
+                 overrun: str = "skip",
+                 offset: Union[int, float] = 0
+                 ):
+        self.key = key
+        self.interval = interval
+        self.offset = offset
+        self.callback = callback
+        self.args = args if args is not None else []
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.overrun = overrun if overrun in self.OVERRUN_POLICIES\
+            else "skip"
+        self.index = 0
+        self.deadline = 0
+        self.target_tick = 0
+        self.running = False
+        self.pending = None
+        self.cancelled = False
+        self.stats = {
+            "runs": 0,
+            "skipped": 0,
+            "coalesced": 0,
+            "missed": 0,
+            "errors": 0,
+            "last_jitter": 0,
+            "max_jitter": 0,
+            "sum_jitter": 0,
+            "last_duration": 0,
+            "max_duration": 0
+        }
+
+    def set_interval(self, interval: Union[int, float]) -> bool:
+        """
+        Set job interval.
+
+        New interval is used from next run, on a new grid.
+        """
+        result = False
+        if Ut.is_numeric(interval, positive=True):
+            self.interval = interval
+            self.index = 0
+            result = True
+        return result
+
+    def set_offset(self, offset: Union[int, float]) -> bool:
+        """
+        Set job phase offset from epoch grid.
+
+        New offset is used from next run.
+        """
+        result = False
+        if Ut.is_numeric(offset, mini=0):
+            self.offset = offset % self.interval
+            self.index = 0
+            result = True
+        return result
+
+    def set_next_deadline(self, epoch: float, now: float):
+        """
+        Set next deadline on epoch grid, shifted by job offset.
+
+        Grid points already passed are counted as missed.
+        """
+        epoch += self.offset
+        index = math.floor((now - epoch) / self.interval) + 1
+        if self.index > 0 and index > self.index + 1:
+            self.stats["missed"] += index - self.index - 1
+        self.index = max(index, self.index + 1)
+        self.deadline = epoch + self.index * self.interval
+
+    def update_stats(self, deadline: float, start: float, end: float):
+        """Update job jitter and duration stats."""
+        jitter = round(start - deadline, 6)
+        duration = round(end - start, 6)
+        stats = self.stats
+        stats["runs"] += 1
+        stats["last_jitter"] = jitter
+        stats["max_jitter"] = max(stats["max_jitter"], jitter)
+        stats["sum_jitter"] += abs(jitter)
+        stats["last_duration"] = duration
+        stats["max_duration"] = max(stats["max_duration"], duration)
+
+    def get_stats(self) -> dict:
+        """Get job stats."""
+        result = dict(self.stats)
+        result["mean_jitter"] = 0
+        if result.get("runs") > 0:
+            result["mean_jitter"] = round(
+                result.get("sum_jitter") / result.get("runs"), 6
+            )
+        del result["sum_jitter"]
+        return result
+
+
+class TimingWheel:
+    """Hierarchical timing wheel scheduler Helper"""
+
+    def __init__(self,
+                 resolution: float = 0.01,
+                 wheel_size: int = 64,
+                 nb_levels: int = 4,
+                 max_workers: int = 4
+                 ):
+        self.resolution = resolution
+        self.wheel_size = wheel_size
+        self.nb_levels = nb_levels
+        self.max_workers = max_workers
+        self.epoch = None
+        self._tick = 0
+        self._wheels = [
+            [[] for _ in range(wheel_size)]
+            for _ in range(nb_levels)
+        ]
+        self._overflow = []
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._driver = None
+        self._executor = None
+
+    def is_running(self) -> bool:
+        """Test if driver thread is running."""
+        return isinstance(self._driver, threading.Thread)\
+            and self._driver.is_alive()
+
+    def has_job(self, key: str) -> bool:
+        """Test if job key is registered."""
+        return key in self._jobs
+
+    def get_job(self, key: str) -> Optional[ScheduledJob]:
+        """Get registered job from key."""
+        return self._jobs.get(key)
+
+    def get_stats(self) -> dict:
+        """Get all jobs stats."""
+        return {
+            key: job.get_stats()
+            for key, job in self._jobs.items()
+        }
+
+    @staticmethod
+    def get_epoch(now: Optional[float] = None) -> float:
+        """
+        Get monotonic time of last wall clock second.
+
+        Used to keep jobs deadlines on whole seconds
+        without sleeping before start.
+        """
+        if now is None:
+            now = time.monotonic()
+        return now - (time.time() % 1)
+
+    def start(self, epoch: Optional[float] = None) -> bool:
+        """Start driver thread and workers pool."""
+        result = False
+        if not self.is_running():
+            now = time.monotonic()
+            self.epoch = epoch if Ut.is_float(epoch)\
+                else TimingWheel.get_epoch(now)
+            self._tick = math.floor((now - self.epoch) / self.resolution)
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="timing_wheel"
+            )
+            with self._lock:
+                for job in self._jobs.values():
+                    job.set_next_deadline(self.epoch, now)
+                    self._insert(job, self._tick + 1)
+            self._driver = threading.Thread(
+                target=self._run,
+                name="timing_wheel_driver",
+                daemon=True
+            )
+            self._driver.start()
+            result = True
+        return result
+
+    def stop(self, wait: bool = False):
+        """Stop driver thread and workers pool."""
+        self._stop.set()
+        for job in self._jobs.values():
+            job.cancelled = True
+        if self.is_running()\
+                and self._driver is not threading.current_thread():
+            self._driver.join(timeout=1)
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def add_job(self, job: ScheduledJob) -> bool:
+        """Register job, and schedule it if driver is running."""
+        result = False
+        if isinstance(job, ScheduledJob)\
+                and Ut.is_numeric(job.interval, positive=True)\
+                and job.key not in self._jobs:
+            with self._lock:
+                self._jobs[job.key] = job
+                if self.is_running():
+                    job.set_next_deadline(self.epoch, time.monotonic())
+                    self._insert(job, self._tick + 1)
+            result = True
+        return result
+
+    def set_job_interval(self,
+                         key: str,
+                         interval: Union[int, float]
+                         ) -> bool:
+        """Set job interval, used from next job run."""
+        result = False
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                result = job.set_interval(interval)
+        return result
+
+    def set_job_offset(self,
+                       key: str,
+                       offset: Union[int, float]
+                       ) -> bool:
+        """Set job phase offset, used from next job run."""
+        result = False
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                result = job.set_offset(offset)
+        return result
+
+    def remove_job(self, key: str) -> bool:
+        """Unregister job, it will be dropped on next slot run."""
+        result = False
+        with self._lock:
+            job = self._jobs.pop(key, None)
+            if job is not None:
+                job.cancelled = True
+                result = True
+        return result
+
+    def _insert(self, job: ScheduledJob, min_tick: int):
+        """Insert job in wheel slot matching his deadline."""
+        target = math.ceil(
+            round((job.deadline - self.epoch) / self.resolution, 6)
+        )
+        target = max(target, min_tick)
+        job.target_tick = target
+        size = self.wheel_size
+        for level in range(self.nb_levels):
+            span = size ** level
+            if target // span - self._tick // span < size:
+                self._wheels[level][(target // span) % size].append(job)
+                return
+        self._overflow.append(job)
+
+    def _cascade(self, tick: int):
+        """Move jobs from upper levels to lower levels."""
+        size = self.wheel_size
+        for level in range(self.nb_levels - 1, 0, -1):
+            span = size ** level
+            if tick % span == 0:
+                if level == self.nb_levels - 1\
+                        and tick % (span * size) == 0:
+                    jobs, self._overflow = self._overflow, []
+                    for job in jobs:
+                        self._insert(job, tick)
+                slot = (tick // span) % size
+                jobs, self._wheels[level][slot] = \
+                    self._wheels[level][slot], []
+                for job in jobs:
+                    self._insert(job, tick)
+
+    def _process_tick(self, tick: int, now: float):
+        """Run due jobs of tick."""
+        self._tick = tick
+        self._cascade(tick)
+        slot = tick % self.wheel_size
+        jobs, self._wheels[0][slot] = self._wheels[0][slot], []
+        for job in jobs:
+            if job.cancelled:
+                continue
+            if job.target_tick > tick:
+                self._insert(job, tick)
+                continue
+            deadline = job.deadline
+            job.set_next_deadline(self.epoch, now)
+            self._insert(job, tick + 1)
+            self._dispatch(job, deadline)
+
+    def _dispatch(self, job: ScheduledJob, deadline: float):
+        """Submit job to workers pool, or apply overrun policy."""
+        if job.running:
+            if job.overrun == "coalesce":
+                if job.pending is not None:
+                    job.stats["coalesced"] += 1
+                job.pending = deadline
+            else:
+                job.stats["skipped"] += 1
+                logger.debug(
+                    "[TimingWheel::_dispatch] "
+                    "Job %s still running, skip run at %s.",
+                    job.key, deadline
+                )
+        elif self._executor is not None:
+            job.running = True
+            self._executor.submit(self._run_job, job, deadline)
+
+    def _run_job(self, job: ScheduledJob, deadline: float):
+        """Run job callback, then coalesced run if any."""
+        while deadline is not None and not job.cancelled:
+            start = time.monotonic()
+            try:
+                job.callback(*job.args, **job.kwargs)
+            except Exception as ex:
+                job.stats["errors"] += 1
+                logger.error(
+                    "[TimingWheel::_run_job] "
+                    "Job %s raised an exception. ex: %s",
+                    job.key, ex
+                )
+            job.update_stats(deadline, start, time.monotonic())
+            with self._lock:
+                deadline, job.pending = job.pending, None
+                if deadline is None:
+                    job.running = False
+        job.running = False
+
+    def _run(self):
+        """Driver thread loop, process ticks on absolute tick times."""
+        while not self._stop.is_set():
+            next_time = self.epoch + (self._tick + 1) * self.resolution
+            wait = next_time - time.monotonic()
+            if wait > 0 and self._stop.wait(wait):
+                break
+            now = time.monotonic()
+            last_tick = math.floor((now - self.epoch) / self.resolution)
+            with self._lock:
+                for tick in range(self._tick + 1, last_tick + 1):
+                    self._process_tick(tick, now)
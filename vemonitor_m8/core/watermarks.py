@@ -0,0 +1,92 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Output watermarks store Helper.
+
+Persist output workers last_saved_time in a json file,
+so a restarted app block don't send again data already saved,
+and long term storages have no gaps between two runs.
+File is written atomically (temp file then rename).
+"""
+import json
+import logging
+import os
+from typing import Optional, Union
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class WatermarkStore:
+    """Output watermarks store Helper"""
+
+    def __init__(self, file_path: str):
+        self.file_path = os.path.expanduser(file_path)
+        self.data = {}
+        self.load()
+
+    @staticmethod
+    def get_key(block_name: str, output_name: str) -> str:
+        """Get watermark key of block output worker."""
+        return f"{block_name}.{output_name}"
+
+    def load(self) -> bool:
+        """Load watermarks from json file, if exists."""
+        result = False
+        if os.path.isfile(self.file_path):
+            try:
+                with open(self.file_path, encoding="utf-8") as file:
+                    data = json.load(file)
+                if Ut.is_dict(data):
+                    self.data = data
+                    result = True
+            except (OSError, ValueError) as ex:
+                logger.warning(
+                    "[WatermarkStore::load] "
+                    "Unable to load watermarks from %s, ex: %s",
+                    self.file_path, ex
+                )
+        return result
+
+    def get(self, key: str) -> Optional[int]:
+        """Get watermark value."""
+        return Ut.get_int(self.data.get(key), None)
+
+    def set(self, key: str, value: Union[int, float]) -> bool:
+        """Set watermark value, never moved backward."""
+        result = False
+        if Ut.is_str(key, not_null=True)\
+                and Ut.is_numeric(value, positive=True):
+            self.data[key] = max(int(value), Ut.get_int(self.data.get(key), 0))
+            result = True
+        return result
+
+    def save(self) -> bool:
+        """Write watermarks to json file."""
+        result = False
+        tmp_path = f"{self.file_path}.tmp"
+        try:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self.data, file, indent=2, sort_keys=True)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.file_path)
+            result = True
+        except OSError as ex:
+            logger.error(
+                "[WatermarkStore::save] "
+                "Unable to save watermarks to %s, ex: %s",
+                self.file_path, ex
+            )
+        return result
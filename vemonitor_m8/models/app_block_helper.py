@@ -26,7 +26,6 @@ class AppBlockHelper:
                           ) -> Optional[list]:
         """
         Add App Block columns to config
-        Todo: columns can be a dict
         """
         result = None
         if Ut.is_list(columns, not_null=True):
@@ -39,6 +38,21 @@ class AppBlockHelper:
                         result.append(col)
         return result
 
+    @staticmethod
+    def get_flat_columns(columns) -> Optional[list]:
+        """Get columns list, from list or from dict of nodes columns."""
+        result = None
+        if Ut.is_list(columns, not_null=True):
+            result = columns
+        elif Ut.is_dict(columns, not_null=True):
+            result = []
+            for points in columns.values():
+                if Ut.is_list(points):
+                    for point in points:
+                        if point not in result:
+                            result.append(point)
+        return result
+
     @staticmethod
     def get_block_columns_from_inout(item: dict,
                                      blocks_columns: Optional[list] = None
@@ -48,14 +62,12 @@ class AppBlockHelper:
             for data in item.values():
                 if Ut.is_list(data, not_null=True):
                     for content in data:
-                        if Ut.is_dict(content)\
-                                and Ut.is_list(
-                                    content.get('columns'),
-                                    not_null=True
-                                ):
+                        if Ut.is_dict(content):
                             blocks_columns = AppBlockHelper.add_block_columns(
                                 blocks_columns=blocks_columns,
-                                columns=content.get('columns')
+                                columns=AppBlockHelper.get_flat_columns(
+                                    content.get('columns')
+                                )
                             )
         return blocks_columns
 
@@ -4,7 +4,6 @@
 Configuration AppBlock model Helper class
 """
 from typing import Optional
-from jsonschema import SchemaError, ValidationError
 from ve_utils.utype import UType as Ut
 from vemonitor_m8.conf_manager.shema_validate_selector\
     import SchemaValidateSelector as jValid
@@ -40,6 +39,8 @@ class ConfigBatteryBanks(ConfigDataStructures):
 
     def validate_battery_banks(self, battery_banks: dict) -> None:
         """Validate Battery Banks"""
+        # jsonschema is imported on first validation
+        from jsonschema import SchemaError, ValidationError
         result = False
         if Ut.is_dict(battery_banks, not_null=True):
             result = True
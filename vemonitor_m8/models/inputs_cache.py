@@ -30,6 +30,10 @@ class InputsCache(ABC):
             result = True
         return result
 
+    def get_max_rows(self) -> int:
+        """Get max_rows property"""
+        return self._max_rows
+
     def set_max_rows(self, value: int) -> bool:
         """Set interval_min property."""
         result = False
@@ -38,6 +42,14 @@ class InputsCache(ABC):
             result = True
         return result
 
+    def rollup_rows(self, time_keys: list) -> bool:
+        """
+        Aggregate rows in one row, stored on last time key.
+
+        Return False if cache don't support rollups.
+        """
+        return False
+
     @abstractmethod
     def has_data(self):
         """Test if instance has data cache."""
@@ -53,6 +53,13 @@ class DictOfObject(ABC):
             result = self.items.get(key)
         return result
 
+    def remove_item(self, key: any) -> Optional[object]:
+        """Remove item key, and return removed item."""
+        result = None
+        if self.has_item_key(key):
+            result = self.items.pop(key)
+        return result
+
     def loop_on_items(self):
         """Get item key."""
         if self.has_items():
@@ -5,6 +5,7 @@ Workers models helper.
 This module contain worker models and helpers.
     - Worker(ABC) Worker base class
     - InputWorker(Worker) Input Worker base class
+    - InputTimeSeriesWorker(InputDictWorker) Time series Input Worker
     - OutputWorker(Worker) Output Worker base class
     - WorkersDict Workers items container class
     - Workers controller class
@@ -44,6 +45,14 @@ class Worker(ABC):
         """Properly close worker instance."""
         return True
 
+    def release(self) -> bool:
+        """
+        Release worker own resources, on worker removal.
+
+        Worker connector may be used by other workers, and is kept open.
+        """
+        return True
+
     def get_worker_status(self) -> bool:
         """Test if instance has name property."""
         return self._status is True
@@ -227,6 +236,34 @@ class InputDictWorker(InputWorker):
         return result
 
 
+class InputTimeSeriesWorker(InputDictWorker):
+    """
+    Time series Input Worker model helper.
+    Used by inputs workers reading rows of many nodes at once,
+    read_data returns rows with their own time keys:
+        {time_key: {node: {point: value}}}
+
+    Workers reading from a durable source can commit their read position
+    once rows are cached and sent by all outputs (at least once delivery).
+    """
+
+    def set_rows_cached(self):
+        """Mark rows of last read as cached."""
+
+    def get_cached_position(self) -> Optional[dict]:
+        """Get read position of cached rows, if worker commits it."""
+        return None
+
+    def commit(self, position: dict, saved_time: Optional[int]) -> bool:
+        """
+        Commit read position of rows sent by all outputs.
+
+        :param position: read position got from get_cached_position
+        :param saved_time: outputs min last saved time, None if no outputs
+        """
+        return False
+
+
 class OutputWorker(Worker):
     """Output Worker model helper"""
 
@@ -236,6 +273,9 @@ class OutputWorker(Worker):
         self.cache_interval = 0
         self.min_req_interval = 0
         self.last_req = 0
+        self.send_timeout = 30
+        self.max_in_flight = 1
+        self.points_types = None
 
     def has_columns(self) -> bool:
         """Test if instance has columns property."""
@@ -298,6 +338,49 @@ class OutputWorker(Worker):
             result = True
         return result
 
+    def get_send_timeout(self) -> float:
+        """Get send_timeout property."""
+        return Ut.get_float(self.send_timeout, 30)
+
+    def set_send_timeout(self, value: Union[int, float]) -> bool:
+        """Set send_timeout property."""
+        result = False
+        if Ut.is_numeric(value, positive=True):
+            self.send_timeout = value
+            result = True
+        return result
+
+    def get_max_in_flight(self) -> int:
+        """Get max_in_flight property."""
+        return max(Ut.get_int(self.max_in_flight, 1), 1)
+
+    def set_max_in_flight(self, value: int) -> bool:
+        """Set max_in_flight property."""
+        result = False
+        if Ut.is_int(value, positive=True):
+            self.max_in_flight = value
+            result = True
+        return result
+
+    def get_point_type(self, point: str) -> Optional[str]:
+        """Get point output type."""
+        result = None
+        if Ut.is_dict(self.points_types):
+            result = self.points_types.get(point)
+        return result
+
+    def set_points_types(self, points: dict) -> bool:
+        """Set points output types, from data structures points."""
+        result = False
+        if Ut.is_dict(points, not_null=True):
+            self.points_types = {
+                key: point.get('output_type')
+                for key, point in points.items()
+                if Ut.is_dict(point)
+            }
+            result = True
+        return result
+
     def update_req_time(self):
         """Update request time."""
         self.last_req = time.time()
@@ -323,6 +406,8 @@ class OutputWorker(Worker):
             - time_interval: Union[int, float]: required
             - columns: dict: required
             - cache_interval: Union[int, float]: optional
+            - send_timeout: Union[int, float]: optional
+            - max_in_flight: int: optional
             - ref_cols: list: optional
 
         """
@@ -334,6 +419,8 @@ class OutputWorker(Worker):
                 and self.set_columns(conf.get('columns')):
             self.set_name(conf.get('name'))
             self.set_cache_interval(conf.get('cache_interval'))
+            self.set_send_timeout(conf.get('send_timeout'))
+            self.set_max_in_flight(conf.get('max_in_flight'))
             self.set_ref_cols(conf.get('ref_cols'))
             result = True
         return result
@@ -377,6 +464,10 @@ class WorkersDict(DictOfObject):
         """Get worker key."""
         return self.get_item(key=key)
 
+    def remove_worker(self, key: str) -> Optional[Worker]:
+        """Remove worker key, and return removed worker."""
+        return self.remove_item(key=key)
+
     def loop_on_workers(self):
         """Get worker key."""
         if self.has_workers():
@@ -532,6 +623,8 @@ class WorkersHelper:
                 "enum_key": conf.get('enum_key'),
                 "time_interval": conf['item'].get('time_interval'),
                 "cache_interval": conf['item'].get('cache_interval'),
+                "send_timeout": conf['item'].get('send_timeout'),
+                "max_in_flight": conf['item'].get('max_in_flight'),
                 "columns": conf['item'].get('columns'),
                 "ref_cols": conf['item'].get('ref_cols')
             }
@@ -1,5 +1,7 @@
 """ActiveConnectors model helper"""
 import logging
+import threading
+from typing import Optional
 from ve_utils.utype import UType as Ut
 from vemonitor_m8.models.item_dict import DictOfObject
 
@@ -35,3 +37,50 @@ class ActiveConnectors(DictOfObject):
         return Ut.is_tuple(item, eq=2)\
             and Ut.is_str(item[0], not_null=True) \
             and Ut.is_str(item[1], not_null=True)
+
+
+class SharedConnectors(DictOfObject):
+    """
+    Live connectors shared between app blocks.
+
+    Keys are (worker_key, source) tuples, values are connector instances
+    (VedirectApp, HmapTimeSeriesApp, ...) opened by the first block
+    who needs them, and reused by the others.
+    Each connector has his own lock, used to serialize
+    output workers who send data on the same connector.
+    """
+    def __init__(self):
+        DictOfObject.__init__(self)
+        self._lock = threading.Lock()
+        self._connector_locks = {}
+
+    def add_item(self, key: tuple, value: object) -> bool:
+        """Add connector if key is not registered yet."""
+        with self._lock:
+            result = False
+            if not self.has_item_key(key):
+                result = DictOfObject.add_item(self, key, value)
+            return result
+
+    def remove_item(self, key: tuple) -> Optional[object]:
+        """Remove connector, new blocks workers will open a new one."""
+        with self._lock:
+            return DictOfObject.remove_item(self, key)
+
+    def get_connector_lock(self, connector: object) -> threading.Lock:
+        """Get lock of connector instance."""
+        key = id(connector)
+        with self._lock:
+            if key not in self._connector_locks:
+                self._connector_locks[key] = threading.Lock()
+            return self._connector_locks[key]
+
+    @staticmethod
+    def is_valid_item_key(key: tuple):
+        """Test if is valid item key"""
+        return ActiveConnectors.is_valid_item_type(key)
+
+    @staticmethod
+    def is_valid_item_value(value: object):
+        """Test if is valid item value"""
+        return value is not None and not Ut.is_dict(value)
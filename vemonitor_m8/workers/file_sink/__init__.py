@@ -0,0 +1 @@
+"""File sink worker modules."""
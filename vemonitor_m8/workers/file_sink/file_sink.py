@@ -0,0 +1,259 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+File sink Helper.
+
+Append rows batches to rotated local files, in one sink directory:
+    [path]/[name]/[name]_[start time].[format]
+Files are rotated by size or by data time interval,
+and written rows are synced to storage every fsync_interval seconds,
+so small batches are sequential writes without a sync each.
+A json index (index.json) keeps time range, rows and size of every file,
+files older than retention are removed on rotation.
+"""
+import json
+import logging
+import os
+import time
+from typing import Optional
+from ve_utils.utype import UType as Ut
+from vemonitor_m8.workers.file_sink.file_writers import (
+    FileWriter, FileWriterHelper
+)
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class FileSinkApp:
+    """File sink connector Helper"""
+
+    DEFAULT_FSYNC_INTERVAL = 30
+
+    def __init__(self, credentials: dict):
+        self.credentials = credentials
+        self.path = os.path.abspath(os.path.expandvars(
+            os.path.expanduser(credentials.get('path'))
+        ))
+        self.fsync_interval = Ut.get_float(
+            credentials.get('fsync_interval'),
+            FileSinkApp.DEFAULT_FSYNC_INTERVAL
+        )
+        self.retention = Ut.get_float(
+            credentials.get('retention_days'), 0
+        ) * 86400
+
+    @staticmethod
+    def is_file_sink_connector(connector) -> bool:
+        """Test if is file sink connector credentials."""
+        return Ut.is_dict(connector, not_null=True)\
+            and Ut.is_str(connector.get('path'), not_null=True)
+
+    def get_sink_dir(self, name: str) -> str:
+        """Get sink directory path, created if not exists."""
+        result = os.path.join(self.path, name)
+        os.makedirs(result, exist_ok=True)
+        return result
+
+    def is_ready(self) -> bool:
+        """Test if sinks root directory is writable."""
+        return os.path.isdir(self.path) and os.access(self.path, os.W_OK)
+
+    def close(self) -> bool:
+        """Close connector, sinks are closed by their workers."""
+        return True
+
+
+class FileSink:
+    """Rotated files sink Helper"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self,
+                 directory: str,
+                 name: str,
+                 file_format: str,
+                 columns: list,
+                 rotate_size: int,
+                 rotate_interval: int,
+                 fsync_interval: float = 30,
+                 retention: float = 0,
+                 types: Optional[dict] = None
+                 ):
+        self.directory = directory
+        self.name = name
+        self.writer_class = FileWriterHelper.get_writer_class(file_format)
+        self.columns = columns
+        self.types = types
+        self.rotate_size = rotate_size
+        self.rotate_interval = rotate_interval
+        self.fsync_interval = fsync_interval
+        self.retention = retention
+        self.writer: Optional[FileWriter] = None
+        self.start_time = 0
+        self.last_fsync = time.monotonic()
+        self.index = self.load_index()
+
+    def set_types(self, types: Optional[dict]):
+        """Set columns output types, used by next files schemas."""
+        self.types = types
+
+    def get_index_path(self) -> str:
+        """Get sink index file path."""
+        return os.path.join(self.directory, FileSink.INDEX_FILE)
+
+    def load_index(self) -> dict:
+        """Load sink files index, if exists."""
+        result = {}
+        try:
+            with open(self.get_index_path(), "r", encoding="utf-8") as file:
+                result = json.load(file).get('files') or {}
+        except FileNotFoundError:
+            result = {}
+        except (OSError, ValueError, AttributeError) as ex:
+            logger.warning(
+                "[FileSink::load_index] "
+                "Unable to load sink index %s, ex: %s",
+                self.get_index_path(), ex
+            )
+        return result
+
+    def save_index(self):
+        """Write sink files index, atomically."""
+        path = self.get_index_path()
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump({'files': self.index}, file, indent=1)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{path}.tmp", path)
+
+    def get_file_name(self, time_key: int) -> str:
+        """Get new file name, from file start time."""
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(time_key))
+        result = f"{self.name}_{stamp}.{self.writer_class.EXTENSION}"
+        count = 0
+        while os.path.exists(os.path.join(self.directory, result)):
+            count += 1
+            result = f"{self.name}_{stamp}_{count}."\
+                f"{self.writer_class.EXTENSION}"
+        return result
+
+    def is_rotation_time(self, time_key: int) -> bool:
+        """Test if current file must be rotated before time_key rows."""
+        return self.writer is None\
+            or self.writer.get_size() >= self.rotate_size\
+            or (self.rotate_interval > 0
+                and time_key - self.start_time >= self.rotate_interval)
+
+    def update_index(self, rows: Optional[list] = None):
+        """Update current file index entry."""
+        entry = self.index.get(os.path.basename(self.writer.path))
+        if Ut.is_list(rows, not_null=True):
+            entry['end'] = max(entry.get('end') or 0, int(rows[-1][0]))
+            entry['rows'] = entry.get('rows', 0) + len(rows)
+        entry['size'] = self.writer.get_size()
+
+    def close_file(self):
+        """Close current file, and update his index entry."""
+        if self.writer is not None:
+            self.writer.close()
+            entry = self.index.get(os.path.basename(self.writer.path))
+            if entry is not None:
+                entry['size'] = os.path.getsize(self.writer.path)
+            self.writer = None
+
+    def rotate(self, time_key: int):
+        """Close current file, apply retention, and open new file."""
+        self.close_file()
+        self.apply_retention(time_key)
+        file_name = self.get_file_name(time_key)
+        self.writer = self.writer_class(
+            os.path.join(self.directory, file_name),
+            self.columns,
+            self.types
+        )
+        self.writer.open()
+        self.start_time = time_key
+        self.index[file_name] = {
+            'format': self.writer_class.EXTENSION,
+            'start': int(time_key),
+            'end': None,
+            'rows': 0,
+            'size': 0
+        }
+        self.save_index()
+        self.last_fsync = time.monotonic()
+
+    def get_file_end(self, file_name: str, entry: dict) -> Optional[int]:
+        """
+        Get file end time, from index entry.
+
+        Files never synced (after a crash) have no end time,
+        their start time, or their modification time is used.
+        """
+        result = entry.get('end')
+        if not Ut.is_int(result):
+            result = entry.get('start')
+        if not Ut.is_int(result):
+            try:
+                result = int(os.path.getmtime(
+                    os.path.join(self.directory, file_name)
+                ))
+            except OSError:
+                result = None
+        return result
+
+    def apply_retention(self, time_key: int) -> int:
+        """Remove files ended before retention, return removed files."""
+        result = 0
+        if self.retention > 0:
+            limit = time_key - self.retention
+            for file_name, entry in list(self.index.items()):
+                end = self.get_file_end(file_name, entry)
+                if Ut.is_int(end) and end < limit:
+                    try:
+                        os.remove(os.path.join(self.directory, file_name))
+                    except FileNotFoundError:
+                        pass
+                    del self.index[file_name]
+                    result += 1
+        return result
+
+    def write(self, rows: list) -> bool:
+        """
+        Append rows batch, sorted by time, to current file.
+
+        Rows are flushed to system by batch,
+        and synced to storage every fsync_interval seconds.
+        """
+        result = False
+        if Ut.is_list(rows, not_null=True):
+            if self.is_rotation_time(int(rows[0][0])):
+                self.rotate(int(rows[0][0]))
+            self.writer.write(rows)
+            self.writer.flush()
+            self.update_index(rows)
+            if time.monotonic() - self.last_fsync >= self.fsync_interval:
+                self.fsync()
+            result = True
+        return result
+
+    def fsync(self):
+        """Sync current file and index to storage."""
+        if self.writer is not None:
+            self.writer.fsync()
+            self.update_index()
+        self.save_index()
+        self.last_fsync = time.monotonic()
+
+    def close(self):
+        """Close current file and save index."""
+        self.close_file()
+        self.save_index()
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+File sink Worker Helper.
+
+Append output cache batches to rotated local files,
+as ndjson, csv, or with pyarrow as arrow or parquet columnar files.
+Columns are flattened as "node.point" keys.
+
+ .. seealso:: FileSink
+"""
+import logging
+from typing import Optional, Union
+from ve_utils.utype import UType as Ut
+from vemonitor_m8.workers.file_sink.file_sink import FileSink, FileSinkApp
+from vemonitor_m8.workers.file_sink.file_writers import (
+    FileWriter, FileWriterHelper
+)
+from vemonitor_m8.models.workers import OutputWorker
+from vemonitor_m8.core.exceptions import SettingInvalidException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class FileSinkWorkerHelper:
+    """File sink worker Helper"""
+
+    @staticmethod
+    def prepare_connector_data(
+            conf: dict
+            ) -> Optional[Union[dict, FileSinkApp]]:
+        """Get formatted configuration data."""
+        result = None
+        if Ut.is_dict(conf, not_null=True):
+            if FileSinkApp.is_file_sink_connector(conf.get('connector'))\
+                    or isinstance(conf.get('connector'), FileSinkApp):
+                result = conf.get('connector')
+        return result
+
+    @staticmethod
+    def get_worker_conf_from_dict(conf: dict) -> Optional[dict]:
+        """Test if is configuration data."""
+        result = None
+        if Ut.is_dict(conf, not_null=True) \
+                and Ut.is_dict(conf.get('item'), not_null=True):
+            result = {
+                "name": conf['item'].get('name'),
+                "worker_key": conf.get('worker_key'),
+                "enum_key": conf.get('enum_key'),
+                "time_interval": conf['item'].get('time_interval'),
+                "cache_interval": conf['item'].get('cache_interval'),
+                "send_timeout": conf['item'].get('send_timeout'),
+                "max_in_flight": conf['item'].get('max_in_flight'),
+                "format": conf['item'].get('format'),
+                "rotate_size": conf['item'].get('rotate_size'),
+                "rotate_interval": conf['item'].get('rotate_interval'),
+                "columns": conf['item'].get('columns'),
+                "ref_cols": conf['item'].get('ref_cols')
+            }
+        return result
+
+    @staticmethod
+    def get_flat_columns(columns: dict) -> list:
+        """Get "node.point" columns."""
+        return [
+            f"{node}.{point}"
+            for node, points in columns.items()
+            if Ut.is_list(points)
+            for point in points
+        ]
+
+    @staticmethod
+    def get_flat_types(columns: dict, points_types: Optional[dict]) -> dict:
+        """Get "node.point" columns output types."""
+        result = {}
+        if Ut.is_dict(points_types, not_null=True):
+            result = {
+                f"{node}.{point}": points_types.get(point)
+                for node, points in columns.items()
+                if Ut.is_list(points)
+                for point in points
+                if points_types.get(point) is not None
+            }
+        return result
+
+    @staticmethod
+    def get_rows(data: dict, columns: dict) -> list:
+        """Get (time, {"node.point": value}) rows, sorted by time."""
+        result = []
+        if Ut.is_dict(data, not_null=True):
+            for time_key in sorted(data):
+                values = data.get(time_key)
+                if not Ut.is_dict(values, not_null=True):
+                    continue
+                row = {
+                    f"{node}.{point}": values[node][point]
+                    for node, points in columns.items()
+                    if Ut.is_dict(values.get(node))
+                    for point in points
+                    if point in values[node]
+                }
+                if row:
+                    result.append((time_key, row))
+        return result
+
+
+class FileSinkOutputWorker(OutputWorker):
+    """File sink Output Worker Helper"""
+
+    DEFAULT_FORMAT = "ndjson"
+    DEFAULT_ROTATE_SIZE = 64 * 1024 * 1024
+    DEFAULT_ROTATE_INTERVAL = 86400
+
+    def __init__(self, conf: dict):
+        OutputWorker.__init__(self)
+        self.cache_interval = 10
+        self.file_format = FileSinkOutputWorker.DEFAULT_FORMAT
+        self.rotate_size = FileSinkOutputWorker.DEFAULT_ROTATE_SIZE
+        self.rotate_interval = FileSinkOutputWorker.DEFAULT_ROTATE_INTERVAL
+        self.sink: Optional[FileSink] = None
+        if self.set_conf(conf):
+            self.set_worker_status()
+
+    def is_ready(self) -> bool:
+        """Test if worker is ready."""
+        return isinstance(self.worker, FileSinkApp)\
+            and isinstance(self.sink, FileSink)\
+            and self.worker.is_ready()
+
+    def set_worker_status(self) -> bool:
+        """Test if Worker status is ready."""
+        self._status = self.is_ready()
+        return self._status
+
+    def set_worker(self, worker: Union[dict, FileSinkApp]) -> bool:
+        """Set file sink worker, and worker sink."""
+        result = False
+        if FileSinkApp.is_file_sink_connector(worker):
+            self.worker = FileSinkApp(credentials=worker)
+            result = True
+        elif isinstance(worker, FileSinkApp):
+            self.worker = worker
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[FileSinkOutputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid."
+            )
+        self.sink = FileSink(
+            directory=self.worker.get_sink_dir(self.get_name()),
+            name=self.get_name(),
+            file_format=self.file_format,
+            columns=FileSinkWorkerHelper.get_flat_columns(self.columns),
+            rotate_size=self.rotate_size,
+            rotate_interval=self.rotate_interval,
+            fsync_interval=self.worker.fsync_interval,
+            retention=self.worker.retention,
+            types=FileSinkWorkerHelper.get_flat_types(
+                self.columns, self.points_types
+            )
+        )
+        return result
+
+    def set_points_types(self, points: dict) -> bool:
+        """Set points output types, used by columnar files schemas."""
+        result = OutputWorker.set_points_types(self, points)
+        if result and isinstance(self.sink, FileSink):
+            self.sink.set_types(FileSinkWorkerHelper.get_flat_types(
+                self.columns, self.points_types
+            ))
+        return result
+
+    def set_file_format(self, value: str) -> bool:
+        """Set file format property."""
+        result = False
+        if value in FileWriterHelper.get_formats():
+            if value in ("arrow", "parquet")\
+                    and not FileWriter.has_pyarrow():
+                logger.warning(
+                    "[FileSinkOutputWorker] pyarrow is not installed, "
+                    "%s sink is written as ndjson.",
+                    self.get_name()
+                )
+            self.file_format = value
+            result = True
+        return result
+
+    def set_rotation(self, rotate_size: int, rotate_interval: int):
+        """Set rotate_size and rotate_interval properties."""
+        if Ut.is_int(rotate_size, positive=True):
+            self.rotate_size = rotate_size
+        if Ut.is_int(rotate_interval, mini=0):
+            self.rotate_interval = rotate_interval
+
+    def set_worker_conf(self,
+                        conf: dict
+                        ) -> bool:
+        """
+        Set Worker configuration data.
+
+        the conf dictionary must contain :
+            - name: str: required
+            - format: str: optional
+            - rotate_size: int: optional
+            - rotate_interval: int: optional
+            - worker_key: str: required
+            - enum_key: int: required
+            - time_interval: Union[int, float]: required
+            - columns: dict: required
+            - cache_interval: Union[int, float]: optional
+            - send_timeout: Union[int, float]: optional
+            - max_in_flight: int: optional
+            - ref_cols: list: optional
+
+        """
+        result = False
+        if Ut.is_dict(conf)\
+                and self.set_name(conf.get('name'))\
+                and self.set_worker_key(conf.get('worker_key'))\
+                and self.set_enum_key(conf.get('enum_key'))\
+                and self.set_time_interval(conf.get('time_interval'))\
+                and self.set_columns(conf.get('columns')):
+            if conf.get('format') is not None:
+                result = self.set_file_format(conf.get('format'))
+            else:
+                result = True
+            self.set_rotation(
+                conf.get('rotate_size'),
+                conf.get('rotate_interval')
+            )
+            self.set_cache_interval(conf.get('cache_interval'))
+            self.set_send_timeout(conf.get('send_timeout'))
+            self.set_max_in_flight(conf.get('max_in_flight'))
+            self.set_ref_cols(conf.get('ref_cols'))
+        return result
+
+    def set_conf(self, conf: dict) -> bool:
+        """Set Configuration data."""
+        result = False
+        connector = FileSinkWorkerHelper.prepare_connector_data(conf)
+        if connector is not None\
+                and self.set_worker_conf(
+                    FileSinkWorkerHelper.get_worker_conf_from_dict(conf)
+                ):
+            self.set_worker(connector)
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[FileSinkOutputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid."
+            )
+        return result
+
+    def send_data(self,
+                  data: dict,
+                  input_structure: dict
+                  ) -> bool:
+        """Append data batch to sink files."""
+        result = False
+        if self.is_ready():
+            try:
+                result = self.sink.write(
+                    FileSinkWorkerHelper.get_rows(data, self.columns)
+                )
+            except OSError as ex:
+                logger.error(
+                    "[FileSinkOutputWorker] Unable to write %s sink, ex: %s",
+                    self.get_name(), ex
+                )
+        return result
+
+    def release(self) -> bool:
+        """Close worker sink file, file sink connector may be shared."""
+        if isinstance(self.sink, FileSink):
+            self.sink.close()
+        return True
+
+    def close(self) -> bool:
+        """Properly close worker instance."""
+        return self.release()
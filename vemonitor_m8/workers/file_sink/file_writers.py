@@ -0,0 +1,288 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+File sink writers.
+
+Append rows batches to one file, in one format:
+    - ndjson: one json object by row
+    - csv: one header line, then one line by row
+    - arrow: Arrow IPC stream, one record batch by rows batch
+    - parquet: Parquet file, buffered rows are written as a row group
+      when buffer is full and on every fsync, so rows are on storage
+      after fsync_interval seconds, like other formats
+Rows are (time, {column: value}) tuples, columns are "node.point" keys.
+Text files are written with a large write buffer, and flushed by batch.
+Arrow and Parquet writers need pyarrow, columns types are set
+from data structures points output types: float64 for numeric points,
+else string. Columns of unknown points are typed on first batch.
+A Parquet file is readable only after his writer is closed,
+on rotation or on sink close.
+"""
+import csv
+import io
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Optional
+from ve_utils.utype import UType as Ut
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pa, pq = None, None
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+
+class FileWriter(ABC):
+    """File sink writer base class."""
+
+    EXTENSION = ""
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self,
+                 path: str,
+                 columns: list,
+                 types: Optional[dict] = None
+                 ):
+        self.path = path
+        self.columns = columns
+        self.types = types if Ut.is_dict(types) else {}
+        self.file = None
+
+    @staticmethod
+    def has_pyarrow() -> bool:
+        """Test if pyarrow is installed."""
+        return pa is not None
+
+    def open(self):
+        """Open file in append mode."""
+        self.file = open(self.path, "ab", buffering=FileWriter.BUFFER_SIZE)
+
+    def flush(self):
+        """Flush written rows to system."""
+        if self.file is not None:
+            self.file.flush()
+
+    def fsync(self):
+        """Flush written rows, and sync file to storage."""
+        if self.file is not None:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def get_size(self) -> int:
+        """Get file size, with not flushed rows."""
+        result = 0
+        if self.file is not None:
+            result = self.file.tell()
+        return result
+
+    def close(self):
+        """Flush, sync and close file."""
+        if self.file is not None:
+            if not self.file.closed:
+                self.fsync()
+                self.file.close()
+            self.file = None
+
+    @abstractmethod
+    def write(self, rows: list):
+        """Append rows batch to file."""
+
+
+class NdjsonWriter(FileWriter):
+    """Newline delimited json file writer."""
+
+    EXTENSION = "ndjson"
+
+    def write(self, rows: list):
+        """Append rows batch to file."""
+        self.file.write("".join(
+            json.dumps(
+                dict({"time": time_key}, **values),
+                separators=(',', ':')
+            ) + "\n"
+            for time_key, values in rows
+        ).encode("utf-8"))
+
+
+class CsvWriter(FileWriter):
+    """Csv file writer."""
+
+    EXTENSION = "csv"
+
+    def open(self):
+        """Open file in append mode, and write header of new file."""
+        FileWriter.open(self)
+        if self.file.tell() == 0:
+            self.write_lines([["time"] + self.columns])
+
+    def write_lines(self, lines: list):
+        """Write csv lines."""
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(lines)
+        self.file.write(buffer.getvalue().encode("utf-8"))
+
+    def write(self, rows: list):
+        """Append rows batch to file."""
+        self.write_lines([
+            [time_key] + [values.get(column) for column in self.columns]
+            for time_key, values in rows
+        ])
+
+
+class ArrowWriter(FileWriter):
+    """Arrow IPC stream file writer."""
+
+    EXTENSION = "arrow"
+    NUMERIC_TYPES = ("int", "float", "numeric", "time", "intBool")
+
+    def __init__(self,
+                 path: str,
+                 columns: list,
+                 types: Optional[dict] = None
+                 ):
+        FileWriter.__init__(self, path, columns, types)
+        self.schema = None
+        self.writer = None
+
+    def get_schema(self, rows: list):
+        """
+        Get columns schema from points output types.
+
+        Columns of unknown points are typed from first rows batch.
+        """
+        fields = [pa.field("time", pa.int64())]
+        for column in self.columns:
+            output_type = self.types.get(column)
+            if output_type is not None:
+                is_numeric = output_type in ArrowWriter.NUMERIC_TYPES
+            else:
+                values = [
+                    values.get(column) for _, values in rows
+                    if values.get(column) is not None
+                ]
+                is_numeric = Ut.is_list(values, not_null=True) and all(
+                    isinstance(value, (int, float)) for value in values
+                )
+            fields.append(pa.field(
+                column,
+                pa.float64() if is_numeric else pa.string()
+            ))
+        return pa.schema(fields)
+
+    def get_table(self, rows: list):
+        """Get rows batch as arrow table, cast to columns schema."""
+        if self.schema is None:
+            self.schema = self.get_schema(rows)
+        data = {"time": [int(time_key) for time_key, _ in rows]}
+        for field in self.schema:
+            if field.name == "time":
+                continue
+            values = [values.get(field.name) for _, values in rows]
+            if field.type == pa.float64():
+                data[field.name] = [
+                    float(value) if isinstance(value, (int, float))
+                    else None
+                    for value in values
+                ]
+            else:
+                data[field.name] = [
+                    str(value) if value is not None else None
+                    for value in values
+                ]
+        return pa.table(data, schema=self.schema)
+
+    def write(self, rows: list):
+        """Append rows batch to file, as one record batch."""
+        table = self.get_table(rows)
+        if self.writer is None:
+            self.writer = pa.ipc.new_stream(self.file, self.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        """Close stream writer, and file."""
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        FileWriter.close(self)
+
+
+class ParquetWriter(ArrowWriter):
+    """Parquet file writer, buffered by row groups."""
+
+    EXTENSION = "parquet"
+    ROW_GROUP_SIZE = 10000
+
+    def __init__(self,
+                 path: str,
+                 columns: list,
+                 types: Optional[dict] = None
+                 ):
+        ArrowWriter.__init__(self, path, columns, types)
+        self.rows = []
+
+    def fsync(self):
+        """Write buffered rows as a row group, and sync file to storage."""
+        self.write_row_group()
+        FileWriter.fsync(self)
+
+    def write(self, rows: list):
+        """Buffer rows batch, and write full row groups."""
+        self.rows.extend(rows)
+        if len(self.rows) >= ParquetWriter.ROW_GROUP_SIZE:
+            self.write_row_group()
+
+    def write_row_group(self):
+        """Write buffered rows as a row group."""
+        if self.rows:
+            table = self.get_table(self.rows)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(
+                    self.file, self.schema, compression="zstd"
+                )
+            self.writer.write_table(table)
+            self.rows = []
+
+    def get_size(self) -> int:
+        """Get file size, with estimated buffered rows size."""
+        return FileWriter.get_size(self)\
+            + len(self.rows) * len(self.schema or self.columns) * 8
+
+    def close(self):
+        """Write buffered rows, parquet footer, and close file."""
+        self.write_row_group()
+        ArrowWriter.close(self)
+
+
+class FileWriterHelper:
+    """File sink writers Helper"""
+
+    WRITERS = {
+        writer.EXTENSION: writer
+        for writer in (NdjsonWriter, CsvWriter, ArrowWriter, ParquetWriter)
+    }
+
+    @staticmethod
+    def get_formats() -> list:
+        """Get writers file formats."""
+        return list(FileWriterHelper.WRITERS)
+
+    @staticmethod
+    def get_writer_class(file_format: str) -> Optional[type]:
+        """
+        Get writer class of file format.
+
+        Arrow and Parquet writers fall back to ndjson if pyarrow is missing.
+        """
+        result = FileWriterHelper.WRITERS.get(file_format)
+        if result in (ArrowWriter, ParquetWriter)\
+                and not FileWriter.has_pyarrow():
+            result = NdjsonWriter
+        return result
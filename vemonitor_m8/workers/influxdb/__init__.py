@@ -0,0 +1 @@
+"""InfluxDb worker modules."""
@@ -0,0 +1,221 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+InfluxDb 2 vemonitor Helper.
+
+Write line protocol batches on InfluxDb 2 write api (/api/v2/write).
+Http connections are kept alive in a small pool, and reused by batches.
+Batches are gzip compressed, split by lines number and by size,
+and retried with exponential backoff on connection errors,
+on 429 (too many requests) and 5xx responses.
+"""
+import gzip
+import http.client
+import logging
+import queue
+import ssl
+import time
+from typing import Optional
+from urllib.parse import urlencode, urlsplit
+from ve_utils.utype import UType as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class InfluxApp:
+    """InfluxDb 2 App Helper"""
+
+    DEFAULT_TIMEOUT = 10000
+    DEFAULT_POOL_SIZE = 2
+    DEFAULT_MAX_RETRIES = 3
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 10
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, credentials: dict):
+        self.credentials = credentials
+        self.url = urlsplit(credentials.get('host'))
+        self.timeout = Ut.get_int(
+            credentials.get('timeout'),
+            InfluxApp.DEFAULT_TIMEOUT
+        ) / 1000
+        self.max_retries = Ut.get_int(
+            credentials.get('max_retries'),
+            InfluxApp.DEFAULT_MAX_RETRIES
+        )
+        self.gzip = credentials.get('gzip') is not False
+        self._pool = queue.LifoQueue(maxsize=Ut.get_int(
+            credentials.get('pool_size'),
+            InfluxApp.DEFAULT_POOL_SIZE
+        ))
+
+    @staticmethod
+    def is_influx_connector(connector) -> bool:
+        """Test if is influxDb 2 connector credentials."""
+        return Ut.is_dict(connector, not_null=True)\
+            and Ut.is_str(connector.get('host'), not_null=True)\
+            and urlsplit(connector.get('host')).scheme in ('http', 'https')\
+            and Ut.is_str(connector.get('org'), not_null=True)\
+            and Ut.is_str(connector.get('auth'), not_null=True)
+
+    def is_ready(self) -> bool:
+        """Test if InfluxDb 2 App is ready."""
+        return Ut.is_str(self.url.hostname, not_null=True)
+
+    def new_connection(self) -> http.client.HTTPConnection:
+        """Get new http connection to InfluxDb 2 server."""
+        if self.url.scheme == "https":
+            context = None
+            if self.credentials.get('verify_ssl') is False:
+                context = ssl._create_unverified_context()
+            return http.client.HTTPSConnection(
+                self.url.hostname,
+                port=self.url.port,
+                timeout=self.timeout,
+                context=context
+            )
+        return http.client.HTTPConnection(
+            self.url.hostname,
+            port=self.url.port,
+            timeout=self.timeout
+        )
+
+    def get_connection(self) -> http.client.HTTPConnection:
+        """Get idle pooled connection, or new connection."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self.new_connection()
+
+    def release_connection(self, connection: http.client.HTTPConnection):
+        """Put back connection to pool, or close it if pool is full."""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def get_write_path(self, bucket: str, precision: str = "s") -> str:
+        """Get write api path."""
+        return f"{self.url.path.rstrip('/')}/api/v2/write?" + urlencode({
+            'org': self.credentials.get('org'),
+            'bucket': bucket,
+            'precision': precision
+        })
+
+    def get_headers(self) -> dict:
+        """Get write request headers."""
+        headers = {
+            'Authorization': f"Token {self.credentials.get('auth')}",
+            'Content-Type': "text/plain; charset=utf-8",
+            'Accept': "application/json"
+        }
+        if self.gzip:
+            headers['Content-Encoding'] = "gzip"
+        return headers
+
+    def request(self,
+                connection: http.client.HTTPConnection,
+                path: str,
+                body: bytes
+                ) -> tuple:
+        """Send write request and read response."""
+        connection.request(
+            "POST", path, body=body, headers=self.get_headers()
+        )
+        response = connection.getresponse()
+        return response, response.read()
+
+    def post(self, path: str, body: bytes) -> tuple:
+        """
+        Post body on pooled keep-alive connection.
+
+        :return: tuple of response status, Retry-After header and body.
+        """
+        connection = self.get_connection()
+        try:
+            try:
+                response, content = self.request(connection, path, body)
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError):
+                # idle keep-alive connection closed by server
+                connection.close()
+                connection = self.new_connection()
+                response, content = self.request(connection, path, body)
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self.release_connection(connection)
+        return response.status, response.getheader('Retry-After'), content
+
+    @staticmethod
+    def get_backoff(retry: int, retry_after: Optional[str] = None) -> float:
+        """Get wait time before retry, from Retry-After header if set."""
+        result = Ut.get_float(retry_after, 0)
+        if result <= 0:
+            result = InfluxApp.BACKOFF_BASE * (2 ** retry)
+        return min(result, InfluxApp.BACKOFF_MAX)
+
+    def write(self,
+              bucket: str,
+              body: bytes,
+              deadline: float,
+              precision: str = "s"
+              ) -> bool:
+        """
+        Write line protocol body, with retries until deadline.
+
+        Bad request (400) lines never become valid,
+        so they are logged and dropped, not retried.
+        """
+        result, retry = False, 0
+        path = self.get_write_path(bucket, precision)
+        if self.gzip:
+            body = gzip.compress(body, compresslevel=5)
+        while not result:
+            status, retry_after, content = 0, None, b""
+            try:
+                status, retry_after, content = self.post(path, body)
+            except (OSError, http.client.HTTPException) as ex:
+                content = str(ex).encode("utf-8")
+            if 200 <= status < 300:
+                result = True
+            elif status == 400:
+                logger.error(
+                    "[InfluxApp] Bad line protocol batch dropped: %s",
+                    content[:200]
+                )
+                result = True
+            elif (status == 0 or status in InfluxApp.RETRY_STATUS)\
+                    and retry < self.max_retries\
+                    and time.monotonic()\
+                    + InfluxApp.get_backoff(retry, retry_after) < deadline:
+                time.sleep(InfluxApp.get_backoff(retry, retry_after))
+                retry += 1
+            else:
+                logger.warning(
+                    "[InfluxApp] Unable to write batch on %s, "
+                    "status: %s, retries: %s, response: %s",
+                    self.url.hostname, status, retry, content[:200]
+                )
+                break
+        return result
+
+    def close(self) -> bool:
+        """Close pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        return True
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+InfluxDb 2 Worker Helper.
+
+Write output cache batches to InfluxDb 2 as line protocol,
+one line per node and time point:
+    measurement,node=bmv700,tag=value V=12.5,I=1.2 1700000000
+
+Measurement and tags prefix of node lines, and escaped fields keys,
+are precomputed from worker configuration.
+Item tags are "key=value" strings, a bare "value" tag is a "value=true" tag.
+Numbers are written as floats, to avoid fields type conflicts.
+Batch lines are split by batch_size lines and max_batch_bytes.
+"""
+import logging
+import math
+import time
+from typing import Optional, Union
+from ve_utils.utype import UType as Ut
+from vemonitor_m8.workers.influxdb.influx_app import InfluxApp
+from vemonitor_m8.models.workers import OutputWorker
+from vemonitor_m8.core.exceptions import SettingInvalidException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class InfluxWorkerHelper:
+    """InfluxDb 2 worker Helper"""
+
+    MEASUREMENT_ESCAPES = str.maketrans({',': r'\,', ' ': r'\ '})
+    KEY_ESCAPES = str.maketrans({',': r'\,', '=': r'\=', ' ': r'\ '})
+    STRING_ESCAPES = str.maketrans({'"': r'\"', '\\': r'\\'})
+
+    @staticmethod
+    def prepare_connector_data(conf: dict) -> Optional[Union[dict, InfluxApp]]:
+        """Get formatted configuration data."""
+        result = None
+        if Ut.is_dict(conf, not_null=True):
+            if InfluxApp.is_influx_connector(conf.get('connector'))\
+                    or isinstance(conf.get('connector'), InfluxApp):
+                result = conf.get('connector')
+        return result
+
+    @staticmethod
+    def get_worker_conf_from_dict(conf: dict) -> Optional[dict]:
+        """Test if is configuration data."""
+        result = None
+        if Ut.is_dict(conf, not_null=True) \
+                and Ut.is_dict(conf.get('item'), not_null=True):
+            result = {
+                "name": conf['item'].get('name'),
+                "worker_key": conf.get('worker_key'),
+                "enum_key": conf.get('enum_key'),
+                "time_interval": conf['item'].get('time_interval'),
+                "cache_interval": conf['item'].get('cache_interval'),
+                "send_timeout": conf['item'].get('send_timeout'),
+                "max_in_flight": conf['item'].get('max_in_flight'),
+                "db": conf['item'].get('db'),
+                "measurement": conf['item'].get('measurement'),
+                "tags": conf['item'].get('tags'),
+                "batch_size": conf['item'].get('batch_size'),
+                "max_batch_bytes": conf['item'].get('max_batch_bytes'),
+                "columns": conf['item'].get('columns'),
+                "ref_cols": conf['item'].get('ref_cols')
+            }
+        return result
+
+    @staticmethod
+    def escape_key(value: str) -> str:
+        """Escape tag key, tag value or field key."""
+        return str(value).translate(InfluxWorkerHelper.KEY_ESCAPES)
+
+    @staticmethod
+    def get_tags(tags: Optional[list]) -> dict:
+        """Get tags by key, from "key=value" or bare "value" tags."""
+        result = {}
+        if Ut.is_list(tags, not_null=True):
+            for tag in tags:
+                key, _, value = str(tag).partition("=")
+                result[key] = value or "true"
+        return result
+
+    @staticmethod
+    def get_line_prefix(measurement: str, node: str, tags: dict) -> str:
+        """Get node line measurement and tags prefix, tags sorted by key."""
+        tags = dict(tags, node=node)
+        return ",".join(
+            [measurement.translate(InfluxWorkerHelper.MEASUREMENT_ESCAPES)]
+            + [
+                f"{InfluxWorkerHelper.escape_key(key)}="
+                f"{InfluxWorkerHelper.escape_key(tags[key])}"
+                for key in sorted(tags)
+            ]
+        )
+
+    @staticmethod
+    def format_value(value) -> Optional[str]:
+        """Get line protocol field value, or None if not writable."""
+        result = None
+        if isinstance(value, bool):
+            result = "true" if value else "false"
+        elif isinstance(value, (int, float)):
+            if math.isfinite(value):
+                result = repr(float(value))
+        elif isinstance(value, str):
+            escaped = value.translate(InfluxWorkerHelper.STRING_ESCAPES)
+            result = f'"{escaped}"'
+        return result
+
+    @staticmethod
+    def split_lines(lines: list,
+                    batch_size: int,
+                    max_batch_bytes: int
+                    ) -> list:
+        """
+        Split lines to batches of max batch_size lines and bytes size.
+
+        Lines size is their utf-8 encoded size, as sent.
+        """
+        result, batch, size = [], [], 0
+        for line in lines:
+            line_size = len(line.encode("utf-8")) + 1
+            if batch and (len(batch) >= batch_size
+                          or size + line_size > max_batch_bytes):
+                result.append(batch)
+                batch, size = [], 0
+            batch.append(line)
+            size += line_size
+        if batch:
+            result.append(batch)
+        return result
+
+
+class InfluxDbOutputWorker(OutputWorker):
+    """InfluxDb 2 Output Worker Helper"""
+
+    DEFAULT_BATCH_SIZE = 5000
+    DEFAULT_MAX_BATCH_BYTES = 1024 * 1024
+
+    def __init__(self, conf: dict):
+        OutputWorker.__init__(self)
+        self.cache_interval = 5
+        self.db = None
+        self.measurement = None
+        self.tags = {}
+        self.batch_size = InfluxDbOutputWorker.DEFAULT_BATCH_SIZE
+        self.max_batch_bytes = InfluxDbOutputWorker.DEFAULT_MAX_BATCH_BYTES
+        # precomputed nodes lines prefixes and fields keys
+        self._prefixes = {}
+        self._fields = {}
+        if self.set_conf(conf):
+            self.set_worker_status()
+
+    def is_ready(self) -> bool:
+        """Test if worker is ready."""
+        return isinstance(self.worker, InfluxApp)\
+            and self.worker.is_ready()
+
+    def set_worker_status(self) -> bool:
+        """Test if Worker status is ready."""
+        self._status = self.is_ready()
+        return self._status
+
+    def set_worker(self, worker: Union[dict, InfluxApp]) -> bool:
+        """Set InfluxDb 2 worker"""
+        result = False
+        if InfluxApp.is_influx_connector(worker):
+            self.worker = InfluxApp(credentials=worker)
+            result = True
+        elif isinstance(worker, InfluxApp):
+            self.worker = worker
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[InfluxDbOutputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid."
+            )
+        return result
+
+    def set_db(self, value: str) -> bool:
+        """Set db (bucket) property."""
+        result = False
+        if Ut.is_str(value, not_null=True):
+            self.db = value
+            result = True
+        return result
+
+    def set_measurement(self, value: str) -> bool:
+        """Set measurement property."""
+        result = False
+        if Ut.is_str(value, not_null=True):
+            self.measurement = value
+            result = True
+        return result
+
+    def set_batch_limits(self, batch_size: int, max_batch_bytes: int):
+        """Set batch_size and max_batch_bytes properties."""
+        if Ut.is_int(batch_size, positive=True):
+            self.batch_size = batch_size
+        if Ut.is_int(max_batch_bytes, positive=True):
+            self.max_batch_bytes = max_batch_bytes
+
+    def set_line_templates(self) -> bool:
+        """Precompute nodes lines prefixes and escaped fields keys."""
+        result = False
+        if self.has_columns() and Ut.is_str(self.measurement, not_null=True):
+            self._prefixes = {
+                node: InfluxWorkerHelper.get_line_prefix(
+                    self.measurement, node, self.tags
+                )
+                for node in self.columns
+            }
+            self._fields = {
+                node: {
+                    point: InfluxWorkerHelper.escape_key(point)
+                    for point in points
+                }
+                for node, points in self.columns.items()
+                if Ut.is_list(points)
+            }
+            result = True
+        return result
+
+    def set_worker_conf(self,
+                        conf: dict
+                        ) -> bool:
+        """
+        Set Worker configuration data.
+
+        the conf dictionary must contain :
+            - name: str: optional
+            - db: str: required
+            - measurement: str: required
+            - tags: list: optional
+            - batch_size: int: optional
+            - max_batch_bytes: int: optional
+            - worker_key: str: required
+            - enum_key: int: required
+            - time_interval: Union[int, float]: required
+            - columns: dict: required
+            - cache_interval: Union[int, float]: optional
+            - send_timeout: Union[int, float]: optional
+            - max_in_flight: int: optional
+            - ref_cols: list: optional
+
+        """
+        result = False
+        if Ut.is_dict(conf)\
+                and self.set_worker_key(conf.get('worker_key'))\
+                and self.set_enum_key(conf.get('enum_key'))\
+                and self.set_time_interval(conf.get('time_interval'))\
+                and self.set_columns(conf.get('columns'))\
+                and self.set_db(conf.get('db'))\
+                and self.set_measurement(conf.get('measurement')):
+            self.set_name(conf.get('name'))
+            self.tags = InfluxWorkerHelper.get_tags(conf.get('tags'))
+            self.set_batch_limits(
+                conf.get('batch_size'),
+                conf.get('max_batch_bytes')
+            )
+            self.set_cache_interval(conf.get('cache_interval'))
+            self.set_send_timeout(conf.get('send_timeout'))
+            self.set_max_in_flight(conf.get('max_in_flight'))
+            self.set_ref_cols(conf.get('ref_cols'))
+            result = self.set_line_templates()
+        return result
+
+    def set_conf(self, conf: dict) -> bool:
+        """Set Configuration data."""
+        result = False
+        connector = InfluxWorkerHelper.prepare_connector_data(conf)
+        if connector is not None\
+                and self.set_worker_conf(
+                    InfluxWorkerHelper.get_worker_conf_from_dict(conf)
+                ):
+            self.set_worker(connector)
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[InfluxDbOutputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid."
+            )
+        return result
+
+    def get_lines(self, data: dict) -> list:
+        """Get line protocol lines of data batch."""
+        result = []
+        if Ut.is_dict(data, not_null=True):
+            for time_key, values in data.items():
+                if not Ut.is_dict(values, not_null=True):
+                    continue
+                for node, prefix in self._prefixes.items():
+                    points = values.get(node)
+                    if not Ut.is_dict(points, not_null=True):
+                        continue
+                    fields = []
+                    for point, key in self._fields.get(node, {}).items():
+                        value = InfluxWorkerHelper.format_value(
+                            points.get(point)
+                        )
+                        if value is not None:
+                            fields.append(f"{key}={value}")
+                    if fields:
+                        result.append(
+                            f"{prefix} {','.join(fields)} {int(time_key)}"
+                        )
+        return result
+
+    def send_data(self,
+                  data: dict,
+                  input_structure: dict
+                  ) -> bool:
+        """
+        Write data batch to InfluxDb 2, split by batch limits.
+
+        A batch without any writable line is sent (nothing to write).
+        """
+        result = False
+        lines = self.get_lines(data)
+        if self.is_ready() and not Ut.is_list(lines, not_null=True):
+            result = True
+        elif self.is_ready():
+            deadline = time.monotonic() + self.get_send_timeout()
+            result = True
+            for batch in InfluxWorkerHelper.split_lines(
+                    lines, self.batch_size, self.max_batch_bytes):
+                if not self.worker.write(
+                        bucket=self.db,
+                        body="\n".join(batch).encode("utf-8"),
+                        deadline=deadline):
+                    result = False
+                    break
+        return result
+
+    def close(self) -> bool:
+        """Properly close worker instance."""
+        if isinstance(self.worker, InfluxApp):
+            self.worker.close()
+        return True
@@ -0,0 +1 @@
+"""Mqtt worker modules."""
@@ -0,0 +1,189 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Mqtt vemonitor Helper.
+
+Wrap a paho-mqtt client, connected on a background network thread.
+Messages are published pipelined, without waiting each acknowledge,
+the number of unacknowledged QoS 1/2 messages is bounded by max_inflight,
+and the client queue is bounded by max_queued.
+With clean_session set to False, and a stable client_id,
+the broker keeps the session while the client is disconnected.
+"""
+import logging
+import threading
+import time
+from typing import Optional
+import paho.mqtt.client as mqtt
+from ve_utils.utype import UType as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class MqttApp:
+    """Mqtt App Helper"""
+
+    DEFAULT_PORT = 1883
+    DEFAULT_KEEPALIVE = 60
+    DEFAULT_MAX_INFLIGHT = 20
+    DEFAULT_MAX_QUEUED = 1000
+
+    def __init__(self, credentials: dict, client_id: Optional[str] = None):
+        self.credentials = credentials
+        self.client = None
+        self._connected = threading.Event()
+        if MqttApp.is_mqtt_connector(credentials):
+            self.init_client(client_id)
+
+    @staticmethod
+    def is_mqtt_connector(connector) -> bool:
+        """Test if is mqtt connector credentials."""
+        return Ut.is_dict(connector, not_null=True)\
+            and Ut.is_str(connector.get('host'), not_null=True)
+
+    def get_client_id(self, client_id: Optional[str] = None) -> str:
+        """Get connector client_id, or default client_id."""
+        result = self.credentials.get('client_id')
+        if not Ut.is_str(result, not_null=True):
+            result = client_id if Ut.is_str(client_id, not_null=True)\
+                else "vemonitor"
+        return result
+
+    def init_client(self, client_id: Optional[str] = None):
+        """Initialise paho mqtt client."""
+        self.client = mqtt.Client(
+            mqtt.CallbackAPIVersion.VERSION2,
+            client_id=self.get_client_id(client_id),
+            clean_session=self.credentials.get('clean_session') is True
+        )
+        if Ut.is_str(self.credentials.get('username'), not_null=True):
+            self.client.username_pw_set(
+                self.credentials.get('username'),
+                self.credentials.get('password')
+            )
+        if self.credentials.get('tls') is True:
+            self.client.tls_set()
+        self.client.max_inflight_messages_set(Ut.get_int(
+            self.credentials.get('max_inflight'),
+            MqttApp.DEFAULT_MAX_INFLIGHT
+        ))
+        self.client.max_queued_messages_set(Ut.get_int(
+            self.credentials.get('max_queued'),
+            MqttApp.DEFAULT_MAX_QUEUED
+        ))
+        self.client.on_connect = self.on_connect
+        self.client.on_disconnect = self.on_disconnect
+
+    def on_connect(self, client, userdata, flags, reason_code, properties):
+        """Paho on_connect callback."""
+        if not reason_code.is_failure:
+            self._connected.set()
+            logger.info(
+                "[MqttApp] Connected to mqtt broker %s, session present: %s",
+                self.credentials.get('host'),
+                flags.session_present
+            )
+        else:
+            logger.warning(
+                "[MqttApp] Mqtt broker %s refused connection: %s",
+                self.credentials.get('host'),
+                reason_code
+            )
+
+    def on_disconnect(self, client, userdata, flags, reason_code, properties):
+        """Paho on_disconnect callback."""
+        self._connected.clear()
+        logger.warning(
+            "[MqttApp] Disconnected from mqtt broker %s: %s",
+            self.credentials.get('host'),
+            reason_code
+        )
+
+    def connect(self, timeout: float = 2) -> bool:
+        """
+        Connect client and start network thread.
+
+        Network thread reconnects on connection lost,
+        so a broker not reachable at start is connected later.
+        """
+        result = False
+        if self.client is not None:
+            try:
+                self.client.connect_async(
+                    self.credentials.get('host'),
+                    port=Ut.get_int(
+                        self.credentials.get('port'),
+                        MqttApp.DEFAULT_PORT
+                    ),
+                    keepalive=Ut.get_int(
+                        self.credentials.get('keepalive'),
+                        MqttApp.DEFAULT_KEEPALIVE
+                    )
+                )
+                self.client.loop_start()
+                result = self._connected.wait(timeout)
+            except (OSError, ValueError) as ex:
+                logger.warning(
+                    "[MqttApp] Unable to connect to mqtt broker %s, ex: %s",
+                    self.credentials.get('host'), ex
+                )
+        return result
+
+    def is_ready(self) -> bool:
+        """Test if client is connected."""
+        return self.client is not None\
+            and self._connected.is_set()\
+            and self.client.is_connected()
+
+    def publish_messages(self,
+                         messages: list,
+                         qos: int = 0,
+                         retain: bool = False,
+                         timeout: float = 30
+                         ) -> bool:
+        """
+        Publish messages pipelined, and wait all are published.
+
+        :param messages: list of (topic, payload) tuples.
+        :return: True if all messages are published before timeout.
+        """
+        result = False
+        if self.is_ready() and Ut.is_list(messages, not_null=True):
+            deadline = time.monotonic() + timeout
+            infos = [
+                self.client.publish(topic, payload, qos=qos, retain=retain)
+                for topic, payload in messages
+            ]
+            result = all(info.rc == mqtt.MQTT_ERR_SUCCESS for info in infos)
+            try:
+                for info in infos:
+                    if not result:
+                        break
+                    info.wait_for_publish(
+                        max(deadline - time.monotonic(), 0)
+                    )
+                    result = info.is_published()
+            except (RuntimeError, ValueError):
+                result = False
+            if not result:
+                logger.warning(
+                    "[MqttApp] Unable to publish %s messages to %s.",
+                    len(messages), self.credentials.get('host')
+                )
+        return result
+
+    def close(self) -> bool:
+        """Disconnect client and stop network thread."""
+        if self.client is not None:
+            self.client.disconnect()
+            self.client.loop_stop()
+            self._connected.clear()
+        return True
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Mqtt Worker Helper.
+
+Publish output cache batches to a mqtt broker.
+Item topic template sets published messages:
+    - "{node}/{point}" fields: one message per node point
+    - "{node}" field: one message per node
+    - no field: one message per batch
+Topic template can also use the item {name} field.
+
+Payloads are json, rows of time and values,
+or with compact encoding columnar lists of values:
+    - point: [{"time": t, "value": v}] or [[t, v]]
+    - node: [{"time": t, "V": v}] or {"time": [t], "V": [v]}
+    - batch: [{"time": t, "bmv700": {"V": v}}]
+        or {"time": [t], "bmv700": {"V": [v]}}
+"""
+import json
+import logging
+import string
+from typing import Optional, Union
+from ve_utils.utype import UType as Ut
+from vemonitor_m8.workers.mqtt.mqtt_app import MqttApp
+from vemonitor_m8.models.workers import OutputWorker
+from vemonitor_m8.core.exceptions import SettingInvalidException
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class MqttWorkerHelper:
+    """Mqtt worker Helper"""
+
+    TOPIC_FIELDS = ("name", "node", "point")
+
+    @staticmethod
+    def prepare_connector_data(conf: dict) -> Optional[Union[dict, MqttApp]]:
+        """Get formatted configuration data."""
+        result = None
+        if Ut.is_dict(conf, not_null=True):
+            if Ut.is_dict(conf.get('connector'), not_null=True)\
+                    or isinstance(conf.get('connector'), MqttApp):
+                result = conf.get('connector')
+        return result
+
+    @staticmethod
+    def get_worker_conf_from_dict(conf: dict) -> Optional[dict]:
+        """Test if is configuration data."""
+        result = None
+        if Ut.is_dict(conf, not_null=True) \
+                and Ut.is_dict(conf.get('item'), not_null=True):
+            result = {
+                "name": conf['item'].get('name'),
+                "source": conf['item'].get('source'),
+                "worker_key": conf.get('worker_key'),
+                "enum_key": conf.get('enum_key'),
+                "time_interval": conf['item'].get('time_interval'),
+                "cache_interval": conf['item'].get('cache_interval'),
+                "send_timeout": conf['item'].get('send_timeout'),
+                "max_in_flight": conf['item'].get('max_in_flight'),
+                "topic": conf['item'].get('topic'),
+                "qos": conf['item'].get('qos'),
+                "retain": conf['item'].get('retain'),
+                "compact": conf['item'].get('compact'),
+                "columns": conf['item'].get('columns'),
+                "ref_cols": conf['item'].get('ref_cols')
+            }
+        return result
+
+    @staticmethod
+    def get_topic_fields(topic: str) -> Optional[set]:
+        """Get topic template fields, or None if template is invalid."""
+        result = None
+        try:
+            result = {
+                field
+                for _, field, _, _ in string.Formatter().parse(topic)
+                if field is not None
+            }
+            if not result.issubset(MqttWorkerHelper.TOPIC_FIELDS)\
+                    or ("point" in result and "node" not in result):
+                result = None
+        except (ValueError, TypeError):
+            result = None
+        return result
+
+    @staticmethod
+    def dumps(data: Union[dict, list], compact: bool = False) -> str:
+        """Get json payload."""
+        if compact:
+            return json.dumps(data, separators=(',', ':'))
+        return json.dumps(data)
+
+    @staticmethod
+    def get_point_payload(data: dict,
+                          node: str,
+                          point: str,
+                          compact: bool = False
+                          ) -> list:
+        """Get node point values, by time."""
+        if compact:
+            return [
+                [time_key, values[node][point]]
+                for time_key, values in data.items()
+                if point in values.get(node, {})
+            ]
+        return [
+            {"time": time_key, "value": values[node][point]}
+            for time_key, values in data.items()
+            if point in values.get(node, {})
+        ]
+
+    @staticmethod
+    def get_node_payload(data: dict,
+                         node: str,
+                         points: list,
+                         compact: bool = False
+                         ) -> Union[dict, list]:
+        """Get node points values, by time."""
+        time_keys = [
+            time_key
+            for time_key, values in data.items()
+            if Ut.is_dict(values.get(node), not_null=True)
+        ]
+        if compact:
+            result = {"time": time_keys}
+            result.update({
+                point: [
+                    data[time_key][node].get(point)
+                    for time_key in time_keys
+                ]
+                for point in points
+            })
+            return result
+        return [
+            dict({"time": time_key}, **data[time_key][node])
+            for time_key in time_keys
+        ]
+
+    @staticmethod
+    def get_batch_payload(data: dict,
+                          structure: dict,
+                          compact: bool = False
+                          ) -> Union[dict, list]:
+        """Get nodes points values, by time."""
+        if compact:
+            result = {"time": list(data)}
+            result.update({
+                node: {
+                    point: [
+                        values.get(node, {}).get(point)
+                        for values in data.values()
+                    ]
+                    for point in points
+                }
+                for node, points in structure.items()
+            })
+            return result
+        return [
+            dict({"time": time_key}, **values)
+            for time_key, values in data.items()
+        ]
+
+
+class MqttOutputWorker(OutputWorker):
+    """Mqtt Output Worker Helper"""
+    def __init__(self, conf: dict):
+        OutputWorker.__init__(self)
+        self.cache_interval = 5
+        self.topic = None
+        self.topic_fields = None
+        self.qos = 0
+        self.retain = False
+        self.compact = False
+        if self.set_conf(conf):
+            self.set_worker_status()
+
+    def is_ready(self) -> bool:
+        """Test if worker is ready."""
+        return isinstance(self.worker, MqttApp)\
+            and self.worker.is_ready()
+
+    def notify_worker_error(self) -> bool:
+        """Add message to logger if worker is not ready."""
+        if self._status is False:
+            logger.warning(
+                "Mqtt Connection Error: "
+                "Mqtt worker is not ready. "
+                "Worker Name: %s",
+                self.get_name()
+            )
+
+    def set_worker_status(self) -> bool:
+        """Test if Worker status is ready."""
+        self._status = self.is_ready()
+        self.notify_worker_error()
+        return self._status
+
+    def set_worker(self, worker: Union[dict, MqttApp], source: str) -> bool:
+        """Set mqtt worker, connected on first set."""
+        result = False
+        if MqttApp.is_mqtt_connector(worker):
+            self.worker = MqttApp(
+                credentials=worker,
+                client_id=f"vemonitor_{source}"
+            )
+            self.worker.connect(timeout=worker.get('waitTimeout', 2))
+            result = True
+        elif isinstance(worker, MqttApp):
+            self.worker = worker
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[MqttOutputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid."
+            )
+        return result
+
+    def set_topic(self, value: str) -> bool:
+        """Set topic template property."""
+        result = False
+        fields = MqttWorkerHelper.get_topic_fields(value)
+        if Ut.is_str(value, not_null=True) and fields is not None:
+            self.topic = value
+            self.topic_fields = fields
+            result = True
+        return result
+
+    def set_qos(self, value: int) -> bool:
+        """Set qos property."""
+        result = False
+        if Ut.is_int(value, mini=0, maxi=2):
+            self.qos = value
+            result = True
+        return result
+
+    def set_worker_conf(self,
+                        conf: dict
+                        ) -> bool:
+        """
+        Set Worker configuration data.
+
+        the conf dictionary must contain :
+            - name: str: optional
+            - topic: str: required
+            - qos: int: optional
+            - retain: bool: optional
+            - compact: bool: optional
+            - worker_key: str: required
+            - enum_key: int: required
+            - time_interval: Union[int, float]: required
+            - columns: dict: required
+            - cache_interval: Union[int, float]: optional
+            - send_timeout: Union[int, float]: optional
+            - max_in_flight: int: optional
+            - ref_cols: list: optional
+
+        """
+        result = False
+        if Ut.is_dict(conf)\
+                and self.set_worker_key(conf.get('worker_key'))\
+                and self.set_enum_key(conf.get('enum_key'))\
+                and self.set_time_interval(conf.get('time_interval'))\
+                and self.set_columns(conf.get('columns'))\
+                and self.set_topic(conf.get('topic')):
+            self.set_name(conf.get('name'))
+            self.set_qos(conf.get('qos'))
+            self.retain = conf.get('retain') is True
+            self.compact = conf.get('compact') is True
+            self.set_cache_interval(conf.get('cache_interval'))
+            self.set_send_timeout(conf.get('send_timeout'))
+            self.set_max_in_flight(conf.get('max_in_flight'))
+            self.set_ref_cols(conf.get('ref_cols'))
+            result = True
+        return result
+
+    def set_conf(self, conf: dict) -> bool:
+        """Set Configuration data."""
+        result = False
+        connector = MqttWorkerHelper.prepare_connector_data(conf)
+        worker_conf = MqttWorkerHelper.get_worker_conf_from_dict(conf)
+        if connector is not None\
+                and self.set_worker_conf(worker_conf):
+            self.set_worker(connector, worker_conf.get('source'))
+            result = True
+        else:
+            raise SettingInvalidException(
+                "[MqttOutputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid."
+            )
+        return result
+
+    def get_topic(self, node: str = "", point: str = "") -> str:
+        """Get formatted topic."""
+        return self.topic.format(
+            name=self.get_name() or "",
+            node=node,
+            point=point
+        )
+
+    def get_messages(self, data: dict, input_structure: dict) -> list:
+        """Get (topic, payload) messages of data batch."""
+        result = []
+        if Ut.is_dict(data, not_null=True)\
+                and Ut.is_dict(input_structure, not_null=True):
+            if "point" in self.topic_fields:
+                for node, points in input_structure.items():
+                    for point in points:
+                        payload = MqttWorkerHelper.get_point_payload(
+                            data, node, point, self.compact
+                        )
+                        if payload:
+                            result.append((
+                                self.get_topic(node, point),
+                                MqttWorkerHelper.dumps(payload, self.compact)
+                            ))
+            elif "node" in self.topic_fields:
+                for node, points in input_structure.items():
+                    payload = MqttWorkerHelper.get_node_payload(
+                        data, node, points, self.compact
+                    )
+                    # compact payload is a dict, even without rows
+                    has_rows = bool(payload.get("time")) if self.compact\
+                        else bool(payload)
+                    if has_rows:
+                        result.append((
+                            self.get_topic(node),
+                            MqttWorkerHelper.dumps(payload, self.compact)
+                        ))
+            else:
+                result.append((
+                    self.get_topic(),
+                    MqttWorkerHelper.dumps(
+                        MqttWorkerHelper.get_batch_payload(
+                            data, input_structure, self.compact
+                        ),
+                        self.compact
+                    )
+                ))
+        return result
+
+    def send_data(self,
+                  data: dict,
+                  input_structure: dict
+                  ) -> bool:
+        """Publish data batch to mqtt broker."""
+        result = False
+        if self.is_ready():
+            result = self.worker.publish_messages(
+                messages=self.get_messages(data, input_structure),
+                qos=self.qos,
+                retain=self.retain,
+                timeout=self.get_send_timeout()
+            )
+        return result
+
+    def close(self) -> bool:
+        """Properly close worker instance."""
+        if isinstance(self.worker, MqttApp):
+            self.worker.close()
+        return True
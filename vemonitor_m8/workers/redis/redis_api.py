@@ -2,7 +2,7 @@
 """Redis vemonitor Helper"""
 import logging
 from typing import Optional, Union
-from redis.client import Redis
+from redis.client import Pipeline, Redis
 from redis.commands.timeseries import TimeSeries
 from redis.exceptions import RedisError
 from vemonitor_m8.core.utils import Utils as Ut
@@ -134,6 +134,32 @@ class RedisCli:
 
         return result
 
+    def get_pipeline(self, transaction: bool = True) -> Pipeline:
+        """
+        Get new redis pipeline.
+
+        Unlike set_pipeline, the pipeline is not shared with other callers,
+        so threads sharing the connector don't execute each other commands.
+        """
+        try:
+            if not self.is_ready():
+                raise RedisConnectionException(
+                    "[RedisApi:get_pipeline] "
+                    "Fatal Error : Unable to get pipeline, "
+                    "Redis connection is down, try to reconnect."
+                )
+            result = self.cli.pipeline(transaction=transaction)
+        except RedisError as ex:
+            logger.debug(
+                "[RedisApi:get_pipeline] "
+                "Fatal Error : Unable to get pipeline. ex : %s",
+                ex
+            )
+            raise RedisVeError(
+                "[RedisApi:get_pipeline] Fatal Error : Unable to get pipeline."
+            ) from ex
+        return result
+
     def flush(self) -> bool:
         """
         Delete all data on actual db.
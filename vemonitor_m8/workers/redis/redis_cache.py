@@ -79,7 +79,8 @@ class RedisCache(RedisConnector, InputsCache):
     def __init__(self,
                  max_rows: int = 10,
                  connector: Optional[Union[dict, HmapTimeSeriesApp]] = None,
-                 reset_at_start: bool = True
+                 reset_at_start: bool = True,
+                 cache_name: str = "inputs_cache"
                  ):
         RedisConnector.__init__(self,
                                 connector=connector,
@@ -88,7 +89,7 @@ class RedisCache(RedisConnector, InputsCache):
         InputsCache.__init__(self,
                              max_rows=max_rows
                              )
-        self.cache_name = "inputs_cache"
+        self.cache_name = cache_name
         self._nodes = []
         if reset_at_start is True:
             self.reset_data_cache()
@@ -7,6 +7,7 @@ import logging
 from operator import itemgetter
 import time
 from typing import Optional, Union
+from redis.exceptions import RedisError
 from ve_utils.ujson import UJson
 from vemonitor_m8.core.exceptions import RedisAppException
 from vemonitor_m8.core.utils import Utils as Ut
@@ -562,6 +563,191 @@ class HmapTimeSeriesApp(RedisApp):
 
         return result, last_time, max_time
 
+    def get_watermarks(self,
+                       node_name: str,
+                       consumer: str,
+                       node_keys: list
+                       ) -> dict:
+        """Get consumer last read time key of each formatted node."""
+        result = {}
+        if Ut.is_list(node_keys, not_null=True):
+            values = self.api.get_hmap_data(
+                HmapTimeSeriesApp.get_watermarks_key(node_name),
+                [f"{consumer}:{node}" for node in node_keys]
+            )
+            if Ut.is_list(values):
+                result = {
+                    node: Ut.get_int(value, 0)
+                    for node, value in zip(node_keys, values)
+                }
+        return result
+
+    def set_watermarks(self,
+                       node_name: str,
+                       consumer: str,
+                       watermarks: dict
+                       ) -> int:
+        """Save consumer last read time key of each formatted node."""
+        result = 0
+        if Ut.is_dict(watermarks, not_null=True):
+            result = self.api.set_hmap_data(
+                name=HmapTimeSeriesApp.get_watermarks_key(node_name),
+                values={
+                    f"{consumer}:{node}": str(time_key)
+                    for node, time_key in watermarks.items()
+                }
+            )
+        return result
+
+    def get_new_keys(self,
+                     node_keys: list,
+                     watermarks: dict,
+                     nb_items: int = 0
+                     ) -> dict:
+        """
+        Get time keys newer than watermark of each formatted node.
+
+        Nodes keys are read with one pipelined HKEYS,
+        and limited to nb_items oldest keys by node, if nb_items is set.
+        """
+        result = {}
+        if Ut.is_list(node_keys, not_null=True):
+            pipe = self.api.get_pipeline(transaction=False)
+            for node in node_keys:
+                self.api.get_hmap_keys(node, client=pipe)
+            for node, keys in zip(node_keys, pipe.execute()):
+                from_time = watermarks.get(node, 0)
+                time_keys = sorted(
+                    time_key
+                    for time_key in (Ut.get_int(key, 0) for key in keys)
+                    if time_key > from_time
+                )
+                if Ut.is_int(nb_items, positive=True):
+                    time_keys = time_keys[:nb_items]
+                if time_keys:
+                    result[node] = time_keys
+        return result
+
+    def get_nodes_time_series(self,
+                              node_name: str,
+                              nodes_keys: dict,
+                              structure: Optional[dict] = None
+                              ) -> dict:
+        """
+        Get time series rows of formatted nodes time keys.
+
+        Rows are read with one pipelined HMGET by node,
+        and returned sorted by time key: {time_key: {node: values}}
+        """
+        result = {}
+        if Ut.is_dict(nodes_keys, not_null=True):
+            nodes = list(nodes_keys)
+            pipe = self.api.get_pipeline(transaction=False)
+            for node in nodes:
+                self.api.get_hmap_data(
+                    node,
+                    [str(time_key) for time_key in nodes_keys[node]],
+                    client=pipe
+                )
+            for node, values in zip(nodes, pipe.execute()):
+                name = HmapTimeSeriesApp.get_node_from_map_key(
+                    key=node,
+                    node_base=node_name
+                )
+                for time_key, value in zip(nodes_keys[node], values):
+                    if not Ut.is_str(value, not_null=True):
+                        continue
+                    value = UJson.loads_json(value)
+                    if Ut.is_dict(structure, not_null=True):
+                        value = Ut.get_items_from_dict(
+                            value, structure.get(name)
+                        )
+                    if Ut.is_dict(value, not_null=True):
+                        Ut.init_dict_key(result, time_key, {})
+                        result[time_key][name] = value
+        return dict(sorted(result.items()))
+
+    def get_consumer_nodes(self,
+                           node_name: str,
+                           structure: Optional[dict] = None
+                           ) -> list:
+        """Get formatted nodes of redis node, filtered on structure."""
+        return [
+            node
+            for node in self.api.get_set_members(node_name) or []
+            if not Ut.is_dict(structure, not_null=True)
+            or HmapTimeSeriesApp.get_node_from_map_key(
+                key=node,
+                node_base=node_name
+            ) in structure
+        ]
+
+    def load_watermarks(self,
+                        node_name: str,
+                        consumer: str,
+                        structure: Optional[dict] = None
+                        ) -> dict:
+        """Load consumer watermarks saved on server."""
+        result = {}
+        if self.is_ready():
+            try:
+                result = self.get_watermarks(
+                    node_name,
+                    consumer,
+                    self.get_consumer_nodes(node_name, structure)
+                )
+            except RedisError as ex:
+                raise RedisAppException(
+                    "[HmapTimeSeriesApp:load_watermarks] "
+                    f"Unable to load watermarks of {node_name}."
+                ) from ex
+        return result
+
+    def read_time_series(self,
+                         node_name: str,
+                         consumer: str,
+                         watermarks: dict,
+                         nb_items: int = 0,
+                         structure: Optional[dict] = None
+                         ) -> tuple:
+        """
+        Read time series rows added since consumer watermarks.
+
+        Each read costs three round trips to server, whatever nodes number:
+        nodes set members, pipelined HKEYS and pipelined HMGET.
+        Watermarks are loaded from server if empty,
+        and returned updated to last read time key of each node.
+        """
+        result = {}
+        if self.is_ready():
+            try:
+                node_keys = self.get_consumer_nodes(node_name, structure)
+                if not Ut.is_dict(watermarks, not_null=True):
+                    watermarks = self.get_watermarks(
+                        node_name, consumer, node_keys
+                    )
+                nodes_keys = self.get_new_keys(
+                    node_keys, watermarks, nb_items
+                )
+                result = self.get_nodes_time_series(
+                    node_name, nodes_keys, structure
+                )
+            except RedisError as ex:
+                raise RedisAppException(
+                    "[HmapTimeSeriesApp:read_time_series] "
+                    f"Unable to read time series of {node_name}."
+                ) from ex
+            watermarks = dict(watermarks, **{
+                node: time_keys[-1]
+                for node, time_keys in nodes_keys.items()
+            })
+        return result, watermarks
+
+    @staticmethod
+    def get_watermarks_key(node_name: str) -> str:
+        """Get consumers watermarks hmap key of redis node."""
+        return f"{node_name}:watermarks"
+
     @staticmethod
     def get_interval_keys(keys: list) -> int:
         """Get time interval from hmap keys."""
@@ -4,8 +4,9 @@ import logging
 from typing import Optional, Union
 from ve_utils.utype import UType as Ut
 from vemonitor_m8.workers.redis.redis_app import RedisApp
-from vemonitor_m8.models.workers import InputDictWorker
+from vemonitor_m8.models.workers import InputTimeSeriesWorker
 from vemonitor_m8.models.workers import OutputWorker
+from vemonitor_m8.core.exceptions import RedisVeError
 from vemonitor_m8.core.exceptions import SettingInvalidException
 from vemonitor_m8.workers.redis.redis_h_time_series import HmapTimeSeriesApp
 
@@ -58,8 +59,11 @@ class RedisWorkerHelper:
                 "enum_key": conf.get('enum_key'),
                 "time_interval": conf['item'].get('time_interval'),
                 "cache_interval": conf['item'].get('cache_interval'),
+                "send_timeout": conf['item'].get('send_timeout'),
+                "max_in_flight": conf['item'].get('max_in_flight'),
                 "redis_node": conf['item'].get('redis_node'),
                 "redis_data_structure": conf['item'].get('redis_data_structure'),
+                "max_items": conf['item'].get('max_items'),
                 "columns": conf['item'].get('columns'),
                 "ref_cols": conf['item'].get('ref_cols')
             }
@@ -88,17 +92,34 @@ class RedisCommonWorker:
             result = True
         return result
 
-class RedisInputWorker(RedisCommonWorker, InputDictWorker):
-    """Redis reader app Helper"""
+class RedisInputWorker(RedisCommonWorker, InputTimeSeriesWorker):
+    """
+    Redis reader app Helper.
+
+    Read rows added on redis_node by another vemonitor instance output,
+    since last read, so instances can be chained.
+    Last time key of each node sent by all outputs is saved
+    on redis server, under input name as consumer key,
+    so a restarted worker resumes without losing rows.
+    """
+    DEFAULT_MAX_ITEMS = 1000
+
     def __init__(self, conf: dict):
         RedisCommonWorker.__init__(self)
-        InputDictWorker.__init__(self)
+        InputTimeSeriesWorker.__init__(self)
+        self.max_items = RedisInputWorker.DEFAULT_MAX_ITEMS
+        # last read time key of each node
+        self.watermarks = {}
+        # last read time key of each node, of rows cached
+        self.cached_watermarks = {}
+        # last time key of each node, saved on redis server
+        self.saved_watermarks = {}
         if self.set_conf(conf):
             self.set_worker_status()
 
     def is_ready(self) -> bool:
         """Test if worker is ready."""
-        return isinstance(self.worker, RedisApp)\
+        return isinstance(self.worker, HmapTimeSeriesApp)\
             and self.worker.is_ready()
 
     def notify_worker_error(self) -> bool:
@@ -117,22 +138,28 @@ class RedisInputWorker(RedisCommonWorker, InputDictWorker):
         self.notify_worker_error()
         return self._status
 
-    def set_worker(self, worker: Union[dict, RedisApp]) -> bool:
-        """Set redis worker"""
+    def set_worker(self, worker: Union[dict, HmapTimeSeriesApp]) -> bool:
+        """
+        Set redis worker.
+
+        Shared connectors must be HmapTimeSeriesApp instances,
+        to read time series rows.
+        """
         result = False
         if RedisWorkerHelper.is_connector(worker):
             if Ut.is_dict(worker, not_null=True)\
                     and worker.get('active'):
                 worker.pop('active')
-            self.worker = RedisApp(credentials=worker)
+            self.worker = HmapTimeSeriesApp(worker)
             result = True
-        elif isinstance(worker, RedisApp):
+        elif isinstance(worker, HmapTimeSeriesApp):
             self.worker = worker
             result = True
         else:
             raise SettingInvalidException(
-                "[RedisOutputWorker] Fatal error: "
-                "Some configuration parameters are missing/invalid."
+                "[RedisInputWorker] Fatal error: "
+                "Some configuration parameters are missing/invalid, "
+                "or redis connector is not an HmapTimeSeriesApp instance."
             )
         return result
 
@@ -146,11 +173,11 @@ class RedisInputWorker(RedisCommonWorker, InputDictWorker):
             - name: str: required
             - redis_node: str: required
             - redis_data_structure: str: optional
+            - max_items: int: optional
             - worker_key: str: required
             - enum_key: int: required
             - time_interval: Union[int, float]: required
             - columns: dict: required
-            - cache_interval: Union[int, float]: optional
             - ref_cols: list: optional
 
         """
@@ -163,10 +190,19 @@ class RedisInputWorker(RedisCommonWorker, InputDictWorker):
                 and self.set_columns(conf.get('columns'))\
                 and self.set_redis_node(conf.get('redis_node')):
             self.set_redis_data_structure(conf.get('redis_data_structure'))
+            self.set_max_items(conf.get('max_items'))
             self.set_ref_cols(conf.get('ref_cols'))
             result = True
         return result
 
+    def set_max_items(self, value: int) -> bool:
+        """Set max_items property, max rows read by node and by read."""
+        result = False
+        if Ut.is_int(value, positive=True):
+            self.max_items = value
+            result = True
+        return result
+
     def set_conf(self, conf: dict) -> bool:
         """Set Configuration data."""
         result = False
@@ -186,11 +222,86 @@ class RedisInputWorker(RedisCommonWorker, InputDictWorker):
 
     def read_data(self,
                   timeout: int = 2
-                  ) -> dict:
-        """Get input data from Redis controller."""
+                  ) -> Optional[dict]:
+        """
+        Get rows added on redis_node since last read.
+
+        Rows are returned as {time_key: {node: {point: value}}}.
+        Watermarks saved on redis server are loaded on first read,
+        and saved only when rows are committed.
+        """
+        result = None
         if self.is_ready()\
                 and self.has_columns():
-            self.worker.api.get_set_members('inputs_cache')
+            try:
+                if not Ut.is_dict(self.watermarks, not_null=True):
+                    self.watermarks = self.worker.load_watermarks(
+                        node_name=self.redis_node,
+                        consumer=self.get_name(),
+                        structure=self.columns
+                    )
+                    self.saved_watermarks = dict(self.watermarks)
+                result, self.watermarks = self.worker.read_time_series(
+                    node_name=self.redis_node,
+                    consumer=self.get_name(),
+                    watermarks=self.watermarks,
+                    nb_items=self.max_items,
+                    structure=self.columns
+                )
+            except RedisVeError as ex:
+                # source server may be down, rows are read on next run
+                result = None
+                logger.warning(
+                    "[RedisInputWorker] "
+                    "Unable to read %s rows, ex: %s",
+                    self.get_name(), ex
+                )
+        return result
+
+    def set_rows_cached(self):
+        """Mark rows of last read as cached."""
+        self.cached_watermarks = dict(self.watermarks)
+
+    def get_cached_position(self) -> Optional[dict]:
+        """Get last read time key of each node, of rows cached."""
+        return dict(self.cached_watermarks)
+
+    def commit(self, position: dict, saved_time: Optional[int]) -> bool:
+        """
+        Save watermarks of rows sent by all outputs on redis server.
+
+        Each node watermark is limited to outputs last saved time,
+        and is never moved back.
+        """
+        result = False
+        if Ut.is_dict(position, not_null=True)\
+                and self.is_ready():
+            watermarks = {
+                node: value
+                for node, value in (
+                    (node, time_key if saved_time is None
+                     else min(time_key, int(saved_time)))
+                    for node, time_key in position.items()
+                )
+                if value > self.saved_watermarks.get(node, 0)
+            }
+            if Ut.is_dict(watermarks, not_null=True):
+                try:
+                    self.worker.set_watermarks(
+                        node_name=self.redis_node,
+                        consumer=self.get_name(),
+                        watermarks=watermarks
+                    )
+                    self.saved_watermarks.update(watermarks)
+                    result = True
+                except RedisVeError as ex:
+                    # watermarks are saved on next commit
+                    logger.warning(
+                        "[RedisInputWorker] "
+                        "Unable to save %s watermarks, ex: %s",
+                        self.get_name(), ex
+                    )
+        return result
 
 
 class RedisOutputWorker(OutputWorker, RedisCommonWorker):
@@ -258,6 +369,8 @@ class RedisOutputWorker(OutputWorker, RedisCommonWorker):
             - time_interval: Union[int, float]: required
             - columns: dict: required
             - cache_interval: Union[int, float]: optional
+            - send_timeout: Union[int, float]: optional
+            - max_in_flight: int: optional
             - ref_cols: list: optional
 
         """
@@ -271,6 +384,8 @@ class RedisOutputWorker(OutputWorker, RedisCommonWorker):
             self.set_name(conf.get('name'))
             self.set_redis_data_structure(conf.get('redis_data_structure'))
             self.set_cache_interval(conf.get('cache_interval'))
+            self.set_send_timeout(conf.get('send_timeout'))
+            self.set_max_in_flight(conf.get('max_in_flight'))
             self.set_ref_cols(conf.get('ref_cols'))
             result = True
         return result
@@ -6,6 +6,8 @@ from typing import NamedTuple, Optional, Union
 from vedirect_m8.packet_stats import PacketStats
 from vedirect_m8.vepackets_app import VePacketsApp
 from ve_utils.utype import UType as Ut
+from vemonitor_m8.core.fifo_lock import FifoLock
+from vemonitor_m8.workers.vedirect.vedirect_sampler import PacketRateSampler
 from vemonitor_m8.core.exceptions import SettingInvalidException
 
 __author__ = "Eli Serra"
@@ -32,10 +34,16 @@ class WorkerConf(NamedTuple):
     accepted_keys: Optional[list] = None
     min_interval: int = 1
     max_read_error: int = 30
+    lock_timeout: Union[int, float] = 10
 
 
 class VedirectApp:
-    """This class is a shared VeDirect Controller Helper."""
+    """
+    This class is a shared VeDirect Controller Helper.
+
+    Serial port access is granted to callers in arrival order,
+    by a fifo lock who waits at most lock_timeout seconds.
+    """
     def __init__(self,
                  serial_conf: dict,
                  serial_test: dict,
@@ -48,6 +56,7 @@ class VedirectApp:
                  accepted_keys: Optional[list] = None,
                  min_interval: int = 1,
                  max_read_error: int = 30,
+                 lock_timeout: Union[int, float] = 10,
                  **kwargs: WorkerConf
                  ):
         self.ve = VePacketsApp(
@@ -63,11 +72,12 @@ class VedirectApp:
             min_interval=min_interval,
             max_read_error=max_read_error
         )
-        self._serial_lock = False
-        self._lock_caller = None
+        self._serial_lock = FifoLock()
+        self.lock_timeout = lock_timeout
         self._min_source_interval = 1
         self._nb_packets = 4
         self.packets_stats = PacketStats()
+        self.sampler = PacketRateSampler()
 
     def is_ready(self) -> bool:
         """Test if worker is ready."""
@@ -76,40 +86,48 @@ class VedirectApp:
 
     def is_serial_locked(self) -> bool:
         """Test if serial connexion is locked."""
-        return self._serial_lock is True
+        return self._serial_lock.is_locked()
 
     def is_serial_locked_by_caller(self, caller_name: str) -> bool:
         """Test if serial connexion is locked by caller name."""
-        return self.is_serial_locked() and self._lock_caller == caller_name
+        return self._serial_lock.is_owner(caller_name)
+
+    def get_lock_stats(self) -> dict:
+        """Get serial lock wait time stats."""
+        return self._serial_lock.get_stats()
+
+    def lock_serial(self,
+                    caller_name: str,
+                    timeout: Optional[Union[int, float]] = None
+                    ) -> bool:
+        """
+        Lock serial connexion for caller_name node.
 
-    def lock_serial(self, caller_name: str) -> bool:
-        """Lock serial connexion for caller_name node."""
+        Wait for callers arrived before, at most timeout seconds
+        (lock_timeout by default).
+        """
         result = False
-        self._lock_caller = None
         if Ut.is_str(caller_name):
-            self._lock_caller = caller_name
-            self._serial_lock = True
-            result = True
+            if timeout is None:
+                timeout = self.lock_timeout
+            result = self._serial_lock.acquire(caller_name, timeout)
         return result
 
     def unlock_serial(self):
         """Unlock serial connexion."""
-        self._lock_caller = None
-        self._serial_lock = False
+        self._serial_lock.release()
 
-    def init_lock_serial(self, caller_name):
+    def init_lock_serial(self,
+                         caller_name,
+                         timeout: Optional[Union[int, float]] = None
+                         ) -> bool:
         """Init lock status for serial connexion."""
-        result = False
-        if not self.is_serial_locked():
-            if not self.lock_serial(caller_name):
-                raise SettingInvalidException(
-                    "[VedirectHelper:init_lock_serial] "
-                    "Invalid Caller key. Unable to lock serial port."
-                )
-            result = True
-        elif self.is_serial_locked_by_caller(caller_name):
-            result = True
-        return result
+        if not Ut.is_str(caller_name):
+            raise SettingInvalidException(
+                "[VedirectHelper:init_lock_serial] "
+                "Invalid Caller key. Unable to lock serial port."
+            )
+        return self.lock_serial(caller_name, timeout)
 
     def try_serial_connection(self, caller_name: str):
         """Try serial connection."""
@@ -122,16 +140,28 @@ class VedirectApp:
                   timeout: int = 2
                   ) -> Optional[dict]:
         """Read data"""
-        result = None
+        result, is_cache = None, False
         now = time.time()
-        self.init_lock_serial(
-            caller_name=caller_name
-        )
-        result, is_cache = self.ve.read_data(
-            caller_name=caller_name,
-            timeout=timeout
-        )
-        self.unlock_serial()
+        if self.init_lock_serial(caller_name=caller_name):
+            try:
+                result, is_cache = self.ve.read_data(
+                    caller_name=caller_name,
+                    timeout=timeout
+                )
+            finally:
+                self.unlock_serial()
+            if not is_cache and Ut.is_dict(result, not_null=True):
+                # time of first block read from serial
+                self.sampler.add_block_time(self.ve.get_time_cache())
+        else:
+            logger.warning(
+                "[VedirectApp::read_data] "
+                "Unable to lock serial port for %s, "
+                "port is busy since more than %ss. Lock owner: %s",
+                caller_name,
+                self.lock_timeout,
+                self._serial_lock.get_owner()
+            )
         nb_data = 0
         if Ut.is_dict(result, not_null=True):
             nb_data = len(result)
@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Vedirect port reader Helper.
+
+Serial port acquisition stage, shared by all input items
+reading the same serial source.
+VE.Direct blocks are read and decoded once per port tick,
+projected on the union of items columns,
+and fanned out to every input item due on this tick.
+Serial app accepted_keys is not set to the union of items columns:
+vedirect_m8 counts blocks with other keys as bad packets,
+and stops reading after max_read_error of them.
+Blocks are so filtered by this projection, in the same pass
+as data format (see AsyncAppBlockRun.read_port_data).
+The port tick interval is the greatest common divisor
+of items time intervals, and port ticks can be shifted by read_offset
+to read just after expected device blocks.
+"""
+import logging
+import math
+import time
+from typing import Optional, Union
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class VedirectPortReader:
+    """Vedirect port reader Helper"""
+
+    # time intervals precision, used to compute port tick interval
+    INTERVAL_SCALE = 10
+    # time keys added to cache rows
+    TIME_KEYS = ('time', 'time_ref')
+
+    def __init__(self, source: str, app):
+        self.source = source
+        self.app = app
+        self._items = {}
+        self._columns = []
+        self.read_offset = 0
+        self.stats = {
+            "reads": 0,
+            "read_errors": 0,
+            "items_read": 0
+        }
+
+    def has_items(self) -> bool:
+        """Test if any input item is registered."""
+        return Ut.is_dict(self._items, not_null=True)
+
+    def get_items_names(self) -> list:
+        """Get registered input items names."""
+        return list(self._items.keys())
+
+    def get_columns(self) -> list:
+        """Get union of registered input items columns."""
+        return self._columns
+
+    def get_stats(self) -> dict:
+        """Get port reads stats."""
+        return self.stats
+
+    def add_item(self,
+                 name: str,
+                 node: str,
+                 interval: Union[int, float],
+                 columns: list
+                 ) -> bool:
+        """Register input item read on port, and his cache node name."""
+        result = False
+        if Ut.is_str(name, not_null=True)\
+                and Ut.is_str(node, not_null=True)\
+                and Ut.is_numeric(interval, positive=True)\
+                and Ut.is_list(columns, not_null=True):
+            # items are replaced, not mutated, port may be reading them
+            items = dict(self._items)
+            items[name] = {
+                'node': node,
+                'interval': interval,
+                'columns': columns,
+                'ratio': 1
+            }
+            self._items = items
+            self._columns = sorted(
+                set(self._columns).union(columns)
+            )
+            self.set_items_ratio()
+            result = True
+        return result
+
+    def remove_item(self, name: str) -> bool:
+        """Unregister input item, port columns are reduced to other items."""
+        result = False
+        if name in self._items:
+            self._items = {
+                key: item
+                for key, item in self._items.items()
+                if key != name
+            }
+            self._columns = sorted(set().union(*[
+                item.get('columns')
+                for item in self._items.values()
+            ]))
+            if self.has_items():
+                self.set_items_ratio()
+            result = True
+        return result
+
+    def get_tick_interval(self) -> Optional[float]:
+        """Get port tick interval, gcd of items time intervals."""
+        result = None
+        if self.has_items():
+            result = math.gcd(*[
+                int(round(item.get('interval') * self.INTERVAL_SCALE))
+                for item in self._items.values()
+            ]) / self.INTERVAL_SCALE
+            if result.is_integer():
+                result = int(result)
+        return result
+
+    def set_items_ratio(self):
+        """Set number of port ticks between two reads of each item."""
+        tick_interval = self.get_tick_interval()
+        for item in self._items.values():
+            item['ratio'] = max(
+                1, int(round(item.get('interval') / tick_interval))
+            )
+
+    def set_item_interval(self,
+                          name: str,
+                          interval: Union[int, float]
+                          ) -> bool:
+        """
+        Set item time interval, without changing port tick interval.
+
+        Interval is rounded to a multiple of port tick interval.
+        """
+        result = False
+        if name in self._items\
+                and Ut.is_numeric(interval, positive=True):
+            self._items[name]['ratio'] = max(
+                1, int(round(interval / self.get_tick_interval()))
+            )
+            result = True
+        return result
+
+    def get_due_items(self, tick: int) -> list:
+        """Get names of items due on port tick."""
+        return [
+            name
+            for name, item in self._items.items()
+            if tick % item.get('ratio') == 0
+        ]
+
+    def get_item_node(self, name: str) -> Optional[str]:
+        """Get item cache node name."""
+        result = None
+        if name in self._items:
+            result = self._items[name].get('node')
+        return result
+
+    def get_item_data(self, name: str, data: dict) -> Optional[dict]:
+        """Project port data on item columns."""
+        result = None
+        if name in self._items:
+            result = Ut.get_items_from_dict(
+                data,
+                self._items[name].get('columns')
+            )
+        return result
+
+    def get_item_row(self,
+                     name: str,
+                     row: dict,
+                     reuse: bool = False
+                     ) -> Optional[dict]:
+        """
+        Get item cache row from port row, with time keys.
+
+        If reuse is set and item reads all port columns,
+        port row is returned without copy.
+        """
+        result = None
+        if name in self._items:
+            columns = self._items[name].get('columns')
+            if reuse and len(columns) == len(self._columns):
+                result = row
+            else:
+                result = {
+                    key: row[key]
+                    for key in (*columns, *self.TIME_KEYS)
+                    if key in row
+                }
+        return result
+
+    def read_tick(self,
+                  timeout: int = 2,
+                  all_items: bool = False,
+                  project: bool = True
+                  ) -> tuple:
+        """
+        Read port once, if any item is due on this tick (or all_items).
+
+        Ticks are counted on wall clock, so a skipped tick
+        don't shift items phase.
+        Data is projected on the union of items columns,
+        or returned as raw decoded frame if project is False.
+        :return: tuple of (time_key, data, due items names)
+        """
+        data = None
+        time_key = time.time()
+        due_items = self.get_items_names() if all_items\
+            else self.get_due_items(int(round(
+                (time_key - self.read_offset) / self.get_tick_interval()
+            )))
+        if Ut.is_list(due_items, not_null=True):
+            data = self.app.read_data(
+                caller_name=self.source,
+                timeout=timeout
+            )
+            if project:
+                data = Ut.get_items_from_dict(data, self._columns)
+            self.stats["reads"] += 1
+            if Ut.is_dict(data, not_null=True):
+                self.stats["items_read"] += len(due_items)
+            else:
+                self.stats["read_errors"] += 1
+                logger.debug(
+                    "[VedirectPortReader::read_tick] "
+                    "Unable to read data from serial port %s.",
+                    self.source
+                )
+        return time_key, data, due_items
@@ -0,0 +1,305 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Vedirect reader processes Helper.
+
+Optional serial inputs mode, where each serial connector is read
+by his own process. Serial frames parsing and data checks
+run out of the main process, and validated rows are pushed
+on a shared memory ring buffer, consumed in batches by the main process.
+A stalled serial port can't block the others, nor the outputs.
+"""
+import logging
+import multiprocessing
+import signal
+import time
+from typing import Optional
+from vemonitor_m8.core.app_run_main import AppBlockRun
+from vemonitor_m8.core.data_checker import DataChecker
+from vemonitor_m8.core.shm_ring import ShmRingBuffer
+from vemonitor_m8.core.timing_wheel import ScheduledJob, TimingWheel
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.models.inputs_cache import InputsCache
+from vemonitor_m8.workers.vedirect.vedirect_app import VedirectApp
+from vemonitor_m8.core.exceptions import DeviceDataConfError
+from vemonitor_m8.core.exceptions import DeviceInputValueError
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class SerialReader:
+    """Serial connector reader, run on reader process."""
+
+    def __init__(self,
+                 connector: dict,
+                 items: list,
+                 points: dict,
+                 ring: ShmRingBuffer
+                 ):
+        self.app = VedirectApp(**connector)
+        self.points = points
+        self.ring = ring
+        self.jobs = [
+            ScheduledJob(
+                key=item.get('name'),
+                interval=self.app.sampler.check_interval(
+                    item.get('interval'),
+                    item.get('name')
+                ),
+                callback=None,
+                kwargs={'columns': item.get('columns')}
+            )
+            for item in items
+        ]
+        self.ingests = {
+            item.get('name'): AppBlockRun.compile_ingest(
+                DataChecker.compile_plan(item.get('columns'), points)
+            )
+            for item in items
+        }
+
+    def read_item(self, job: ScheduledJob) -> Optional[dict]:
+        """Read, filter and check item data."""
+        result = None
+        time_key = time.time()
+        data = self.app.read_data(caller_name=job.key, timeout=2)
+        if Ut.is_dict(data, not_null=True):
+            try:
+                data = self.ingests.get(job.key)(data, time_key)
+            except (DeviceDataConfError, DeviceInputValueError) as ex:
+                logger.error(
+                    "[SerialReader::read_item] "
+                    "Unable to check data from %s. ex: %s",
+                    job.key, ex
+                )
+                data = None
+            if Ut.is_dict(data, not_null=True):
+                result = {
+                    'node': job.key,
+                    'time': time_key,
+                    'data': data
+                }
+        return result
+
+    def run(self, stop_event):
+        """Read items on their epoch grid until stop_event is set."""
+        epoch = TimingWheel.get_epoch()
+        for job in self.jobs:
+            job.set_next_deadline(epoch, time.monotonic())
+        while not stop_event.is_set():
+            job = min(self.jobs, key=lambda x: x.deadline)
+            wait = job.deadline - time.monotonic()
+            if wait > 0 and stop_event.wait(wait):
+                break
+            deadline = job.deadline
+            start = time.monotonic()
+            row = self.read_item(job)
+            if row is not None and not self.ring.push(row):
+                logger.warning(
+                    "[SerialReader::run] "
+                    "Ring buffer is full, row from %s dropped.",
+                    job.key
+                )
+            end = time.monotonic()
+            job.update_stats(deadline, start, end)
+            self.adapt_jobs_offset()
+            job.set_next_deadline(epoch, end)
+
+    def adapt_jobs_offset(self) -> bool:
+        """Re-phase reads just after expected device blocks."""
+        result = False
+        sampler = self.app.sampler
+        for job in self.jobs:
+            if sampler.is_offset_changed(job.offset, job.interval):
+                job.set_offset(sampler.get_read_offset(job.interval))
+                result = True
+        return result
+
+
+def init_reader_signals():
+    """
+    Reset signal handlers inherited from main process.
+
+    SIGINT and SIGHUP are handled by main process, who stops readers
+    and reloads configuration. SIGTERM stops the reader process,
+    without running main process graceful stop on reader copy.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def run_serial_reader(connector: dict,
+                      items: list,
+                      points: dict,
+                      ring_conf: tuple,
+                      stop_event
+                      ):
+    """Reader process entry point."""
+    init_reader_signals()
+    ring = ShmRingBuffer.attach(*ring_conf)
+    try:
+        reader = SerialReader(connector, items, points, ring)
+        reader.run(stop_event)
+    finally:
+        ring.close()
+
+
+class SerialReadersPool:
+    """Serial reader processes Helper, run on main process."""
+
+    def __init__(self, nb_slots: int = 256, slot_size: int = 4096):
+        self.nb_slots = nb_slots
+        self.slot_size = slot_size
+        self._readers = {}
+        self._stop_event = None
+
+    def has_readers(self) -> bool:
+        """Test if any reader is registered."""
+        return Ut.is_dict(self._readers, not_null=True)
+
+    def add_item(self,
+                 source: str,
+                 connector: dict,
+                 name: str,
+                 columns: list,
+                 interval: int
+                 ) -> bool:
+        """Register item to read on source reader process."""
+        result = False
+        if Ut.is_str(source, not_null=True)\
+                and Ut.is_dict(connector, not_null=True)\
+                and Ut.is_list(columns, not_null=True)\
+                and Ut.is_numeric(interval, positive=True):
+            if source not in self._readers:
+                self._readers[source] = {
+                    'connector': connector,
+                    'items': [],
+                    'ring': None,
+                    'process': None
+                }
+            self._readers[source]['items'].append({
+                'name': name,
+                'columns': columns,
+                'interval': interval
+            })
+            result = True
+        return result
+
+    def start(self, points: dict) -> bool:
+        """Create ring buffers and start one process per source."""
+        result = False
+        if self.has_readers():
+            self._stop_event = multiprocessing.Event()
+            for source, reader in self._readers.items():
+                ring = ShmRingBuffer.create(
+                    nb_slots=self.nb_slots,
+                    slot_size=self.slot_size
+                )
+                process = multiprocessing.Process(
+                    target=run_serial_reader,
+                    args=(
+                        reader.get('connector'),
+                        reader.get('items'),
+                        points,
+                        (ring.name, self.nb_slots, self.slot_size),
+                        self._stop_event
+                    ),
+                    name=f"vemonitor_serial_{source}",
+                    daemon=True
+                )
+                process.start()
+                reader['ring'] = ring
+                reader['process'] = process
+                logger.info(
+                    "[SerialReadersPool] Start serial reader %s (pid %s)",
+                    process.name, process.pid
+                )
+            result = True
+        return result
+
+    def is_alive(self) -> bool:
+        """Test if all reader processes are alive."""
+        return all(
+            reader.get('process') is not None
+            and reader.get('process').is_alive()
+            for reader in self._readers.values()
+        )
+
+    def get_stats(self) -> dict:
+        """Get waiting and dropped rows of each source ring."""
+        result = {}
+        for source, reader in self._readers.items():
+            ring = reader.get('ring')
+            if ring is not None:
+                result[source] = {
+                    'waiting': ring.get_nb_items(),
+                    'dropped': ring.get_nb_dropped()
+                }
+        return result
+
+    def drain(self,
+              inputs_data: InputsCache,
+              max_items: int = 100,
+              on_cached=None,
+              row_filter=None
+              ) -> int:
+        """
+        Consume rows from every ring, and add them to inputs cache.
+
+        on_cached callback is called with time key of every cached row.
+        row_filter callback is called with time key, node and data,
+        and returns data to cache, or None to skip the row.
+        """
+        nb_rows = 0
+        for reader in self._readers.values():
+            ring = reader.get('ring')
+            if ring is None:
+                continue
+            for row in ring.pop_batch(max_items):
+                data = row.get('data')
+                if row_filter is not None:
+                    data = row_filter(row.get('time'), row.get('node'), data)
+                if data is not None\
+                        and inputs_data.add_data_cache(
+                            time_key=row.get('time'),
+                            node=row.get('node'),
+                            data=data)\
+                        and on_cached is not None:
+                    on_cached(row.get('time'))
+                nb_rows += 1
+        return nb_rows
+
+    def stop_processes(self, timeout: float = 3):
+        """
+        Stop reader processes, ring buffers are kept.
+
+        Rows still on ring buffers can then be drained.
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+        for reader in self._readers.values():
+            process = reader.get('process')
+            if process is not None:
+                process.join(timeout=timeout)
+                if process.is_alive():
+                    process.terminate()
+                    process.join(timeout=timeout)
+                reader['process'] = None
+
+    def stop(self, timeout: float = 3):
+        """Stop reader processes and release ring buffers."""
+        self.stop_processes(timeout=timeout)
+        for reader in self._readers.values():
+            if reader.get('ring') is not None:
+                reader.get('ring').close()
+                reader['ring'] = None
@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Vedirect adaptive sampler Helper.
+
+VE.Direct devices emit a text block about once per second,
+whatever the read interval asked for.
+The sampler learns the device block cadence (period)
+and phase (anchor: smoothed wall clock time of last block end)
+from serial reads, to start next reads just after an expected block,
+when the block is already on serial buffer.
+Input intervals faster than the device period are clamped.
+"""
+import logging
+from typing import Optional, Union
+from vemonitor_m8.core.utils import Utils as Ut
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class PacketRateSampler:
+    """Vedirect adaptive sampler Helper"""
+
+    # VE.Direct text protocol blocks period
+    DEFAULT_PERIOD = 1.0
+    MIN_PERIOD = 0.2
+    MAX_PERIOD = 10
+
+    def __init__(self,
+                 period: float = DEFAULT_PERIOD,
+                 alpha: float = 0.2,
+                 min_samples: int = 5,
+                 read_margin: float = 0.05
+                 ):
+        self.period = period
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.read_margin = read_margin
+        self.anchor = None
+        self.nb_samples = 0
+        self.nb_rejected = 0
+        self._last_time = None
+        self._warned = False
+
+    def is_ready(self) -> bool:
+        """Test if enough blocks are observed to predict next one."""
+        return self.anchor is not None\
+            and self.nb_samples >= self.min_samples
+
+    def get_stats(self) -> dict:
+        """Get learned cadence and phase."""
+        return {
+            "period": round(self.period, 6),
+            "phase": None if self.anchor is None
+            else round(self.anchor % 1, 6),
+            "samples": self.nb_samples,
+            "rejected": self.nb_rejected
+        }
+
+    def update_period(self, block_time: float) -> bool:
+        """
+        Update period from time elapsed since last block.
+
+        Elapsed time is divided by the number of periods it spans,
+        so reads slower than the device still refine the period.
+        """
+        result = False
+        diff = block_time - self._last_time
+        if diff > 0:
+            nb_periods = max(1, int(round(diff / self.period)))
+            sample = diff / nb_periods
+            if abs(sample - self.period) <= self.period * 0.25:
+                period = (1 - self.alpha) * self.period + self.alpha * sample
+                self.period = min(
+                    max(period, self.MIN_PERIOD), self.MAX_PERIOD
+                )
+                result = True
+            else:
+                self.nb_rejected += 1
+        return result
+
+    def update_phase(self, block_time: float):
+        """Move anchor toward block time, on expected blocks grid."""
+        if self.anchor is None:
+            self.anchor = block_time
+        else:
+            nb_periods = round((block_time - self.anchor) / self.period)
+            expected = self.anchor + nb_periods * self.period
+            self.anchor = expected + self.alpha * (block_time - expected)
+
+    def add_block_time(self, block_time: float) -> bool:
+        """Observe wall clock time of a block read from serial."""
+        result = False
+        if Ut.is_numeric(block_time, positive=True):
+            if self._last_time is not None:
+                self.update_period(block_time)
+            self.update_phase(block_time)
+            self._last_time = block_time
+            self.nb_samples += 1
+            result = True
+        return result
+
+    def get_next_block_time(self, now: float) -> Optional[float]:
+        """Get wall clock time of next expected block end."""
+        result = None
+        if self.is_ready():
+            nb_periods = (now - self.anchor) // self.period + 1
+            result = self.anchor + nb_periods * self.period
+        return result
+
+    def get_read_offset(self,
+                        interval: Union[int, float] = 1
+                        ) -> Optional[float]:
+        """
+        Get read phase offset from wall clock grid of interval seconds.
+
+        Reads start read_margin seconds after expected block end.
+        """
+        result = None
+        if self.is_ready():
+            result = (self.anchor + self.read_margin) % interval
+        return result
+
+    def is_offset_changed(self,
+                          offset: Union[int, float],
+                          interval: Union[int, float] = 1,
+                          tolerance: float = 0.02
+                          ) -> bool:
+        """Test if read offset moved away from offset."""
+        result = False
+        read_offset = self.get_read_offset(interval)
+        if read_offset is not None:
+            diff = abs(read_offset - offset) % interval
+            result = min(diff, interval - diff) > tolerance
+        return result
+
+    def check_interval(self,
+                       interval: Union[int, float],
+                       name: str
+                       ) -> Union[int, float]:
+        """Clamp input interval faster than device blocks period."""
+        result = interval
+        if Ut.is_numeric(interval, positive=True)\
+                and interval < self.period:
+            result = round(self.period, 1)
+            if result.is_integer():
+                result = int(result)
+            logger.warning(
+                "[PacketRateSampler] "
+                "Input %s interval (%ss) is faster than device blocks "
+                "period (%ss), interval is set to %ss.",
+                name, interval, round(self.period, 3), result
+            )
+        return result
+
+    def warn_fast_interval(self,
+                           interval: Union[int, float],
+                           name: str
+                           ) -> bool:
+        """Warn once if learned period is slower than input interval."""
+        result = False
+        if self.is_ready()\
+                and not self._warned\
+                and interval < self.period * 0.9:
+            self._warned = True
+            logger.warning(
+                "[PacketRateSampler] "
+                "Device %s sends blocks every %ss, "
+                "faster reads (%ss) return the same data.",
+                name, round(self.period, 3), interval
+            )
+            result = True
+        return result
@@ -124,6 +124,9 @@ class VedirectWorker(InputWorker):
                     "min_interval": Ut.get_int(min_interval, 1),
                     "max_read_error": 0
                 }
+                if Ut.is_numeric(connector.get('waitTimeout'), positive=True):
+                    result["wait_timeout"] = connector.get('waitTimeout')
+
                 serial_conf = {}
                 if Ut.is_str(connector.get('serialPort'), not_null=True):
                     serial_port = connector.get('serialPort')
@@ -1,10 +1,11 @@
 """Workers manager helper"""
 import logging
 from typing import Optional
-from vemonitor_m8.models.workers import InputWorker, OutputWorker
+from vemonitor_m8.models.workers import InputWorker, OutputWorker, Worker
 from vemonitor_m8.models.workers import Workers
 from vemonitor_m8.models.workers import WorkersHelper
 from vemonitor_m8.workers.active_connectors import ActiveConnectors
+from vemonitor_m8.workers.active_connectors import SharedConnectors
 from vemonitor_m8.core.exceptions import WorkerException
 from vemonitor_m8.workers.workers_loader import WorkersLoader
 
@@ -23,9 +24,10 @@ logger = logging.getLogger("vemonitor")
 class WorkersManager(Workers):
     """Workers model helper"""
 
-    def __init__(self):
+    def __init__(self, shared_connectors: Optional[SharedConnectors] = None):
         Workers.__init__(self)
         self.active_connectors = ActiveConnectors()
+        self.shared_connectors = shared_connectors
         self._inputs_status = {}
         self._output_status = {}
         self._workers_status = True
@@ -43,6 +45,22 @@ class WorkersManager(Workers):
                 elif from_type == "output":
                     worker = self.get_output_worker(worker_name)
                     result = worker.worker
+        elif isinstance(self.shared_connectors, SharedConnectors):
+            result = self.shared_connectors.get_item(connector_key)
+        return result
+
+    def add_shared_connector(self,
+                             connector_key: tuple,
+                             worker: Worker
+                             ) -> bool:
+        """Share worker connector with other app blocks."""
+        result = False
+        if isinstance(self.shared_connectors, SharedConnectors)\
+                and WorkersHelper.is_worker(worker):
+            result = self.shared_connectors.add_item(
+                key=connector_key,
+                value=worker.worker
+            )
         return result
 
     def add_active_connector(self,
@@ -55,6 +73,99 @@ class WorkersManager(Workers):
             value=value
         )
 
+    def is_connector_used(self, connector: object) -> bool:
+        """Test if connector instance is used by any block worker."""
+        return connector is not None and any(
+            worker.worker is connector
+            for workers in (
+                self.loop_on_input_workers(),
+                self.loop_on_output_workers()
+            )
+            for _, worker in workers
+        )
+
+    def release_connector(self,
+                          connector_key: tuple,
+                          worker: Worker,
+                          worker_name: str,
+                          drop_shared: bool = False
+                          ) -> bool:
+        """
+        Release connector of removed worker.
+
+        Active connector is moved to another worker using it,
+        or removed and closed if no other block worker use it.
+        Connectors shared with other app blocks are never closed,
+        but are dropped from shared connectors if drop_shared is set.
+        Worker own resources are always released.
+        :return: True if worker was closed.
+        """
+        result = False
+        try:
+            worker.release()
+        except BaseException:
+            pass
+        active = self.active_connectors.get_item(connector_key)
+        owner = None
+        for workers in (self.loop_on_input_workers(),
+                        self.loop_on_output_workers()):
+            for name, item in workers:
+                if owner is None\
+                        and worker.worker is not None\
+                        and item.worker is worker.worker:
+                    owner = ('input' if WorkersHelper.is_input_worker(item)
+                             else 'output', name)
+        if active is not None and active[1] == worker_name:
+            self.active_connectors.remove_item(connector_key)
+            if owner is not None:
+                self.add_active_connector(key=connector_key, value=owner)
+        if isinstance(self.shared_connectors, SharedConnectors):
+            if drop_shared:
+                self.shared_connectors.remove_item(connector_key)
+        elif owner is None:
+            try:
+                worker.close()
+                result = True
+            except BaseException:
+                pass
+        return result
+
+    def remove_input_worker(self,
+                            worker_name: str,
+                            connector_key: tuple,
+                            drop_shared: bool = False
+                            ) -> Optional[InputWorker]:
+        """Remove input worker, and release his connector."""
+        result = None
+        if self.has_input_worker_key(worker_name):
+            result = self.inputs.remove_worker(worker_name)
+            self._inputs_status.pop(worker_name, None)
+            self.release_connector(
+                connector_key=connector_key,
+                worker=result,
+                worker_name=worker_name,
+                drop_shared=drop_shared
+            )
+        return result
+
+    def remove_output_worker(self,
+                             worker_name: str,
+                             connector_key: tuple,
+                             drop_shared: bool = False
+                             ) -> Optional[OutputWorker]:
+        """Remove output worker, and release his connector."""
+        result = None
+        if self.has_output_worker_key(worker_name):
+            result = self.outputs.remove_worker(worker_name)
+            self._output_status.pop(worker_name, None)
+            self.release_connector(
+                connector_key=connector_key,
+                worker=result,
+                worker_name=worker_name,
+                drop_shared=drop_shared
+            )
+        return result
+
     def get_workers_status(self) -> bool:
         """Add Worker status error"""
         return self._workers_status is True
@@ -128,6 +239,7 @@ class WorkersManager(Workers):
                 key=worker_name,
                 worker=worker
             )
+            self.add_shared_connector(connector_key, worker)
             result = worker
             self.add_input_worker_status(
                 worker_name=worker_name,
@@ -183,6 +295,7 @@ class WorkersManager(Workers):
                 key=worker_name,
                 worker=worker
             )
+            self.add_shared_connector(connector_key, worker)
             result = worker
             self.add_output_worker_status(
                 worker_name=worker_name,
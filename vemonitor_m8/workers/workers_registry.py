@@ -0,0 +1,361 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Workers plugins registry.
+
+Each connector key (serial, redis, emoncms...) is served by a plugin,
+declaring his input and output workers classes paths,
+his configuration schemas and his capabilities.
+Workers classes are imported on first use,
+so unused backends are never imported.
+
+Built-in plugins are declared here,
+other plugins are discovered through `vemonitor_m8.workers` entry points,
+named by connector key, and loading a WorkerPlugin instance:
+
+    [options.entry_points]
+    vemonitor_m8.workers =
+        myDb = my_package.plugin:PLUGIN
+
+Plugin module must be light, worker classes are declared by path.
+Plugins schemas extend appConnectors and appBlocks schemas.
+"""
+import copy
+import importlib
+import logging
+import threading
+from typing import Optional
+from vemonitor_m8.core.utils import Utils as Ut
+from vemonitor_m8.conf_manager.schema_validate import SchemaValidate
+
+__author__ = "Eli Serra"
+__copyright__ = "Copyright 2022, Eli Serra"
+__deprecated__ = False
+__license__ = "Apache"
+__status__ = "Production"
+__version__ = "1.0.0"
+
+logging.basicConfig()
+logger = logging.getLogger("vemonitor")
+
+
+class WorkerPlugin:
+    """
+    Worker plugin declaration.
+
+    Workers classes are declared as `module.path:ClassName`.
+    Schemas are jsonschema of one connector item,
+    and of block inputs or outputs items list.
+    Capabilities are informational only, app core don't read them,
+    they describe plugin workers to tools and other plugins.
+    Batch sizes and in-flight sends are set by workers configuration
+    (ex: influxDb2 batch_size, outputs max_in_flight).
+    Capabilities:
+        - batch_size: max rows sent by worker in one batch, or None
+        - async: worker sends data without blocking on network io
+        - columnar: worker reads columnar data (one list per column)
+        - columnar_output: worker writes columnar files (arrow, parquet)
+    """
+
+    DEFAULT_CAPABILITIES = {
+        'batch_size': None,
+        'async': False,
+        'columnar': False,
+        'columnar_output': False
+    }
+
+    def __init__(self,
+                 key: str,
+                 input_class: Optional[str] = None,
+                 output_class: Optional[str] = None,
+                 connector_schema: Optional[dict] = None,
+                 input_schema: Optional[dict] = None,
+                 output_schema: Optional[dict] = None,
+                 capabilities: Optional[dict] = None
+                 ):
+        self.key = key
+        self.classes = {
+            'input': input_class,
+            'output': output_class
+        }
+        self.schemas = {
+            'connector': connector_schema,
+            'input': input_schema,
+            'output': output_schema
+        }
+        self.capabilities = dict(
+            WorkerPlugin.DEFAULT_CAPABILITIES,
+            **(capabilities if Ut.is_dict(capabilities) else {})
+        )
+        self._loaded = {}
+
+    def is_valid(self) -> bool:
+        """Test if plugin declares any worker class."""
+        return Ut.is_str(self.key, not_null=True)\
+            and any(
+                WorkerPlugin.is_class_path(path)
+                for path in self.classes.values()
+            )
+
+    @staticmethod
+    def is_class_path(path: Optional[str]) -> bool:
+        """Test if is worker class path, as `module.path:ClassName`."""
+        return Ut.is_str(path, not_null=True)\
+            and len(path.split(":")) == 2\
+            and all(path.split(":"))
+
+    def has_worker(self, direction: str) -> bool:
+        """Test if plugin declares input or output worker."""
+        return WorkerPlugin.is_class_path(self.classes.get(direction))
+
+    def get_class_name(self, direction: str) -> Optional[str]:
+        """Get input or output worker class name."""
+        result = None
+        if self.has_worker(direction):
+            result = self.classes.get(direction).split(":")[1]
+        return result
+
+    def get_schema(self, name: str) -> Optional[dict]:
+        """Get connector, input or output schema."""
+        return self.schemas.get(name)
+
+    def has_schemas(self) -> bool:
+        """Test if plugin declares any schema."""
+        return any(Ut.is_dict(schema) for schema in self.schemas.values())
+
+    def get_capabilities(self) -> dict:
+        """Get worker capabilities."""
+        return self.capabilities
+
+    def get_worker_class(self, direction: str) -> Optional[type]:
+        """
+        Import input or output worker module and get worker class.
+
+        :return: None if worker module is not installed.
+        """
+        result = self._loaded.get(direction)
+        if result is None and self.has_worker(direction):
+            module_path, class_name = self.classes.get(direction).split(":")
+            try:
+                result = getattr(
+                    importlib.import_module(module_path),
+                    class_name,
+                    None
+                )
+                self._loaded[direction] = result
+            except ImportError:
+                logger.warning(
+                    "%s is not installed.",
+                    class_name
+                )
+        return result
+
+
+class WorkersRegistry:
+    """Workers plugins registry"""
+
+    ENTRY_POINTS_GROUP = "vemonitor_m8.workers"
+    BUILTINS = {
+        "serial": WorkerPlugin(
+            key="serial",
+            input_class="vemonitor_m8.workers.vedirect.vedirect_worker"
+                        ":VedirectWorker"
+        ),
+        "redis": WorkerPlugin(
+            key="redis",
+            input_class="vemonitor_m8.workers.redis.redis_worker"
+                        ":RedisInputWorker",
+            output_class="vemonitor_m8.workers.redis.redis_worker"
+                         ":RedisOutputWorker"
+        ),
+        "emoncms": WorkerPlugin(
+            key="emoncms",
+            output_class="emon_worker_m8.emoncms_worker:EmoncmsWorker"
+        ),
+        "influxDb2": WorkerPlugin(
+            key="influxDb2",
+            output_class="vemonitor_m8.workers.influxdb.influx_worker"
+                         ":InfluxDbOutputWorker"
+        ),
+        "mqtt": WorkerPlugin(
+            key="mqtt",
+            output_class="vemonitor_m8.workers.mqtt.mqtt_worker"
+                         ":MqttOutputWorker",
+            capabilities={'async': True}
+        ),
+        "file": WorkerPlugin(
+            key="file",
+            output_class="vemonitor_m8.workers.file_sink.file_sink_worker"
+                         ":FileSinkOutputWorker",
+            capabilities={'columnar_output': True}
+        ),
+    }
+    _plugins = {}
+    _is_discovered = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, plugin: WorkerPlugin) -> bool:
+        """Register plugin, built-in plugins can't be replaced."""
+        result = False
+        if isinstance(plugin, WorkerPlugin) and plugin.is_valid():
+            if plugin.key in cls.BUILTINS:
+                logger.warning(
+                    "[WorkersRegistry] "
+                    "Plugin %s is a built-in plugin, and is not replaced.",
+                    plugin.key
+                )
+            else:
+                with cls._lock:
+                    cls._plugins[plugin.key] = plugin
+                if plugin.has_schemas():
+                    cls.set_schema_extensions()
+                result = True
+        return result
+
+    @classmethod
+    def unregister(cls, key: str) -> bool:
+        """Unregister plugin."""
+        with cls._lock:
+            result = cls._plugins.pop(key, None) is not None
+        if result:
+            SchemaValidate.clear_cache()
+        return result
+
+    @classmethod
+    def set_schema_extensions(cls) -> None:
+        """Extend appConnectors and appBlocks schemas with plugins schemas."""
+        SchemaValidate.add_schema_extension(
+            "appConnectors", cls.extend_app_connectors_schema
+        )
+        SchemaValidate.add_schema_extension(
+            "appBlocks", cls.extend_app_blocks_schema
+        )
+
+    @staticmethod
+    def get_entry_points() -> list:
+        """Get installed workers plugins entry points."""
+        from importlib.metadata import entry_points
+        return list(entry_points(group=WorkersRegistry.ENTRY_POINTS_GROUP))
+
+    @classmethod
+    def discover(cls, force: bool = False) -> dict:
+        """
+        Discover and register workers plugins from entry points, once.
+
+        Invalid or broken plugins are logged and ignored.
+        :return: dict of all plugins, by connector key.
+        """
+        if force or not cls._is_discovered:
+            cls._is_discovered = True
+            for entry_point in cls.get_entry_points():
+                try:
+                    plugin = entry_point.load()
+                    if callable(plugin)\
+                            and not isinstance(plugin, WorkerPlugin):
+                        plugin = plugin()
+                    if not isinstance(plugin, WorkerPlugin)\
+                            or plugin.key != entry_point.name:
+                        raise TypeError(
+                            "entry point must load a WorkerPlugin "
+                            f"with key {entry_point.name}"
+                        )
+                    cls.register(plugin)
+                except Exception as ex:
+                    logger.error(
+                        "[WorkersRegistry::discover] "
+                        "Unable to load workers plugin %s, ex: %s",
+                        entry_point.name, ex
+                    )
+        return cls.get_plugins()
+
+    @classmethod
+    def get_plugins(cls) -> dict:
+        """Get built-in and registered plugins, by connector key."""
+        return dict(cls.BUILTINS, **cls._plugins)
+
+    @classmethod
+    def get_plugin(cls, key: str) -> Optional[WorkerPlugin]:
+        """
+        Get connector key plugin.
+
+        Entry points are discovered only for other than built-in keys.
+        """
+        result = cls.BUILTINS.get(key) or cls._plugins.get(key)
+        if result is None and Ut.is_str(key, not_null=True):
+            result = cls.discover().get(key)
+        return result
+
+    @classmethod
+    def get_worker_class(cls, key: str, direction: str) -> Optional[type]:
+        """Get connector key input or output worker class."""
+        result = None
+        plugin = cls.get_plugin(key)
+        if plugin is not None:
+            result = plugin.get_worker_class(direction)
+        return result
+
+    @classmethod
+    def get_worker_class_by_name(cls, class_name: str) -> Optional[type]:
+        """Get worker class by class name."""
+        result = None
+        for plugin in cls.get_plugins().values():
+            for direction in ('input', 'output'):
+                if result is None\
+                        and plugin.get_class_name(direction) == class_name:
+                    result = plugin.get_worker_class(direction)
+        return result
+
+    @classmethod
+    def get_capabilities(cls, key: str) -> dict:
+        """Get connector key worker capabilities."""
+        plugin = cls.get_plugin(key)
+        return plugin.get_capabilities() if plugin is not None\
+            else dict(WorkerPlugin.DEFAULT_CAPABILITIES)
+
+    @classmethod
+    def extend_app_connectors_schema(cls, schema: dict) -> dict:
+        """Add registered plugins connectors schemas to appConnectors."""
+        result = schema
+        plugins = [
+            plugin for plugin in cls._plugins.values()
+            if Ut.is_dict(plugin.get_schema('connector'))
+            and plugin.key not in schema.get('properties')
+        ]
+        if Ut.is_list(plugins, not_null=True):
+            result = copy.deepcopy(schema)
+            for plugin in plugins:
+                result['properties'][plugin.key] = {
+                    "description": f"{plugin.key} AppConnectors properties.",
+                    "type": "object",
+                    "minProperties": 1,
+                    "additionalProperties": plugin.get_schema('connector')
+                }
+            result['maxProperties'] = len(result['properties'])
+        return result
+
+    @classmethod
+    def extend_app_blocks_schema(cls, schema: dict) -> dict:
+        """Add registered plugins items schemas to appBlocks inputs/outputs."""
+        result = schema
+        for direction in ('input', 'output'):
+            plugins = [
+                plugin for plugin in cls._plugins.values()
+                if Ut.is_dict(plugin.get_schema(direction))
+                and plugin.key not in result['items']['properties'][
+                    f"{direction}s"].get('properties')
+            ]
+            if Ut.is_list(plugins, not_null=True):
+                if result is schema:
+                    result = copy.deepcopy(schema)
+                section = result['items']['properties'][f"{direction}s"]
+                for plugin in plugins:
+                    section['properties'][plugin.key] = {
+                        "description": f"Array of {plugin.key} "
+                                       f"AppConnector {direction} block",
+                        "type": "array",
+                        "minItems": 1,
+                        "items": plugin.get_schema(direction)
+                    }
+                section['maxProperties'] = len(section['properties'])
+        return result